@@ -15,19 +15,69 @@ _module_random = RandomGenerator()
 
 from axelrod.load_data_ import load_pso_tables, load_weights
 from axelrod import graph
-from axelrod.plot import Plot
 from axelrod.game import DefaultGame, AsymmetricGame, Game
-from axelrod.history import History, LimitedHistory
+from axelrod.history import (
+    CompactHistory,
+    CompactLimitedHistory,
+    History,
+    LimitedHistory,
+)
 from axelrod.player import Player
 from axelrod.classifier import Classifiers
 from axelrod.evolvable_player import EvolvablePlayer
 from axelrod.mock_player import MockPlayer
-from axelrod.match import Match
+from axelrod.match import Match, MatchPlan
 from axelrod.moran import MoranProcess, ApproximateMoranProcess
 from axelrod.strategies import *
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.deterministic_cache import (
+    DeterministicCache,
+    PersistentDeterministicCache,
+)
 from axelrod.match_generator import *
-from axelrod.tournament import Tournament
-from axelrod.result_set import ResultSet
-from axelrod.ecosystem import Ecosystem
-from axelrod.fingerprint import AshlockFingerprint, TransitiveFingerprint
+from axelrod.executor import Executor
+
+# `from axelrod.strategies import *` does not bind the strategy collections
+# that are computed on first use, so `strategies` still refers to the
+# subpackage: remove it so that `axelrod.strategies` is the collection, as
+# it has always been.
+del strategies
+
+# These are only imported on first use: the modules that define them import
+# matplotlib, dask or pandas, and the strategy collections instantiate
+# every strategy.
+_lazy_attributes = {
+    "Tournament": "axelrod.tournament",
+    "ResultSet": "axelrod.result_set",
+    "Plot": "axelrod.plot",
+    "Ecosystem": "axelrod.ecosystem",
+    "AshlockFingerprint": "axelrod.fingerprint",
+    "TransitiveFingerprint": "axelrod.fingerprint",
+    "basic_strategies": "axelrod.strategies",
+    "strategies": "axelrod.strategies",
+    "long_run_time_strategies": "axelrod.strategies",
+    "short_run_time_strategies": "axelrod.strategies",
+    "cheating_strategies": "axelrod.strategies",
+    "ordinary_strategies": "axelrod.strategies",
+}
+
+
+def __getattr__(name):
+    """Imports the lazy attributes on first use and keeps them as module
+    attributes."""
+    if name not in _lazy_attributes:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    import importlib
+    import sys
+
+    module = sys.modules.get(_lazy_attributes[name])
+    if module is None:
+        module = importlib.import_module(_lazy_attributes[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
@@ -0,0 +1,185 @@
+"""Checkpoints of a tournament written to a csv file, so that an interrupted
+tournament can be resumed.
+
+The checkpoint of `filename` is kept in `filename + ".checkpoint"`. Its first
+line is a json header with the parameters of the tournament and the seed of
+every chunk (as drawn by the MatchGenerator). Each following line records a
+completed chunk: its index, the number of interactions it holds and the size
+of the output file once its rows were written.
+
+When a tournament is resumed the output file is truncated to the size
+recorded with the last completed chunk (removing the rows of a chunk that was
+being written when the run stopped) and only the chunks that were not
+completed are played, with the seeds of the header. The output file is then
+the same as the output of an uninterrupted run.
+"""
+
+import csv
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from axelrod.action import str_to_actions
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+def checkpoint_filename(filename: str) -> str:
+    """Returns the name of the checkpoint file of an output file."""
+    return filename + CHECKPOINT_SUFFIX
+
+
+class Checkpoint(object):
+    """The checkpoint of a tournament.
+
+    Attributes
+    ----------
+    filename : str
+        The name of the checkpoint file
+    metadata : dict
+        The parameters of the tournament
+    seeds : list
+        The seed of each chunk of the tournament
+    start : int
+        The size of the output file before any chunk was written (its header)
+    completed : list
+        The records of the completed chunks, in the order they were written to
+        the output file. Each record is a dictionary with keys "chunk" (the
+        index of the chunk), "interactions" (the number of interactions of the
+        chunk), "offset" (the size of the output file after the chunk was
+        written) and "num_interactions" (the number of interactions written
+        so far).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        metadata: dict,
+        seeds: List[int],
+        start: int,
+        completed: Optional[List[dict]] = None,
+    ) -> None:
+        self.filename = filename
+        self.metadata = metadata
+        self.seeds = seeds
+        self.start = start
+        self.completed = completed or []
+        self._file = None
+
+    @classmethod
+    def create(
+        cls, filename: str, metadata: dict, seeds: List[int], start: int
+    ) -> "Checkpoint":
+        """Writes the header of a new checkpoint file, replacing any existing
+        one."""
+        checkpoint = cls(filename, metadata, seeds, start)
+        header = {"metadata": metadata, "seeds": seeds, "start": start}
+        with open(filename, "w") as f:
+            f.write(json.dumps(header) + "\n")
+        return checkpoint
+
+    @classmethod
+    def load(cls, filename: str) -> "Checkpoint":
+        """Reads a checkpoint file. Lines that were not completely written
+        (when a run stopped) are ignored."""
+        with open(filename) as f:
+            lines = f.read().split("\n")
+        header = json.loads(lines[0])
+        completed = []
+        for line in lines[1:]:
+            try:
+                completed.append(json.loads(line))
+            except ValueError:
+                continue
+        return cls(
+            filename,
+            header["metadata"],
+            header["seeds"],
+            header["start"],
+            completed,
+        )
+
+    @property
+    def completed_chunks(self) -> set:
+        """The indices of the completed chunks."""
+        return set(record["chunk"] for record in self.completed)
+
+    @property
+    def offset(self) -> int:
+        """The size of the output file after the last completed chunk."""
+        if self.completed:
+            return self.completed[-1]["offset"]
+        return self.start
+
+    @property
+    def num_interactions(self) -> int:
+        """The number of interactions of the completed chunks."""
+        if self.completed:
+            return self.completed[-1]["num_interactions"]
+        return 0
+
+    def record(
+        self,
+        chunk_index: int,
+        interactions: int,
+        offset: int,
+        num_interactions: int,
+    ) -> None:
+        """Records a completed chunk. The output file should have been
+        flushed so that `offset` includes all its rows."""
+        record = {
+            "chunk": chunk_index,
+            "interactions": interactions,
+            "offset": offset,
+            "num_interactions": num_interactions,
+        }
+        self.completed.append(record)
+        if self._file is None:
+            self._file = open(self.filename, "a")
+            # Start a new line in case the last one was not completely written
+            self._file.write("\n")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_completed_interactions(
+        self, output_filename: str
+    ) -> Iterator[Tuple[int, Dict[tuple, list]]]:
+        """Reads the interactions of the completed chunks from the output
+        file.
+
+        Yields
+        ------
+        tuple
+            (chunk index, {index pair: [interaction, ...]}) for each completed
+            chunk, in the order they were written
+        """
+        with open(output_filename, newline="") as f:
+            reader = csv.reader(f)
+            next(reader)  # header
+            for record in self.completed:
+                interactions = []
+                index_pair = None
+                for _ in range(record["interactions"]):
+                    row, opponent_row = next(reader), next(reader)
+                    index_pair = (int(row[1]), int(row[2]))
+                    interactions.append(
+                        list(
+                            zip(
+                                str_to_actions(row[6]),
+                                str_to_actions(opponent_row[6]),
+                            )
+                        )
+                    )
+                yield record["chunk"], {index_pair: interactions}
+
+
+def truncate(filename: str, offset: int) -> None:
+    """Truncates a file to `offset` bytes."""
+    with open(filename, "r+") as f:
+        f.truncate(offset)
+        os.fsync(f.fileno())
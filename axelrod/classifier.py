@@ -1,5 +1,8 @@
+import hashlib
 import os
+import pickle
 import warnings
+import weakref
 from typing import (
     Any,
     Callable,
@@ -18,6 +21,7 @@ from axelrod.makes_use_of import makes_use_of
 from axelrod.player import Player
 
 ALL_CLASSIFIERS_PATH = "data/all_classifiers.yml"
+ALL_CLASSIFIERS_INDEX_PATH = "data/all_classifiers.pickle"
 
 T = TypeVar("T")
 
@@ -87,12 +91,18 @@ all_classifiers = [
 all_classifiers_map = {c.name: c.classify_player for c in all_classifiers}
 
 
+def _index_path(path: Text) -> Text:
+    """Returns the path of the compiled index of a classifier table."""
+    return os.path.splitext(path)[0] + ".pickle"
+
+
 def rebuild_classifier_table(
     classifiers: List[Classifier],
     players: List[Type[Player]],
     path: Text = ALL_CLASSIFIERS_PATH,
 ) -> None:
-    """Builds the classifier table in data.
+    """Builds the classifier table in data, and its compiled index (see
+    `compile_classifier_index`).
 
     Parameters
     ----------
@@ -115,6 +125,68 @@ def rebuild_classifier_table(
     with open(filename, "w") as f:
         yaml.dump(all_player_dicts, f)
 
+    compile_classifier_index(path)
+
+
+def compile_classifier_index(
+    path: Text = ALL_CLASSIFIERS_PATH, index_path: Optional[Text] = None
+) -> None:
+    """Compiles a classifier table to a pickled index, which is much faster to
+    load than the yaml file.
+
+    The index holds the player dicts of the table together with a hash of the
+    yaml file, so that an index that is out of date with its table is not
+    used.
+
+    Parameters
+    ----------
+    path: The yaml file of the classifier table, relative to this module.
+    index_path: Where to save the index, by default the path of the table
+        with a .pickle extension.
+    """
+    dirname = os.path.dirname(__file__)
+    if index_path is None:
+        index_path = _index_path(path)
+    with open(os.path.join(dirname, path), "rb") as f:
+        source = f.read()
+    index = {
+        "sha256": hashlib.sha256(source).hexdigest(),
+        "players": yaml.load(source, Loader=yaml.FullLoader),
+    }
+    with open(os.path.join(dirname, index_path), "wb") as f:
+        pickle.dump(index, f, protocol=4)
+
+
+def load_classifier_table(
+    path: Text = ALL_CLASSIFIERS_PATH, index_path: Optional[Text] = None
+) -> dict:
+    """Reads a classifier table: from its compiled index if it is up to date
+    with the yaml file, otherwise from the yaml file.
+
+    Parameters
+    ----------
+    path: The yaml file of the classifier table, relative to this module.
+    index_path: The compiled index, by default the path of the table with a
+        .pickle extension.
+
+    Returns
+    -------
+    A dict mapping player names to their classifier dicts.
+    """
+    dirname = os.path.dirname(__file__)
+    if index_path is None:
+        index_path = _index_path(path)
+    with open(os.path.join(dirname, path), "rb") as f:
+        source = f.read()
+    try:
+        with open(os.path.join(dirname, index_path), "rb") as f:
+            index = pickle.load(f)
+        if index["sha256"] == hashlib.sha256(source).hexdigest():
+            return index["players"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        pass
+    return yaml.load(source, Loader=yaml.FullLoader)
+
 
 class _Classifiers(object):
     """A singleton used to calculate any known classifier.
@@ -123,25 +195,33 @@ class _Classifiers(object):
     ----------
     all_player_dicts: A local copy of the dict saved in the classifier table.
         The keys are player names, and the values are 'classifier' dicts (keyed
-        by classifier name).
+        by classifier name). This is None until the table is first needed.
     """
 
     _instance = None
-    all_player_dicts = dict()
+    all_player_dicts = None
+
+    # The function returned for each classifier name.
+    _lookups = dict()  # type: dict
+    # For each player class, the values found in the table or calculated,
+    # keyed by player name and classifier name. Classes created by
+    # transformers are forgotten when they are no longer used.
+    _player_class_values = weakref.WeakKeyDictionary()
 
     # Make this a singleton
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(_Classifiers, cls).__new__(cls)
-            # When this is first created, read from the classifier table file.
-            # Get absolute path
-            dirname = os.path.dirname(__file__)
-            filename = os.path.join(dirname, ALL_CLASSIFIERS_PATH)
-            with open(filename, "r") as f:
-                cls.all_player_dicts = yaml.load(f, Loader=yaml.FullLoader)
-
         return cls._instance
 
+    @classmethod
+    def player_dicts(cls) -> dict:
+        """Returns all_player_dicts, reading the classifier table file the
+        first time it is needed."""
+        if cls.all_player_dicts is None:
+            cls.all_player_dicts = load_classifier_table()
+        return cls.all_player_dicts
+
     @classmethod
     def known_classifier(cls, classifier_name: Text) -> bool:
         """Returns True if the passed classifier_name is known."""
@@ -180,35 +260,47 @@ class _Classifiers(object):
         if not isinstance(key, str):
             key = key.name
 
+        try:
+            return cls._lookups[key]
+        except KeyError:
+            pass
+
         if not cls.known_classifier(key):
             raise KeyError("Unknown classifier")
 
+        def try_lookup(player: Player) -> Any:
+            try:
+                player_classifiers = cls.player_dicts()[player.name]
+            except:
+                return None
+
+            return player_classifiers.get(key, None)
+
         def classify_player_for_this_classifier(
             player: Union[Player, Type[Player]]
         ) -> Any:
-            def try_lookup() -> Any:
-                try:
-                    player_classifiers = cls.all_player_dicts[player.name]
-                except:
-                    return None
-
-                return player_classifiers.get(key, None)
-
             # If the passed player is not an instance, then try to initialize an
             # instance without arguments.
             if not isinstance(player, Player):
+                player_class = player
                 try:
-                    player = player()
-                    warnings.warn(
-                        "Classifiers are intended to run on player instances. "
-                        "Passed player {} was initialized with default "
-                        "arguments.".format(player.name)
-                    )
-                except:
-                    # All strategies must have trivial initializers.
-                    raise Exception(
-                        "Passed player class doesn't have a trivial initializer."
-                    )
+                    value = cls._player_class_values[player_class][None, key]
+                except (KeyError, TypeError):
+                    try:
+                        player = player_class()
+                    except:
+                        # All strategies must have trivial initializers.
+                        raise Exception(
+                            "Passed player class doesn't have a trivial initializer."
+                        )
+                    value = classify_player_for_this_classifier(player)
+                    cls._memoize(player_class, (None, key), value)
+                warnings.warn(
+                    "Classifiers are intended to run on player instances. "
+                    "Passed player {} was initialized with default "
+                    "arguments.".format(player_class.name)
+                )
+                return value
 
             # Factory-generated players won't exist in the table.  As well, some
             # players, like Random, may change classifiers at construction time;
@@ -217,17 +309,35 @@ class _Classifiers(object):
             if key in player.classifier:
                 return player.classifier[key]
 
-            # Try to find the name in the all_player_dicts, read from disk.
-            lookup = try_lookup()
-            if lookup is not None:
-                return lookup
-
-            # If we can't find it, then return a function that calculates fresh.
-            global all_classifiers_map
-            return all_classifiers_map[key](player)
+            # The table and the calculation only depend on the class and name
+            # of the player, so their values are memoized.
+            player_class = type(player)
+            try:
+                return cls._player_class_values[player_class][player.name, key]
+            except KeyError:
+                pass
 
+            # Try to find the name in the all_player_dicts, read from disk.
+            value = try_lookup(player)
+            if value is None:
+                # If we can't find it, then calculate it fresh.
+                global all_classifiers_map
+                value = all_classifiers_map[key](player)
+            cls._memoize(player_class, (player.name, key), value)
+            return value
+
+        cls._lookups[key] = classify_player_for_this_classifier
         return classify_player_for_this_classifier
 
+    @classmethod
+    def _memoize(cls, player_class: Type[Player], key: tuple, value: Any):
+        """Keeps a classifier value of a player class."""
+        try:
+            values = cls._player_class_values.setdefault(player_class, {})
+        except TypeError:  # pragma: no cover
+            return
+        values[key] = value
+
     @classmethod
     def is_basic(cls, s: Union[Player, Type[Player]]):
         """
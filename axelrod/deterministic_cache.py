@@ -10,30 +10,48 @@ if some_key in cache:
     do_something(cache[some_key])
 else:
     ...
+
+PersistentDeterministicCache has the same interface and stores the results in
+a SQLite database, so that they can be shared by the worker processes of a
+tournament and reused by later tournaments.
 """
 
+import os
 import pickle
-from collections import UserDict
-from typing import List, Tuple
+import sqlite3
+from collections import OrderedDict, UserDict
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from axelrod import Classifiers
 
 from .action import Action
+from .interaction_utils import STATES, interactions_to_array
 from .player import Player
+from .version import __version__
 
 CachePlayerKey = Tuple[Player, Player]
 CacheKey = Tuple[str, str]
+# Converts a CachePlayerKey to the key of the results of a cache
+KeyTransform = Callable[[CachePlayerKey], Tuple[str, ...]]
+
+# The format of the files written by DeterministicCache.save. The files
+# written before the format was recorded identify the players by name.
+CACHE_FILE_FORMAT = 2
 
 
 def _key_transform(key: CachePlayerKey) -> CacheKey:
     """Convert a CachePlayerKey to a CacheKey
 
+    The players are identified by their configuration keys, so that players
+    of the same class with different parameters are told apart.
+
     Parameters
     ----------
     key: tuple
-        A 3-tuple: (player instance, player instance)
+        A 2-tuple: (player instance, player instance)
     """
-    return key[0].name, key[1].name
+    return key[0].configuration_key(), key[1].configuration_key()
 
 
 def _is_valid_key(key: CachePlayerKey) -> bool:
@@ -78,6 +96,17 @@ def _is_valid_value(value: List) -> bool:
     return isinstance(value, list)
 
 
+def _compact(value: List[Tuple[Action, Action]]) -> bytes:
+    """Stores each turn as one byte: 2 * play + coplay (with C = 0, D = 1)."""
+    actions = interactions_to_array(value)
+    return (actions[:, 0] * 2 + actions[:, 1]).tobytes()
+
+
+def _expand(value: bytes) -> List[Tuple[Action, Action]]:
+    """The inverse of _compact."""
+    return list(map(STATES.__getitem__, value))
+
+
 class DeterministicCache(UserDict):
     """A class to cache the results of deterministic matches.
 
@@ -96,6 +125,13 @@ class DeterministicCache(UserDict):
 
     (axelrod.Cooperator, axelrod.Alternator): [(C, C), (C, D), (C, C)]
 
+    The interactions are stored with one byte per turn and converted back to
+    a list when they are read. The cache can be bounded by a number of
+    entries and by a number of bytes (that is of turns stored): the least
+    recently used entries are then evicted. The attributes `hits`, `misses`
+    and `evictions` count the lookups that found a result, those that did
+    not and the evicted entries.
+
     Most of the functionality is provided by the UserDict class (which uses an
     instance of dict as the 'data' attribute to hold the dictionary entries).
 
@@ -104,27 +140,87 @@ class DeterministicCache(UserDict):
     methods to save/load the cache to/from a file.
     """
 
-    def __init__(self, file_name: str = None) -> None:
+    def __init__(
+        self,
+        file_name: Optional[str] = None,
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
         """Initialize a new cache.
 
         Parameters
         ----------
         file_name : string
             Path to a previously saved cache file
+        max_size : int
+            The maximum number of entries, unbounded if None
+        max_bytes : int
+            The maximum number of bytes used by the stored interactions,
+            unbounded if None
         """
         super().__init__()
+        self.data = OrderedDict()  # type: OrderedDict[Tuple[str, ...], bytes]
         self.mutable = True
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         if file_name is not None:
             self.load(file_name)
 
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """The fraction of the lookups that found a result, or None if there
+        were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def __repr__(self) -> str:
+        return repr({key: _expand(value) for key, value in self.data.items()})
+
+    # Converts a CachePlayerKey to the key of self.data
+    _transform_key = staticmethod(_key_transform)  # type: KeyTransform
+
+    def _lookup(self, key):
+        """Returns the compact value stored for a transformed key, marking it
+        as the most recently used, or None."""
+        value = self.data.get(key)
+        if value is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def _forget(self, key) -> None:
+        """Removes a transformed key from self.data if it is there."""
+        value = self.data.pop(key, None)
+        if value is not None:
+            self.nbytes -= len(value)
+
     def __delitem__(self, key: CachePlayerKey):
-        return super().__delitem__(_key_transform(key))
+        transformed_key = self._transform_key(key)
+        if transformed_key not in self.data:
+            raise KeyError(key)
+        self._forget(transformed_key)
 
     def __getitem__(self, key: CachePlayerKey) -> List[Tuple[Action, Action]]:
-        return super().__getitem__(_key_transform(key))
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: CachePlayerKey, default=None):
+        """Returns the interactions for the key, or `default`, with a single
+        lookup."""
+        value = self._lookup(self._transform_key(key))
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return _expand(value)
 
     def __contains__(self, key):
-        return super().__contains__(_key_transform(key))
+        return self._lookup(self._transform_key(key)) is not None
 
     def __setitem__(self, key: CachePlayerKey, value):
         """Validate the key and value before setting them."""
@@ -141,23 +237,45 @@ class DeterministicCache(UserDict):
                 "Value must be a list with length equal to turns attribute"
             )
 
-        super().__setitem__(_key_transform(key), value)
+        self._store(self._transform_key(key), _compact(value))
+
+    def _store(self, key, value: bytes) -> None:
+        """Stores a compact value as the most recently used entry and evicts
+        the least recently used entries beyond the bounds."""
+        self._forget(key)
+        self.data[key] = value
+        self.nbytes += len(value)
+        while self.data and (
+            (self.max_size is not None and len(self.data) > self.max_size)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, evicted = self.data.popitem(last=False)
+            self.nbytes -= len(evicted)
+            self.evictions += 1
 
     def save(self, file_name: str) -> bool:
         """Serialise the cache dictionary to a file.
 
+        The file records its format (CACHE_FILE_FORMAT) together with the
+        interactions, stored as in memory with one byte per turn.
+
         Parameters
         ----------
         file_name : string
             File path to which the cache should be saved
         """
         with open(file_name, "wb") as io:
-            pickle.dump(self.data, io)
+            pickle.dump(
+                {"format": CACHE_FILE_FORMAT, "data": dict(self.data)}, io
+            )
         return True
 
     def load(self, file_name: str) -> bool:
         """Load a previously saved cache into the dictionary.
 
+        The interactions can be lists of pairs of actions or, as stored in
+        memory, bytes.
+
         Parameters
         ----------
         file_name : string
@@ -166,11 +284,278 @@ class DeterministicCache(UserDict):
         with open(file_name, "rb") as io:
             data = pickle.load(io)
 
-        if isinstance(data, dict):
-            self.data = data
-        else:
+        if not isinstance(data, dict):
             raise ValueError(
                 "Cache file exists but is not the correct format. "
                 "Try deleting and re-building the cache file."
             )
+        if "format" not in data:
+            raise ValueError(
+                "Cache file {} was saved by an earlier version of the "
+                "library, which identified the players by name rather than "
+                "by their configuration key, so none of its results can be "
+                "used. Try deleting and re-building the cache file.".format(
+                    file_name
+                )
+            )
+        if data["format"] != CACHE_FILE_FORMAT:
+            raise ValueError(
+                "Cache file {} has format {}, this version of the library "
+                "reads format {}. Try deleting and re-building the cache "
+                "file.".format(file_name, data["format"], CACHE_FILE_FORMAT)
+            )
+        self.data = OrderedDict()
+        self.nbytes = 0
+        for key, value in data["data"].items():
+            if isinstance(value, list):
+                value = _compact(value)
+            self._store(key, value)
+        return True
+
+
+PersistentCacheKey = Tuple[str, str, str, str, str]
+ProcessConnection = Tuple[int, sqlite3.Connection]
+
+# The open connection to each database file used by this process, with the
+# number of caches using it
+_connections = {}  # type: Dict[Tuple[int, str], List]
+
+
+def _connect(file_name: str, timeout: float) -> sqlite3.Connection:
+    """Returns the connection of this process to the database, creating the
+    database if needed, and counts one more cache using it.
+
+    The connections are keyed by process id: a process forked from this one
+    opens its own connection rather than using the one it inherited.
+    """
+    key = (os.getpid(), os.path.abspath(file_name))
+    if key not in _connections:
+        connection = sqlite3.connect(
+            file_name, timeout=timeout, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "version TEXT, game TEXT, length TEXT, "
+            "player1 TEXT, player2 TEXT, turns INTEGER, plays BLOB, "
+            "PRIMARY KEY (version, game, length, player1, player2))"
+        )
+        _connections[key] = [connection, 0]
+    _connections[key][1] += 1
+    return _connections[key][0]
+
+
+def _disconnect(file_name: str) -> None:
+    """Counts one less cache using the connection of this process to the
+    database, and closes it once no cache uses it."""
+    key = (os.getpid(), os.path.abspath(file_name))
+    if key not in _connections:
+        return
+    _connections[key][1] -= 1
+    if _connections[key][1] == 0:
+        connection, _ = _connections.pop(key)
+        connection.close()
+
+
+def _persistent_key(key: CachePlayerKey) -> PersistentCacheKey:
+    """Convert a CachePlayerKey to the key of a PersistentDeterministicCache.
+
+    The actions of deterministic players can depend on the game and on the
+    length of the match they are told, so these are part of the key,
+    together with the version of the library.
+
+    Parameters
+    ----------
+    key: tuple
+        A 2-tuple: (player instance, player instance)
+    """
+    player1, player2 = key
+    attributes = player1.match_attributes
+    game = attributes["game"]
+    return (
+        __version__,
+        repr((game.A.tolist(), game.B.tolist())),
+        repr(attributes["length"]),
+        player1.configuration_key(),
+        player2.configuration_key(),
+    )
+
+
+def _encode(value: List[Tuple[Action, Action]]) -> bytes:
+    """Packs the actions of a list of turns into 2 bits per turn."""
+    return np.packbits(interactions_to_array(value).ravel()).tobytes()
+
+
+def _decode(plays: bytes, turns: int) -> bytes:
+    """The inverse of _encode, returning the compact value (one byte per
+    turn) used by DeterministicCache."""
+    bits = np.unpackbits(np.frombuffer(plays, dtype=np.uint8), count=2 * turns)
+    return (bits[0::2] * 2 + bits[1::2]).tobytes()
+
+
+class PersistentDeterministicCache(DeterministicCache):
+    """A cache of the results of deterministic matches stored in a SQLite
+    database.
+
+    The results are written to the database as soon as they are cached, with
+    the actions of each turn packed in 2 bits. Any number of processes can
+    read and write the same database file at the same time: the cache can
+    be given to a tournament played with several processes, or to a Moran
+    process or a fingerprint, and is reused by later runs.
+
+    As the cache can be reused in other settings, the results are stored for
+    the configuration key of the players (see Player.configuration_key), the
+    game and the length of the match known to the players (read from the
+    match attributes of the first player) and the version of the library.
+    The longest result of each match is kept.
+
+    The results read from the database are also kept in memory, within the
+    bounds given by `max_size` and `max_bytes` as for a DeterministicCache.
+    """
+
+    _transform_key = staticmethod(_persistent_key)
+
+    def __init__(
+        self,
+        file_name: str,
+        timeout: float = 60,
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Open a cache, creating the database if the file does not exist.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to the database file
+        timeout : float
+            The number of seconds to wait for another process that is
+            writing to the database
+        max_size : int
+            The maximum number of results kept in memory
+        max_bytes : int
+            The maximum number of bytes used by the results kept in memory
+        """
+        super().__init__(max_size=max_size, max_bytes=max_bytes)
+        self.file_name = file_name
+        self.timeout = timeout
+        # The id of the process that opened the connection, and the connection
+        self._process_connection = (
+            os.getpid(),
+            _connect(file_name, timeout),
+        )  # type: Optional[ProcessConnection]
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """The connection of the current process to the database, opened
+        the first time the cache is used by each process."""
+        pid = os.getpid()
+        if self._process_connection is None or (
+            self._process_connection[0] != pid
+        ):
+            connection = _connect(self.file_name, self.timeout)
+            self._process_connection = (pid, connection)
+        return self._process_connection[1]
+
+    def __getstate__(self):
+        return {
+            "file_name": self.file_name,
+            "timeout": self.timeout,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+            "mutable": self.mutable,
+        }
+
+    def __setstate__(self, state):
+        mutable = state.pop("mutable")
+        self.__init__(**state)
+        self.mutable = mutable
+
+    def __repr__(self) -> str:
+        return "PersistentDeterministicCache({!r})".format(self.file_name)
+
+    def _lookup(self, key: PersistentCacheKey):
+        """Returns the compact value stored for a key, reading it from the
+        database if it is not in memory, or None."""
+        value = super()._lookup(key)
+        if value is None:
+            row = self._connection.execute(
+                "SELECT turns, plays FROM results WHERE version = ? AND "
+                "game = ? AND length = ? AND player1 = ? AND player2 = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            turns, plays = row
+            value = _decode(plays, turns)
+            self._store(key, value)
+        return value
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        """Validate the key and value before writing them to the database."""
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+
+        if not _is_valid_key(key):
+            raise ValueError(
+                "Key must be a tuple of 2 deterministic axelrod Player classes"
+            )
+
+        if not _is_valid_value(value):
+            raise ValueError(
+                "Value must be a list with length equal to turns attribute"
+            )
+
+        persistent_key = self._transform_key(key)
+        # Another process may have stored a longer result.
+        self._connection.execute(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (version, game, length, player1, player2) DO UPDATE "
+            "SET turns = excluded.turns, plays = excluded.plays "
+            "WHERE excluded.turns > results.turns",
+            persistent_key + (len(value), _encode(value)),
+        )
+        self._forget(persistent_key)
+
+    def __delitem__(self, key: CachePlayerKey):
+        persistent_key = self._transform_key(key)
+        self._forget(persistent_key)
+        cursor = self._connection.execute(
+            "DELETE FROM results WHERE version = ? AND game = ? AND "
+            "length = ? AND player1 = ? AND player2 = ?",
+            persistent_key,
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM results"
+        ).fetchone()[0]
+
+    def __iter__(self):
+        return iter(
+            self._connection.execute(
+                "SELECT version, game, length, player1, player2 FROM results"
+            ).fetchall()
+        )
+
+    def close(self) -> None:
+        """Releases the connection of this process to the database. The
+        connection is shared by the caches of this process that use the same
+        file and is closed once all of them are closed."""
+        if self._process_connection is None:
+            return
+        if self._process_connection[0] == os.getpid():
+            _disconnect(self.file_name)
+        self._process_connection = None
+
+    def save(self, file_name: Optional[str] = None) -> bool:
+        """The results are saved as they are cached: this does nothing."""
         return True
+
+    def load(self, file_name: str) -> bool:
+        raise TypeError(
+            "A PersistentDeterministicCache reads its database directly."
+        )
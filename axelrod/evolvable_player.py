@@ -32,6 +32,8 @@ class EvolvablePlayer(Player):
         """Use to overwrite parameters for proper cloning and testing."""
         for k, v in kwargs.items():
             self.init_kwargs[k] = v
+        self.__dict__.pop("_configuration_key", None)
+        self.__dict__.pop("_snapshot", None)
 
     def create_new(self, **kwargs):
         """Creates a new variant with parameters overwritten by kwargs. This differs from
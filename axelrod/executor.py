@@ -0,0 +1,255 @@
+"""A pool of worker processes that is kept alive between tournaments.
+
+Tournament.play(processes=N) starts N new processes and sends them the whole
+tournament every time it is called. Fingerprints, Moran processes and
+parameter sweeps play many small tournaments (or rounds) one after the other,
+so starting the processes and sending the players again can take longer than
+playing the matches.
+
+An Executor starts its workers once. The players are registered with the
+executor, which sends each distinct player to the workers once only: the
+workers keep these prototypes and the tasks that follow only refer to them
+by an integer id. The number of prototypes kept is bounded: the least
+recently registered are forgotten, so that a long Moran process with
+mutation, which registers every new mutant, does not fill the workers.
+"""
+
+import pickle
+import time
+from collections import OrderedDict
+from multiprocessing import Process, Queue, cpu_count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from axelrod.player import Player
+
+PrototypeKey = Tuple[type, bytes]
+
+
+def _n_workers(processes: Optional[int] = None) -> int:
+    """Returns the number of workers to use: all the available cores unless
+    `processes` is between 1 and the number of cores."""
+    if processes is not None and 1 <= processes <= cpu_count():
+        return processes
+    return cpu_count()
+
+
+def _prototype_key(player: Player) -> PrototypeKey:
+    """Returns a key that identifies the clones of a player: players of the
+    same class with the same initialisation parameters have the same key."""
+    return type(player), pickle.dumps(player.init_kwargs)
+
+
+class Executor(object):
+    """A pool of worker processes that can be reused by several tournaments,
+    fingerprints and Moran processes.
+
+    The executor can be used as a context manager, which closes the workers
+    on exit. Otherwise `close` should be called once it is no longer needed.
+
+    Attributes
+    ----------
+    processes : int
+        The number of worker processes
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        prefetch: int = 2,
+        max_prototypes: Optional[int] = 1000,
+    ):
+        """
+        Parameters
+        ----------
+        processes : int
+            The number of worker processes. All the available cores are used
+            if this is None or 0.
+        prefetch : int
+            The number of tasks sent to a worker ahead of it finishing its
+            current task. More tasks are sent as results come back so the
+            most expensive tasks, given first, are spread over the workers.
+        max_prototypes : int
+            The maximum number of prototypes kept by the workers. Once it is
+            reached, registering new players makes the workers forget the
+            prototypes that were least recently registered. The number is
+            not bounded if this is None.
+        """
+        self.processes = _n_workers(processes)
+        self.prefetch = max(prefetch, 1)
+        self.max_prototypes = max_prototypes
+        self.evictions = 0
+        # In order of last registration
+        self._prototype_ids = OrderedDict()  # type: Dict[PrototypeKey, int]
+        self._next_id = 0
+        self._workers = []  # type: List[Process]
+        self._input_queues = []  # type: List[Queue]
+        self._output_queue = None  # type: Optional[Queue]
+        self._map_count = 0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Starts the worker processes, if they are not already running."""
+        if self.started:
+            return
+        self._output_queue = Queue()
+        for worker in range(self.processes):
+            input_queue = Queue()  # type: Queue
+            process = Process(
+                target=_worker,
+                args=(worker, input_queue, self._output_queue),
+                daemon=True,
+            )
+            process.start()
+            self._input_queues.append(input_queue)
+            self._workers.append(process)
+
+    def close(self) -> None:
+        """Stops the worker processes and forgets the registered players."""
+        for input_queue in self._input_queues:
+            input_queue.put("STOP")
+        for process in self._workers:
+            process.join()
+        self._workers = []
+        self._input_queues = []
+        self._output_queue = None
+        self._prototype_ids = OrderedDict()
+        self._next_id = 0
+
+    def __enter__(self) -> "Executor":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def register_players(self, players: List[Player]) -> List[int]:
+        """Sends the players that the workers do not already have.
+
+        Parameters
+        ----------
+        players : list
+            A list of axelrod.Player objects
+
+        Returns
+        -------
+        list
+            The id of the prototype of each player in the workers. Tasks
+            receive the prototypes as a dictionary mapping these ids to
+            players, which should be cloned before being played. The ids of
+            the players of previous calls may have been forgotten, so tasks
+            should only use the ids of the latest call.
+        """
+        self.start()
+        ids = []
+        new_prototypes = {}
+        for player in players:
+            key = _prototype_key(player)
+            if key in self._prototype_ids:
+                self._prototype_ids.move_to_end(key)
+            else:
+                self._prototype_ids[key] = self._next_id
+                new_prototypes[self._next_id] = player
+                self._next_id += 1
+            ids.append(self._prototype_ids[key])
+
+        forgotten = []
+        # The prototypes of this call are the most recently registered
+        in_use = len(set(ids))
+        if self.max_prototypes is not None:
+            while len(self._prototype_ids) > max(self.max_prototypes, in_use):
+                _, prototype_id = self._prototype_ids.popitem(last=False)
+                forgotten.append(prototype_id)
+            self.evictions += len(forgotten)
+
+        if new_prototypes or forgotten:
+            for input_queue in self._input_queues:
+                input_queue.put(("players", new_prototypes, forgotten))
+        return ids
+
+    def map(
+        self,
+        function: Callable,
+        tasks: List[tuple],
+        costs: Optional[List[float]] = None,
+    ) -> Iterator[Tuple[int, int, float, Any]]:
+        """Runs `function(prototypes, *task)` for each task in the workers.
+
+        Parameters
+        ----------
+        function : callable
+            A module level function (so that it can be sent to the workers).
+            Its first argument is the dictionary of registered prototypes.
+        tasks : list
+            The arguments of each call
+        costs : list
+            An estimate of the cost of each task: the most expensive tasks
+            are given to the workers first.
+
+        Yields
+        ------
+        tuple
+            (task index, worker, time taken, value returned by the function)
+            for each task, in the order they are completed.
+        """
+        self.start()
+        self._map_count += 1
+        map_id = self._map_count
+        order = list(range(len(tasks)))
+        if costs is not None:
+            order.sort(key=lambda index: -costs[index])
+        order.reverse()
+
+        def submit(worker):
+            index = order.pop()
+            self._input_queues[worker].put(
+                ("task", map_id, index, function, tasks[index])
+            )
+
+        for _ in range(self.prefetch):
+            for worker in range(self.processes):
+                if order:
+                    submit(worker)
+
+        remaining = len(tasks)
+        while remaining:
+            (
+                worker,
+                task_map_id,
+                index,
+                elapsed,
+                value,
+                error,
+            ) = self._output_queue.get()
+            if order:
+                submit(worker)
+            if task_map_id != map_id:
+                # A task of a previous map that was interrupted
+                continue
+            if error is not None:
+                raise error
+            remaining -= 1
+            yield index, worker, elapsed, value
+
+
+def _worker(worker: int, input_queue: Queue, output_queue: Queue) -> None:
+    """The loop run by each worker process."""
+    prototypes = {}  # type: Dict[int, Player]
+    for message in iter(input_queue.get, "STOP"):
+        if message[0] == "players":
+            _, new_prototypes, forgotten = message
+            prototypes.update(new_prototypes)
+            for prototype_id in forgotten:
+                del prototypes[prototype_id]
+            continue
+        _, map_id, index, function, task = message
+        start = time.perf_counter()
+        value, error = None, None
+        try:
+            value = function(prototypes, *task)
+        except Exception as e:
+            error = e
+        elapsed = time.perf_counter() - start
+        output_queue.put((worker, map_id, index, elapsed, value, error))
@@ -9,6 +9,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import tqdm
 from axelrod import Player
+from axelrod.interaction_store import BinaryInteractions, is_binary_file
 from axelrod.interaction_utils import (
     compute_final_score_per_turn,
     read_interactions_from_file,
@@ -283,6 +284,8 @@ class AshlockFingerprint(object):
         filename: str = None,
         progress_bar: bool = True,
         seed: int = None,
+        executor: axl.Executor = None,
+        deterministic_cache: axl.DeterministicCache = None,
     ) -> dict:
         """Build and play the spatial tournament.
 
@@ -310,6 +313,12 @@ class AshlockFingerprint(object):
             Whether or not to create a progress bar which will be updated
         seed : int, optional
             Random seed for reproducibility
+        executor : axelrod.Executor, optional
+            A pool of worker processes, reused between fingerprints, to play
+            the matches. If given, `processes` is ignored.
+        deterministic_cache : axelrod.DeterministicCache, optional
+            A cache of the results of deterministic matches, such as an
+            axelrod.PersistentDeterministicCache reused between fingerprints.
 
         Returns
         ----------
@@ -333,12 +342,14 @@ class AshlockFingerprint(object):
             repetitions=repetitions,
             edges=edges,
             seed=seed,
+            deterministic_cache=deterministic_cache,
         )
         self.spatial_tournament.play(
             build_results=False,
             filename=filename,
             processes=processes,
             progress_bar=progress_bar,
+            executor=executor,
         )
 
         self.interactions = read_interactions_from_file(
@@ -441,6 +452,8 @@ class TransitiveFingerprint(object):
         filename: str = None,
         progress_bar: bool = True,
         seed: int = None,
+        executor: axl.Executor = None,
+        deterministic_cache: axl.DeterministicCache = None,
     ) -> np.ndarray:
         """Creates a spatial tournament to run the necessary matches to obtain
         fingerprint data.
@@ -462,6 +475,14 @@ class TransitiveFingerprint(object):
             if None, a filename will be generated.
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        seed : int, optional
+            Random seed for reproducibility
+        executor : axelrod.Executor, optional
+            A pool of worker processes, reused between fingerprints, to play
+            the matches. If given, `processes` is ignored.
+        deterministic_cache : axelrod.DeterministicCache, optional
+            A cache of the results of deterministic matches, such as an
+            axelrod.PersistentDeterministicCache reused between fingerprints.
 
         Returns
         ----------
@@ -488,12 +509,14 @@ class TransitiveFingerprint(object):
             noise=noise,
             repetitions=repetitions,
             seed=seed,
+            deterministic_cache=deterministic_cache,
         )
         tournament.play(
             filename=filename,
             build_results=False,
             progress_bar=progress_bar,
             processes=processes,
+            executor=executor,
         )
 
         self.data = self.analyse_cooperation_ratio(filename)
@@ -515,7 +538,8 @@ class TransitiveFingerprint(object):
         Parameters
         ----------
         filename : str
-            The filename of the interactions
+            The filename of the interactions, either a csv file or a binary
+            file (see axelrod.interaction_store)
 
         Returns
         ----------
@@ -524,6 +548,23 @@ class TransitiveFingerprint(object):
             opponent in each turn. The ith row corresponds to the ith opponent
             and the jth column the jth turn.
         """
+        if is_binary_file(filename):
+            interactions = BinaryInteractions(filename)
+            cooperation_rates = {}
+            player_rows = np.flatnonzero(interactions.rows["Player index"] == 0)
+            for index in player_rows:
+                opponent_index = int(interactions.rows[index]["Opponent index"])
+                cooperations = 1 - interactions.defections(index)
+                cooperation_rates.setdefault(opponent_index, []).append(
+                    cooperations
+                )
+            return np.array(
+                [
+                    np.mean(cooperation_rates[index], axis=0)
+                    for index in sorted(cooperation_rates)
+                ]
+            )
+
         did_c = np.vectorize(
             lambda actions: [int(action == "C") for action in actions]
         )
@@ -1,4 +1,4 @@
-from typing import Tuple, Union
+from typing import Dict, Tuple, Union
 from enum import Enum
 
 import numpy as np
@@ -17,10 +17,20 @@ class AsymmetricGame(object):
     ----------
     scores: dict
         The numerical score attribute to all combinations of action pairs.
+    payoff_table: np.array
+        The scores of both players for each state of the game, with shape
+        (number of states, 2). The state of a pair (row, col) is
+        row * number of columns + col: for a 2x2 game the states 0 to 3 are
+        (C, C), (C, D), (D, C) and (D, D). This is None if the matrices do not
+        have the same shape.
+    action_payoff_table: np.array
+        The scores of both players for each pair of Actions (C, C), (C, D),
+        (D, C) and (D, D), with shape (4, 2), whatever the size of the game:
+        the pair (row, col) of Actions is at row 2 * row.value + col.value.
     """
 
     # pylint: disable=invalid-name
-    def __init__(self, A: np.array, B: np.array) -> None:
+    def __init__(self, A: np.ndarray, B: np.ndarray) -> None:
         """
         Creates an asymmetric game from two matrices.
 
@@ -41,9 +51,30 @@ class AsymmetricGame(object):
         self.A = A
         self.B = B
 
+        # Both matrices are indexed by (row, col) so the payoff table is only
+        # defined when they have the same shape.
+        self.payoff_table = None
+        if A.shape == B.shape:
+            self.payoff_table = np.stack([A.ravel(), B.ravel()], axis=1)
+
+        # The scores of every pair of integer actions and, for the first two
+        # actions, of the corresponding pairs of Actions, so that `score` is
+        # a single lookup.
+        self._pair_scores = {}  # type: Dict[tuple, tuple]
+        rows, cols = np.minimum(A.shape, B.shape)
+        for row in range(rows):
+            for col in range(cols):
+                scores = (A[row][col], B[row][col])
+                self._pair_scores[(row, col)] = scores
+                if row < 2 and col < 2:
+                    self._pair_scores[(Action(row), Action(col))] = scores
+
         self.scores = {
             pair: self.score(pair) for pair in ((C, C), (D, D), (C, D), (D, C))
         }
+        self.action_payoff_table = np.array(
+            [self.scores[pair] for pair in ((C, C), (C, D), (D, C), (D, D))]
+        )
 
     def score(
         self, pair: Union[Tuple[Action, Action], Tuple[int, int]]
@@ -65,6 +96,11 @@ class AsymmetricGame(object):
             Scores for two player resulting from their actions.
         """
 
+        try:
+            return self._pair_scores[pair]
+        except (KeyError, TypeError):
+            pass
+
         # if an Action has been passed to the method,
         # get which integer the Action corresponds to
         def get_value(x):
@@ -75,6 +111,45 @@ class AsymmetricGame(object):
 
         return (self.A[row][col], self.B[row][col])
 
+    def states(self, rows, cols) -> np.ndarray:
+        """Returns the states of pairs of integer actions.
+
+        Parameters
+        ----------
+        rows: int or np.array
+            The actions of the row player.
+        cols: int or np.array
+            The actions of the column player.
+
+        Returns
+        -------
+        np.array
+            The indices of the states in the payoff table.
+        """
+        return np.asarray(rows) * self.A.shape[1] + np.asarray(cols)
+
+    def score_many(self, states) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the scores of many states at once.
+
+        Parameters
+        ----------
+        states: np.array
+            An array of integer states, as returned by `states`.
+
+        Returns
+        -------
+        tuple of np.array
+            The scores of the row player and of the column player for each
+            state.
+        """
+        if self.payoff_table is None:
+            raise ValueError(
+                "The payoff table is only defined for games whose matrices "
+                "have the same shape."
+            )
+        payoffs = self.payoff_table[states]
+        return payoffs[..., 0], payoffs[..., 1]
+
     def __repr__(self) -> str:
         return "Axelrod game with matrices: {}".format((self.A, self.B))
 
@@ -138,3 +138,223 @@ class LimitedHistory(History):
             first_play, first_coplay = self._plays.pop(0), self._coplays.pop(0)
             self._actions[first_play] -= 1
             self._state_distribution[(first_play, first_coplay)] -= 1
+
+
+# Integer coding of the (play, coplay) states: 2 * play + coplay with C = 0
+# and D = 1.
+_STATES = ((C, C), (C, D), (D, C), (D, D))
+_PLAYS = (C, C, D, D)
+_COPLAYS = (C, D, C, D)
+_FLIPPED_STATES = bytes([2, 3, 0, 1]) + bytes(252)
+
+
+def _state(play, coplay):
+    """Returns the integer code of a (play, coplay) pair."""
+    return (2 if play is D else 0) + (1 if coplay is D else 0)
+
+
+class CompactHistory(History):
+    """
+    History class storing each turn as a single byte in a growable buffer.
+
+    The turn (play, coplay) is coded as 2 * play + coplay (C = 0, D = 1) and
+    the number of times each state occurred is kept as plain integers, so that
+    appending does not update any dictionaries. This has the same interface as
+    History: indexing and slicing return actions of the player.
+    """
+
+    def __init__(self, plays=None, coplays=None):
+        """
+        Parameters
+        ----------
+        plays:
+            An ordered iterable of the actions of the player.
+        coplays:
+            An ordered iterable of the actions of the coplayer (aka opponent).
+        """
+        self._states = bytearray()
+        self._state_counts = [0, 0, 0, 0]
+        if plays:
+            self.extend(plays, coplays)
+
+    def append(self, play, coplay):
+        """Appends a new (play, coplay) pair an updates metadata for
+        number of cooperations and defections, and the state distribution."""
+        state = _state(play, coplay)
+        self._states.append(state)
+        self._state_counts[state] += 1
+
+    def copy(self):
+        """Returns a new object with the same data."""
+        new = self.__class__()
+        new._states = bytearray(self._states)
+        new._state_counts = list(self._state_counts)
+        return new
+
+    def flip_plays(self):
+        """Creates a flipped plays history for use with DualTransformer."""
+        new = self.__class__()
+        new._states = self._states.translate(_FLIPPED_STATES)
+        counts = self._state_counts
+        new._state_counts = [counts[2], counts[3], counts[0], counts[1]]
+        return new
+
+    def extend(self, plays, coplays):
+        """A function that emulates list.extend."""
+        for play, coplay in zip(plays, coplays):
+            self.append(play, coplay)
+
+    def reset(self):
+        """Clears all data in the History object."""
+        self._states = bytearray()
+        self._state_counts = [0, 0, 0, 0]
+
+    @property
+    def _plays(self):
+        return [_PLAYS[state] for state in self._states]
+
+    @property
+    def _coplays(self):
+        return [_COPLAYS[state] for state in self._states]
+
+    @property
+    def coplays(self):
+        return self._coplays
+
+    @property
+    def cooperations(self):
+        return self._state_counts[0] + self._state_counts[1]
+
+    @property
+    def defections(self):
+        return self._state_counts[2] + self._state_counts[3]
+
+    @property
+    def state_distribution(self):
+        return Counter(
+            {
+                state: count
+                for state, count in zip(_STATES, self._state_counts)
+                if count
+            }
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return self._plays == other
+        elif isinstance(other, CompactHistory):
+            return bytes(self._states) == bytes(other._states)
+        elif isinstance(other, History):
+            return (
+                self._plays == other._plays and self._coplays == other._coplays
+            )
+        raise TypeError("Cannot compare types.")
+
+    def __getitem__(self, key):
+        try:
+            return _PLAYS[self._states[key]]
+        except TypeError:
+            # A slice
+            return [_PLAYS[state] for state in self._states[key]]
+
+    def __iter__(self):
+        return (_PLAYS[state] for state in self._states)
+
+    def __contains__(self, action):
+        if action is C:
+            return self.cooperations > 0
+        if action is D:
+            return self.defections > 0
+        return False
+
+    def __str__(self):
+        return actions_to_str(self)
+
+    def __list__(self):
+        return self._plays
+
+    def __len__(self):
+        return len(self._states)
+
+
+class CompactLimitedHistory(CompactHistory):
+    """
+    CompactHistory class that only tracks the last N rounds, stored in a ring
+    buffer so that appending is O(1).
+    """
+
+    def __init__(self, memory_depth, plays=None, coplays=None):
+        """
+        Parameters
+        ----------
+        memory_depth, int:
+            length of history to retain
+        """
+        self.memory_depth = memory_depth
+        super().__init__(plays=plays, coplays=coplays)
+
+    def reset(self):
+        """Clears all data in the History object."""
+        self._buffer = bytearray(self.memory_depth)
+        self._start = 0
+        self._length = 0
+        self._state_counts = [0, 0, 0, 0]
+
+    @property
+    def _states(self):
+        """The stored states, oldest first."""
+        end = self._start + self._length
+        if end <= self.memory_depth:
+            return self._buffer[self._start : end]
+        return (
+            self._buffer[self._start :]
+            + self._buffer[: end - self.memory_depth]
+        )
+
+    @_states.setter
+    def _states(self, states):
+        self.reset()
+        for state in states:
+            self._append_state(state)
+
+    def _append_state(self, state):
+        if self.memory_depth == 0:
+            return
+        self._state_counts[state] += 1
+        if self._length < self.memory_depth:
+            index = (self._start + self._length) % self.memory_depth
+            self._length += 1
+        else:
+            index = self._start
+            self._state_counts[self._buffer[index]] -= 1
+            self._start = (self._start + 1) % self.memory_depth
+        self._buffer[index] = state
+
+    def append(self, play, coplay):
+        """Appends a new (play, coplay) pair an updates metadata for
+        number of cooperations and defections, and the state distribution."""
+        self._append_state(_state(play, coplay))
+
+    def copy(self):
+        """Returns a new object with the same data."""
+        new = self.__class__(self.memory_depth)
+        new._states = self._states
+        return new
+
+    def flip_plays(self):
+        """Creates a flipped plays history for use with DualTransformer."""
+        new = self.__class__(self.memory_depth)
+        new._states = self._states.translate(_FLIPPED_STATES)
+        return new
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [_PLAYS[state] for state in self._states[key]]
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("History index out of range")
+        return _PLAYS[self._buffer[(self._start + key) % self.memory_depth]]
+
+    def __len__(self):
+        return self._length
@@ -0,0 +1,356 @@
+"""A compact binary file format for the interactions of a tournament.
+
+The csv file written by a tournament holds two rows per interaction, with the
+full string of actions and around 20 derived columns as text. This module
+writes the same rows in a binary format:
+
+- the numeric columns are stored as a table of fixed width records (one record
+  per row, see ROW_DTYPE) that can be memory-mapped as a numpy array,
+- the actions of each row are bit-packed (C = 0, D = 1) into a separate block,
+- the names of the players and the parameters of the tournament are kept in a
+  json metadata block.
+
+The scores are stored as floats and, if all the scores written were integers
+(as with the default game), read back as integers.
+
+The layout of a file is:
+
+    MAGIC | records | packed actions | metadata | metadata offset | MAGIC
+
+The metadata is written once all the records are known, the offset at the
+end of the file allows it to be found.
+"""
+
+import json
+import struct
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+from axelrod.action import Action
+
+C, D = Action.C, Action.D
+# The pair of actions of each code 2 * play + coplay, C = 0 and D = 1
+_PAIRS = [(C, C), (C, D), (D, C), (D, D)]
+
+MAGIC = b"AXLINT01"
+_TRAILER = struct.Struct("<Q")
+
+ROW_DTYPE = np.dtype(
+    [
+        ("Interaction index", np.int64),
+        ("Player index", np.int32),
+        ("Opponent index", np.int32),
+        ("Repetition", np.int32),
+        ("Score", np.float64),
+        ("Score difference", np.float64),
+        ("Turns", np.int32),
+        ("Score per turn", np.float64),
+        ("Score difference per turn", np.float64),
+        ("Win", np.int8),
+        ("Initial cooperation", np.bool_),
+        ("Cooperation count", np.int32),
+        ("CC count", np.int32),
+        ("CD count", np.int32),
+        ("DC count", np.int32),
+        ("DD count", np.int32),
+        ("CC to C count", np.int32),
+        ("CC to D count", np.int32),
+        ("CD to C count", np.int32),
+        ("CD to D count", np.int32),
+        ("DC to C count", np.int32),
+        ("DC to D count", np.int32),
+        ("DD to C count", np.int32),
+        ("DD to D count", np.int32),
+        ("Good partner", np.int8),
+        ("Actions offset", np.int64),
+    ]
+)
+
+INDEX_COLUMNS = [
+    "Interaction index",
+    "Player index",
+    "Opponent index",
+    "Repetition",
+]
+RESULT_COLUMNS = [
+    name
+    for name in ROW_DTYPE.names
+    if name not in INDEX_COLUMNS and name != "Actions offset"
+]
+SCORE_COLUMNS = ["Score", "Score difference"]
+
+_D = ord("D")
+
+
+def is_binary_file(filename: str) -> bool:
+    """Returns True if the file is a binary interactions file."""
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def pack_actions(actions: str) -> bytes:
+    """Bit-packs a string of actions such as 'CDDC'."""
+    return np.packbits(
+        np.frombuffer(actions.encode(), dtype=np.uint8) == _D
+    ).tobytes()
+
+
+class BinaryInteractionWriter(object):
+    """Writes the rows of a tournament to a binary interactions file.
+
+    This is used by the Tournament class in place of a csv.writer: rows are
+    given in the same format through `writerow` and the file is completed
+    when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        players: List[str],
+        build_results: bool = True,
+        metadata: Optional[dict] = None,
+        buffer_size: int = 10000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        filename : string
+            The file to write to
+        players : list
+            The names of the players
+        build_results : bool
+            Whether the rows contain the results of the interactions
+        metadata : dict
+            Any other (json serialisable) information to store, such as the
+            parameters of the tournament
+        buffer_size : int
+            The number of rows kept in memory before writing them to file
+        """
+        self.filename = filename
+        self.metadata = dict(metadata or {})
+        self.metadata["players"] = list(players)
+        self.metadata["build_results"] = build_results
+        self.buffer_size = buffer_size
+
+        self._file = open(filename, "wb")
+        self._file.write(MAGIC)
+        self._actions_file = tempfile.TemporaryFile()
+        self._actions_size = 0
+        self._num_rows = 0
+        self._rows = []  # type: List[tuple]
+        self._empty_results = (0,) * len(RESULT_COLUMNS)
+        self._integer_scores = True
+
+    def writerow(self, row: list) -> None:
+        """Buffers a row in the format written to csv by the Tournament."""
+        (
+            interaction_index,
+            player_index,
+            opponent_index,
+            repetition,
+            _,
+            _,
+            actions,
+        ) = row[:7]
+        results = tuple(row[7:]) or self._empty_results
+        packed = pack_actions(actions)
+        if not row[7:]:
+            results = (0, 0, len(actions)) + results[3:]
+        elif self._integer_scores and not (
+            isinstance(results[0], (int, np.integer))
+            and isinstance(results[1], (int, np.integer))
+        ):
+            self._integer_scores = False
+        self._rows.append(
+            (interaction_index, player_index, opponent_index, repetition)
+            + results
+            + (self._actions_size,)
+        )
+        self._actions_file.write(packed)
+        self._actions_size += len(packed)
+        if len(self._rows) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered rows to file."""
+        if self._rows:
+            self._file.write(np.array(self._rows, dtype=ROW_DTYPE).tobytes())
+            self._num_rows += len(self._rows)
+            self._rows = []
+
+    def close(self) -> None:
+        """Completes the file with the packed actions and the metadata."""
+        if self._file.closed:
+            return
+        self.flush()
+        actions_offset = len(MAGIC) + self._num_rows * ROW_DTYPE.itemsize
+        self._actions_file.seek(0)
+        while True:
+            block = self._actions_file.read(2**20)
+            if not block:
+                break
+            self._file.write(block)
+        self._actions_file.close()
+
+        metadata_offset = actions_offset + self._actions_size
+        self.metadata["num_rows"] = self._num_rows
+        self.metadata["actions_offset"] = actions_offset
+        self.metadata["actions_size"] = self._actions_size
+        self.metadata["score_dtype"] = (
+            "int64" if self._integer_scores else "float64"
+        )
+        self._file.write(json.dumps(self.metadata).encode())
+        self._file.write(_TRAILER.pack(metadata_offset))
+        self._file.write(MAGIC)
+        self._file.close()
+
+
+class BinaryInteractions(object):
+    """Memory-mapped read access to a binary interactions file.
+
+    Attributes
+    ----------
+    metadata : dict
+        The metadata of the file (players, build_results, tournament
+        parameters...)
+    players : list
+        The names of the players
+    rows : numpy.memmap
+        The records of the file, with fields given by ROW_DTYPE
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        with open(filename, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(
+                    "{} is not a binary interactions file.".format(filename)
+                )
+            f.seek(-(_TRAILER.size + len(MAGIC)), 2)
+            end = f.tell()
+            (metadata_offset,) = _TRAILER.unpack(f.read(_TRAILER.size))
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(
+                    "{} is an incomplete binary interactions file.".format(
+                        filename
+                    )
+                )
+            f.seek(metadata_offset)
+            self.metadata = json.loads(f.read(end - metadata_offset).decode())
+
+        self.players = self.metadata["players"]
+        self.build_results = self.metadata["build_results"]
+        # Files written before the dtype was recorded give float scores
+        self.score_dtype = np.dtype(self.metadata.get("score_dtype", "float64"))
+        num_rows = self.metadata["num_rows"]
+        if num_rows:
+            self.rows = np.memmap(
+                filename,
+                dtype=ROW_DTYPE,
+                mode="r",
+                offset=len(MAGIC),
+                shape=(num_rows,),
+            )
+        else:
+            self.rows = np.zeros(0, dtype=ROW_DTYPE)
+        if self.metadata["actions_size"]:
+            self._actions = np.memmap(
+                filename,
+                dtype=np.uint8,
+                mode="r",
+                offset=self.metadata["actions_offset"],
+                shape=(self.metadata["actions_size"],),
+            )
+        else:
+            self._actions = np.zeros(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def defections(self, index: int) -> np.ndarray:
+        """Returns an array of the actions of a row, 1 for a defection."""
+        row = self.rows[index]
+        turns = int(row["Turns"])
+        start = int(row["Actions offset"])
+        packed = self._actions[start : start + (turns + 7) // 8]
+        return np.unpackbits(packed)[:turns]
+
+    def actions(self, index: int) -> List[Action]:
+        """Returns the actions of a row."""
+        return [(C, D)[d] for d in self.defections(index)]
+
+    def dataframe(self, start: int = 0, stop: Optional[int] = None):
+        """Returns the numeric columns of rows start to stop as a pandas
+        DataFrame with the same column names as the csv file."""
+        import pandas as pd
+
+        rows = self.rows[start:stop]
+        columns = INDEX_COLUMNS[:]
+        if self.build_results:
+            columns += RESULT_COLUMNS
+        data = {name: np.array(rows[name]) for name in columns}
+        if self.build_results:
+            for name in SCORE_COLUMNS:
+                data[name] = data[name].astype(self.score_dtype)
+        return pd.DataFrame(data)
+
+    def dask_dataframe(self, chunksize: int = 2**18):
+        """Returns the numeric columns as a dask DataFrame, reading chunks of
+        `chunksize` rows from the memory-mapped file as needed."""
+        import dask
+        import dask.dataframe as dd
+
+        meta = self.dataframe(0, 0)
+        bounds = list(range(0, len(self), chunksize)) or [0]
+        parts = [
+            dask.delayed(_read_dataframe)(
+                self.filename, start, start + chunksize
+            )
+            for start in bounds
+        ]
+        return dd.from_delayed(parts, meta=meta)
+
+    def interactions(self) -> Dict[tuple, List[list]]:
+        """Returns a dictionary mapping tuples of player pairs to lists of
+        interactions, as `interaction_utils.read_interactions_from_file`.
+
+        The actions of all the rows are unpacked at once: only the lists of
+        pairs of actions are built in Python.
+        """
+        pairs_to_interactions = defaultdict(list)
+        rows = self.rows
+        if not len(rows):
+            return pairs_to_interactions
+        bits = np.unpackbits(self._actions)
+        plays = _unpack_rows(bits, rows[0::2])
+        coplays = _unpack_rows(bits, rows[1::2])
+        codes = (2 * plays + coplays).tolist()
+        stops = np.cumsum(rows["Turns"][0::2], dtype=np.int64).tolist()
+        keys = zip(
+            rows["Player index"][0::2].tolist(),
+            rows["Opponent index"][0::2].tolist(),
+        )
+        start = 0
+        for key, stop in zip(keys, stops):
+            pairs_to_interactions[key].append(
+                [_PAIRS[code] for code in codes[start:stop]]
+            )
+            start = stop
+        return pairs_to_interactions
+
+
+def _unpack_rows(bits: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Returns the concatenated actions of the rows, 1 for a defection, from
+    the unpacked bits of the actions block."""
+    turns = rows["Turns"].astype(np.int64)
+    starts = rows["Actions offset"].astype(np.int64) * 8
+    # Position of each turn: the start of its row plus its turn in the row
+    first_turns = np.cumsum(turns) - turns
+    index = np.repeat(starts - first_turns, turns) + np.arange(turns.sum())
+    return bits[index]
+
+
+def _read_dataframe(filename: str, start: int, stop: int):
+    return BinaryInteractions(filename).dataframe(start, stop)
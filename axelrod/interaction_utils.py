@@ -6,62 +6,225 @@ form:
 
 This is used by both the Match class and the ResultSet class which analyse
 interactions.
+
+All the metrics of a match are computed in a single pass by
+`compute_batch_metrics`, which codes the interactions as arrays of integers
+(0 for C and 1 for D) and looks up the payoffs of all turns at once. The
+`compute_*` functions below are thin wrappers around it.
 """
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, namedtuple
 
-import pandas as pd
+import numpy as np
 import tqdm
 from axelrod.action import Action, str_to_actions
+from axelrod.interaction_store import BinaryInteractions, is_binary_file
 
-from .game import Game
+from .game import DefaultGame
 
 C, D = Action.C, Action.D
 
+# The states of a turn, in the order of their integer codes: 2 * (action of
+# the first player) + (action of the second player)
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+InteractionMetrics = namedtuple(
+    "InteractionMetrics",
+    [
+        "turns",
+        "scores",
+        "cooperations",
+        "initial_cooperations",
+        "state_counts",
+        "state_to_action_counts",
+        "winner_index",
+    ],
+)
+InteractionMetrics.__doc__ = """The metrics of a batch of interactions.
+
+Each field is an array whose first axis is the interaction in the batch:
+
+- turns: the number of turns,
+- scores: the total score of each player, shape (n, 2),
+- cooperations: the number of cooperations of each player, shape (n, 2),
+- initial_cooperations: whether each player cooperated on the first turn,
+  shape (n, 2),
+- state_counts: the number of turns in each of STATES, shape (n, 4),
+- state_to_action_counts: for each player, the number of times it played
+  each action (C then D) on the turn after each of STATES, shape (n, 2, 4, 2),
+- winner_index: the index of the player with the highest score, -1 if the
+  scores are equal, shape (n,).
+"""
+
+
+def interactions_to_array(interactions):
+    """Returns an interaction as an array of shape (turns, 2) of integer codes:
+    0 for C and 1 for D. Arrays are returned unchanged and other iterables of
+    pairs of actions (such as a zip of two histories) are accepted."""
+    if isinstance(interactions, np.ndarray):
+        return interactions
+    count = 2 * len(interactions) if hasattr(interactions, "__len__") else -1
+    return np.fromiter(
+        (action is D for plays in interactions for action in plays),
+        dtype=np.uint8,
+        count=count,
+    ).reshape(-1, 2)
+
+
+def compute_batch_metrics(batch, game=None):
+    """
+    Computes all the metrics of a batch of interactions in a single pass.
+
+    Parameters
+    ----------
+    batch : list or numpy.ndarray
+        A list of interactions (lists of pairs of actions or integer coded
+        arrays of shape (turns, 2)), for example all the repetitions of a
+        match, or an array of shape (n, turns, 2).
+    game : axelrod.Game
+        The game used to score the interactions
+
+    Returns
+    -------
+    InteractionMetrics
+    """
+    if not game:
+        game = DefaultGame
+    table = game.action_payoff_table
+    arrays = [interactions_to_array(interactions) for interactions in batch]
+    size = len(arrays)
+    turns = np.array([len(array) for array in arrays], dtype=np.int64)
+    length = int(turns.max()) if size else 0
+
+    # Pad the interactions to a common length with the code 4, which is not
+    # a state, so that the padding is ignored in the counts.
+    codes = np.zeros((size, length, 2), dtype=np.int64)
+    for row, array in enumerate(arrays):
+        codes[row, : len(array)] = array
+    valid = np.arange(length) < turns[:, None]
+    states = np.where(valid, 2 * codes[:, :, 0] + codes[:, :, 1], 4)
+
+    rows = np.arange(size)[:, None]
+    state_counts = np.bincount(
+        (5 * rows + states).ravel(), minlength=5 * size
+    ).reshape(size, 5)[:, :4]
+
+    defections = (codes * valid[:, :, None]).sum(axis=1)
+    cooperations = turns[:, None] - defections
+    initial_cooperations = np.zeros((size, 2), dtype=bool)
+    if length:
+        initial_cooperations = (codes[:, 0, :] == 0) & (turns[:, None] > 0)
+
+    # For each turn after the first: the previous state, the player and its
+    # action.
+    previous = states[:, :-1, None]
+    actions = codes[:, 1:, :]
+    transitions = np.where(
+        valid[:, 1:, None],
+        16 * rows[:, :, None] + 4 * previous + 2 * np.arange(2) + actions,
+        16 * size,
+    )
+    state_to_action_counts = (
+        np.bincount(transitions.ravel(), minlength=16 * size + 1)[:-1]
+        .reshape(size, 4, 2, 2)
+        .transpose(0, 2, 1, 3)
+    )
+
+    if np.issubdtype(table.dtype, np.integer):
+        scores = state_counts @ table
+    else:
+        # Sum the payoffs turn by turn, as a sequential sum of floats does.
+        padded_table = np.vstack([table, np.zeros((1, 2), dtype=table.dtype)])
+        payoffs = padded_table[states]
+        scores = np.zeros((size, 2), dtype=table.dtype)
+        if length:
+            scores = np.add.accumulate(payoffs, axis=1)[:, -1]
+
+    winner_index = np.where(
+        scores[:, 0] == scores[:, 1], -1, np.argmax(scores, axis=1)
+    )
+
+    return InteractionMetrics(
+        turns=turns,
+        scores=scores,
+        cooperations=cooperations,
+        initial_cooperations=initial_cooperations,
+        state_counts=state_counts,
+        state_to_action_counts=state_to_action_counts,
+        winner_index=winner_index,
+    )
+
+
+def compute_metrics(interactions, game=None):
+    """Computes all the metrics of a single interaction: each field of the
+    returned InteractionMetrics is that of `compute_batch_metrics` for this
+    interaction."""
+    metrics = compute_batch_metrics([interactions], game)
+    return InteractionMetrics(*(field[0] for field in metrics))
+
+
+def state_distribution_from_counts(state_counts):
+    """Returns the Counter of states of `compute_state_distribution` from
+    the state counts of InteractionMetrics."""
+    return Counter(
+        {
+            state: int(count)
+            for state, count in zip(STATES, state_counts)
+            if count
+        }
+    )
+
+
+def state_to_action_distribution_from_counts(state_to_action_counts):
+    """Returns the list of Counters of `compute_state_to_action_distribution`
+    from the state to action counts of InteractionMetrics."""
+    return [
+        Counter(
+            {
+                (state, action): int(counts[s, a])
+                for s, state in enumerate(STATES)
+                for a, action in enumerate((C, D))
+                if counts[s, a]
+            }
+        )
+        for counts in state_to_action_counts
+    ]
+
 
 def compute_scores(interactions, game=None):
     """Returns the scores of a given set of interactions."""
     if not game:
-        game = Game()
-    return [game.score(plays) for plays in interactions]
+        game = DefaultGame
+    array = interactions_to_array(interactions)
+    payoffs = game.action_payoff_table[2 * array[:, 0] + array[:, 1]]
+    return [tuple(scores) for scores in payoffs.tolist()]
 
 
 def compute_final_score(interactions, game=None):
     """Returns the final score of a given set of interactions."""
-    scores = compute_scores(interactions, game)
-    if len(scores) == 0:
+    interactions = interactions_to_array(interactions)
+    if len(interactions) == 0:
         return None
-
-    final_score = tuple(
-        sum([score[player_index] for score in scores])
-        for player_index in [0, 1]
-    )
-    return final_score
+    return tuple(compute_metrics(interactions, game).scores.tolist())
 
 
 def compute_final_score_per_turn(interactions, game=None):
     """Returns the mean score per round for a set of interactions"""
-    scores = compute_scores(interactions, game)
-    num_turns = len(interactions)
-
-    if len(scores) == 0:
+    interactions = interactions_to_array(interactions)
+    if len(interactions) == 0:
         return None
-
-    final_score_per_turn = tuple(
-        sum([score[player_index] for score in scores]) / num_turns
-        for player_index in [0, 1]
-    )
-    return final_score_per_turn
+    scores = compute_metrics(interactions, game).scores
+    return tuple((scores / len(interactions)).tolist())
 
 
 def compute_winner_index(interactions, game=None):
     """Returns the index of the winner of the Match"""
-    scores = compute_final_score(interactions, game)
-
-    if scores is not None:
-        if scores[0] == scores[1]:
-            return False  # No winner
-        return max([0, 1], key=lambda i: scores[i])
-    return None
+    interactions = interactions_to_array(interactions)
+    if len(interactions) == 0:
+        return None
+    winner_index = int(compute_metrics(interactions, game).winner_index)
+    if winner_index == -1:
+        return False  # No winner
+    return winner_index
 
 
 def compute_cooperations(interactions):
@@ -71,11 +234,7 @@ def compute_cooperations(interactions):
     if len(interactions) == 0:
         return None
 
-    cooperation = tuple(
-        sum([play[player_index] == C for play in interactions])
-        for player_index in [0, 1]
-    )
-    return cooperation
+    return tuple(compute_metrics(interactions).cooperations.tolist())
 
 
 def compute_normalised_cooperation(interactions):
@@ -108,9 +267,11 @@ def compute_state_distribution(interactions):
         Dictionary where the keys are the states and the values are the number
         of times that state occurs.
     """
-    if not interactions:
+    if len(interactions) == 0:
         return None
-    return Counter(interactions)
+    return state_distribution_from_counts(
+        compute_metrics(interactions).state_counts
+    )
 
 
 def compute_normalised_state_distribution(interactions):
@@ -129,10 +290,10 @@ def compute_normalised_state_distribution(interactions):
         Dictionary where the keys are the states and the values are a normalized
         count of the number of times that state occurs.
     """
-    if not interactions:
+    if len(interactions) == 0:
         return None
 
-    interactions_count = Counter(interactions)
+    interactions_count = compute_state_distribution(interactions)
     total = sum(interactions_count.values(), 0)
 
     normalized_count = Counter(
@@ -170,19 +331,12 @@ def compute_state_to_action_distribution(interactions):
         the values the counts. The
         first/second Counter corresponds to the first/second player.
     """
-    if not interactions:
+    if len(interactions) == 0:
         return None
 
-    distributions = [
-        Counter(
-            [
-                (state, outcome[j])
-                for state, outcome in zip(interactions, interactions[1:])
-            ]
-        )
-        for j in range(2)
-    ]
-    return distributions
+    return state_to_action_distribution_from_counts(
+        compute_metrics(interactions).state_to_action_counts
+    )
 
 
 def compute_normalised_state_to_action_distribution(interactions):
@@ -255,7 +409,15 @@ def read_interactions_from_file(filename, progress_bar=True):
     """
     Reads a file and returns a dictionary mapping tuples of player pairs to
     lists of interactions
+
+    The file can either be a csv file or a binary file (see
+    axelrod.interaction_store).
     """
+    if is_binary_file(filename):
+        return BinaryInteractions(filename).interactions()
+
+    import pandas as pd
+
     df = pd.read_csv(filename)[
         ["Interaction index", "Player index", "Opponent index", "Actions"]
     ]
@@ -264,7 +426,7 @@ def read_interactions_from_file(filename, progress_bar=True):
         groupby = tqdm.tqdm(groupby)
 
     pairs_to_interactions = defaultdict(list)
-    for _, d in tqdm.tqdm(groupby):
+    for _, d in groupby:
         key = tuple(d[["Player index", "Opponent index"]].iloc[0])
         value = list(map(str_to_actions, zip(*d["Actions"])))
         pairs_to_interactions[key].append(value)
@@ -1,7 +1,9 @@
+from collections import Counter
 from math import ceil, log
+from typing import NamedTuple, Tuple
 
 import axelrod.interaction_utils as iu
-from axelrod import DEFAULT_TURNS, Classifiers
+from axelrod import DEFAULT_TURNS, Classifiers, vectorized
 from axelrod.action import Action
 from axelrod.deterministic_cache import DeterministicCache
 from axelrod.game import Game
@@ -16,8 +18,34 @@ def is_stochastic(players, noise):
     return noise or any(map(Classifiers["stochastic"], players))
 
 
+class MatchPlan(NamedTuple):
+    """The decisions a match makes before playing, which only depend on its
+    players, noise and cache."""
+
+    stochastic: bool
+    # Whether the results can be read from and written to the cache.
+    cacheable: bool
+    # Whether each player is stochastic and so is seeded before playing.
+    seeded: Tuple[bool, bool]
+    cache_key: tuple
+
+
 class Match(object):
-    """The Match class conducts matches between two players."""
+    """The Match class conducts matches between two players.
+
+    The class attribute `counters` counts, over all matches played in this
+    process, how many match plans were computed ("plans") and reused
+    ("plan_reuses") and how each play was obtained: from the deterministic
+    cache ("cache_hits"), by playing a deterministic match that was not
+    cached ("cache_misses") or by playing a stochastic match
+    ("stochastic_plays"). It also counts the plays that were vectorized
+    ("vectorized_plays"), the results written to the cache ("cache_writes"),
+    the cycles found by matches that detect cycles ("cycles_detected") and
+    the turns that were not played because of them ("turns_skipped"). Use
+    `Match.reset_counters` to set them to zero.
+    """
+
+    counters = Counter()  # type: Counter
 
     def __init__(
         self,
@@ -30,6 +58,8 @@ class Match(object):
         match_attributes=None,
         reset=True,
         seed=None,
+        vectorize=False,
+        detect_cycles=False,
     ):
         """
         Parameters
@@ -54,6 +84,18 @@ class Match(object):
             Whether to reset players or not
         seed : int
             Random seed for reproducibility
+        vectorize : bool
+            Whether to play the turns as array operations when both players
+            can be expressed as tables (see axelrod.vectorized). This gives
+            the same results as the default path for the same seed.
+        detect_cycles : bool
+            Whether deterministic matches should stop playing once the
+            state of both players repeats, which is only known for players
+            that define `state_key` (such as FSMPlayer, LookerUp, Cycler
+            and deterministic MemoryOnePlayer). The remaining turns are then
+            copied from the cycle and the final score is calculated from
+            the scores of one cycle. This gives the same results and leaves
+            the players in the same state as playing every turn.
         """
 
         defaults = {
@@ -64,7 +106,9 @@ class Match(object):
         }
         self.turns, self.prob_end = defaults[(turns is None, prob_end is None)]
 
+        self._plan = None
         self.result = []
+        self._final_score = None
         self.noise = noise
 
         self.set_seed(seed)
@@ -91,6 +135,9 @@ class Match(object):
 
         self.players = list(players)
         self.reset = reset
+        self.vectorize = vectorize
+        self.detect_cycles = detect_cycles
+        self._plan = self._make_plan()
 
     def set_seed(self, seed):
         """Sets a random seed for the Match, for reproducibility. Initializes
@@ -115,6 +162,54 @@ class Match(object):
             player.set_match_attributes(**self.match_attributes)
             newplayers.append(player)
         self._players = newplayers
+        self._plan = None
+
+    @property
+    def noise(self):
+        return self._noise
+
+    @noise.setter
+    def noise(self, noise):
+        self._noise = noise
+        self._plan = None
+
+    @property
+    def _cache(self):
+        return self._deterministic_cache
+
+    @_cache.setter
+    def _cache(self, cache):
+        self._deterministic_cache = cache
+        self._plan = None
+
+    @classmethod
+    def reset_counters(cls):
+        """Sets all the counters of the matches played to zero."""
+        Match.counters.clear()
+
+    def _make_plan(self):
+        """Computes the plan of the match from its players and noise."""
+        self.counters["plans"] += 1
+        seeded = tuple(Classifiers["stochastic"](p) for p in self.players)
+        stochastic = bool(self.noise) or any(seeded)
+        return MatchPlan(
+            stochastic=stochastic,
+            cacheable=not stochastic,
+            seeded=seeded,
+            cache_key=tuple(self.players),
+        )
+
+    @property
+    def plan(self):
+        """
+        The MatchPlan of the match: it is computed when the match is created
+        and again only after its players, noise or cache are replaced.
+        """
+        if self._plan is None:
+            self._plan = self._make_plan()
+        else:
+            self.counters["plan_reuses"] += 1
+        return self._plan
 
     @property
     def _stochastic(self):
@@ -122,27 +217,14 @@ class Match(object):
         A boolean to show whether a match between two players would be
         stochastic.
         """
-        return is_stochastic(self.players, self.noise)
+        return self.plan.stochastic
 
     @property
     def _cache_update_required(self):
         """
         A boolean to show whether the deterministic cache should be updated.
         """
-        return (
-            not self.noise
-            and self._cache.mutable
-            and not (any(Classifiers["stochastic"](p) for p in self.players))
-        )
-
-    def _cached_enough_turns(self, cache_key, turns):
-        """
-        Returns true iff there are is a entry in self._cache for the given key and
-        it's at least turns long.
-        """
-        if cache_key not in self._cache:
-            return False
-        return len(self._cache[cache_key]) >= turns
+        return self.plan.cacheable and self._cache.mutable
 
     def simultaneous_play(self, player, coplayer, noise=0):
         """This pits two players against each other."""
@@ -157,6 +239,87 @@ class Match(object):
         coplayer.update_history(s2, s1)
         return s1, s2
 
+    def _sample_turns(self):
+        """Returns the number of turns of the next play of the match."""
+        if self.prob_end:
+            r = self._random.random()
+            return min(sample_length(self.prob_end, r), self.turns)
+        return self.turns
+
+    def _prepare_players(self, seeded):
+        """Resets the players and seeds those that are marked as seeded."""
+        for p, is_seeded in zip(self.players, seeded):
+            if self.reset:
+                p.reset()
+            p.set_match_attributes(**self.match_attributes)
+            # Generate a random seed for the player, if stochastic
+            if is_seeded:
+                p.set_seed(self._random.random_seed_int())
+
+    def _play_turns(self, turns, seeded):
+        """Resets the players, seeds those that are marked as seeded and plays
+        the given number of turns."""
+        self._prepare_players(seeded)
+        result = []
+        for _ in range(turns):
+            plays = self.simultaneous_play(
+                self.players[0], self.players[1], self.noise
+            )
+            result.append(plays)
+        return result
+
+    def _play_turns_detecting_cycles(self, turns):
+        """
+        Resets the players and plays the given number of turns of a
+        deterministic match, skipping the turns that repeat a cycle.
+
+        Before each turn the state keys of both players and the actions of
+        the previous turn are recorded. When they are seen again the play
+        from then on repeats the turns since they were first seen: the
+        skipped repetitions of the cycle are added to the result and to the
+        histories of the players and the turns left over are played, so
+        that the players end in the state they would have after every turn.
+        """
+        self._prepare_players((False, False))
+        player1, player2 = self.players
+        result = []
+        seen = {}
+        while len(result) < turns:
+            key1, key2 = player1.state_key(), player2.state_key()
+            if key1 is not None and key2 is not None:
+                key = (key1, key2, result[-1] if result else None)
+                start = seen.setdefault(key, len(result))
+                if start < len(result):
+                    break
+            result.append(self.simultaneous_play(player1, player2))
+        else:
+            return result
+
+        cycle = result[start:]
+        repeats, remainder = divmod(turns - len(result), len(cycle))
+        self.counters["cycles_detected"] += 1
+        self.counters["turns_skipped"] += repeats * len(cycle)
+        if repeats:
+            plays, coplays = zip(*cycle)
+            player1.history.extend(plays * repeats, coplays * repeats)
+            player2.history.extend(coplays * repeats, plays * repeats)
+            result.extend(cycle * repeats)
+        for _ in range(remainder):
+            result.append(self.simultaneous_play(player1, player2))
+
+        totals = [0, 0]
+        for turns_played, weight in (
+            (result[:start], 1),
+            (cycle, repeats + 1),
+            (cycle[:remainder], 1),
+        ):
+            for plays in turns_played:
+                scores = self.game.score(plays)
+                totals[0] += weight * scores[0]
+                totals[1] += weight * scores[1]
+        self._final_score = (result, tuple(totals))
+        return result
+
     def play(self):
         """
         The resulting list of actions from a match between two players.
@@ -175,46 +338,113 @@ class Match(object):
 
         i.e. One entry per turn containing a pair of actions.
         """
-        if self.prob_end:
-            r = self._random.random()
-            turns = min(sample_length(self.prob_end, r), self.turns)
-        else:
-            turns = self.turns
-        cache_key = (self.players[0], self.players[1])
-
-        if self._stochastic or not self._cached_enough_turns(cache_key, turns):
-            for p in self.players:
-                if self.reset:
-                    p.reset()
-                p.set_match_attributes(**self.match_attributes)
-                # Generate a random seed for the player, if stochastic
-                if Classifiers["stochastic"](p):
-                    p.set_seed(self._random.random_seed_int())
-            result = []
-            for _ in range(turns):
-                plays = self.simultaneous_play(
-                    self.players[0], self.players[1], self.noise
-                )
-                result.append(plays)
-
-            if self._cache_update_required:
+        turns = self._sample_turns()
+        plan = self.plan
+        cache_key = plan.cache_key
+        cached = None if plan.stochastic else self._cache.get(cache_key)
+
+        if cached is None or len(cached) < turns:
+            if plan.stochastic:
+                self.counters["stochastic_plays"] += 1
+            else:
+                self.counters["cache_misses"] += 1
+            results = None
+            if self.vectorize:
+                results = vectorized.play_repetitions(self, 1, lengths=[turns])
+            if results is not None:
+                self.counters["vectorized_plays"] += 1
+                result = results[0]
+            elif self.detect_cycles and not plan.stochastic:
+                result = self._play_turns_detecting_cycles(turns)
+            else:
+                result = self._play_turns(turns, plan.seeded)
+
+            if plan.cacheable and self._cache.mutable:
+                self.counters["cache_writes"] += 1
                 self._cache[cache_key] = result
         else:
-            result = self._cache[cache_key][:turns]
+            self.counters["cache_hits"] += 1
+            del cached[turns:]
+            result = cached
 
         self.result = result
         return result
 
+    def play_repetitions(self, repetitions):
+        """
+        Plays the match a number of times.
+
+        This gives the same results as calling `play` `repetitions` times. If
+        `vectorize` is set and the match is stochastic, all repetitions are
+        played at once when the players can be expressed as tables (see
+        axelrod.vectorized).
+
+        Returns
+        -------
+        A list of the resulting list of actions for each repetition.
+        """
+        results = None
+        if self.vectorize and self._stochastic:
+            results = vectorized.play_repetitions(self, repetitions)
+        if results is None:
+            results = []
+            for _ in range(repetitions):
+                results.append(self.play())
+        elif results:
+            self.counters["stochastic_plays"] += repetitions
+            self.counters["vectorized_plays"] += repetitions
+            self.result = results[-1]
+        return results
+
+    @classmethod
+    def play_batch(cls, matches):
+        """
+        Plays each of a list of matches once.
+
+        This gives the same results as calling `play` on each match. If
+        `vectorize` is set and the matches are stochastic matches between
+        players with the same configurations, they are all played at once
+        when the players can be expressed as tables (see axelrod.vectorized).
+
+        Returns
+        -------
+        A list of the resulting list of actions of each match.
+        """
+        results = None
+        if len(matches) > 1 and all(
+            match.vectorize and match._stochastic for match in matches
+        ):
+            results = vectorized.play_matches(matches)
+        if results is None:
+            return [match.play() for match in matches]
+        Match.counters["stochastic_plays"] += len(matches)
+        Match.counters["vectorized_plays"] += len(matches)
+        for match, result in zip(matches, results):
+            match.result = result
+        return results
+
     def scores(self):
         """Returns the scores of the previous Match plays."""
         return iu.compute_scores(self.result, self.game)
 
     def final_score(self):
         """Returns the final score for a Match."""
+        if (
+            self._final_score is not None
+            and self._final_score[0] is self.result
+        ):
+            # Calculated from the cycle that was detected
+            return self._final_score[1]
         return iu.compute_final_score(self.result, self.game)
 
     def final_score_per_turn(self):
         """Returns the mean score per round for a Match."""
+        if (
+            self._final_score is not None
+            and self._final_score[0] is self.result
+        ):
+            turns = len(self.result)
+            return tuple(score / turns for score in self._final_score[1])
         return iu.compute_final_score_per_turn(self.result, self.game)
 
     def winner(self):
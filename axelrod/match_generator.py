@@ -13,6 +13,7 @@ class MatchGenerator(object):
         edges=None,
         match_attributes=None,
         seed=None,
+        deterministic_cache=None,
     ):
         """
         A class to generate matches. This is used by the Tournament class which
@@ -39,6 +40,9 @@ class MatchGenerator(object):
             The default is to use the correct values for turns, game and noise
             but these can be overridden if desired.
         seed : int
+        deterministic_cache : axelrod.DeterministicCache
+            A cache of resulting actions for deterministic matches, shared
+            by all the matches
         """
         self.players = players
         self.turns = turns
@@ -48,6 +52,7 @@ class MatchGenerator(object):
         self.opponents = players
         self.prob_end = prob_end
         self.match_attributes = match_attributes
+        self.deterministic_cache = deterministic_cache
         self.random_generator = BulkRandomGenerator(seed)
 
         self.edges = edges
@@ -92,6 +97,7 @@ class MatchGenerator(object):
             "noise": self.noise,
             "prob_end": self.prob_end,
             "match_attributes": self.match_attributes,
+            "deterministic_cache": self.deterministic_cache,
         }
 
 
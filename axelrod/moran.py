@@ -1,16 +1,20 @@
 """Implementation of the Moran process on Graphs."""
 
 from collections import Counter
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 from axelrod import DEFAULT_TURNS, EvolvablePlayer, Game, Player
 from axelrod.deterministic_cache import DeterministicCache
+from axelrod.executor import Executor
 from axelrod.graph import Graph, complete_graph
 from axelrod.match import Match
 from axelrod.random_ import BulkRandomGenerator, RandomGenerator
 
+# The number of matches kept by the default deterministic cache of a Moran
+# process: with mutation, every mutant adds new matches to the cache.
+DEFAULT_CACHE_SIZE = 2**16
+
 
 class MoranProcess(object):
     def __init__(
@@ -30,6 +34,8 @@ class MoranProcess(object):
         stop_on_fixation=True,
         seed=None,
         match_class=Match,
+        executor: Executor = None,
+        vectorize: bool = False,
     ) -> None:
         """
         An agent based Moran process class. In each round, each player plays a
@@ -69,7 +75,8 @@ class MoranProcess(object):
         game: axelrod.Game
             The game object used to score matches.
         deterministic_cache:
-            A optional prebuilt deterministic cache
+            A optional prebuilt deterministic cache. By default a cache of
+            the DEFAULT_CACHE_SIZE most recently used matches is created.
         mutation_rate:
             The rate of mutation. Replicating players are mutated with
             probability `mutation_rate`
@@ -89,6 +96,19 @@ class MoranProcess(object):
             A bool indicating if the process should stop on fixation
         seed: int
             A random seed for reproducibility
+        match_class:
+            The class used to play the matches
+        executor: axelrod.Executor
+            A pool of worker processes used to play the stochastic matches
+            (and the deterministic matches that are not in the cache) of each
+            round. This gives the same results as playing them in this
+            process.
+        vectorize: bool
+            Whether stochastic matches between players that can be expressed
+            as tables (see axelrod.vectorized) should be played as array
+            operations. The matches of a round between players with the same
+            configurations are then played all at once. This gives the same
+            results.
         """
         m = mutation_method.lower()
         if m in ["atomic", "transition"]:
@@ -105,9 +125,13 @@ class MoranProcess(object):
         if deterministic_cache is not None:
             self.deterministic_cache = deterministic_cache
         else:
-            self.deterministic_cache = DeterministicCache()
+            self.deterministic_cache = DeterministicCache(
+                max_size=DEFAULT_CACHE_SIZE
+            )
         self.turns = turns
         self.match_class = match_class
+        self.executor = executor
+        self.vectorize = vectorize
         self.prob_end = prob_end
         self.game = game
         self.noise = noise
@@ -375,6 +399,7 @@ class MoranProcess(object):
         """
         N = len(self.players)
         scores = [0] * N
+        matches = []
         for i, j in self._matchup_indices():
             player1 = self.players[i]
             player2 = self.players[j]
@@ -386,14 +411,96 @@ class MoranProcess(object):
                 game=self.game,
                 deterministic_cache=self.deterministic_cache,
                 seed=next(self._bulk_random),
+                vectorize=self.vectorize,
             )
-            match.play()
+            if self.executor is None and not self.vectorize:
+                match.play()
+            matches.append((i, j, match))
+        if self.executor is not None:
+            self._play_with_executor([match for _, _, match in matches])
+        elif self.vectorize:
+            self._play_batches([match for _, _, match in matches])
+        for i, j, match in matches:
             match_scores = match.final_score_per_turn()
             scores[i] += match_scores[0]
             scores[j] += match_scores[1]
         self.score_history.append(scores)
         return scores
 
+    def _play_batches(self, matches: List[Match]) -> None:
+        """Plays the matches of a round, the stochastic matches between
+        players with the same configurations together with
+        Match.play_batch."""
+        batches = {}  # type: Dict[Tuple[str, str], List[Match]]
+        for match in matches:
+            player1, player2 = match.players
+            if not match.plan.stochastic or player1 is player2:
+                match.play()
+                continue
+            key = (player1.configuration_key(), player2.configuration_key())
+            batches.setdefault(key, []).append(match)
+        for batch in batches.values():
+            self.match_class.play_batch(batch)
+
+    def _play_with_executor(self, matches: List[Match]) -> None:
+        """Plays the matches of a round with the workers of self.executor.
+
+        The matches read from the deterministic cache are played here, the
+        others are played by the workers between clones of the players and
+        their results are cached as they would be by Match.play.
+        """
+        executor = self.executor
+        assert executor is not None
+        players = [player for player in self.players if player is not None]
+        ids = executor.register_players(players)
+        index = {id(player): ids[k] for k, player in enumerate(players)}
+        tasks = []
+        remote_matches = []
+        for match in matches:
+            player1, player2 = match.players
+            plan = match.plan
+            if (
+                not plan.stochastic
+                and plan.cache_key in self.deterministic_cache
+            ):
+                match.play()
+                continue
+            kwargs = {
+                "turns": self.turns,
+                "prob_end": self.prob_end,
+                "noise": self.noise,
+                "game": self.game,
+                "seed": match.seed,
+                "vectorize": self.vectorize,
+            }
+            player_ids = (index[id(player1)], index[id(player2)])
+            same_player = player1 is player2
+            tasks.append((self.match_class, player_ids, same_player, kwargs))
+            remote_matches.append(match)
+
+        # The result and the states of the players of each remote match
+        outcomes = {}  # type: Dict[int, Tuple[List[tuple], List[dict]]]
+        for k, _, _, outcome in executor.map(_play_match, tasks):
+            outcomes[k] = outcome
+
+        # Playing a match resets the players, which reseeds their random
+        # generators, and stochastic players draw from them: atomic mutation
+        # then draws from the generators as the matches left them. So, in
+        # order, the players take the generators of their clones, unless the
+        # match would have been read from the cache filled by an earlier one.
+        for k, match in enumerate(remote_matches):
+            result, states = outcomes[k]
+            match.result = result
+            if (
+                not match.plan.stochastic
+                and match.plan.cache_key in self.deterministic_cache
+            ):
+                continue
+            for player, state in zip(match.players, states):
+                vars(player).update(state)
+            if match._cache_update_required:
+                self.deterministic_cache[tuple(match.players)] = result
+
     def population_distribution(self) -> Counter:
         """Returns the population distribution of the last iteration.
 
@@ -467,6 +574,8 @@ class MoranProcess(object):
         A matplotlib axis object
 
         """
+        import matplotlib.pyplot as plt
+
         player_names = self.populations[0].keys()
         if ax is None:
             _, ax = plt.subplots()
@@ -489,6 +598,28 @@ class MoranProcess(object):
         return ax
 
 
+def _play_match(prototypes, match_class, player_ids, same_player, kwargs):
+    """Plays a match between clones of two prototypes in a worker process of
+    an axelrod.Executor. If `same_player` is True, a single clone plays both
+    sides of the match, as when a player object is matched with itself.
+
+    Returns the result of the match and the seed and random generator, where
+    they have them, of the players once the match is played."""
+    players = [prototypes[player_id].clone() for player_id in player_ids]
+    if same_player:
+        players[1] = players[0]
+    result = match_class(players, **kwargs).play()
+    states = [
+        {
+            name: value
+            for name, value in vars(player).items()
+            if name in ("_seed", "_random")
+        }
+        for player in players
+    ]
+    return result, states
+
+
 class ApproximateMoranProcess(MoranProcess):
     """
     A class to approximate a Moran process based
@@ -1,20 +1,216 @@
+import collections
 import copy
+import hashlib
 import inspect
 import itertools
 import types
 import warnings
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 import numpy as np
 from axelrod import _module_random
 from axelrod.action import Action
-from axelrod.game import DefaultGame
+from axelrod.game import AsymmetricGame, DefaultGame
 from axelrod.history import History
 from axelrod.random_ import RandomGenerator
 
 C, D = Action.C, Action.D
 
 
+def _describe_class(cls: type) -> Any:
+    """Returns a description of a class that is the same in every process.
+
+    Classes made by strategy transformers are described by the transformer,
+    its arguments and the class that was transformed.
+    """
+    decorator = vars(cls).get("decorator")
+    if decorator is None:
+        return "{}.{}".format(cls.__module__, cls.__qualname__)
+    return (
+        decorator.name_prefix,
+        _canonical(decorator.args),
+        _canonical(decorator.kwargs),
+        _describe_class(cls.original_class),
+    )
+
+
+def _canonical(value: Any) -> Any:
+    """Returns a form of a parameter of a player whose repr describes it.
+
+    Numerical tables (arrays and lists of numbers) are reduced to their bytes,
+    so that large tables are described quickly and in full, and the items of
+    dictionaries and sets are sorted so that their order does not matter.
+    """
+    if value is None or isinstance(value, (Action, str, int, float)):
+        return value
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        try:
+            array = np.asarray(value)
+        except ValueError:  # The items are sequences of different lengths
+            array = None
+        if array is not None and array.dtype.kind in "biuf":
+            return _canonical(array)
+        return (
+            type(value).__name__,
+            tuple(_canonical(item) for item in value),
+        )
+    if isinstance(value, dict):
+        items = ((_canonical(k), _canonical(v)) for k, v in value.items())
+        return ("dict", tuple(sorted(items, key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(map(_canonical, value), key=repr)))
+    if isinstance(value, type):
+        return _describe_class(value)
+    if isinstance(value, Player):
+        return value.configuration_key()
+    return value
+
+
+# The ways in which an attribute of a player is rebuilt from its snapshot.
+_SHARED, _COPIED, _REBUILT, _PLAYER = range(4)
+
+# Values of these types are shared by a player and its snapshot. Games are
+# not changed by the players that are told about them.
+_SHARED_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+    Action,
+    np.generic,
+    type,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    AsymmetricGame,
+)
+
+
+def _copy_counter(counter: collections.Counter) -> collections.Counter:
+    # Counter.copy goes through Counter.update, which is much slower.
+    new_counter = dict.__new__(collections.Counter)
+    dict.update(new_counter, counter)
+    return new_counter
+
+
+def _copy_object(value: Any) -> Any:
+    new_value = object.__new__(type(value))
+    new_value.__dict__.update(value.__dict__)
+    return new_value
+
+
+# The functions that copy the containers that are copied item by item.
+_CONTAINER_COPIERS = {
+    list: list.copy,
+    dict: dict.copy,
+    set: set.copy,
+    bytearray: bytearray.copy,
+    collections.OrderedDict: collections.OrderedDict.copy,
+    collections.Counter: _copy_counter,
+    collections.defaultdict: collections.defaultdict.copy,
+    collections.deque: collections.deque.copy,
+}
+
+# The attributes of a player that are not restored from its snapshot.
+_NOT_SNAPSHOTTED = ("init_kwargs", "_configuration_key", "_snapshot")
+
+
+def _is_shared(value: Any) -> bool:
+    cls = type(value)
+    if cls in _SHARED_TYPES:  # The most common case, checked first
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(_is_shared, value))
+    return isinstance(value, _SHARED_TYPES)
+
+
+def _object_copier(value: Any) -> Optional[Callable]:
+    """Returns the function that copies a plain object, or None if the value
+    is not one."""
+    cls = type(value)
+    if (
+        not hasattr(value, "__dict__")
+        or hasattr(value, "__slots__")
+        or isinstance(value, types.MethodType)
+    ):
+        return None
+    if (
+        cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and not hasattr(cls, "__copy__")
+    ):
+        return _copy_object
+    return copy.copy
+
+
+def _snapshot_entry(value: Any, seen: set) -> Optional[tuple]:
+    """
+    Returns an entry from which copies of a value can be rebuilt, or None if
+    the value cannot be copied (generators, random number generators and
+    objects referred to more than once).
+
+    Containers and plain objects are copied item by item, other players are
+    cloned and immutable values are shared.
+    """
+    if _is_shared(value):
+        return (_SHARED, value)
+    if id(value) in seen or isinstance(value, (tuple, frozenset)):
+        return None
+    seen.add(id(value))
+    if isinstance(value, Player):
+        return (_PLAYER, value.clone())
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return None
+        return (_COPIED, value.copy(), np.ndarray.copy)
+
+    copier = _CONTAINER_COPIERS.get(type(value))
+    if copier is None:
+        copier = _object_copier(value)
+        if copier is None:
+            return None
+        items = vars(value).items()
+    elif isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, collections.deque)):
+        items = enumerate(value)
+    else:  # The items of sets and bytearrays are not copied
+        items = ()
+
+    entries = {}
+    for key, item in items:
+        if _is_shared(item):
+            continue
+        entry = _snapshot_entry(item, seen)
+        if entry is None:
+            return None
+        entries[key] = entry
+    if not entries:
+        return (_COPIED, copier(value), copier)
+    return (_REBUILT, copier(value), copier, entries)
+
+
+def _restore(entry: tuple) -> Any:
+    """Returns a new copy of the value recorded in a snapshot entry."""
+    kind, template = entry[0], entry[1]
+    if kind == _SHARED:
+        return template
+    if kind == _COPIED:
+        return entry[2](template)
+    if kind == _PLAYER:
+        return template.clone()
+    value = entry[2](template)
+    target = value if type(value) in _CONTAINER_COPIERS else value.__dict__
+    for key, item_entry in entry[3].items():
+        target[key] = _restore(item_entry)
+    return value
+
+
 class PostInitCaller(type):
     """Metaclass to be able to handle post __init__ tasks.
     If there is a DerivedPlayer class of Player that overrides
@@ -82,6 +278,13 @@ class Player(object, metaclass=PostInitCaller):
     name = "Player"
     classifier = {}  # type: Dict[str, Any]
     _reclassifiers = []
+    # The class used to record the history of play, e.g. CompactHistory for a
+    # smaller memory footprint.
+    history_class = History
+    # Whether reset and clone restore the state recorded after __init__
+    # rather than running __init__ again. Players whose __init__ has effects
+    # outside of the player can set this to False.
+    reset_from_snapshot = True
 
     def __new__(cls, *args, **kwargs):
         """Caches arguments for Player cloning."""
@@ -97,6 +300,29 @@ class Player(object, metaclass=PostInitCaller):
         Use *args and **kwargs as value if specified
         and complete the rest with the default values.
         """
+        parameters = cls.__dict__.get("_init_parameters")
+        if parameters is None or parameters[0] is not cls.__init__:
+            parameters = cls._inspect_init()
+        _, sig, defaults = parameters
+        # Players are mostly created with keyword arguments (by clone and
+        # reset for example), which can be bound without the signature.
+        if (
+            not args
+            and defaults is not None
+            and kwargs.keys() <= defaults.keys()
+        ):
+            arguments = defaults.copy()
+            arguments.update(kwargs)
+            return arguments
+        boundargs = sig.bind_partial(*args, **kwargs)
+        boundargs.apply_defaults()
+        return boundargs.arguments
+
+    @classmethod
+    def _inspect_init(cls):
+        """Computes the signature of __init__ (without 'self') and, if every
+        parameter has a default and can be passed by keyword, the defaults.
+        These are stored on the class so that they are only computed once."""
         sig = inspect.signature(cls.__init__)
         # The 'self' parameter needs to be removed or the first *args will be
         # assigned to it
@@ -104,13 +330,25 @@ class Player(object, metaclass=PostInitCaller):
         new_params = list(sig.parameters.values())
         new_params.remove(self_param)
         sig = sig.replace(parameters=new_params)
-        boundargs = sig.bind_partial(*args, **kwargs)
-        boundargs.apply_defaults()
-        return boundargs.arguments
+
+        defaults = {}  # type: Optional[Dict[str, Any]]
+        for param in new_params:
+            if (
+                param.kind
+                not in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+                or param.default is param.empty
+            ):
+                defaults = None
+                break
+            defaults[param.name] = param.default
+
+        parameters = (cls.__init__, sig, defaults)
+        cls._init_parameters = parameters
+        return parameters
 
     def __init__(self):
         """Initial class setup."""
-        self._history = History()
+        self._history = self.history_class()
         self.classifier = copy.deepcopy(self.classifier)
         self.set_match_attributes()
 
@@ -124,6 +362,60 @@ class Player(object, metaclass=PostInitCaller):
         for (reclassifier, args, kwargs) in self._reclassifiers:
             self.classifier = reclassifier(self.classifier, *args, **kwargs)
 
+    def _take_snapshot(self):
+        """Records the state of the player, which must have just been
+        initialised, so that reset and clone can restore it without running
+        __init__ again.
+
+        Players whose state cannot be copied (for example because it
+        includes a generator or a random number generator) have no snapshot
+        and are reset by running __init__.
+        """
+        snapshot = None  # type: Optional[Dict[str, tuple]]
+        if self.reset_from_snapshot:
+            snapshot = {}
+            seen = {id(self)}
+            for name, value in self.__dict__.items():
+                if name in _NOT_SNAPSHOTTED:
+                    continue
+                entry = _snapshot_entry(value, seen)
+                if entry is None:
+                    snapshot = None
+                    break
+                snapshot[name] = entry
+        self._snapshot = snapshot
+
+    def _get_snapshot(self):
+        """Returns the snapshot of the player, or None if it has none.
+
+        The snapshot is taken the first time it is needed, from a new player
+        with the same parameters, so that creating players stays cheap.
+        """
+        if "_snapshot" not in self.__dict__:
+            if self.reset_from_snapshot:
+                new_player = self.__class__(**self.init_kwargs)
+                new_player._take_snapshot()
+                self._snapshot = new_player._snapshot
+            else:
+                self._snapshot = None
+        return self._snapshot
+
+    def _restore_snapshot(self):
+        """Restores the state recorded by _take_snapshot."""
+        self.__dict__.update(
+            (name, _restore(entry)) for name, entry in self._snapshot.items()
+        )
+
+    def _from_snapshot(self):
+        """Returns a new player in the state recorded by _take_snapshot."""
+        new_player = object.__new__(self.__class__)
+        new_player.init_kwargs = self.init_kwargs.copy()
+        new_player._snapshot = self._snapshot
+        new_player._restore_snapshot()
+        if "_configuration_key" in self.__dict__:
+            new_player._configuration_key = self._configuration_key
+        return new_player
+
     def __eq__(self, other):
         """
         Test if two players are equal, ignoring random seed and RNG state.
@@ -138,8 +430,13 @@ class Player(object, metaclass=PostInitCaller):
             value = getattr(self, attribute, None)
             other_value = getattr(other, attribute, None)
 
-            if attribute in ["_random", "_seed"]:
-                # Don't compare the random generators.
+            if attribute in [
+                "_random",
+                "_seed",
+                "_configuration_key",
+                "_snapshot",
+            ]:
+                # Don't compare the random generators or the cached state.
                 continue
 
             if isinstance(value, np.ndarray):
@@ -240,8 +537,13 @@ class Player(object, metaclass=PostInitCaller):
         # Note that this would require a deepcopy in some cases and there may
         # be significant changes required throughout the library.
         # Consider overriding in special cases only if necessary
-        cls = self.__class__
-        new_player = cls(**self.init_kwargs)
+        if self._get_snapshot() is not None:
+            new_player = self._from_snapshot()
+        else:
+            cls = self.__class__
+            new_player = cls(**self.init_kwargs)
+            if "_configuration_key" in self.__dict__:
+                new_player._configuration_key = self._configuration_key
         new_player.match_attributes = copy.copy(self.match_attributes)
         return new_player
 
@@ -253,11 +555,50 @@ class Player(object, metaclass=PostInitCaller):
         It ensures that no 'memory' of previous matches is carried forward.
         """
         # This also resets the history.
-        self.__init__(**self.init_kwargs)
+        if self._get_snapshot() is not None:
+            self._restore_snapshot()
+        else:
+            self.__init__(**self.init_kwargs)
 
     def update_history(self, play, coplay):
         self.history.append(play, coplay)
 
+    def state_key(self):
+        """Returns a hashable key of the state of the player, or None if the
+        state is not known.
+
+        The key, together with the actions of the previous turn, must
+        determine every future action of the player against the same
+        opponent. Matches played with `detect_cycles` compare the keys of
+        both players before each turn to find when the play starts to
+        repeat.
+        """
+        return None
+
+    def configuration_key(self) -> str:
+        """Returns a fingerprint of the class of the player and of its
+        `init_kwargs`, other than the seed.
+
+        Two players with the same key are configured in the same way, so the
+        key is used to store the results of deterministic matches. It is the
+        same in every process and is computed once per player.
+        """
+        key = self.__dict__.get("_configuration_key")
+        if key is None:
+            parameters = {
+                name: value
+                for name, value in self.init_kwargs.items()
+                if name != "seed"
+            }
+            description = repr(
+                (_describe_class(type(self)), _canonical(parameters))
+            )
+            key = hashlib.blake2b(
+                description.encode(), digest_size=16
+            ).hexdigest()
+            self._configuration_key = key
+        return key
+
     @property
     def history(self):
         return self._history
@@ -1,20 +1,34 @@
 import csv
-import itertools
+import io
+import os
+import tracemalloc
 import warnings
 from collections import Counter, namedtuple
-from multiprocessing import cpu_count
+from functools import cached_property, partial
+from multiprocessing import Pool, cpu_count
 from typing import List
 
-import dask as da
-import dask.dataframe as dd
 import numpy as np
+import pandas as pd
 import tqdm
 from axelrod.action import Action
+from axelrod.interaction_store import BinaryInteractions, is_binary_file
 
 from . import eigen
 
 C, D = Action.C, Action.D
 
+STATE_KEYS = [(C, C), (C, D), (D, C), (D, D)]
+STATE_COLUMNS = ["CC count", "CD count", "DC count", "DD count"]
+STATE_TO_ACTION_KEYS = [
+    (state, action) for state in STATE_KEYS for action in (C, D)
+]
+STATE_TO_ACTION_COLUMNS = [
+    "{} to {} count".format(column[:2], action)
+    for column in STATE_COLUMNS
+    for action in ("C", "D")
+]
+
 
 def update_progress_bar(method):
     """A decorator to update a progress bar if it exists"""
@@ -33,301 +47,607 @@ def update_progress_bar(method):
     return wrapper
 
 
+# The aggregated results of a tournament from which the results of a
+# ResultSet are computed (see `ResultSet._build_tasks`)
+SUMMARIES = [
+    "mean_per_reps_player_opponent",
+    "sum_per_player_opponent",
+    "sum_per_player_repetition",
+    "normalised_scores",
+    "initial_cooperation_count",
+    "interactions_count",
+]
+
+# The results of a ResultSet, mapped to the summaries (their index in
+# SUMMARIES) and the other results they are computed from
+METRICS = {
+    "payoffs": ([0], []),
+    "score_diffs": ([0], []),
+    "match_lengths": ([0], []),
+    "wins": ([2], []),
+    "scores": ([2], []),
+    "normalised_scores": ([3], []),
+    "cooperation": ([1], []),
+    "good_partner_matrix": ([1], []),
+    "state_distribution": ([1], []),
+    "normalised_state_distribution": ([], ["state_distribution"]),
+    "state_to_action_distribution": ([1], []),
+    "normalised_state_to_action_distribution": (
+        [],
+        ["state_to_action_distribution"],
+    ),
+    "initial_cooperation_count": ([4], []),
+    "initial_cooperation_rate": ([5], ["initial_cooperation_count"]),
+    "good_partner_rating": ([5], ["good_partner_matrix"]),
+    "normalised_cooperation": ([], ["cooperation", "match_lengths"]),
+    "ranking": ([], ["normalised_scores"]),
+    "ranked_names": ([], ["ranking"]),
+    "payoff_matrix": ([0], ["payoffs"]),
+    "payoff_stddevs": ([0], ["payoffs"]),
+    "payoff_diffs_means": ([], ["score_diffs"]),
+    "cooperating_rating": ([], ["cooperation", "match_lengths"]),
+    "vengeful_cooperation": ([], ["normalised_cooperation"]),
+    "eigenjesus_rating": ([], ["normalised_cooperation"]),
+    "eigenmoses_rating": ([], ["vengeful_cooperation"]),
+}
+
+
+def _required_metrics(metrics):
+    """
+    Returns the metrics and all the metrics they depend on, in the order of
+    METRICS.
+    """
+    required = set()
+    to_visit = list(metrics)
+    while to_visit:
+        metric = to_visit.pop()
+        if metric not in required:
+            required.add(metric)
+            to_visit.extend(METRICS[metric][1])
+    return [metric for metric in METRICS if metric in required]
+
+
+def _listed(name):
+    """A result set attribute giving the array attribute `name` as lists."""
+    return cached_property(lambda self: getattr(self, name).tolist())
+
+
+def _listed_per_repetition(name, axes):
+    """A result set attribute giving the array attribute `name` as lists, with
+    the integer 0 for the repetitions that were not played. `axes` orders the
+    (player, opponent, repetition) dimensions as in the array."""
+
+    def listed(self):
+        array = getattr(self, name).astype(object)
+        array[~np.transpose(self._played, axes)] = 0
+        return array.tolist()
+
+    return cached_property(listed)
+
+
+def _counters(name, keys):
+    """A result set attribute giving the array attribute `name` as lists of
+    counter objects (see `_to_counters`)."""
+    return cached_property(lambda self: _to_counters(getattr(self, name), keys))
+
+
 class ResultSet:
     """
     A class to hold the results of a tournament. Reads in a CSV file produced
-    by the tournament class.
+    by the tournament class, or is built directly by a ResultSetBuilder.
+
+    The results (see `METRICS`) are computed when the result set is created
+    or, if only some metrics are requested, on first access.
     """
 
     def __init__(
-        self, filename, players, repetitions, processes=None, progress_bar=True
+        self,
+        filename,
+        players,
+        repetitions,
+        processes=None,
+        progress_bar=True,
+        metrics=None,
+        chunk_size=None,
+        memory_limit=None,
+        trace_memory=False,
     ):
         """
+        Reads the results of a tournament from file. A tournament does not
+        read its output file: it aggregates the results in memory with a
+        ResultSetBuilder as the matches are played (see `from_summaries`).
+
+        By default the whole file is read with dask. If `chunk_size`,
+        `memory_limit` or `processes` is given, the file is aggregated in
+        chunks by ResultSetBuilder.from_file instead.
+
         Parameters
         ----------
             filename : string
-                the file from which to read the interactions
+                the file from which to read the interactions: either a csv
+                file or a binary file (see axelrod.interaction_store)
             players : list
-                A list of the names of players. If not known will be efficiently
-                read from file.
+                A list of the names of players, in the order of their indices
+                in the file.
             repetitions : int
-                The number of repetitions of each match. If not know will be
-                efficiently read from file.
+                The number of repetitions of each match.
             processes : integer
                 The number of processes to be used for parallel processing
+                (all available cores if 0). If the file is read in chunks,
+                each of these processes aggregates a part of the file (see
+                ResultSetBuilder.from_file).
             progress_bar: boolean
                 If a progress bar will be shown.
+            metrics : list
+                The names of the results to compute (see `METRICS`): only
+                the parts of the file they need are aggregated. The other
+                results are computed when they are first accessed. By default
+                all results are computed.
+            chunk_size : int
+                If given, the file is read this number of rows at a time and
+                aggregated as it is read (see ResultSetBuilder.from_file), so
+                that it is never held in memory.
+            memory_limit : int
+                If given, a target in bytes for the memory used to aggregate
+                the file (in each process), from which the size of the chunks
+                is chosen. It is estimated, not enforced (see
+                ResultSetBuilder.from_file).
+            trace_memory : boolean
+                If the file is read in chunks, whether to trace the memory
+                allocated while reading it with tracemalloc. The peak is then
+                kept as the `peak_memory` attribute, which is None otherwise.
         """
         self.filename = filename
         self.players, self.repetitions = players, repetitions
         self.num_players = len(self.players)
 
-        if progress_bar:
-            self.progress_bar = tqdm.tqdm(total=25, desc="Analysing")
-
-        df = dd.read_csv(filename)
-        dask_tasks = self._build_tasks(df)
-
         if processes == 0:
             processes = cpu_count()
+        self._processes = processes
+
+        if chunk_size is not None or memory_limit is not None:
+            builder = ResultSetBuilder.from_file(
+                filename,
+                players,
+                repetitions,
+                chunk_size=chunk_size,
+                memory_limit=memory_limit,
+                progress_bar=progress_bar,
+                processes=processes,
+                trace_memory=trace_memory,
+            )
+            self.peak_memory = builder.peak_memory
+            self._df = None
+            self._summaries = list(builder.summaries())
+        else:
+            self.peak_memory = None
+            if is_binary_file(filename):
+                self._df = BinaryInteractions(filename).dask_dataframe()
+            else:
+                import dask.dataframe as dd
+
+                self._df = dd.read_csv(filename)
+            self._summaries = [None] * len(SUMMARIES)
+
+        self._analyse(metrics, progress_bar)
+
+    @classmethod
+    def from_summaries(
+        cls,
+        summaries,
+        players,
+        repetitions,
+        filename=None,
+        progress_bar=True,
+        metrics=None,
+    ):
+        """
+        Build a result set from already aggregated results (see
+        ResultSetBuilder) rather than by reading a file.
 
-        out = self._compute_tasks(tasks=dask_tasks, processes=processes)
-
-        self._reshape_out(*out)
+        Parameters
+        ----------
+            summaries : tuple
+                The six pandas objects otherwise computed from the file by
+                `_build_tasks`
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+            filename : string
+                The file the interactions were written to, if any
+            progress_bar: boolean
+                If a progress bar will be shown.
+            metrics : list
+                The names of the results to compute (see `METRICS`). The
+                other results are computed when they are first accessed. By
+                default all results are computed.
+        """
+        result_set = cls.__new__(cls)
+        result_set.filename = filename
+        result_set.players, result_set.repetitions = players, repetitions
+        result_set.num_players = len(players)
+        result_set._df, result_set._processes = None, None
+        result_set._summaries = list(summaries)
+
+        result_set._analyse(metrics, progress_bar)
+        return result_set
+
+    @classmethod
+    def merge(cls, *parts, progress_bar=True):
+        """
+        Build a result set from the aggregated results of parts of a
+        tournament, for example the shards written by
+        `Tournament.play_shard`, without reading the interactions. The
+        result set is the same as that of playing the whole tournament.
 
-        if progress_bar:
-            self.progress_bar.close()
+        Parameters
+        ----------
+            parts : ResultSetBuilder or string
+                The aggregated results of each part, or the files they were
+                written to (see ResultSetBuilder.save)
+            progress_bar: boolean
+                If a progress bar will be shown.
+        """
+        builders = [
+            part
+            if isinstance(part, ResultSetBuilder)
+            else ResultSetBuilder.load(part)
+            for part in parts
+        ]
+        return ResultSetBuilder.merge(*builders).build(
+            progress_bar=progress_bar
+        )
 
-    def _reshape_out(
-        self,
-        mean_per_reps_player_opponent_df,
-        sum_per_player_opponent_df,
-        sum_per_player_repetition_df,
-        normalised_scores_series,
-        initial_cooperation_count_series,
-        interactions_count_series,
-    ):
+    def _analyse(self, metrics=None, progress_bar=True):
         """
-        Reshape the various pandas series objects to be of the required form and
-        set the corresponding attributes.
+        Compute the requested metrics, and the metrics they depend on, from
+        the summaries they need.
+
+        Parameters
+        ----------
+            metrics : list
+                The names of the metrics, all of them if None
+            progress_bar: boolean
+                If a progress bar will be shown.
         """
+        if metrics is None:
+            metrics = list(METRICS)
+        unknown = [metric for metric in metrics if metric not in METRICS]
+        if unknown:
+            raise ValueError(
+                "Unknown metrics: {}. The metrics are: {}.".format(
+                    ", ".join(unknown), ", ".join(METRICS)
+                )
+            )
+        required = _required_metrics(metrics)
 
-        self.payoffs = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Score per turn"],
-            first_dimension=range(self.num_players),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.repetitions),
-            key_order=[2, 0, 1],
-        )
+        if progress_bar:
+            self.progress_bar = tqdm.tqdm(total=len(required), desc="Analysing")
 
-        self.score_diffs = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Score difference per turn"],
-            first_dimension=range(self.num_players),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.repetitions),
-            key_order=[2, 0, 1],
-            alternative=0,
+        self._compute_summaries(
+            sorted(
+                {index for metric in required for index in METRICS[metric][0]}
+            )
         )
+        for metric in metrics:
+            getattr(self, metric)
 
-        self.match_lengths = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Turns"],
-            first_dimension=range(self.repetitions),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.num_players),
-            alternative=0,
-        )
+        if progress_bar:
+            self.progress_bar.close()
 
-        self.wins = self._reshape_two_dim_list(
-            sum_per_player_repetition_df["Win"]
-        )
-        self.scores = self._reshape_two_dim_list(
-            sum_per_player_repetition_df["Score"]
-        )
-        self.normalised_scores = self._reshape_two_dim_list(
-            normalised_scores_series
-        )
+        if len(required) == len(METRICS):
+            # Nothing is left to compute
+            self._df, self._summaries = None, None
+
+    def _summary(self, index):
+        """
+        Returns one of the summaries (see `SUMMARIES`), computing it if it
+        has not been computed yet.
+        """
+        self._compute_summaries([index])
+        return self._summaries[index]
 
-        self.cooperation = self._build_cooperation(
-            sum_per_player_opponent_df["Cooperation count"]
+    def _compute_summaries(self, indices):
+        """
+        Compute the summaries (see `SUMMARIES`) that have not been computed
+        yet, from the interactions read from file.
+        """
+        indices = [index for index in indices if self._summaries[index] is None]
+        if not indices:
+            return
+        tasks = self._build_tasks(self._df)
+        out = self._compute_tasks(
+            tasks=[tasks[index] for index in indices],
+            processes=self._processes,
         )
-        self.good_partner_matrix = self._build_good_partner_matrix(
-            sum_per_player_opponent_df["Good partner"]
+        for index, summary in zip(indices, out):
+            self._summaries[index] = summary
+
+    @cached_property
+    def _played(self):
+        """Whether each repetition of each match, by player and opponent,
+        was played."""
+        n = self.num_players
+        played = np.zeros((n, n, self.repetitions), dtype=bool)
+        played[
+            _index_positions(self._summary(0).index, levels=[1, 2, 0])
+        ] = True
+        return played
+
+    @cached_property
+    def _interactions(self):
+        """The number of interactions of each player, ignoring self
+        interactions."""
+        return _series_to_array(
+            self._summary(5), (self.num_players,), levels=[0]
         )
 
-        columns = ["CC count", "CD count", "DC count", "DD count"]
-        self.state_distribution = self._build_state_distribution(
-            sum_per_player_opponent_df[columns]
-        )
-        self.normalised_state_distribution = (
-            self._build_normalised_state_distribution()
+    # Each of the results is computed as a numpy array, from the index of the
+    # summaries, and is available with an `_array` suffix (for example
+    # `payoffs_array`) alongside the list of lists attribute.
+
+    @cached_property
+    def payoffs_array(self):
+        n = self.num_players
+        return self._reshape_three_dim_array(
+            self._summary(0)["Score per turn"],
+            shape=(n, n, self.repetitions),
+            levels=[1, 2, 0],
+            alternative=np.nan,
         )
 
-        columns = [
-            "CC to C count",
-            "CC to D count",
-            "CD to C count",
-            "CD to D count",
-            "DC to C count",
-            "DC to D count",
-            "DD to C count",
-            "DD to D count",
+    @cached_property
+    def payoffs(self):
+        if self._played.all():
+            return self.payoffs_array.tolist()
+        # Only the repetitions of the matches that were played are listed
+        return [
+            [utilities[played].tolist() for utilities, played in zip(*rows)]
+            for rows in zip(self.payoffs_array, self._played)
         ]
-        self.state_to_action_distribution = (
-            self._build_state_to_action_distribution(
-                sum_per_player_opponent_df[columns]
-            )
-        )
-        self.normalised_state_to_action_distribution = (
-            self._build_normalised_state_to_action_distribution()
-        )
 
-        self.initial_cooperation_count = self._build_initial_cooperation_count(
-            initial_cooperation_count_series
-        )
-        self.initial_cooperation_rate = self._build_initial_cooperation_rate(
-            interactions_count_series
+    @cached_property
+    def score_diffs_array(self):
+        n = self.num_players
+        return self._reshape_three_dim_array(
+            self._summary(0)["Score difference per turn"],
+            shape=(n, n, self.repetitions),
+            levels=[1, 2, 0],
         )
-        self.good_partner_rating = self._build_good_partner_rating(
-            interactions_count_series
+
+    @cached_property
+    def match_lengths_array(self):
+        n = self.num_players
+        return self._reshape_three_dim_array(
+            self._summary(0)["Turns"],
+            shape=(self.repetitions, n, n),
+            levels=[0, 1, 2],
         )
 
-        self.normalised_cooperation = self._build_normalised_cooperation()
-        self.ranking = self._build_ranking()
-        self.ranked_names = self._build_ranked_names()
+    @cached_property
+    def wins_array(self):
+        return self._reshape_two_dim_array(self._summary(2)["Win"])
 
-        self.payoff_matrix = self._build_summary_matrix(self.payoffs)
-        self.payoff_stddevs = self._build_summary_matrix(
-            self.payoffs, func=np.std
+    @cached_property
+    def scores_array(self):
+        return self._reshape_two_dim_array(self._summary(2)["Score"])
+
+    @cached_property
+    def normalised_scores_array(self):
+        return self._reshape_two_dim_array(self._summary(3))
+
+    @cached_property
+    def cooperation_array(self):
+        return self._build_cooperation(self._summary(1)["Cooperation count"])
+
+    @cached_property
+    def good_partner_matrix_array(self):
+        return self._build_good_partner_matrix(self._summary(1)["Good partner"])
+
+    @cached_property
+    def state_distribution_array(self):
+        return self._build_state_distribution(self._summary(1)[STATE_COLUMNS])
+
+    @cached_property
+    def normalised_state_distribution_array(self):
+        return self._build_normalised_state_distribution()
+
+    @cached_property
+    def state_to_action_distribution_array(self):
+        return self._build_state_to_action_distribution(
+            self._summary(1)[STATE_TO_ACTION_COLUMNS]
         )
 
-        self.payoff_diffs_means = self._build_payoff_diffs_means()
-        self.cooperating_rating = self._build_cooperating_rating()
-        self.vengeful_cooperation = self._build_vengeful_cooperation()
-        self.eigenjesus_rating = self._build_eigenjesus_rating()
-        self.eigenmoses_rating = self._build_eigenmoses_rating()
+    @cached_property
+    def normalised_state_to_action_distribution_array(self):
+        return self._build_normalised_state_to_action_distribution()
+
+    @cached_property
+    def initial_cooperation_count_array(self):
+        return self._build_initial_cooperation_count(self._summary(4))
+
+    @cached_property
+    def initial_cooperation_rate_array(self):
+        return self._build_initial_cooperation_rate(self._interactions)
+
+    @cached_property
+    def good_partner_rating_array(self):
+        return self._build_good_partner_rating(self._interactions)
+
+    @cached_property
+    def normalised_cooperation_array(self):
+        return self._build_normalised_cooperation()
+
+    @cached_property
+    def ranking(self):
+        return self._build_ranking()
+
+    @cached_property
+    def ranked_names(self):
+        return self._build_ranked_names()
+
+    @cached_property
+    def payoff_matrix_array(self):
+        return self._build_summary_matrix(self.payoffs_array)
+
+    @cached_property
+    def payoff_stddevs_array(self):
+        return self._build_summary_matrix(self.payoffs_array, func=np.std)
+
+    @cached_property
+    def payoff_diffs_means_array(self):
+        return self._build_payoff_diffs_means()
+
+    @cached_property
+    def cooperating_rating_array(self):
+        return self._build_cooperating_rating()
+
+    @cached_property
+    def vengeful_cooperation_array(self):
+        return self._build_vengeful_cooperation()
+
+    @cached_property
+    def eigenjesus_rating(self):
+        return self._build_eigenjesus_rating()
+
+    @cached_property
+    def eigenmoses_rating(self):
+        return self._build_eigenmoses_rating()
+
+    score_diffs = _listed_per_repetition("score_diffs_array", axes=(0, 1, 2))
+    match_lengths = _listed_per_repetition(
+        "match_lengths_array", axes=(2, 0, 1)
+    )
+    wins = _listed("wins_array")
+    scores = _listed("scores_array")
+    normalised_scores = _listed("normalised_scores_array")
+    cooperation = _listed("cooperation_array")
+    good_partner_matrix = _listed("good_partner_matrix_array")
+    state_distribution = _counters("state_distribution_array", STATE_KEYS)
+    normalised_state_distribution = _counters(
+        "normalised_state_distribution_array", STATE_KEYS
+    )
+    state_to_action_distribution = _counters(
+        "state_to_action_distribution_array", STATE_TO_ACTION_KEYS
+    )
+    normalised_state_to_action_distribution = _counters(
+        "normalised_state_to_action_distribution_array", STATE_TO_ACTION_KEYS
+    )
+    initial_cooperation_count = _listed("initial_cooperation_count_array")
+    initial_cooperation_rate = _listed("initial_cooperation_rate_array")
+    good_partner_rating = _listed("good_partner_rating_array")
+    normalised_cooperation = _listed("normalised_cooperation_array")
+    payoff_matrix = _listed("payoff_matrix_array")
+    payoff_stddevs = _listed("payoff_stddevs_array")
+    payoff_diffs_means = _listed("payoff_diffs_means_array")
+    cooperating_rating = _listed("cooperating_rating_array")
+    vengeful_cooperation = _listed("vengeful_cooperation_array")
 
     @update_progress_bar
-    def _reshape_three_dim_list(
-        self,
-        series,
-        first_dimension,
-        second_dimension,
-        third_dimension,
-        alternative=None,
-        key_order=[0, 1, 2],
-    ):
+    def _reshape_three_dim_array(self, series, shape, levels, alternative=0):
         """
         Parameters
         ----------
             series : pandas.Series
-            first_dimension : iterable
-            second_dimension : iterable
-            third_dimension : iterable
-            alternative : int
-                What to do if there is no entry at given position
-            key_order : list
-                Indices re-ording the dimensions to the correct keys in the
-                series
+                Indexed by repetition, player index and opponent index
+            shape : tuple
+                The shape of the array
+            levels : list
+                The level of the index of the series giving the position
+                along each dimension of the array
+            alternative : float
+                The value where there is no entry in the series
 
         Returns:
         --------
-            A three dimensional list across the three dimensions
-        """
-        series_dict = series.to_dict()
-        output = []
-        for first_index in first_dimension:
-            matrix = []
-            for second_index in second_dimension:
-                row = []
-                for third_index in third_dimension:
-                    key = (first_index, second_index, third_index)
-                    key = tuple([key[order] for order in key_order])
-                    if key in series_dict:
-                        row.append(series_dict[key])
-                    elif alternative is not None:
-                        row.append(alternative)
-                matrix.append(row)
-            output.append(matrix)
-        return output
+            A three dimensional array
+        """
+        return _series_to_array(series, shape, levels, alternative)
 
     @update_progress_bar
-    def _reshape_two_dim_list(self, series):
+    def _reshape_two_dim_array(self, series):
         """
         Parameters
         ----------
             series : pandas.Series
+                Indexed by player index and repetition
 
         Returns:
         --------
-            A two dimensional list across repetitions and opponents
+            A two dimensional array across players and repetitions
         """
-        series_dict = series.to_dict()
-        out = [
-            [
-                series_dict.get((player_index, repetition), 0)
-                for repetition in range(self.repetitions)
-            ]
-            for player_index in range(self.num_players)
-        ]
-        return out
+        return _series_to_array(
+            series, (self.num_players, self.repetitions), levels=[0, 1]
+        )
 
     @update_progress_bar
     def _build_cooperation(self, cooperation_series):
-        cooperation_dict = cooperation_series.to_dict()
-        cooperation = []
-        for player_index in range(self.num_players):
-            row = []
-            for opponent_index in range(self.num_players):
-                count = cooperation_dict.get((player_index, opponent_index), 0)
-                if player_index == opponent_index:
-                    # Address double count
-                    count = int(count / 2)
-                row.append(count)
-            cooperation.append(row)
+        cooperation = _series_to_array(
+            cooperation_series, (self.num_players, self.num_players), [0, 1]
+        )
+        # Address double count
+        diagonal = np.diag_indices(self.num_players)
+        cooperation[diagonal] = (cooperation[diagonal] / 2).astype(
+            cooperation.dtype
+        )
         return cooperation
 
     @update_progress_bar
     def _build_good_partner_matrix(self, good_partner_series):
-        good_partner_dict = good_partner_series.to_dict()
-        good_partner_matrix = []
-        for player_index in range(self.num_players):
-            row = []
-            for opponent_index in range(self.num_players):
-                if player_index == opponent_index:
-                    # The reduce operation implies a double count of self
-                    # interactions.
-                    row.append(0)
-                else:
-                    row.append(
-                        good_partner_dict.get((player_index, opponent_index), 0)
-                    )
-            good_partner_matrix.append(row)
+        good_partner_matrix = _series_to_array(
+            good_partner_series, (self.num_players, self.num_players), [0, 1]
+        )
+        # The reduce operation implies a double count of self interactions.
+        np.fill_diagonal(good_partner_matrix, 0)
         return good_partner_matrix
 
     @update_progress_bar
     def _build_summary_matrix(self, attribute, func=np.mean):
-        matrix = [
-            [0 for opponent_index in range(self.num_players)]
-            for player_index in range(self.num_players)
-        ]
-
-        pairs = itertools.product(range(self.num_players), repeat=2)
-
-        for player_index, opponent_index in pairs:
-            utilities = attribute[player_index][opponent_index]
-            if utilities:
-                matrix[player_index][opponent_index] = func(utilities)
+        """
+        Parameters
+        ----------
+            attribute : numpy.ndarray
+                The values of each repetition, by player and opponent, with
+                nan for the repetitions that were not played
+            func : callable
+                The summary of the values of a pair of players
 
+        Returns:
+        --------
+            A two dimensional array, with 0 for the pairs that did not play
+        """
+        matrix = np.zeros(attribute.shape[:2])
+        played = self._played
+        complete = played.all(axis=2)
+        if complete.any():
+            matrix[complete] = func(attribute[complete], axis=1)
+        partial = played.any(axis=2) & ~complete
+        for player_index, opponent_index in zip(*np.nonzero(partial)):
+            utilities = attribute[player_index, opponent_index]
+            matrix[player_index, opponent_index] = func(
+                utilities[played[player_index, opponent_index]]
+            )
         return matrix
 
     @update_progress_bar
     def _build_payoff_diffs_means(self):
-        payoff_diffs_means = [
-            [np.mean(diff) for diff in player] for player in self.score_diffs
-        ]
-
-        return payoff_diffs_means
+        return np.mean(self.score_diffs_array, axis=2)
 
     @update_progress_bar
     def _build_state_distribution(self, state_distribution_series):
-        state_key_map = {
-            "CC count": (C, C),
-            "CD count": (C, D),
-            "DC count": (D, C),
-            "DD count": (D, D),
-        }
-        state_distribution = [
-            [
-                create_counter_dict(
-                    state_distribution_series,
-                    player_index,
-                    opponent_index,
-                    state_key_map,
-                )
-                for opponent_index in range(self.num_players)
-            ]
-            for player_index in range(self.num_players)
-        ]
+        """
+        Returns:
+        --------
+            An array of shape (players, players, 4) of the number of times
+            each state (CC, CD, DC, DD) occurs, with no counts for self
+            interactions.
+        """
+        n = self.num_players
+        state_distribution = _series_to_array(
+            state_distribution_series, (n, n, len(STATE_KEYS)), [0, 1]
+        )
+        state_distribution[np.diag_indices(n)] = 0
         return state_distribution
 
     @update_progress_bar
@@ -335,132 +655,81 @@ class ResultSet:
         """
         Returns:
         --------
-            norm : list
-
-            Normalised state distribution. A list of lists of counter objects:
+            norm : numpy.ndarray
 
-            Dictionary where the keys are the states and the values are a
-            normalized counts of the number of times that state occurs.
+            Normalised state distribution: the count of each state divided
+            by the total count of the states of the pair of players.
         """
-        normalised_state_distribution = []
-        for player in self.state_distribution:
-            counters = []
-            for counter in player:
-                total = sum(counter.values())
-                counters.append(
-                    Counter(
-                        {key: value / total for key, value in counter.items()}
-                    )
-                )
-            normalised_state_distribution.append(counters)
-        return normalised_state_distribution
+        counts = self.state_distribution_array
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalised = counts / counts.sum(axis=2, keepdims=True)
+        return np.nan_to_num(normalised)
 
     @update_progress_bar
     def _build_state_to_action_distribution(
         self, state_to_action_distribution_series
     ):
-        state_to_action_key_map = {
-            "CC to C count": ((C, C), C),
-            "CC to D count": ((C, C), D),
-            "CD to C count": ((C, D), C),
-            "CD to D count": ((C, D), D),
-            "DC to C count": ((D, C), C),
-            "DC to D count": ((D, C), D),
-            "DD to C count": ((D, D), C),
-            "DD to D count": ((D, D), D),
-        }
-        state_to_action_distribution = [
-            [
-                create_counter_dict(
-                    state_to_action_distribution_series,
-                    player_index,
-                    opponent_index,
-                    state_to_action_key_map,
-                )
-                for opponent_index in range(self.num_players)
-            ]
-            for player_index in range(self.num_players)
-        ]
-        return state_to_action_distribution
+        """
+        Returns:
+        --------
+            An array of shape (players, players, 4, 2) of the number of times
+            each state (CC, CD, DC, DD) is followed by each action (C, D),
+            with no counts for self interactions.
+        """
+        n = self.num_players
+        state_to_action_distribution = _series_to_array(
+            state_to_action_distribution_series,
+            (n, n, len(STATE_TO_ACTION_KEYS)),
+            [0, 1],
+        )
+        state_to_action_distribution[np.diag_indices(n)] = 0
+        return state_to_action_distribution.reshape(n, n, 4, 2)
 
     @update_progress_bar
     def _build_normalised_state_to_action_distribution(self):
         """
         Returns:
         --------
-            norm : list
-
-            A list of lists of counter objects.
-
-            Dictionary where the keys are the states and the values are a
-            normalized counts of the number of times that state goes to a given
-            action.
-        """
-        normalised_state_to_action_distribution = []
-        for player in self.state_to_action_distribution:
-            counters = []
-            for counter in player:
-                norm_counter = Counter()
-                for state in [(C, C), (C, D), (D, C), (D, D)]:
-                    total = counter[(state, C)] + counter[(state, D)]
-                    if total > 0:
-                        for action in [C, D]:
-                            if counter[(state, action)] > 0:
-                                norm_counter[(state, action)] = (
-                                    counter[(state, action)] / total
-                                )
-                counters.append(norm_counter)
-            normalised_state_to_action_distribution.append(counters)
-        return normalised_state_to_action_distribution
+            norm : numpy.ndarray
+
+            The number of times that each state goes to a given action divided
+            by the number of times the state occurs.
+        """
+        counts = self.state_to_action_distribution_array
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalised = counts / counts.sum(axis=3, keepdims=True)
+        return np.nan_to_num(normalised)
 
     @update_progress_bar
     def _build_initial_cooperation_count(
         self, initial_cooperation_count_series
     ):
-        initial_cooperation_count_dict = (
-            initial_cooperation_count_series.to_dict()
+        return _series_to_array(
+            initial_cooperation_count_series, (self.num_players,), [0]
         )
-        initial_cooperation_count = [
-            initial_cooperation_count_dict.get(player_index, 0)
-            for player_index in range(self.num_players)
-        ]
-        return initial_cooperation_count
 
     @update_progress_bar
     def _build_normalised_cooperation(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            normalised_cooperation = [
-                list(np.nan_to_num(row))
-                for row in np.array(self.cooperation)
-                / sum(map(np.array, self.match_lengths))
-            ]
-            return normalised_cooperation
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalised_cooperation = self.cooperation_array / np.sum(
+                self.match_lengths_array, axis=0
+            )
+        return np.nan_to_num(normalised_cooperation)
 
     @update_progress_bar
-    def _build_initial_cooperation_rate(self, interactions_series):
-        interactions_array = np.array(
-            [
-                interactions_series.get(player_index, 0)
-                for player_index in range(self.num_players)
-            ]
-        )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            initial_cooperation_rate = list(
-                np.nan_to_num(
-                    np.array(self.initial_cooperation_count)
-                    / interactions_array
-                )
+    def _build_initial_cooperation_rate(self, interactions):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            initial_cooperation_rate = (
+                self.initial_cooperation_count_array / interactions
             )
-            return initial_cooperation_rate
+        return np.nan_to_num(initial_cooperation_rate)
 
     @update_progress_bar
     def _build_ranking(self):
-        ranking = sorted(
-            range(self.num_players),
-            key=lambda i: -np.nanmedian(self.normalised_scores[i]),
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            medians = np.nanmedian(self.normalised_scores_array, axis=1)
+        ranking = sorted(range(self.num_players), key=lambda i: -medians[i])
         return ranking
 
     @update_progress_bar
@@ -477,7 +746,7 @@ class ResultSet:
         http://www.scottaaronson.com/morality.pdf
         """
         eigenvector, eigenvalue = eigen.principal_eigenvector(
-            self.vengeful_cooperation
+            self.vengeful_cooperation_array
         )
 
         return eigenvector.tolist()
@@ -491,7 +760,7 @@ class ResultSet:
         http://www.scottaaronson.com/morality.pdf
         """
         eigenvector, eigenvalue = eigen.principal_eigenvector(
-            self.normalised_cooperation
+            self.normalised_cooperation_array
         )
 
         return eigenvector.tolist()
@@ -501,39 +770,20 @@ class ResultSet:
         """
         Returns:
         --------
-            The list of cooperation ratings
-            List of the form:
+            The array of cooperation ratings, of the form:
 
             [ML1, ML2, ML3..., MLn]
 
-            Where n is the number of players and MLi is a list of the form:
-
-            [pi1, pi2, pi3, ..., pim]
-
-            Where pij is the total number of cooperations divided by the total
-            number of turns over all repetitions played by player i against
-            player j.
+            Where n is the number of players and MLi is the total number of
+            cooperations of player i divided by the total number of turns over
+            all repetitions played by player i against the other players.
         """
-
-        plist = list(range(self.num_players))
-        total_length_v_opponent = [
-            zip(*[rep[player_index] for rep in self.match_lengths])
-            for player_index in plist
-        ]
-        lengths = [
-            [sum(e) for j, e in enumerate(row) if i != j]
-            for i, row in enumerate(total_length_v_opponent)
-        ]
-
-        cooperation = [
-            [col for j, col in enumerate(row) if i != j]
-            for i, row in enumerate(self.cooperation)
-        ]
+        others = ~np.eye(self.num_players, dtype=bool)
+        lengths = np.sum(self.match_lengths_array, axis=0)
+        lengths = np.where(others, lengths, 0).sum(axis=1)
+        cooperation = np.where(others, self.cooperation_array, 0).sum(axis=1)
         # Max is to deal with edge cases of matches that have no turns
-        cooperating_rating = [
-            sum(cs) / max(1, sum(ls)) for cs, ls in zip(cooperation, lengths)
-        ]
-        return cooperating_rating
+        return cooperation / np.maximum(1, lengths)
 
     @update_progress_bar
     def _build_vengeful_cooperation(self):
@@ -545,30 +795,24 @@ class ResultSet:
 
                 Dij = 2(Cij - 0.5)
         """
-        vengeful_cooperation = [
-            [2 * (element - 0.5) for element in row]
-            for row in self.normalised_cooperation
-        ]
-        return vengeful_cooperation
+        return 2 * (self.normalised_cooperation_array - 0.5)
 
     @update_progress_bar
-    def _build_good_partner_rating(self, interactions_series):
+    def _build_good_partner_rating(self, interactions):
         """
         At the end of a read of the data, build the good partner rating
         attribute
         """
-        interactions_dict = interactions_series.to_dict()
-        good_partner_rating = [
-            sum(self.good_partner_matrix[player])
-            / max(1, interactions_dict.get(player, 0))
-            for player in range(self.num_players)
-        ]
-        return good_partner_rating
+        return self.good_partner_matrix_array.sum(axis=1) / np.maximum(
+            1, interactions
+        )
 
     def _compute_tasks(self, tasks, processes):
         """
         Compute all dask tasks
         """
+        import dask as da
+
         if processes is None:
             out = da.compute(*tasks, scheduler="single-threaded")
         else:
@@ -705,8 +949,8 @@ class ResultSet:
 
         """
 
-        median_scores = map(np.nanmedian, self.normalised_scores)
-        median_wins = map(np.nanmedian, self.wins)
+        median_scores = np.nanmedian(self.normalised_scores_array, axis=1)
+        median_wins = np.nanmedian(self.wins_array, axis=1)
 
         self.player = namedtuple(
             "Player",
@@ -728,36 +972,31 @@ class ResultSet:
             ],
         )
 
-        states = [(C, C), (C, D), (D, C), (D, D)]
-        state_prob = []
-        for i, player in enumerate(self.normalised_state_distribution):
-            counts = []
-            for state in states:
-                p = sum([opp[state] for j, opp in enumerate(player) if i != j])
-                counts.append(p)
-            try:
-                counts = [c / sum(counts) for c in counts]
-            except ZeroDivisionError:
-                counts = [0 for c in counts]
-            state_prob.append(counts)
-
-        state_to_C_prob = []
-        for player in self.normalised_state_to_action_distribution:
-            rates = []
-            for state in states:
-                counts = [
-                    counter[(state, C)]
-                    for counter in player
-                    if counter[(state, C)] > 0
-                ]
-
-                if len(counts) > 0:
-                    rate = np.mean(counts)
-                else:
-                    rate = 0
+        # Self interactions have no states
+        state_prob = self.normalised_state_distribution_array.sum(axis=1)
+        totals = state_prob.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            state_prob = np.nan_to_num(state_prob / totals).tolist()
+        # The rates of a player that reaches no state are written as 0
+        state_prob = [
+            rates if total else [0] * len(rates)
+            for rates, total in zip(state_prob, totals[:, 0])
+        ]
 
-                rates.append(rate)
-            state_to_C_prob.append(rates)
+        # The mean rate of cooperation after each state, over the opponents
+        # against which it occurs
+        state_to_C_prob = self.normalised_state_to_action_distribution_array[
+            :, :, :, 0
+        ]
+        occurrences = np.count_nonzero(state_to_C_prob, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            state_to_C_prob = np.nan_to_num(
+                state_to_C_prob.sum(axis=1) / occurrences
+            ).tolist()
+        state_to_C_prob = [
+            [rate if count else 0 for rate, count in zip(rates, counts)]
+            for rates, counts in zip(state_to_C_prob, occurrences)
+        ]
 
         summary_measures = list(
             zip(
@@ -797,11 +1036,996 @@ class ResultSet:
                 writer.writerow(player)
 
 
+SUM_PER_PLAYER_OPPONENT_COLUMNS = [
+    "Cooperation count",
+    "CC count",
+    "CD count",
+    "DC count",
+    "DD count",
+    "CC to C count",
+    "CC to D count",
+    "CD to C count",
+    "CD to D count",
+    "DC to C count",
+    "DC to D count",
+    "DD to C count",
+    "DD to D count",
+    "Good partner",
+]
+
+
+# The arrays of a ResultSetBuilder, mapping the compensated sums to their
+# compensations
+_COMPENSATIONS = {
+    "_score_per_turn": "_score_per_turn_compensation",
+    "_score_diff_per_turn": "_score_diff_per_turn_compensation",
+    "_score": "_score_compensation",
+}
+# The aggregates of a ResultSetBuilder: per repetition, player and opponent,
+# per player and opponent, and per player
+_CELL_AGGREGATES = [
+    "_counts",
+    "_turns",
+    "_score_per_turn",
+    "_score_per_turn_compensation",
+    "_score_diff_per_turn",
+    "_score_diff_per_turn_compensation",
+    "_score",
+    "_score_compensation",
+]
+_PAIR_AGGREGATES = ["_pair_sums"]
+_PLAYER_AGGREGATES = ["_player_counts", "_wins", "_initial_cooperation"]
+_AGGREGATES = _CELL_AGGREGATES + _PAIR_AGGREGATES + _PLAYER_AGGREGATES
+
+# The columns of an interactions file that identify the cell of a row in the
+# aggregates per repetition, player and opponent
+_CELL_COLUMNS = ["Repetition", "Player index", "Opponent index"]
+
+
+# The columns of an interactions file that are aggregated by a
+# ResultSetBuilder
+_FOLDED_COLUMNS = [
+    "Repetition",
+    "Player index",
+    "Opponent index",
+    "Turns",
+    "Score",
+    "Score per turn",
+    "Score difference per turn",
+    "Win",
+    "Initial cooperation",
+] + SUM_PER_PLAYER_OPPONENT_COLUMNS
+
+# The default number of rows of an interactions file read at a time by
+# `ResultSetBuilder.from_file`
+DEFAULT_CHUNK_SIZE = 2**18
+
+# Estimates of the memory, in bytes, needed to read and aggregate a chunk of
+# an interactions file, from which `ResultSetBuilder.from_file` sizes the
+# chunks for a memory_limit: for each of its rows, and for reading the file
+# and for each pair of players whatever the size of the chunk
+_ROW_MEMORY = 1024
+_READ_MEMORY = 2**21
+_PAIR_MEMORY = 16
+
+
+def _compensated_add(sums, compensations, index, values):
+    """
+    Add values to sums[index] using Kahan summation.
+
+    This is the summation used by pandas for grouped sums and means so that
+    incremental results are identical to those read from a binary file (see
+    ResultSetBuilder).
+    """
+    y = values - compensations[index]
+    t = sums[index] + y
+    compensations[index] = (t - sums[index]) - y
+    sums[index] = t
+
+
+def _occurrences(keys):
+    """
+    Returns, for each of the keys, the number of times it occurs before in
+    keys.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    positions = np.arange(len(keys))
+    starts = np.ones(len(keys), dtype=bool)
+    starts[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    occurrences = np.empty(len(keys), dtype=np.int64)
+    occurrences[order] = positions - np.maximum.accumulate(
+        np.where(starts, positions, 0)
+    )
+    return occurrences
+
+
+class _ByteRange(io.RawIOBase):
+    """
+    A readable file of the bytes of an open file from its position up to an
+    offset. Used to parse a part of a csv file with pandas.
+    """
+
+    def __init__(self, file, stop):
+        self._file, self._stop = file, stop
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = max(min(len(buffer), self._stop - self._file.tell()), 0)
+        data = self._file.read(size)
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _partition(filename, parts):
+    """
+    Splits an interactions file into at most `parts` contiguous ranges of
+    rows of about the same size, without reading it: ranges of row numbers
+    for a binary file and ranges of byte offsets of whole lines for a csv
+    file. Used by `ResultSetBuilder.from_file`.
+
+    A range never ends between two rows of the same repetition, player and
+    opponent (the two rows of a self interaction, which are written one
+    after the other), so that the ranges add to different cells of the
+    aggregates.
+    """
+    if is_binary_file(filename):
+        rows = BinaryInteractions(filename).rows
+        start, stop = 0, len(rows)
+
+        def cell(row):
+            return [rows[column][row] for column in _CELL_COLUMNS]
+
+        bounds = [start]
+        for part in range(1, parts):
+            bound = max(stop * part // parts, bounds[-1])
+            while 0 < bound < stop and cell(bound - 1) == cell(bound):
+                bound += 1
+            bounds.append(bound)
+    else:
+        with open(filename, "rb") as file:
+            header = next(csv.reader([file.readline().decode()]))
+            positions = [header.index(column) for column in _CELL_COLUMNS]
+            start, stop = file.tell(), os.path.getsize(filename)
+
+            def cell(line):
+                fields = next(csv.reader([line.decode()]))
+                return [fields[position] for position in positions]
+
+            bounds = [start]
+            for part in range(1, parts):
+                file.seek(max(start + (stop - start) * part // parts, start))
+                # Skip to the start of a line
+                file.readline()
+                previous, bound = file.readline(), file.tell()
+                line = file.readline()
+                while line and cell(line) == cell(previous):
+                    previous, bound = line, file.tell()
+                    line = file.readline()
+                bounds.append(max(bound, bounds[-1]))
+    bounds.append(stop)
+    return [
+        range(first, last)
+        for first, last in zip(bounds[:-1], bounds[1:])
+        if last > first
+    ]
+
+
+def _read_chunks(filename, chunk_size, rows=None):
+    """
+    Yields the columns of an interactions file needed by a
+    ResultSetBuilder, as pandas data frames of at most chunk_size rows.
+
+    If rows (a range given by `_partition`) is given only these rows are
+    read.
+    """
+    if is_binary_file(filename):
+        interactions = BinaryInteractions(filename)
+        if rows is None:
+            rows = range(len(interactions))
+        for start in range(rows.start, rows.stop, chunk_size):
+            yield interactions.dataframe(
+                start, min(start + chunk_size, rows.stop)
+            )
+    elif rows is None:
+        with pd.read_csv(
+            filename, usecols=_FOLDED_COLUMNS, chunksize=chunk_size
+        ) as reader:
+            yield from reader
+    else:
+        with open(filename, "rb") as file:
+            names = next(csv.reader([file.readline().decode()]))
+            file.seek(rows.start)
+            with pd.read_csv(
+                io.BufferedReader(_ByteRange(file, rows.stop)),
+                header=None,
+                names=names,
+                usecols=_FOLDED_COLUMNS,
+                chunksize=chunk_size,
+            ) as reader:
+                yield from reader
+
+
+def _read_part(
+    filename,
+    players,
+    repetitions,
+    chunk_size,
+    memory_limit,
+    trace_memory,
+    rows,
+):
+    """
+    Aggregate a range of rows of an interactions file (see `_partition`).
+    Run by the workers of `ResultSetBuilder.from_file`.
+
+    Returns
+    -------
+        The aggregates of these rows (see `ResultSetBuilder._part`), whether
+        the scores are integers and the peak memory used, if it is traced
+    """
+    builder = ResultSetBuilder._read(
+        filename,
+        players,
+        repetitions,
+        chunk_size=chunk_size,
+        memory_limit=memory_limit,
+        rows=rows,
+        trace_memory=trace_memory,
+    )
+    return builder._part(), builder._integer_scores, builder.peak_memory
+
+
+class ResultSetBuilder:
+    """
+    Incrementally aggregates the interactions of a tournament, as they are
+    played, into the running sums and counts needed by ResultSet. This avoids
+    writing the interactions to file and reading them back.
+
+    The aggregates are held in numpy arrays indexed by repetition, player and
+    opponent and give the same ResultSet as reading the corresponding binary
+    file. A csv file holds the scores per turn as text, which pandas may read
+    back one unit in the last place away: the payoffs, payoff matrix, payoff
+    standard deviations and normalised scores read from a csv file (and those
+    of a tournament played without a filename before the results were
+    aggregated in memory) can differ from these in the last digit.
+    The aggregates can be saved to file and the aggregates of different parts
+    of a tournament merged (see `merge`).
+    """
+
+    def __init__(self, players, repetitions):
+        """
+        Parameters
+        ----------
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+        """
+        self.players, self.repetitions = players, repetitions
+        self.num_players = n = len(players)
+
+        # Per repetition, player and opponent
+        self._counts = np.zeros((repetitions, n, n), dtype=np.int64)
+        self._turns = np.zeros((repetitions, n, n), dtype=np.int64)
+        self._score_per_turn = np.zeros((repetitions, n, n))
+        self._score_per_turn_compensation = np.zeros((repetitions, n, n))
+        self._score_diff_per_turn = np.zeros((repetitions, n, n))
+        self._score_diff_per_turn_compensation = np.zeros((repetitions, n, n))
+        self._score = np.zeros((repetitions, n, n))
+        self._score_compensation = np.zeros((repetitions, n, n))
+
+        # Per player and opponent
+        self._pair_sums = np.zeros(
+            (n, n, len(SUM_PER_PLAYER_OPPONENT_COLUMNS)), dtype=np.int64
+        )
+
+        # Per player and repetition, ignoring self interactions
+        self._player_counts = np.zeros((n, repetitions), dtype=np.int64)
+        self._wins = np.zeros((n, repetitions), dtype=np.int64)
+        self._integer_scores = True
+
+        # Per player, ignoring self interactions
+        self._initial_cooperation = np.zeros(n, dtype=np.int64)
+
+        # Set by `from_file` if the memory used to read a file is traced
+        self.peak_memory = None
+
+    def add_interactions(self, results):
+        """
+        Add the output of `Tournament._play_matches`: a dictionary mapping
+        player index pairs to a list of [interaction, results] pairs, one for
+        each repetition.
+        """
+        for index_pair, interactions in results.items():
+            if not interactions:
+                continue
+            repetitions = np.arange(len(interactions))
+            match_results = [results for _, results in interactions]
+            (
+                scores,
+                _,
+                turns,
+                scores_per_turn,
+                score_diffs_per_turn,
+                initial_cooperation,
+                cooperations,
+                state_distributions,
+                state_to_action_distributions,
+                winner_indices,
+            ) = zip(*match_results)
+
+            if self._integer_scores:
+                self._integer_scores = all(
+                    isinstance(score, (int, np.integer))
+                    for pair in scores
+                    for score in pair
+                )
+
+            for index, player_index in enumerate(index_pair):
+                opponent_index = index_pair[index - 1]
+                self._add_player_results(
+                    index,
+                    player_index,
+                    opponent_index,
+                    repetitions,
+                    scores,
+                    turns,
+                    scores_per_turn,
+                    score_diffs_per_turn,
+                    initial_cooperation,
+                    cooperations,
+                    state_distributions,
+                    state_to_action_distributions,
+                    winner_indices,
+                )
+
+    def _add_player_results(
+        self,
+        index,
+        player_index,
+        opponent_index,
+        repetitions,
+        scores,
+        turns,
+        scores_per_turn,
+        score_diffs_per_turn,
+        initial_cooperation,
+        cooperations,
+        state_distributions,
+        state_to_action_distributions,
+        winner_indices,
+    ):
+        """Add the rows of one of the players of a match, as written to file
+        by `Tournament._write_interactions_to_file`."""
+        cell = (repetitions, player_index, opponent_index)
+        self._counts[cell] += 1
+        self._turns[cell] += turns
+        _compensated_add(
+            self._score_per_turn,
+            self._score_per_turn_compensation,
+            cell,
+            np.array([s[index] for s in scores_per_turn], dtype=float),
+        )
+        _compensated_add(
+            self._score_diff_per_turn,
+            self._score_diff_per_turn_compensation,
+            cell,
+            np.array([s[index] for s in score_diffs_per_turn], dtype=float),
+        )
+        _compensated_add(
+            self._score,
+            self._score_compensation,
+            cell,
+            np.array([s[index] for s in scores], dtype=float),
+        )
+
+        states = [(C, C), (C, D), (D, C), (D, D)]
+        if index == 1:
+            states = [s[::-1] for s in states]
+        own_cooperations = [c[index] for c in cooperations]
+        sums = [sum(own_cooperations)]
+        sums.extend(
+            sum(distribution[state] for distribution in state_distributions)
+            for state in states
+        )
+        for state in states:
+            for action in (C, D):
+                sums.append(
+                    sum(
+                        distributions[index][(state, action)]
+                        for distributions in state_to_action_distributions
+                    )
+                )
+        sums.append(sum(int(c[index] >= c[index - 1]) for c in cooperations))
+        self._pair_sums[player_index, opponent_index] += sums
+
+        if player_index != opponent_index:
+            cell = (player_index, repetitions)
+            self._player_counts[cell] += 1
+            self._wins[cell] += [
+                int(winner_index is index) for winner_index in winner_indices
+            ]
+            self._initial_cooperation[player_index] += sum(
+                bool(c[index]) for c in initial_cooperation
+            )
+
+    def add_rows(self, df):
+        """
+        Add rows of an interactions file, as read by pandas (see
+        `from_file`).
+
+        The rows are added in order so that, for a file written by a
+        tournament, the aggregates are the same as those of its interactions
+        added as they were played.
+
+        Parameters
+        ----------
+            df : pandas.DataFrame
+                The rows, with (at least) the columns used to build a
+                ResultSet
+        """
+        if not len(df):
+            return
+        n = self.num_players
+        repetitions = df["Repetition"].to_numpy(dtype=np.intp)
+        players = df["Player index"].to_numpy(dtype=np.intp)
+        opponents = df["Opponent index"].to_numpy(dtype=np.intp)
+        self._integer_scores &= np.issubdtype(df["Score"].dtype, np.integer)
+
+        # A cell appears more than once for a self interaction: its rows are
+        # added in turn so that each cell is indexed once by each addition
+        occurrences = _occurrences((repetitions * n + players) * n + opponents)
+        for occurrence in range(occurrences.max() + 1):
+            rows = occurrences == occurrence
+            cell = (repetitions[rows], players[rows], opponents[rows])
+            self._counts[cell] += 1
+            self._turns[cell] += df["Turns"].to_numpy()[rows]
+            for name, column in (
+                ("_score_per_turn", "Score per turn"),
+                ("_score_diff_per_turn", "Score difference per turn"),
+                ("_score", "Score"),
+            ):
+                _compensated_add(
+                    getattr(self, name),
+                    getattr(self, _COMPENSATIONS[name]),
+                    cell,
+                    df[column].to_numpy(dtype=float)[rows],
+                )
+
+        pairs = players * n + opponents
+        for index, column in enumerate(SUM_PER_PLAYER_OPPONENT_COLUMNS):
+            self._pair_sums[:, :, index] += (
+                np.bincount(
+                    pairs, weights=df[column].to_numpy(), minlength=n * n
+                )
+                .reshape(n, n)
+                .astype(np.int64)
+            )
+
+        rows = players != opponents
+        cells = players[rows] * self.repetitions + repetitions[rows]
+        size = n * self.repetitions
+        self._player_counts += np.bincount(cells, minlength=size).reshape(
+            n, self.repetitions
+        )
+        self._wins += (
+            np.bincount(
+                cells, weights=df["Win"].to_numpy()[rows], minlength=size
+            )
+            .reshape(n, self.repetitions)
+            .astype(np.int64)
+        )
+        self._initial_cooperation += np.bincount(
+            players[rows],
+            weights=df["Initial cooperation"].to_numpy()[rows],
+            minlength=n,
+        ).astype(np.int64)
+
+    def _part(self):
+        """
+        Returns the aggregates of the cells (of a repetition, player and
+        opponent) and of the pairs of players that rows were added to, and
+        the aggregates per player, as a tuple of the flat indices of the
+        cells and of the pairs and a dictionary of the aggregates. Only these
+        cells are sent back by the workers of `from_file`, as each reads a
+        part of the file.
+        """
+        n = self.num_players
+        cells = np.flatnonzero(self._counts)
+        pairs = np.flatnonzero(self._counts.any(axis=0))
+        aggregates = {
+            name: getattr(self, name).reshape(-1)[cells]
+            for name in _CELL_AGGREGATES
+        }
+        aggregates.update(
+            {
+                name: getattr(self, name).reshape(n * n, -1)[pairs]
+                for name in _PAIR_AGGREGATES
+            }
+        )
+        aggregates.update(
+            {name: getattr(self, name) for name in _PLAYER_AGGREGATES}
+        )
+        return cells, pairs, aggregates
+
+    def _add_part(self, cells, pairs, aggregates):
+        """
+        Add the aggregates of a part of a file (see `_part`). The sums of a
+        cell are added as they are, so the aggregates are the same as those
+        of reading the whole file if no rows of the other parts were added to
+        the same cells.
+        """
+        n = self.num_players
+        for name in _CELL_AGGREGATES:
+            getattr(self, name).reshape(-1)[cells] += aggregates[name]
+        for name in _PAIR_AGGREGATES:
+            getattr(self, name).reshape(n * n, -1)[pairs] += aggregates[name]
+        for name in _PLAYER_AGGREGATES:
+            getattr(self, name)[...] += aggregates[name]
+
+    def _sum_over_opponents(self, values):
+        """
+        Returns the sums, by player and repetition, of values for each
+        repetition, player and opponent, ignoring self interactions.
+
+        The values are added in the order of the opponents (as they are
+        written to file by a serial tournament) so that the sums do not
+        depend on the order in which the interactions were added.
+        """
+        sums = np.zeros((self.num_players, self.repetitions))
+        compensations = np.zeros((self.num_players, self.repetitions))
+        observed = self._counts.transpose(1, 0, 2) > 0
+        for opponent_index in range(self.num_players):
+            cell = observed[:, :, opponent_index].copy()
+            cell[opponent_index] = False
+            _compensated_add(
+                sums,
+                compensations,
+                cell,
+                values[:, :, opponent_index].T[cell],
+            )
+        return sums
+
+    def summaries(self):
+        """
+        Returns the aggregated results as the six pandas objects (see
+        `SUMMARIES`) from which a ResultSet is computed.
+        """
+        observed = np.nonzero(self._counts)
+        counts = self._counts[observed]
+        mean_per_reps_player_opponent_df = pd.DataFrame(
+            {
+                "Turns": self._turns[observed] / counts,
+                "Score per turn": self._score_per_turn[observed] / counts,
+                "Score difference per turn": self._score_diff_per_turn[observed]
+                / counts,
+            },
+            index=pd.MultiIndex.from_arrays(
+                observed, names=["Repetition", "Player index", "Opponent index"]
+            ),
+        )
+
+        observed = np.nonzero(self._counts.sum(axis=0))
+        sum_per_player_opponent_df = pd.DataFrame(
+            self._pair_sums[observed],
+            columns=SUM_PER_PLAYER_OPPONENT_COLUMNS,
+            index=pd.MultiIndex.from_arrays(
+                observed, names=["Player index", "Opponent index"]
+            ),
+        )
+
+        observed = np.nonzero(self._player_counts)
+        scores = self._sum_over_opponents(self._score)[observed]
+        if self._integer_scores:
+            scores = scores.astype(np.int64)
+        index = pd.MultiIndex.from_arrays(
+            observed, names=["Player index", "Repetition"]
+        )
+        sum_per_player_repetition_df = pd.DataFrame(
+            {"Win": self._wins[observed], "Score": scores}, index=index
+        )
+        normalised_scores = self._sum_over_opponents(self._score_per_turn)
+        normalised_scores_series = pd.Series(
+            normalised_scores[observed] / self._player_counts[observed],
+            index=index,
+        )
+
+        interactions_count = self._player_counts.sum(axis=1)
+        (observed,) = np.nonzero(interactions_count)
+        initial_cooperation_count_series = pd.Series(
+            self._initial_cooperation[observed], index=observed
+        )
+        interactions_count_series = pd.Series(
+            interactions_count[observed], index=observed
+        )
+
+        return (
+            mean_per_reps_player_opponent_df,
+            sum_per_player_opponent_df,
+            sum_per_player_repetition_df,
+            normalised_scores_series,
+            initial_cooperation_count_series,
+            interactions_count_series,
+        )
+
+    def save(self, filename):
+        """
+        Write the aggregated results to file so that they can be combined
+        with those of other parts of the tournament (see `merge`).
+
+        Parameters
+        ----------
+            filename : string
+                The file to write to (in numpy's npz format)
+        """
+        arrays = {name: getattr(self, name) for name in _AGGREGATES}
+        with open(filename, "wb") as file_obj:
+            np.savez(
+                file_obj,
+                players=np.array(self.players, dtype=str),
+                repetitions=self.repetitions,
+                integer_scores=self._integer_scores,
+                **arrays,
+            )
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Read aggregated results written by `save`.
+
+        Parameters
+        ----------
+            filename : string
+                The file to read from
+        """
+        with np.load(filename) as data:
+            builder = cls(
+                players=data["players"].tolist(),
+                repetitions=int(data["repetitions"]),
+            )
+            builder._integer_scores = bool(data["integer_scores"])
+            for name in _AGGREGATES:
+                setattr(builder, name, data[name])
+        return builder
+
+    @classmethod
+    def from_file(
+        cls,
+        filename,
+        players,
+        repetitions,
+        chunk_size=None,
+        memory_limit=None,
+        progress_bar=False,
+        processes=None,
+        trace_memory=False,
+    ):
+        """
+        Aggregate the interactions of a file, reading it a chunk of rows at
+        a time, so that the whole file is never held in memory.
+
+        The memory used is that of the aggregates, which depends on the
+        number of players and repetitions but not on the length of the file,
+        and that of the chunk being read. A memory_limit is a target from
+        which the number of rows of a chunk is chosen, using fixed estimates
+        of the memory needed per row, per pair of players and to read the
+        file: it is not enforced and the memory used may exceed it.
+
+        With trace_memory, the peak memory allocated while reading (in any
+        one process) is kept as the `peak_memory` attribute of the builder.
+        It is measured with tracemalloc, so it counts the Python objects and
+        numpy arrays but not the buffers of the pandas csv parser. If
+        tracemalloc is already tracing, its peak is not reset: the
+        `peak_memory` is then an upper bound, as it includes any higher peak
+        traced before the file was read.
+
+        With more than one process, the file is split once into contiguous
+        ranges of rows (of bytes for a csv file), without being read, and
+        each process of a pool parses and aggregates the rows of one range.
+        The processes send back the aggregates of the cells their rows were
+        added to, which are added together. The ranges do not split the rows
+        of a cell, so the result is the same as reading the file in a single
+        process. The rest of the analysis, which depends on the number of
+        players rather than on the length of the file, is carried out in a
+        single process.
+
+        Parameters
+        ----------
+            filename : string
+                A csv or binary interactions file (see
+                axelrod.interaction_store)
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+            chunk_size : int
+                The number of rows to read at a time. Defaults to
+                DEFAULT_CHUNK_SIZE, or to as many rows as fit in
+                memory_limit.
+            memory_limit : int
+                A target for the memory, in bytes, used to read the file in
+                each process, from which the size of the chunks is chosen.
+            progress_bar: boolean
+                If a progress bar of the chunks (or of the parts of the file)
+                read will be shown.
+            processes : integer
+                The number of processes to use, all available cores if 0.
+                By default the file is read in this process.
+            trace_memory : boolean
+                Whether to trace the peak memory allocated while reading.
+
+        Returns
+        -------
+            A ResultSetBuilder
+        """
+        if processes == 0:
+            processes = cpu_count()
+        if processes is None or processes < 2:
+            return cls._read(
+                filename,
+                players,
+                repetitions,
+                chunk_size=chunk_size,
+                memory_limit=memory_limit,
+                progress_bar=progress_bar,
+                trace_memory=trace_memory,
+            )
+
+        parts = _partition(filename, processes)
+        read = partial(
+            _read_part,
+            filename,
+            players,
+            repetitions,
+            chunk_size,
+            memory_limit,
+            trace_memory,
+        )
+        builder = cls(players=players, repetitions=repetitions)
+        with Pool(max(len(parts), 1)) as pool:
+            results = pool.imap(read, parts)
+            if progress_bar:
+                results = tqdm.tqdm(
+                    results, total=len(parts), desc="Reading interactions"
+                )
+            for part, integer_scores, peak_memory in results:
+                builder._add_part(*part)
+                builder._integer_scores &= integer_scores
+                if trace_memory:
+                    builder.peak_memory = max(
+                        builder.peak_memory or 0, peak_memory
+                    )
+        return builder
+
+    @classmethod
+    def _read(
+        cls,
+        filename,
+        players,
+        repetitions,
+        chunk_size=None,
+        memory_limit=None,
+        progress_bar=False,
+        rows=None,
+        trace_memory=False,
+    ):
+        """
+        Aggregate the interactions of a file in this process (see
+        `from_file`).
+
+        Parameters
+        ----------
+            filename : string
+                A csv or binary interactions file (see
+                axelrod.interaction_store)
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+            chunk_size : int
+                The number of rows to read at a time. Defaults to
+                DEFAULT_CHUNK_SIZE, or to as many rows as fit in
+                memory_limit.
+            memory_limit : int
+                A target for the memory, in bytes, used to read the file,
+                from which the size of the chunks is chosen.
+            progress_bar: boolean
+                If a progress bar of the chunks read will be shown.
+            rows : range
+                If given, only these rows (see `_partition`) are aggregated.
+            trace_memory : boolean
+                Whether to trace the peak memory allocated while reading.
+
+        Returns
+        -------
+            A ResultSetBuilder
+        """
+        # A tracing session started by the caller is left as it is
+        start_tracing = trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            if trace_memory:
+                start, _ = tracemalloc.get_traced_memory()
+            builder = cls(players=players, repetitions=repetitions)
+            reserved = (
+                sum(getattr(builder, name).nbytes for name in _AGGREGATES)
+                + _READ_MEMORY
+                + _PAIR_MEMORY * builder.num_players**2
+            )
+
+            if memory_limit is not None:
+                chunk_rows = (memory_limit - reserved) // _ROW_MEMORY
+                if chunk_rows < 1:
+                    raise ValueError(
+                        "Aggregating the results of {} players and {} "
+                        "repetitions needs more than {} bytes.".format(
+                            len(players), repetitions, reserved
+                        )
+                    )
+                chunk_size = min(chunk_size or chunk_rows, chunk_rows)
+            if chunk_size is None:
+                chunk_size = DEFAULT_CHUNK_SIZE
+
+            chunks = _read_chunks(filename, chunk_size, rows)
+            if progress_bar:
+                chunks = tqdm.tqdm(chunks, desc="Reading interactions")
+            for chunk in chunks:
+                builder.add_rows(chunk)
+                # Free the chunk before the next one is read
+                del chunk
+
+            if trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                builder.peak_memory = max(peak - start, 0)
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+        return builder
+
+    @classmethod
+    def merge(cls, *builders):
+        """
+        Combine the aggregated results of parts of a tournament, for example
+        the shards written by `Tournament.play_shard`.
+
+        The sums and counts of each part are added, so the parts can be
+        merged in any order and in any grouping. If the parts are made of
+        different matches (as the shards are) the result is the same as
+        aggregating all the interactions in one builder.
+
+        Parameters
+        ----------
+            builders : ResultSetBuilder
+                The parts of the tournament: each has the same players and
+                number of repetitions
+
+        Returns
+        -------
+            A new ResultSetBuilder
+        """
+        if not builders:
+            raise ValueError("At least one part is needed to merge results.")
+        first = builders[0]
+        for builder in builders[1:]:
+            if (
+                builder.players != first.players
+                or builder.repetitions != first.repetitions
+            ):
+                raise ValueError(
+                    "Only the results of the same players and number of "
+                    "repetitions can be merged."
+                )
+
+        merged = cls(players=first.players, repetitions=first.repetitions)
+        for builder in builders:
+            for name in _AGGREGATES:
+                if name in _COMPENSATIONS.values():
+                    continue
+                if name in _COMPENSATIONS:
+                    compensation = _COMPENSATIONS[name]
+                    _compensated_add(
+                        getattr(merged, name),
+                        getattr(merged, compensation),
+                        ...,
+                        getattr(builder, name) - getattr(builder, compensation),
+                    )
+                else:
+                    getattr(merged, name)[...] += getattr(builder, name)
+            merged._integer_scores &= builder._integer_scores
+        return merged
+
+    def build(self, filename=None, progress_bar=True, metrics=None):
+        """
+        Returns the ResultSet of the interactions added so far.
+
+        Parameters
+        ----------
+            filename : string
+                The file the interactions were written to, if any
+            progress_bar: boolean
+                If a progress bar will be shown.
+            metrics : list
+                The names of the results to compute (see `METRICS`). The
+                other results are computed when they are first accessed. By
+                default all results are computed.
+        """
+        return ResultSet.from_summaries(
+            self.summaries(),
+            players=self.players,
+            repetitions=self.repetitions,
+            filename=filename,
+            progress_bar=progress_bar,
+            metrics=metrics,
+        )
+
+
+def _index_positions(index, levels):
+    """
+    Returns the positions in an array given by levels of a pandas index.
+    """
+    return tuple(
+        index.get_level_values(level).to_numpy(dtype=np.intp)
+        for level in levels
+    )
+
+
+def _series_to_array(values, shape, levels, alternative=0):
+    """
+    Scatter a pandas series (or data frame) into an array. Used by
+    `ResultSet`
+
+    Parameters
+    ----------
+        values : a pandas series or data frame
+        shape : tuple
+            The shape of the array. For a data frame the last dimension
+            corresponds to its columns.
+        levels : list
+            The levels of the index of values giving the position along each
+            of the first dimensions of the array
+        alternative : float
+            The value where there is no entry in values
+
+    Returns
+    -------
+        A numpy array
+    """
+    data = values.to_numpy()
+    array = np.full(shape, alternative, dtype=np.result_type(data, alternative))
+    if len(data):
+        array[_index_positions(values.index, levels)] = data
+    return array
+
+
+def _to_counters(array, keys):
+    """
+    Returns a list of lists of counter objects, mapping keys to the non zero
+    values along the last dimensions of array. Used by `ResultSet`
+    """
+    rows = array.reshape(array.shape[:2] + (len(keys),)).tolist()
+    # There is a counter for each pair of players, so they are filled as
+    # dictionaries rather than by Counter.__init__, which takes longer than
+    # filling them
+    new, update = Counter.__new__, dict.update
+    counters = []
+    for row in rows:
+        counters.append([])
+        for counts in row:
+            counter = new(Counter)
+            update(counter, [item for item in zip(keys, counts) if item[1]])
+            counters[-1].append(counter)
+    return counters
+
+
 def create_counter_dict(df, player_index, opponent_index, key_map):
     """
     Create a Counter object mapping states (corresponding to columns of df) for
     players given by player_index, opponent_index. Renaming the variables with
-    `key_map`. Used by `ResultSet._reshape_out`
+    `key_map`.
 
     Parameters
     ----------
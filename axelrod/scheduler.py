@@ -0,0 +1,266 @@
+"""Scheduling of the chunks of a tournament over parallel workers.
+
+The matches of a tournament do not all take the same time: a chunk with a
+`long_run_time` strategy (such as a meta player) can take a hundred times
+longer than Cooperator against Defector. Dispatching the chunks in the order
+they are generated can leave most workers idle at the end of a run while one
+of them plays an expensive match that it picked up late.
+
+The scheduler:
+
+- estimates the cost of each chunk, either from the classifiers of the players
+  or from timings recorded in a previous run,
+- assigns the chunks to the workers, most expensive first (the longest
+  processing time heuristic) so that each worker starts with its most
+  expensive chunk,
+- lets a worker that has finished its own chunks steal the remaining chunks
+  of the busiest worker.
+"""
+
+import multiprocessing
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from axelrod import DEFAULT_TURNS
+from axelrod.classifier import Classifiers
+from axelrod.player import Player
+
+LONG_RUN_TIME_COST = 100
+INFINITE_MEMORY_COST = 4
+
+WorkerReport = namedtuple(
+    "WorkerReport", ["worker", "chunks", "stolen", "busy_time", "utilisation"]
+)
+
+
+def player_cost(player: Player) -> float:
+    """Returns the relative cost of a single turn played by a player.
+
+    A player with a `long_run_time` costs LONG_RUN_TIME_COST times more than a
+    basic player and a player with an infinite memory depth, that typically
+    inspects its whole history, INFINITE_MEMORY_COST times more.
+    """
+    if Classifiers["long_run_time"](player):
+        return LONG_RUN_TIME_COST
+    if Classifiers["memory_depth"](player) == float("inf"):
+        return INFINITE_MEMORY_COST
+    return 1
+
+
+def expected_turns(turns: Optional[int], prob_end: Optional[float]) -> float:
+    """Returns the expected number of turns of a match.
+
+    The number of turns of a match with a probabilistic ending is capped by
+    `turns`, as in Match. A match with neither a number of turns nor a
+    positive probability of ending is counted as DEFAULT_TURNS long, so that
+    its cost stays finite.
+    """
+    if not prob_end:
+        return DEFAULT_TURNS if turns is None else turns
+    if turns is None:
+        return 1 / prob_end
+    return min(turns, 1 / prob_end)
+
+
+def estimate_chunk_cost(chunk: tuple, players: List[Player]) -> float:
+    """Estimates the relative cost of playing a chunk of a tournament.
+
+    Parameters
+    ----------
+    chunk : tuple
+        (index pair, match parameters, repetitions, seed) as given by
+        MatchGenerator.build_match_chunks
+    players : list
+        The players of the tournament
+
+    Returns
+    -------
+    float
+        The cost of one turn of both players, multiplied by the expected
+        number of turns and by the number of repetitions that are actually
+        played: a deterministic match is only played once, the following
+        repetitions are read from the cache of the match.
+    """
+    index_pair, match_params, repetitions, _ = chunk
+    pair = [players[index] for index in index_pair]
+    turns = expected_turns(match_params["turns"], match_params["prob_end"])
+    stochastic = match_params["noise"] or any(
+        Classifiers["stochastic"](player) for player in pair
+    )
+    if not stochastic:
+        repetitions = 1
+    return sum(player_cost(player) for player in pair) * turns * repetitions
+
+
+def timing_key(chunk: tuple, players: List[Player]) -> Tuple[str, str]:
+    """Returns the key of a chunk in a dictionary of recorded timings."""
+    index_pair = chunk[0]
+    return str(players[index_pair[0]]), str(players[index_pair[1]])
+
+
+def estimate_costs(
+    chunks: List[tuple],
+    players: List[Player],
+    timings: Optional[Dict[Tuple[str, str], float]] = None,
+) -> List[float]:
+    """Estimates the costs of a list of chunks.
+
+    The recorded timings of a previous run are used where they are known.
+    The chunks without a timing are estimated from the classifiers of their
+    players, scaled to seconds by the median ratio of the recorded timings to
+    the estimates.
+
+    Parameters
+    ----------
+    chunks : list
+        The chunks of the tournament
+    players : list
+        The players of the tournament
+    timings : dict
+        Mapping pairs of player names to the time (in seconds) it took to play
+        their chunk
+
+    Returns
+    -------
+    list
+        The cost of each chunk
+    """
+    estimates = [estimate_chunk_cost(chunk, players) for chunk in chunks]
+    if not timings:
+        return estimates
+    keys = [timing_key(chunk, players) for chunk in chunks]
+    ratios = [
+        timings[key] / estimate
+        for key, estimate in zip(keys, estimates)
+        if key in timings and estimate > 0
+    ]
+    if not ratios:
+        return estimates
+    scale = float(np.median(ratios))
+    return [
+        timings[key] if key in timings else estimate * scale
+        for key, estimate in zip(keys, estimates)
+    ]
+
+
+def assign_chunks(costs: List[float], workers: int) -> List[List[int]]:
+    """Assigns chunks to workers with the longest processing time heuristic.
+
+    The chunks are taken in decreasing order of cost and each is assigned to
+    the worker with the smallest total cost so far.
+
+    Parameters
+    ----------
+    costs : list
+        The cost of each chunk
+    workers : int
+        The number of workers
+
+    Returns
+    -------
+    list
+        For each worker, the indices of its chunks in decreasing order of cost
+    """
+    assignments = [[] for _ in range(workers)]  # type: List[List[int]]
+    loads = [0.0] * workers
+    order = sorted(range(len(costs)), key=lambda index: -costs[index])
+    for index in order:
+        worker = loads.index(min(loads))
+        assignments[worker].append(index)
+        loads[worker] += costs[index]
+    return assignments
+
+
+class WorkStealingQueues(object):
+    """Per worker queues of chunk indices, in shared memory.
+
+    A worker takes the chunks of its own queue from the front (the most
+    expensive first). Once its queue is empty it steals from the back of the
+    queue of the worker with the most chunks remaining.
+    """
+
+    def __init__(self, assignments: List[List[int]]) -> None:
+        """
+        Parameters
+        ----------
+        assignments : list
+            For each worker, the indices of its chunks in the order they
+            should be played
+        """
+        items = [index for assignment in assignments for index in assignment]
+        starts = np.cumsum([0] + [len(a) for a in assignments]).tolist()
+        self.workers = len(assignments)
+        self._items = multiprocessing.Array("l", items or [0], lock=False)
+        self._lo = multiprocessing.Array("l", starts[:-1] or [0], lock=False)
+        self._hi = multiprocessing.Array("l", starts[1:] or [0], lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def remaining(self, worker: int) -> int:
+        """Returns the number of chunks left in the queue of a worker."""
+        with self._lock:
+            return self._hi[worker] - self._lo[worker]
+
+    def get(self, worker: int) -> Optional[Tuple[int, bool]]:
+        """Returns the next chunk index for a worker and whether it was stolen
+        from another worker, or None if there is no work left."""
+        with self._lock:
+            if self._lo[worker] < self._hi[worker]:
+                index = self._items[self._lo[worker]]
+                self._lo[worker] += 1
+                return index, False
+            victim = max(
+                range(self.workers), key=lambda w: self._hi[w] - self._lo[w]
+            )
+            if self._lo[victim] < self._hi[victim]:
+                self._hi[victim] -= 1
+                return self._items[self._hi[victim]], True
+        return None
+
+    def iterate(self, worker: int):
+        """Yields the chunk indices (and whether they were stolen) played by a
+        worker until all the queues are empty."""
+        while True:
+            item = self.get(worker)
+            if item is None:
+                return
+            yield item
+
+
+def worker_reports(
+    workers: int, timings: List[Tuple[int, bool, float]], wall_time: float
+) -> List[WorkerReport]:
+    """Summarises the chunks played by each worker.
+
+    Parameters
+    ----------
+    workers : int
+        The number of workers
+    timings : list
+        (worker, stolen, elapsed time) for each chunk played
+    wall_time : float
+        The time between the start of the workers and the end of the run
+
+    Returns
+    -------
+    list
+        A WorkerReport for each worker, its utilisation is the fraction of the
+        wall time it spent playing matches.
+    """
+    chunks = [0] * workers
+    stolen = [0] * workers
+    busy_time = [0.0] * workers
+    for worker, was_stolen, elapsed in timings:
+        chunks[worker] += 1
+        stolen[worker] += int(was_stolen)
+        busy_time[worker] += elapsed
+    return [
+        WorkerReport(
+            worker=worker,
+            chunks=chunks[worker],
+            stolen=stolen[worker],
+            busy_time=busy_time[worker],
+            utilisation=busy_time[worker] / wall_time if wall_time > 0 else 0,
+        )
+        for worker in range(workers)
+    ]
@@ -81,20 +81,63 @@ axelrod_first_strategies = [
     FirstByAnonymous,
     Random,
 ]
-basic_strategies = [s for s in all_strategies if Classifiers.is_basic(s())]
-strategies = [s for s in all_strategies if Classifiers.obey_axelrod(s())]
 
-long_run_time_strategies = [
-    s for s in all_strategies if Classifiers["long_run_time"](s())
-]
-short_run_time_strategies = [
-    s for s in strategies if not Classifiers["long_run_time"](s())
-]
-cheating_strategies = [
-    s for s in all_strategies if not Classifiers.obey_axelrod(s())
-]
 
-ordinary_strategies = strategies  # This is a legacy and will be removed
+# The collections below classify instances of every strategy, which is slow,
+# so they are only computed when they are first used (see `__getattr__`).
+def _basic_strategies():
+    return [s for s in all_strategies if Classifiers.is_basic(s())]
+
+
+def _strategies():
+    return [s for s in all_strategies if Classifiers.obey_axelrod(s())]
+
+
+def _long_run_time_strategies():
+    return [s for s in all_strategies if Classifiers["long_run_time"](s())]
+
+
+def _short_run_time_strategies():
+    return [
+        s
+        for s in __getattr__("strategies")
+        if not Classifiers["long_run_time"](s())
+    ]
+
+
+def _cheating_strategies():
+    return [s for s in all_strategies if not Classifiers.obey_axelrod(s())]
+
+
+def _ordinary_strategies():
+    # This is a legacy and will be removed
+    return __getattr__("strategies")
+
+
+_lazy_collections = {
+    "basic_strategies": _basic_strategies,
+    "strategies": _strategies,
+    "long_run_time_strategies": _long_run_time_strategies,
+    "short_run_time_strategies": _short_run_time_strategies,
+    "cheating_strategies": _cheating_strategies,
+    "ordinary_strategies": _ordinary_strategies,
+}
+
+
+def __getattr__(name):
+    """Computes the strategy collections on first use and keeps them as
+    module attributes."""
+    if name not in _lazy_collections:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    if name not in globals():
+        globals()[name] = _lazy_collections[name]()
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_collections))
 
 
 def filtered_strategies(filterset, strategies=all_strategies):
@@ -18,7 +18,6 @@ from typing import Dict, List, Optional, Tuple
 from axelrod.action import Action
 from axelrod.player import Player
 from axelrod.strategy_transformers import FinalTransformer
-from scipy.stats import chisquare
 
 from .memoryone import MemoryOnePlayer
 
@@ -433,6 +432,8 @@ class FirstByGraaskamp(Player):
             return C
 
         # Check if opponent plays randomly, if so, defect for the rest of the game
+        from scipy.stats import chisquare
+
         p_value = chisquare([opponent.cooperations, opponent.defections]).pvalue
         self.opponent_is_random = (
             p_value >= self.alpha
@@ -890,6 +891,8 @@ class FirstBySteinAndRapoport(Player):
             return opponent.history[-1]
 
         if round_number % 15 == 0:
+            from scipy.stats import chisquare
+
             p_value = chisquare(
                 [opponent.cooperations, opponent.defections]
             ).pvalue
@@ -29,6 +29,12 @@ class Cooperator(Player):
         """Actual strategy definition that determines player's action."""
         return C
 
+    def state_key(self):
+        if type(self).strategy is not Cooperator.strategy:
+            return None
+        # The player always cooperates.
+        return ()
+
 
 class TrickyCooperator(Player):
     """
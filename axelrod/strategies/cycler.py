@@ -95,6 +95,11 @@ class Cycler(Player):
         """Actual strategy definition that determines player's action."""
         return next(self.cycle_iter)
 
+    def state_key(self):
+        if type(self).strategy is not Cycler.strategy:
+            return None
+        return len(self.history) % len(self.cycle)
+
     def set_cycle(self, cycle: str):
         """Set or change the cycle."""
         self.cycle = cycle
@@ -45,6 +45,8 @@ class Darwin(Player):
 
     genome = [C]
     valid_callers = ["play"]  # What functions may invoke our strategy.
+    # __init__ reads the shared genome, which changes during play.
+    reset_from_snapshot = False
 
     def __init__(self) -> None:
         self.outcomes = None  # type: Optional[dict]
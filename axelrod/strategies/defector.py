@@ -29,6 +29,12 @@ class Defector(Player):
         """Actual strategy definition that determines player's action."""
         return D
 
+    def state_key(self):
+        if type(self).strategy is not Defector.strategy:
+            return None
+        # The player always defects.
+        return ()
+
 
 class TrickyDefector(Player):
     """A defector that is trying to be tricky.
@@ -128,6 +128,11 @@ class FSMPlayer(Player):
         else:
             return self.fsm.move(opponent.history[-1])
 
+    def state_key(self):
+        if type(self).strategy is not FSMPlayer.strategy:
+            return None
+        return self.fsm.state
+
 
 class EvolvableFSMPlayer(FSMPlayer, EvolvablePlayer):
     """Abstract base class for evolvable finite state machine players."""
@@ -385,6 +385,25 @@ class LookerUp(Player):
             player_last_n_plays, opponent_last_n_plays, opponent_initial_plays
         )
 
+    def state_key(self):
+        if type(self).strategy is not LookerUp.strategy:
+            return None
+        lookup = self._lookup
+        turn = len(self.history)
+        if turn < max(
+            len(self._initial_actions_pool),
+            lookup.player_depth,
+            lookup.op_depth,
+            lookup.op_openings_depth,
+        ):
+            return None
+        coplays = self.history.coplays
+        return (
+            get_last_n_plays(player=self, depth=lookup.player_depth),
+            tuple(coplays[turn - lookup.op_depth :]),
+            tuple(coplays[: lookup.op_openings_depth]),
+        )
+
     @property
     def lookup_dict(self):
         return self._lookup.dictionary
@@ -134,6 +134,14 @@ class MemoryOnePlayer(Player):
         except AttributeError:
             return D if p == 0 else C
 
+    def state_key(self):
+        if type(self).strategy is not MemoryOnePlayer.strategy or any(
+            0 < p < 1 for p in self._four_vector.values()
+        ):
+            return None
+        # The actions of the previous turn are the whole state.
+        return ()
+
 
 class WinShiftLoseStay(MemoryOnePlayer):
     """Win-Shift Lose-Stay, also called Reverse Pavlov.
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 from axelrod.action import Action
 from axelrod.classifier import Classifiers
@@ -16,10 +18,19 @@ from .hunter import (
     RandomHunter,
 )
 
-# Needs to be computed manually to prevent circular dependency
-ordinary_strategies = [
-    s for s in all_strategies if Classifiers.obey_axelrod(s())
-]
+# The strategies defined before the meta strategies: `all_strategies` is
+# extended with the meta strategies once this module is imported.
+_non_meta_strategies = list(all_strategies)
+
+
+@lru_cache(maxsize=None)
+def _ordinary_strategies():
+    """Returns the strategies that obey Axelrod's rules, other than the meta
+    strategies. This is computed on first use rather than at import as it
+    instantiates every strategy, and manually to prevent a circular
+    dependency."""
+    return [s for s in _non_meta_strategies if Classifiers.obey_axelrod(s())]
+
 
 C, D = Action.C, Action.D
 
@@ -50,7 +61,7 @@ class MetaPlayer(Player):
         if team:
             self.team = team
         else:
-            self.team = ordinary_strategies
+            self.team = _ordinary_strategies()
         # Make sure we don't use any meta players to avoid infinite recursion.
         self.team = [t for t in self.team if not issubclass(t, MetaPlayer)]
         # Initiate all the players in our team.
@@ -189,12 +200,12 @@ class MetaWinner(MetaPlayer):
         # Update the running score for each player, before determining the
         # next move.
         game = self.match_attributes["game"]
-        scores = []
-        for player in self.team:
-            last_round = (player.history[-1], coplay)
-            s = game.scores[last_round][0]
-            scores.append(s)
-        self.scores += np.array(scores)
+        actions = np.fromiter(
+            (player.history[-1].value for player in self.team),
+            dtype=int,
+            count=len(self.team),
+        )
+        self.scores += game.action_payoff_table[2 * actions + coplay.value, 0]
 
     def update_histories(self, coplay):
         super().update_histories(coplay)
@@ -375,7 +386,7 @@ class MetaMajorityMemoryOne(MetaMajority):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) <= 1
         ]
         super().__init__(team=team)
@@ -395,7 +406,7 @@ class MetaMajorityFiniteMemory(MetaMajority):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) < float("inf")
         ]
         super().__init__(team=team)
@@ -414,7 +425,7 @@ class MetaMajorityLongMemory(MetaMajority):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) == float("inf")
         ]
         super().__init__(team=team)
@@ -433,7 +444,7 @@ class MetaWinnerMemoryOne(MetaWinner):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) <= 1
         ]
         super().__init__(team=team)
@@ -453,7 +464,7 @@ class MetaWinnerFiniteMemory(MetaWinner):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) < float("inf")
         ]
         super().__init__(team=team)
@@ -472,7 +483,7 @@ class MetaWinnerLongMemory(MetaWinner):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) == float("inf")
         ]
         super().__init__(team=team)
@@ -490,7 +501,9 @@ class MetaWinnerDeterministic(MetaWinner):
 
     def __init__(self):
         team = [
-            s for s in ordinary_strategies if not Classifiers["stochastic"](s())
+            s
+            for s in _ordinary_strategies()
+            if not Classifiers["stochastic"](s())
         ]
         super().__init__(team=team)
         self.classifier["stochastic"] = False
@@ -508,7 +521,7 @@ class MetaWinnerStochastic(MetaWinner):
 
     def __init__(self):
         team = [
-            s for s in ordinary_strategies if Classifiers["stochastic"](s())
+            s for s in _ordinary_strategies() if Classifiers["stochastic"](s())
         ]
         super().__init__(team=team)
 
@@ -603,7 +616,9 @@ class NMWEDeterministic(NiceMetaWinnerEnsemble):
 
     def __init__(self):
         team = [
-            s for s in ordinary_strategies if not Classifiers["stochastic"](s())
+            s
+            for s in _ordinary_strategies()
+            if not Classifiers["stochastic"](s())
         ]
         super().__init__(team=team)
         self.classifier["stochastic"] = True
@@ -621,7 +636,7 @@ class NMWEStochastic(NiceMetaWinnerEnsemble):
 
     def __init__(self):
         team = [
-            s for s in ordinary_strategies if Classifiers["stochastic"](s())
+            s for s in _ordinary_strategies() if Classifiers["stochastic"](s())
         ]
         super().__init__(team=team)
 
@@ -639,7 +654,7 @@ class NMWEFiniteMemory(NiceMetaWinnerEnsemble):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) < float("inf")
         ]
         super().__init__(team=team)
@@ -658,7 +673,7 @@ class NMWELongMemory(NiceMetaWinnerEnsemble):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) == float("inf")
         ]
         super().__init__(team=team)
@@ -677,7 +692,7 @@ class NMWEMemoryOne(NiceMetaWinnerEnsemble):
     def __init__(self):
         team = [
             s
-            for s in ordinary_strategies
+            for s in _ordinary_strategies()
             if Classifiers["memory_depth"](s()) <= 1
         ]
         super().__init__(team=team)
@@ -47,6 +47,12 @@ class TitForTat(Player):
             return D
         return C
 
+    def state_key(self):
+        if type(self).strategy is not TitForTat.strategy:
+            return None
+        # The actions of the previous turn are the whole state.
+        return ()
+
 
 class TitFor2Tats(Player):
     """A player starts by cooperating and then defects only after two defects by
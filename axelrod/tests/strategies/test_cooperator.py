@@ -25,6 +25,11 @@ class TestCooperator(TestPlayer):
         actions = [(C, C)] + [(C, D), (C, C)] * 9
         self.versus_test(opponent=axl.Alternator(), expected_actions=actions)
 
+    def test_state_key(self):
+        self.assertEqual(axl.Cooperator().state_key(), ())
+        player = axl.strategy_transformers.FlipTransformer()(axl.Cooperator)()
+        self.assertIsNone(player.state_key())
+
 
 class TestTrickyCooperator(TestPlayer):
 
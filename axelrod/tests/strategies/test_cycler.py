@@ -105,6 +105,14 @@ class TestBasicCycler(TestPlayer):
     def test_cycle_raises_value_error_on_bad_cycle_str(self):
         self.assertRaises(ValueError, axl.Cycler, cycle="CdDC")
 
+    def test_state_key(self):
+        player = axl.Cycler(cycle="CCD")
+        self.assertEqual(player.state_key(), 0)
+        player.history.append(C, D)
+        self.assertEqual(player.state_key(), 1)
+        transformed = axl.strategy_transformers.FlipTransformer()(axl.Cycler)()
+        self.assertIsNone(transformed.state_key())
+
 
 def test_cycler_factory(cycle_str):
     class TestCyclerChild(TestPlayer):
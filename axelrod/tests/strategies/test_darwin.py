@@ -70,6 +70,21 @@ class TestDarwin(TestPlayer):
         self.assertEqual(len(p1.history), 0)
         self.assertEqual(p1.genome, [C, C, C, C, D])
 
+    def test_consecutive_matches(self):
+        """Reset reads the genome left by the previous match."""
+        player = self.player()
+        expected_results = [
+            [(C, D)] + [(D, D)] * 4,
+            [(C, C)] * 4 + [(D, C)],
+            [(C, D)] + [(D, D)] * 4,
+            [(C, C)] * 4 + [(D, C)],
+        ]
+        opponents = [axl.Defector(), axl.Cooperator()] * 2
+        for opponent, expected in zip(opponents, expected_results):
+            match = axl.Match((player, opponent), turns=5)
+            self.assertEqual(match.play(), expected)
+        self.assertEqual(player.genome, [D] * 5)
+
     def test_all_darwin_instances_share_one_genome(self):
         p1 = self.player()
         p2 = self.player()
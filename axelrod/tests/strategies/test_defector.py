@@ -26,6 +26,11 @@ class TestDefector(TestPlayer):
         actions = [(D, C)] + [(D, D), (D, C)] * 9
         self.versus_test(opponent=axl.Alternator(), expected_actions=actions)
 
+    def test_state_key(self):
+        self.assertEqual(axl.Defector().state_key(), ())
+        player = axl.strategy_transformers.FlipTransformer()(axl.Defector)()
+        self.assertIsNone(player.state_key())
+
 
 class TestTrickyDefector(TestPlayer):
 
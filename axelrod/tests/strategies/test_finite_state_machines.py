@@ -263,6 +263,12 @@ class TestFSMPlayer(TestPlayer):
         )
         self.assertEqual(un_callable_states, set(), msg=extra_info)
 
+    def test_state_key(self):
+        player = self.player()
+        self.assertEqual(player.state_key(), player.fsm.state)
+        transformed = axl.strategy_transformers.FlipTransformer()(self.player)()
+        self.assertIsNone(transformed.state_key())
+
     def test_strategy(self):
         """
         Regression test for init without specifying initial state or action
@@ -121,6 +121,10 @@ class TestHumanClass(TestPlayer):
         """Overwrite the reset method for this strategy."""
         pass
 
+    def test_reset_from_snapshot_matches_reset_with_init(self):
+        """Overwrite the reset method for this strategy."""
+        pass
+
     def test_repr(self):
         human = Human()
         self.assertEqual(human.__repr__(), "Human: human")
@@ -380,6 +380,19 @@ class TestLookerUp(TestPlayer):
             init_kwargs={"lookup_dict": first_move_table},
         )
 
+    def test_state_key(self):
+        parameters = Plays(self_plays=1, op_plays=2, op_openings=1)
+        player = axl.LookerUp(pattern="C" * 16, parameters=parameters)
+        self.assertIsNone(player.state_key())
+        player.history.append(C, D)
+        self.assertIsNone(player.state_key())
+        player.history.append(D, C)
+        self.assertEqual(player.state_key(), ((D,), (D, C), (D,)))
+        transformed = axl.strategy_transformers.FlipTransformer()(
+            axl.LookerUp
+        )()
+        self.assertIsNone(transformed.state_key())
+
     def test_lookup_table_display(self):
         player = axl.LookerUp(
             pattern="CCCC",
@@ -250,6 +250,16 @@ class TestMemoryOnePlayer(unittest.TestCase):
         with self.assertRaises(ValueError):
             player.set_four_vector([0.1, x, 0.5, 0.1])
 
+    def test_state_key(self):
+        player = MemoryOnePlayer(four_vector=(1, 0, 0, 1))
+        self.assertEqual(player.state_key(), ())
+        player = MemoryOnePlayer(four_vector=(0.5, 0.5, 0.5, 0.5))
+        self.assertIsNone(player.state_key())
+        player = axl.strategy_transformers.FlipTransformer()(MemoryOnePlayer)(
+            four_vector=(1, 0, 0, 1)
+        )
+        self.assertIsNone(player.state_key())
+
 
 class TestSoftJoss(TestPlayer):
 
@@ -122,6 +122,163 @@ class TestPlayerClass(unittest.TestCase):
         self.assertEqual(player.defections, 1)
         self.assertEqual(player.cooperations, 1)
 
+    def test_state_key(self):
+        self.assertIsNone(axl.Player().state_key())
+        self.assertEqual(axl.TitForTat().state_key(), ())
+        transformed = axl.strategy_transformers.FlipTransformer()(
+            axl.TitForTat
+        )()
+        self.assertIsNone(transformed.state_key())
+
+    def test_configuration_key(self):
+        key = axl.Cycler("CCD").configuration_key()
+        self.assertEqual(axl.Cycler("CCD").configuration_key(), key)
+        self.assertNotEqual(axl.Cycler("CDD").configuration_key(), key)
+        self.assertNotEqual(axl.TitForTat().configuration_key(), key)
+        player = pickle.loads(pickle.dumps(axl.Cycler("CCD")))
+        self.assertEqual(player.configuration_key(), key)
+        # The seed is not part of the configuration.
+        self.assertEqual(
+            axl.EvolvableCycler(cycle="CCD", seed=1).configuration_key(),
+            axl.EvolvableCycler(cycle="CCD", seed=2).configuration_key(),
+        )
+        # Tables are compared in full.
+        table, other_table = [0.5] * 200, [0.5] * 199 + [0.25]
+        for convert in (list, np.array):
+            player = ParameterisedTestPlayer(convert(table))
+            other_player = ParameterisedTestPlayer(convert(other_table))
+            self.assertNotEqual(
+                player.configuration_key(), other_player.configuration_key()
+            )
+        # The order of the items of a dictionary does not matter.
+        self.assertEqual(
+            ParameterisedTestPlayer({C: 1, D: 2}).configuration_key(),
+            ParameterisedTestPlayer({D: 2, C: 1}).configuration_key(),
+        )
+        # Nor does the order of the items of a set.
+        self.assertEqual(
+            ParameterisedTestPlayer({C, D}).configuration_key(),
+            ParameterisedTestPlayer({D, C}).configuration_key(),
+        )
+        self.assertNotEqual(
+            ParameterisedTestPlayer({C}).configuration_key(),
+            ParameterisedTestPlayer({C, D}).configuration_key(),
+        )
+        # Classes and players are described by their configuration.
+        self.assertEqual(
+            ParameterisedTestPlayer(axl.TitForTat).configuration_key(),
+            ParameterisedTestPlayer(axl.TitForTat).configuration_key(),
+        )
+        self.assertNotEqual(
+            ParameterisedTestPlayer(axl.TitForTat).configuration_key(),
+            ParameterisedTestPlayer(axl.Cooperator).configuration_key(),
+        )
+        self.assertEqual(
+            ParameterisedTestPlayer(axl.Cycler("CCD")).configuration_key(),
+            ParameterisedTestPlayer(axl.Cycler("CCD")).configuration_key(),
+        )
+        self.assertNotEqual(
+            ParameterisedTestPlayer(axl.Cycler("CCD")).configuration_key(),
+            ParameterisedTestPlayer(axl.Cycler("CDD")).configuration_key(),
+        )
+        # Other values are described by themselves.
+        game = axl.Game(r=4)
+        self.assertEqual(
+            ParameterisedTestPlayer(game).configuration_key(),
+            ParameterisedTestPlayer(game).configuration_key(),
+        )
+
+    def test_configuration_key_of_transformed_players(self):
+        JossAnn = axl.strategy_transformers.JossAnnTransformer
+        keys = {
+            JossAnn((0.2, 0.3))(axl.TitForTat)().configuration_key(),
+            JossAnn((0.2, 0.4))(axl.TitForTat)().configuration_key(),
+            JossAnn((0.2, 0.3))(axl.Cooperator)().configuration_key(),
+            axl.TitForTat().configuration_key(),
+        }
+        self.assertEqual(len(keys), 4)
+
+    def test_configuration_key_is_computed_once(self):
+        player = axl.EvolvableCycler(cycle="CCD", seed=1)
+        key = player.configuration_key()
+        player.init_kwargs["cycle"] = "CDD"
+        self.assertEqual(player.configuration_key(), key)
+        player.overwrite_init_kwargs(cycle="CDD")
+        self.assertNotEqual(player.configuration_key(), key)
+
+    def test_reset_from_snapshot(self):
+        player = axl.EvolvedLookerUp2_2_2()
+        self.assertNotIn("_snapshot", player.__dict__)
+        history, classifier = player.history, player.classifier
+        match = axl.Match((player, axl.Alternator()), turns=10)
+        match.play()
+        player.reset()
+        self.assertIsNotNone(player._snapshot)
+        self.assertEqual(len(player.history), 0)
+        self.assertIsNot(player.history, history)
+        self.assertIsNot(player.classifier, classifier)
+        self.assertEqual(player, axl.EvolvedLookerUp2_2_2())
+
+    def test_reset_of_player_without_snapshot(self):
+        # The state of a Cycler includes an iterator, which cannot be copied.
+        player = axl.Cycler("CCD")
+        self.assertIsNone(player._get_snapshot())
+        match = axl.Match((player, axl.Alternator()), turns=10)
+        match.play()
+        player.reset()
+        self.assertEqual(player, axl.Cycler("CCD"))
+        self.assertEqual(player.clone(), axl.Cycler("CCD"))
+
+    def test_reset_from_snapshot_with_custom_copy(self):
+        class Counter:
+            def __init__(self):
+                self.count = 0
+
+            def __copy__(self):
+                new_counter = Counter()
+                new_counter.count = self.count
+                return new_counter
+
+        class CountingPlayer(axl.Player):
+            def __init__(self):
+                super().__init__()
+                self.counter = Counter()
+
+        player = CountingPlayer()
+        self.assertIsNotNone(player._get_snapshot())
+        counter = player.counter
+        counter.count = 3
+        player.reset()
+        self.assertIsNot(player.counter, counter)
+        self.assertEqual(player.counter.count, 0)
+
+    def test_reset_of_player_with_object_array(self):
+        class ArrayPlayer(axl.Player):
+            def __init__(self):
+                super().__init__()
+                self.table = np.array([[], [1]], dtype=object)
+
+        player = ArrayPlayer()
+        self.assertIsNone(player._get_snapshot())
+        player.table[1] = [2]
+        player.reset()
+        self.assertEqual(player.table[1], [1])
+
+    def test_reset_from_snapshot_opt_out(self):
+        class CountingPlayer(axl.Player):
+            reset_from_snapshot = False
+            inits = 0
+
+            def __init__(self):
+                super().__init__()
+                CountingPlayer.inits += 1
+
+        player = CountingPlayer()
+        self.assertIsNone(player._get_snapshot())
+        player.reset()
+        player.clone()
+        self.assertEqual(CountingPlayer.inits, 3)
+
     def test_history_assignment(self):
         player = axl.Player()
         with self.assertRaises(AttributeError):
@@ -305,6 +462,31 @@ class TestPlayerClass(unittest.TestCase):
             {"arg_test1": "other", "arg_test2": "testing2"},
         )
 
+    def test_init_params_caches_the_signature(self):
+        ParameterisedTestPlayer.init_params()
+        init, _, defaults = ParameterisedTestPlayer._init_parameters
+        self.assertIs(init, ParameterisedTestPlayer.__init__)
+        self.assertEqual(
+            defaults, {"arg_test1": "testing1", "arg_test2": "testing2"}
+        )
+        self.assertEqual(
+            ParameterisedTestPlayer.init_params("other", arg_test2="again"),
+            {"arg_test1": "other", "arg_test2": "again"},
+        )
+        with self.assertRaises(TypeError):
+            ParameterisedTestPlayer.init_params(arg_test3="other")
+
+        class Subclass(ParameterisedTestPlayer):
+            def __init__(self, arg_test3="testing3"):
+                super().__init__()
+
+        self.assertEqual(Subclass.init_params(), {"arg_test3": "testing3"})
+        self.assertEqual(Subclass().init_kwargs, {"arg_test3": "testing3"})
+        self.assertEqual(
+            ParameterisedTestPlayer.init_params(),
+            {"arg_test1": "testing1", "arg_test2": "testing2"},
+        )
+
     def test_init_kwargs(self):
         """Tests player  correct parameters caching."""
 
@@ -451,6 +633,21 @@ class TestPlayer(unittest.TestCase):
             player.reset()
             self.assertEqual(player, clone)
 
+    def test_reset_from_snapshot_matches_reset_with_init(self):
+        player = self.player()
+        other = player.clone()
+        other._snapshot = None
+        for p in (player, other):
+            match = axl.Match((p, axl.Alternator()), turns=10, seed=111)
+            match.play()
+            p.reset()
+        self.assertEqual(player, other)
+
+    def test_configuration_key_of_clone(self):
+        player = self.player()
+        key = player.configuration_key()
+        self.assertEqual(player.clone().configuration_key(), key)
+
     def test_reset_clone(self):
         """Make sure history resetting with cloning works correctly, regardless
         if self.test_reset() is overwritten."""
@@ -0,0 +1,81 @@
+"""Tests for the checkpoints of tournaments."""
+import os
+import pathlib
+import unittest
+
+import axelrod as axl
+from axelrod.checkpoint import Checkpoint, checkpoint_filename, truncate
+from axelrod.load_data_ import axl_filename
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        path = pathlib.Path("test_outputs/test_checkpoint.csv")
+        self.output_filename = str(axl_filename(path))
+        self.filename = checkpoint_filename(self.output_filename)
+
+    def tearDown(self):
+        for filename in [self.filename, self.output_filename]:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_checkpoint_filename(self):
+        self.assertEqual(checkpoint_filename("a.csv"), "a.csv.checkpoint")
+
+    def test_create_and_load(self):
+        checkpoint = Checkpoint.create(
+            self.filename, {"turns": 5}, seeds=[3, 1, 2], start=10
+        )
+        self.assertEqual(checkpoint.offset, 10)
+        self.assertEqual(checkpoint.num_interactions, 0)
+        checkpoint.record(2, interactions=4, offset=50, num_interactions=4)
+        checkpoint.record(0, interactions=4, offset=90, num_interactions=8)
+        checkpoint.close()
+
+        checkpoint = Checkpoint.load(self.filename)
+        self.assertEqual(checkpoint.metadata, {"turns": 5})
+        self.assertEqual(checkpoint.seeds, [3, 1, 2])
+        self.assertEqual(checkpoint.start, 10)
+        self.assertEqual(checkpoint.completed_chunks, {0, 2})
+        self.assertEqual(checkpoint.offset, 90)
+        self.assertEqual(checkpoint.num_interactions, 8)
+
+    def test_load_ignores_incomplete_records(self):
+        checkpoint = Checkpoint.create(self.filename, {}, seeds=[1, 2], start=0)
+        checkpoint.record(0, interactions=1, offset=5, num_interactions=1)
+        checkpoint.close()
+        with open(self.filename, "a") as f:
+            f.write('{"chunk": 1, "inter')
+
+        checkpoint = Checkpoint.load(self.filename)
+        self.assertEqual(checkpoint.completed_chunks, {0})
+        checkpoint.record(1, interactions=1, offset=10, num_interactions=2)
+        checkpoint.close()
+        checkpoint = Checkpoint.load(self.filename)
+        self.assertEqual(checkpoint.completed_chunks, {0, 1})
+
+    def test_read_completed_interactions(self):
+        tournament = axl.Tournament(
+            [axl.Cooperator(), axl.Defector()], turns=2, repetitions=2
+        )
+        tournament.play(
+            filename=self.output_filename, progress_bar=False, checkpoint=True
+        )
+        checkpoint = Checkpoint.load(self.filename)
+        self.assertEqual(
+            list(checkpoint.read_completed_interactions(self.output_filename)),
+            [
+                (0, {(0, 0): [[(C, C), (C, C)], [(C, C), (C, C)]]}),
+                (1, {(0, 1): [[(C, D), (C, D)], [(C, D), (C, D)]]}),
+                (2, {(1, 1): [[(D, D), (D, D)], [(D, D), (D, D)]]}),
+            ],
+        )
+
+    def test_truncate(self):
+        with open(self.output_filename, "w") as f:
+            f.write("0123456789")
+        truncate(self.output_filename, 4)
+        with open(self.output_filename) as f:
+            self.assertEqual(f.read(), "0123")
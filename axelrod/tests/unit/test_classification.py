@@ -1,16 +1,21 @@
 """Tests for the classification."""
 
 import os
+import pickle
 import unittest
 import warnings
 from typing import Any, Text
+from unittest.mock import patch
 
 import axelrod as axl
 import yaml
 from axelrod.classifier import (
+    ALL_CLASSIFIERS_PATH,
     Classifier,
     Classifiers,
     _Classifiers,
+    compile_classifier_index,
+    load_classifier_table,
     memory_depth,
     rebuild_classifier_table,
 )
@@ -74,6 +79,78 @@ class TestClassification(unittest.TestCase):
             },
         )
 
+    def test_compiled_index(self):
+        dirname = os.path.dirname(__file__)
+        test_path = os.path.join(
+            dirname, "../../../test_outputs/classifier_index_test.yaml"
+        )
+        index_path = os.path.splitext(test_path)[0] + ".pickle"
+        self.addCleanup(os.remove, test_path)
+        self.addCleanup(os.remove, index_path)
+
+        name_classifier = Classifier[Text]("name", lambda player: player.name)
+        rebuild_classifier_table(
+            classifiers=[name_classifier],
+            players=[axl.Cooperator, axl.Defector],
+            path=test_path,
+        )
+        self.assertTrue(os.path.exists(index_path))
+        expected = {
+            "Cooperator": {"name": "Cooperator"},
+            "Defector": {"name": "Defector"},
+        }
+        with patch("yaml.load") as yaml_load:
+            self.assertEqual(load_classifier_table(test_path), expected)
+            yaml_load.assert_not_called()
+
+        # An index that is out of date with its table is not used
+        with open(test_path, "a") as f:
+            f.write("Grudger:\n  name: Grudger\n")
+        expected["Grudger"] = {"name": "Grudger"}
+        self.assertEqual(load_classifier_table(test_path), expected)
+
+        compile_classifier_index(test_path)
+        with patch("yaml.load") as yaml_load:
+            self.assertEqual(load_classifier_table(test_path), expected)
+            yaml_load.assert_not_called()
+
+        # Missing, corrupt and malformed indices are not used
+        other_index_path = os.path.splitext(test_path)[0] + "_other.pickle"
+        self.assertEqual(
+            load_classifier_table(test_path, other_index_path), expected
+        )
+        self.addCleanup(os.remove, other_index_path)
+        for contents in (b"", b"not a pickle", pickle.dumps({}), b"N."):
+            with open(other_index_path, "wb") as f:
+                f.write(contents)
+            self.assertEqual(
+                load_classifier_table(test_path, other_index_path), expected
+            )
+
+    def test_shipped_index_is_up_to_date(self):
+        dirname = os.path.dirname(axl.classifier.__file__)
+        with open(os.path.join(dirname, ALL_CLASSIFIERS_PATH), "rb") as f:
+            source = f.read()
+        with patch("yaml.load") as yaml_load:
+            table = load_classifier_table()
+            yaml_load.assert_not_called()
+        self.assertEqual(table, yaml.load(source, Loader=yaml.FullLoader))
+
+    def test_lookups_are_memoized(self):
+        self.assertIs(Classifiers["stochastic"], Classifiers["stochastic"])
+
+        class NotInTable(Player):
+            name = "Not in the table"
+            classifier = {}
+
+        calculate = unittest.mock.MagicMock(return_value=3)
+        with patch.dict(
+            axl.classifier.all_classifiers_map, {"memory_depth": calculate}
+        ):
+            self.assertEqual(Classifiers["memory_depth"](NotInTable()), 3)
+            self.assertEqual(Classifiers["memory_depth"](NotInTable()), 3)
+        self.assertEqual(calculate.call_count, 1)
+
     def test_singletonity_of_classifiers_class(self):
         classifiers_1 = _Classifiers()
         classifiers_2 = _Classifiers()
@@ -1,9 +1,15 @@
+import multiprocessing
 import os
 import pathlib
 import pickle
 import unittest
 
 import axelrod as axl
+from axelrod.deterministic_cache import (
+    _connections,
+    _disconnect,
+    _persistent_key,
+)
 from axelrod.load_data_ import axl_filename
 
 C, D = axl.Action.C, axl.Action.D
@@ -18,8 +24,12 @@ class TestDeterministicCache(unittest.TestCase):
         cls.test_save_file = axl_filename(save_path)
         load_path = pathlib.Path("test_outputs/test_cache_load.txt")
         cls.test_load_file = axl_filename(load_path)
+        cls.transformed_key = tuple(
+            player.configuration_key() for player in cls.test_key
+        )
         test_data_to_pickle = {
-            ("Tit For Tat", "Defector"): [(C, D), (D, D), (D, D)]
+            "format": axl.deterministic_cache.CACHE_FILE_FORMAT,
+            "data": {cls.transformed_key: bytes([1, 3, 3])},
         }
         cls.test_pickle = pickle.dumps(test_data_to_pickle)
 
@@ -111,3 +121,269 @@ class TestDeterministicCache(unittest.TestCase):
         self.assertTrue(self.test_key in self.cache)
         del self.cache[self.test_key]
         self.assertFalse(self.test_key in self.cache)
+        with self.assertRaises(KeyError):
+            del self.cache[self.test_key]
+
+    def test_values_are_stored_as_bytes(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(
+            self.cache.data[self.transformed_key], bytes([1, 3, 3])
+        )
+        self.assertEqual(self.cache.nbytes, 3)
+        self.assertEqual(
+            repr(self.cache),
+            "{{{}: [(C, D), (D, D), (D, D)]}}".format(self.transformed_key),
+        )
+
+    def test_load_lists_of_actions(self):
+        filename = str(axl_filename(pathlib.Path("test_outputs/test.cache")))
+        with open(filename, "wb") as io:
+            pickle.dump(
+                {
+                    "format": axl.deterministic_cache.CACHE_FILE_FORMAT,
+                    "data": {self.transformed_key: self.test_value},
+                },
+                io,
+            )
+        self.cache.load(filename)
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_load_error_for_file_keyed_by_names(self):
+        filename = str(axl_filename(pathlib.Path("test_outputs/test.cache")))
+        with open(filename, "wb") as io:
+            pickle.dump({("Tit For Tat", "Defector"): self.test_value}, io)
+        with self.assertRaisesRegex(ValueError, "earlier version"):
+            self.cache.load(filename)
+
+    def test_load_error_for_other_format(self):
+        filename = str(axl_filename(pathlib.Path("test_outputs/test.cache")))
+        with open(filename, "wb") as io:
+            pickle.dump({"format": 3, "data": {}}, io)
+        with self.assertRaisesRegex(ValueError, "has format 3"):
+            self.cache.load(filename)
+
+    def test_statistics(self):
+        self.assertIsNone(self.cache.hit_rate)
+        self.assertIsNone(self.cache.get(self.test_key))
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache.get(self.test_key), self.test_value)
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+        self.assertAlmostEqual(self.cache.hit_rate, 2 / 3)
+
+    def test_getitem_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.cache[self.test_key]
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_max_size(self):
+        cache = axl.DeterministicCache(max_size=2)
+        keys = [
+            (axl.TitForTat(), axl.Defector()),
+            (axl.Cooperator(), axl.Defector()),
+            (axl.Alternator(), axl.Defector()),
+        ]
+        cache[keys[0]] = self.test_value
+        cache[keys[1]] = self.test_value
+        # Reading the first key makes the second one the least recently used
+        cache[keys[0]]
+        cache[keys[2]] = self.test_value
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(keys[0] in cache)
+        self.assertFalse(keys[1] in cache)
+        self.assertTrue(keys[2] in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_max_bytes(self):
+        cache = axl.DeterministicCache(max_bytes=5)
+        cache[self.test_key] = self.test_value
+        key = (axl.Cooperator(), axl.Defector())
+        cache[key] = self.test_value
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, 3)
+        self.assertTrue(key in cache)
+        cache[key] = self.test_value * 2
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_match_uses_a_single_lookup(self):
+        players = (axl.TitForTat(), axl.Defector())
+        match = axl.Match(players, 3, deterministic_cache=self.cache)
+        match.play()
+        match.play()
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_players_with_different_parameters(self):
+        opponent = axl.TitForTat()
+        self.cache[(axl.Cycler("CCD"), opponent)] = [(C, C), (C, C), (D, C)]
+        self.cache[(axl.Cycler("DDC"), opponent)] = [(D, C), (D, D), (C, D)]
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(
+            self.cache[(axl.Cycler("CCD"), opponent)], [(C, C), (C, C), (D, C)]
+        )
+
+
+class TestPersistentDeterministicCache(unittest.TestCase):
+    def setUp(self):
+        path = pathlib.Path("test_outputs/test_persistent_cache.db")
+        self.filename = str(axl_filename(path))
+        self.remove_database()
+        self.cache = axl.PersistentDeterministicCache(self.filename)
+        self.addCleanup(self.remove_database)
+        self.addCleanup(self.cache.close)
+        self.test_key = (axl.TitForTat(), axl.Defector())
+        self.test_value = [(C, D), (D, D), (D, D)]
+
+    def remove_database(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.filename + suffix):
+                os.remove(self.filename + suffix)
+
+    def test_setitem(self):
+        self.assertFalse(self.test_key in self.cache)
+        self.cache[self.test_key] = self.test_value
+        self.assertTrue(self.test_key in self.cache)
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_getitem_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.cache[self.test_key]
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.cache),
+            "PersistentDeterministicCache({!r})".format(self.filename),
+        )
+
+    def test_results_are_stored_in_the_database(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache.close()
+        cache = axl.PersistentDeterministicCache(self.filename)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache[self.test_key], self.test_value)
+
+    def test_close_keeps_connection_of_other_caches(self):
+        cache = axl.PersistentDeterministicCache(self.filename)
+        self.assertIs(cache._connection, self.cache._connection)
+        cache.close()
+        cache.close()
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_closed_cache_reconnects(self):
+        self.cache.close()
+        self.assertIsNone(self.cache._process_connection)
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache._process_connection[0], os.getpid())
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_disconnect_without_connection(self):
+        self.cache.close()
+        _disconnect(self.filename)
+        self.assertNotIn(
+            (os.getpid(), os.path.abspath(self.filename)), _connections
+        )
+
+    def test_forked_process_opens_its_own_connection(self):
+        def store(cache, queue):  # pragma: no cover
+            # Runs in the forked process, which is not traced
+            cache[self.test_key] = self.test_value
+            queue.put(cache._process_connection[0] == os.getpid())
+            cache.close()
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(target=store, args=(self.cache, queue))
+        process.start()
+        self.assertTrue(queue.get())
+        process.join()
+        self.assertEqual(self.cache._process_connection[0], os.getpid())
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_pickle(self):
+        self.cache[self.test_key] = self.test_value
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.file_name, self.filename)
+        self.assertEqual(cache[self.test_key], self.test_value)
+
+    def test_longest_result_is_kept(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache[self.test_key] = self.test_value[:2]
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        longer_value = self.test_value * 3
+        self.cache[self.test_key] = longer_value
+        self.assertEqual(self.cache[self.test_key], longer_value)
+
+    def test_key_includes_game_and_length(self):
+        self.cache[self.test_key] = self.test_value
+        key = (axl.TitForTat(), axl.Defector())
+        key[0].set_match_attributes(length=3)
+        self.assertFalse(key in self.cache)
+        key = (axl.TitForTat(), axl.Defector())
+        key[0].set_match_attributes(game=axl.Game(r=4))
+        self.assertFalse(key in self.cache)
+
+    def test_setitem_with_immutable_cache(self):
+        self.cache.mutable = False
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = self.test_value
+
+    def test_setitem_invalid_key_stochastic_player(self):
+        with self.assertRaises(ValueError):
+            self.cache[(axl.Random(), axl.TitForTat())] = self.test_value
+
+    def test_setitem_invalid_value_not_list(self):
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = 5
+
+    def test_del_item(self):
+        self.cache[self.test_key] = self.test_value
+        del self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        with self.assertRaises(KeyError):
+            del self.cache[self.test_key]
+
+    def test_iter(self):
+        self.assertEqual(list(self.cache), [])
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(
+            list(self.cache),
+            [_persistent_key(self.test_key)],
+        )
+
+    def test_save(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertTrue(self.cache.save())
+        self.assertEqual(len(self.cache), 1)
+
+    def test_results_kept_in_memory_are_bounded(self):
+        other_key = (axl.Cooperator(), axl.Defector())
+        self.cache[self.test_key] = self.test_value
+        self.cache[other_key] = self.test_value
+        cache = axl.PersistentDeterministicCache(self.filename, max_size=1)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache[self.test_key], self.test_value)
+        self.assertEqual(cache[other_key], self.test_value)
+        self.assertEqual(len(cache.data), 1)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.evictions), (2, 1))
+
+    def test_load(self):
+        with self.assertRaises(TypeError):
+            self.cache.load(self.filename)
+
+    def test_tournament(self):
+        players = [axl.TitForTat(), axl.Cooperator(), axl.Alternator()]
+        expected = axl.Tournament(players, turns=10, repetitions=2).play(
+            progress_bar=False
+        )
+        for processes in (None, 2):
+            tournament = axl.Tournament(
+                players, turns=10, repetitions=2, deterministic_cache=self.cache
+            )
+            results = tournament.play(progress_bar=False, processes=processes)
+            self.assertEqual(results, expected)
+            self.assertEqual(len(self.cache), 6)
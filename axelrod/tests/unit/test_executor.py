@@ -0,0 +1,144 @@
+"""Tests for the reusable pool of worker processes."""
+import unittest
+from multiprocessing import Queue
+
+import axelrod as axl
+from axelrod.executor import Executor, _n_workers, _prototype_key, _worker
+
+
+def _count_prototypes(prototypes, offset):
+    return len(prototypes) + offset
+
+
+def _clone_name(prototypes, player_id):
+    return str(prototypes[player_id].clone())
+
+
+def _raise(prototypes):
+    raise ValueError("Failed in a worker")
+
+
+class TestExecutor(unittest.TestCase):
+    def test_n_workers(self):
+        self.assertEqual(_n_workers(1), 1)
+        self.assertEqual(_n_workers(None), axl.executor.cpu_count())
+        self.assertEqual(_n_workers(0), axl.executor.cpu_count())
+
+    def test_prototype_key(self):
+        self.assertEqual(
+            _prototype_key(axl.Random(0.3)), _prototype_key(axl.Random(0.3))
+        )
+        self.assertNotEqual(
+            _prototype_key(axl.Random(0.3)), _prototype_key(axl.Random(0.4))
+        )
+        self.assertNotEqual(
+            _prototype_key(axl.Cooperator()), _prototype_key(axl.Defector())
+        )
+
+    def test_context_manager(self):
+        with Executor(processes=2) as executor:
+            self.assertTrue(executor.started)
+            self.assertEqual(len(executor._workers), executor.processes)
+            workers = executor._workers
+        self.assertFalse(executor.started)
+        for process in workers:
+            self.assertFalse(process.is_alive())
+
+    def test_register_players_once(self):
+        with Executor(processes=1) as executor:
+            ids = executor.register_players(
+                [axl.Cooperator(), axl.Defector(), axl.Cooperator()]
+            )
+            self.assertEqual(ids, [0, 1, 0])
+            ids = executor.register_players([axl.Random(), axl.Defector()])
+            self.assertEqual(ids, [2, 1])
+            results = list(executor.map(_count_prototypes, [(0,), (10,)]))
+            self.assertEqual(sorted(r[3] for r in results), [3, 13])
+            results = list(executor.map(_clone_name, [(2,)]))
+            self.assertEqual(results[0][3], "Random: 0.5")
+
+    def test_least_recently_registered_players_are_forgotten(self):
+        with Executor(processes=1, max_prototypes=2) as executor:
+            ids = executor.register_players([axl.Cooperator(), axl.Defector()])
+            self.assertEqual(ids, [0, 1])
+            self.assertEqual(executor.register_players([axl.Cooperator()]), [0])
+            self.assertEqual(executor.register_players([axl.Random()]), [2])
+            self.assertEqual(executor.evictions, 1)
+            results = list(executor.map(_count_prototypes, [(0,)]))
+            self.assertEqual(results[0][3], 2)
+            results = list(executor.map(_clone_name, [(0,), (2,)]))
+            self.assertEqual(
+                sorted(r[3] for r in results), ["Cooperator", "Random: 0.5"]
+            )
+            # Defector was forgotten and is sent again with a new id
+            self.assertEqual(executor.register_players([axl.Defector()]), [3])
+
+    def test_players_of_one_call_are_kept(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.Random()]
+        with Executor(processes=1, max_prototypes=2) as executor:
+            self.assertEqual(executor.register_players(players), [0, 1, 2])
+            results = list(executor.map(_count_prototypes, [(0,)]))
+            self.assertEqual(results[0][3], 3)
+            self.assertEqual(executor.register_players(players[:1]), [0])
+            results = list(executor.map(_count_prototypes, [(0,)]))
+            self.assertEqual(results[0][3], 2)
+
+    def test_unbounded_prototypes(self):
+        with Executor(processes=1, max_prototypes=None) as executor:
+            for player in [axl.Cooperator(), axl.Defector(), axl.Random()]:
+                executor.register_players([player])
+            results = list(executor.map(_count_prototypes, [(0,)]))
+            self.assertEqual(results[0][3], 3)
+            self.assertEqual(executor.evictions, 0)
+
+    def test_map(self):
+        tasks = [(offset,) for offset in range(10)]
+        costs = list(range(10))
+        with Executor(processes=2) as executor:
+            results = list(executor.map(_count_prototypes, tasks, costs))
+        self.assertEqual(
+            sorted((index, value) for index, _, _, value in results),
+            [(index, index) for index in range(10)],
+        )
+        for _, worker, elapsed, _ in results:
+            self.assertIn(worker, range(executor.processes))
+            self.assertGreaterEqual(elapsed, 0)
+
+    def test_error_in_worker(self):
+        with Executor(processes=1) as executor:
+            with self.assertRaises(ValueError):
+                list(executor.map(_raise, [()]))
+            # The executor can still be used
+            results = list(executor.map(_count_prototypes, [(1,)]))
+            self.assertEqual(results[0][3], 1)
+
+    def test_interrupted_map(self):
+        with Executor(processes=1) as executor:
+            for result in executor.map(_count_prototypes, [(1,), (2,), (3,)]):
+                break
+            results = list(executor.map(_count_prototypes, [(4,)]))
+            self.assertEqual([r[3] for r in results], [4])
+
+    def test_worker(self):
+        input_queue, output_queue = Queue(), Queue()
+        input_queue.put(
+            ("players", {0: axl.Cooperator(), 1: axl.Defector()}, [])
+        )
+        input_queue.put(("task", 1, 0, _count_prototypes, (10,)))
+        input_queue.put(("players", {2: axl.Random()}, [0, 1]))
+        input_queue.put(("task", 1, 1, _clone_name, (2,)))
+        input_queue.put(("task", 2, 0, _raise, ()))
+        input_queue.put("STOP")
+        _worker(3, input_queue, output_queue)
+
+        worker, map_id, index, elapsed, value, error = output_queue.get()
+        self.assertEqual((worker, map_id, index), (3, 1, 0))
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertEqual((value, error), (12, None))
+        worker, map_id, index, elapsed, value, error = output_queue.get()
+        self.assertEqual((worker, map_id, index), (3, 1, 1))
+        self.assertEqual((value, error), ("Random: 0.5", None))
+        worker, map_id, index, elapsed, value, error = output_queue.get()
+        self.assertEqual((worker, map_id, index), (3, 2, 0))
+        self.assertIsNone(value)
+        self.assertIsInstance(error, ValueError)
@@ -251,6 +251,24 @@ class TestFingerprint(unittest.TestCase):
         self.assertEqual(edge_keys, self.edges_when_using_half_step)
         self.assertEqual(coord_keys, self.points_when_using_half_step)
 
+    def test_fingerprint_with_executor(self):
+        af = AshlockFingerprint(axl.TitForTat)
+        expected = af.fingerprint(
+            turns=10, repetitions=2, step=0.5, progress_bar=False, seed=1
+        )
+        with axl.Executor(processes=2) as executor:
+            for _ in range(2):
+                af = AshlockFingerprint(axl.TitForTat)
+                data = af.fingerprint(
+                    turns=10,
+                    repetitions=2,
+                    step=0.5,
+                    progress_bar=False,
+                    seed=1,
+                    executor=executor,
+                )
+                self.assertEqual(data, expected)
+
     def test_parallel_fingerprint(self):
         af = AshlockFingerprint(axl.TitForTat)
         af.fingerprint(
@@ -512,6 +530,22 @@ class TestTransitiveFingerprint(unittest.TestCase):
         )
         self.assertEqual(tf.data.shape, (50, 50))
 
+    def test_fingerprint_with_executor(self):
+        tf = TransitiveFingerprint(axl.TitForTat(), number_of_opponents=5)
+        expected = tf.fingerprint(
+            turns=5, repetitions=3, progress_bar=False, seed=2
+        )
+        with axl.Executor(processes=2) as executor:
+            tf = TransitiveFingerprint(axl.TitForTat(), number_of_opponents=5)
+            data = tf.fingerprint(
+                turns=5,
+                repetitions=3,
+                progress_bar=False,
+                seed=2,
+                executor=executor,
+            )
+        np.testing.assert_array_equal(data, expected)
+
     def test_parallel_fingerprint(self):
         strategy = axl.TitForTat()
         tf = TransitiveFingerprint(strategy)
@@ -549,6 +583,44 @@ class TestTransitiveFingerprint(unittest.TestCase):
         )
         self.assertTrue(np.array_equal(data, expected_data))
 
+    def test_analyse_cooperation_ratio_binary_file(self):
+        tf = TransitiveFingerprint(axl.TitForTat)
+        path = pathlib.Path("test_outputs/test_fingerprint.bin")
+        filename = str(axl_filename(path))
+        rows = [
+            (0, 0, 1, 0, "CCC"),
+            (0, 1, 0, 0, "DDD"),
+            (1, 0, 1, 1, "CCC"),
+            (1, 1, 0, 1, "DDD"),
+            (2, 0, 2, 0, "CCD"),
+            (2, 2, 0, 0, "DDD"),
+            (3, 0, 2, 1, "CCC"),
+            (3, 2, 0, 1, "DDD"),
+            (4, 0, 3, 0, "CCD"),
+            (4, 3, 0, 0, "DDD"),
+            (5, 0, 3, 1, "DCC"),
+            (5, 3, 0, 1, "DDD"),
+            (6, 0, 4, 2, "DDD"),
+            (6, 4, 0, 2, "DDD"),
+            (7, 0, 4, 3, "DDD"),
+            (7, 4, 0, 3, "DDD"),
+        ]
+        writer = axl.interaction_store.BinaryInteractionWriter(
+            filename,
+            players=["Player{}".format(i) for i in range(5)],
+            build_results=False,
+        )
+        for index, player, opponent, repetition, actions in rows:
+            writer.writerow(
+                [index, player, opponent, repetition, "", "", actions]
+            )
+        writer.close()
+        data = tf.analyse_cooperation_ratio(filename)
+        expected_data = np.array(
+            [[1, 1, 1], [1, 1, 1 / 2], [1 / 2, 1, 1 / 2], [0, 0, 0]]
+        )
+        self.assertTrue(np.array_equal(data, expected_data))
+
     def test_plot(self):
         """
         Test that plot is created with various arguments.
@@ -94,7 +94,55 @@ class TestGame(unittest.TestCase):
         for key, value in pair_ints.items():
             self.assertEqual(game.score(key), game.score(value))
 
+    def test_payoff_table(self):
+        game = axl.Game()
+        np.testing.assert_array_equal(
+            game.payoff_table, [[3, 3], [0, 5], [5, 0], [1, 1]]
+        )
+
+    @given(game=games())
+    def test_score_many(self, game):
+        states = game.states(np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1]))
+        np.testing.assert_array_equal(states, [0, 1, 2, 3])
+        row_scores, col_scores = game.score_many(states)
+        for index, pair in enumerate([(C, C), (C, D), (D, C), (D, D)]):
+            self.assertEqual(
+                (row_scores[index], col_scores[index]), game.score(pair)
+            )
+
+    def test_score_with_numpy_integers(self):
+        game = axl.Game()
+        self.assertEqual(game.score((np.int64(1), np.int64(0))), (5, 0))
+        self.assertEqual(game.score([D, C]), (5, 0))
+        self.assertEqual(game.score([1, 0]), (5, 0))
+
+
 class TestAsymmetricGame(unittest.TestCase):
+    def test_states_and_score_many(self):
+        A = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        game = axl.AsymmetricGame(A, -A)
+        states = game.states(1, np.array([0, 2]))
+        np.testing.assert_array_equal(states, [3, 5])
+        row_scores, col_scores = game.score_many(states)
+        np.testing.assert_array_equal(row_scores, [4, 6])
+        np.testing.assert_array_equal(col_scores, [-4, -6])
+        self.assertEqual(game.score((1, 2)), (6, -6))
+
+    def test_score_many_with_different_shapes(self):
+        A = np.array([[1, 2, 3], [4, 5, 6]])
+        game = axl.AsymmetricGame(A, A.transpose())
+        self.assertIsNone(game.payoff_table)
+        self.assertEqual(game.score((1, 1)), (5, 5))
+        with self.assertRaises(ValueError):
+            game.score_many(np.array([0]))
+
+    def test_action_payoff_table(self):
+        A = np.array([[1, 2, 3], [4, 5, 6]])
+        game = axl.AsymmetricGame(A, A.transpose())
+        np.testing.assert_array_equal(
+            game.action_payoff_table, [[1, 1], [2, 4], [4, 2], [5, 5]]
+        )
+
     @given(A=arrays(int, array_shapes(min_dims=2, max_dims=2, min_side=2)),
            B=arrays(int, array_shapes(min_dims=2, max_dims=2, min_side=2)))
     @settings(max_examples=5)
@@ -2,7 +2,12 @@ import unittest
 from collections import Counter
 
 import axelrod as axl
-from axelrod.history import History, LimitedHistory
+from axelrod.history import (
+    CompactHistory,
+    CompactLimitedHistory,
+    History,
+    LimitedHistory,
+)
 
 C, D = axl.Action.C, axl.Action.D
 
@@ -116,3 +121,154 @@ class TestLimitedHistory(unittest.TestCase):
             h.state_distribution,
             Counter({(D, D): 1, (C, D): 1, (D, C): 1, (C, C): 0}),
         )
+
+
+class TestCompactHistory(unittest.TestCase):
+    def test_init(self):
+        h1 = CompactHistory([C, C, D], [C, C, C])
+        self.assertEqual(list(h1), [C, C, D])
+        h1.extend([C, C], [D, D])
+        self.assertEqual(list(h1), [C, C, D, C, C])
+        self.assertEqual(h1.coplays, [C, C, C, D, D])
+        self.assertIsInstance(h1, History)
+
+    def test_str_list_repr(self):
+        h = CompactHistory()
+        h.append(C, D)
+        h.append(D, C)
+        h.append(C, D)
+        self.assertEqual(str(h), "CDC")
+        self.assertEqual(list(h), [C, D, C])
+        self.assertEqual(repr(h), "[C, D, C]")
+        h2 = h.flip_plays()
+        self.assertEqual(str(h2), "DCD")
+        self.assertEqual(h2.coplays, [D, C, D])
+
+    def test_getitem(self):
+        h = CompactHistory([C, D, D, C], [D, D, C, C])
+        self.assertEqual(h[0], C)
+        self.assertEqual(h[-1], C)
+        self.assertEqual(h[-2], D)
+        self.assertEqual(h[-2:], [D, C])
+        self.assertEqual(h[1:3], [D, D])
+        self.assertEqual(h[::-1], [C, D, D, C])
+        with self.assertRaises(IndexError):
+            h[4]
+
+    def test_contains(self):
+        h = CompactHistory([C, C], [D, D])
+        self.assertIn(C, h)
+        self.assertNotIn(D, h)
+        # Values that are not actions are never in a history
+        self.assertNotIn("C", h)
+        self.assertNotIn(None, h)
+
+    def test_reset(self):
+        h = CompactHistory()
+        h.append(C, D)
+        self.assertEqual(len(h), 1)
+        self.assertEqual(h.cooperations, 1)
+        h.reset()
+        self.assertEqual(len(h), 0)
+        self.assertEqual(h.cooperations, 0)
+
+    def test_compare(self):
+        h = CompactHistory([C, D, C], [C, C, C])
+        self.assertEqual(h, [C, D, C])
+        h2 = CompactHistory([C, D, C], [C, C, C])
+        self.assertEqual(h, h2)
+        self.assertEqual(h, History([C, D, C], [C, C, C]))
+        self.assertEqual(History([C, D, C], [C, C, C]), h)
+        self.assertNotEqual(h, History([C, D, C], [D, C, C]))
+        h2.reset()
+        self.assertNotEqual(h, h2)
+        with self.assertRaises(TypeError):
+            h == 2
+
+    def test_copy(self):
+        h = CompactHistory([C, D, C], [C, C, C])
+        h2 = h.copy()
+        self.assertEqual(h, h2)
+        h2.append(D, D)
+        self.assertNotEqual(h, h2)
+
+    def test_counts(self):
+        h = CompactHistory([C, C, D, D], [C, D, C, C])
+        self.assertEqual(h.cooperations, 2)
+        self.assertEqual(h.defections, 2)
+        self.assertEqual(
+            h.state_distribution,
+            Counter({(C, C): 1, (C, D): 1, (D, C): 2}),
+        )
+        flipped = h.flip_plays()
+        self.assertEqual(flipped.cooperations, 2)
+        self.assertEqual(flipped.defections, 2)
+        self.assertEqual(
+            flipped.state_distribution,
+            Counter({(D, C): 1, (D, D): 1, (C, C): 2}),
+        )
+
+    def test_player_history_class(self):
+        class CompactCooperator(axl.Cooperator):
+            history_class = CompactHistory
+
+        player = CompactCooperator()
+        match = axl.Match((player, axl.Alternator()), turns=4)
+        match.play()
+        self.assertIsInstance(player.history, CompactHistory)
+        self.assertEqual(player.history, [C, C, C, C])
+        self.assertEqual(player.history.coplays, [C, D, C, D])
+        self.assertEqual(player.cooperations, 4)
+
+
+class TestCompactLimitedHistory(unittest.TestCase):
+    def test_memory_depth(self):
+        h = CompactLimitedHistory(memory_depth=3)
+        h.append(C, C)
+        self.assertEqual(len(h), 1)
+        h.append(D, D)
+        self.assertEqual(len(h), 2)
+        h.append(C, D)
+        self.assertEqual(len(h), 3)
+        self.assertEqual(h.cooperations, 2)
+        self.assertEqual(h.defections, 1)
+        self.assertEqual(
+            h.state_distribution, Counter({(C, C): 1, (D, D): 1, (C, D): 1})
+        )
+        h.append(D, C)
+        self.assertEqual(len(h), 3)
+        self.assertEqual(h._plays, [D, C, D])
+        self.assertEqual(h._coplays, [D, D, C])
+        self.assertEqual(h.cooperations, 1)
+        self.assertEqual(h.defections, 2)
+        self.assertEqual(
+            h.state_distribution,
+            Counter({(D, D): 1, (C, D): 1, (D, C): 1}),
+        )
+
+    def test_getitem(self):
+        h = CompactLimitedHistory(3, [C, C, D, C, D], [C, C, C, C, C])
+        self.assertEqual(list(h), [D, C, D])
+        self.assertEqual(h[0], D)
+        self.assertEqual(h[-1], D)
+        self.assertEqual(h[-2:], [C, D])
+        with self.assertRaises(IndexError):
+            h[3]
+        with self.assertRaises(IndexError):
+            h[-4]
+
+    def test_zero_memory_depth(self):
+        h = CompactLimitedHistory(0, [C, D], [C, C])
+        self.assertEqual(len(h), 0)
+        self.assertEqual(list(h), [])
+        self.assertEqual(h.cooperations, 0)
+
+    def test_copy_and_flip_plays(self):
+        h = CompactLimitedHistory(2, [C, C, D], [D, C, C])
+        h2 = h.copy()
+        self.assertEqual(h, h2)
+        self.assertEqual(h2.memory_depth, 2)
+        flipped = h.flip_plays()
+        self.assertEqual(list(flipped), [D, C])
+        self.assertEqual(flipped.coplays, [C, C])
+        self.assertEqual(flipped.defections, 1)
@@ -0,0 +1,222 @@
+"""Tests for the binary interaction files."""
+import os
+import pathlib
+import unittest
+
+import axelrod as axl
+import numpy as np
+import pandas as pd
+from axelrod.interaction_store import (
+    MAGIC,
+    BinaryInteractions,
+    BinaryInteractionWriter,
+    is_binary_file,
+    pack_actions,
+)
+from axelrod.load_data_ import axl_filename
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestPackActions(unittest.TestCase):
+    def test_pack_actions(self):
+        self.assertEqual(pack_actions("CDDC"), bytes([0b01100000]))
+        self.assertEqual(pack_actions("D" * 9), bytes([255, 128]))
+        self.assertEqual(pack_actions(""), b"")
+
+
+class TestBinaryInteractions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        path = pathlib.Path("test_outputs/test_interaction_store.bin")
+        cls.filename = str(axl_filename(path))
+        path = pathlib.Path("test_outputs/test_interaction_store.csv")
+        cls.csv_filename = str(axl_filename(path))
+
+        cls.players = [axl.Cooperator(), axl.TitForTat(), axl.Random()]
+        cls.names = [str(p) for p in cls.players]
+        for filename, file_format in [
+            (cls.filename, "binary"),
+            (cls.csv_filename, "csv"),
+        ]:
+            tournament = axl.Tournament(
+                cls.players, turns=13, repetitions=2, noise=0.1, seed=0
+            )
+            tournament.play(
+                filename=filename,
+                file_format=file_format,
+                progress_bar=False,
+                build_results=False,
+            )
+            tournament.play(
+                filename=filename, file_format=file_format, progress_bar=False
+            )
+
+    def test_is_binary_file(self):
+        self.assertTrue(is_binary_file(self.filename))
+        self.assertFalse(is_binary_file(self.csv_filename))
+
+    def test_metadata(self):
+        interactions = BinaryInteractions(self.filename)
+        self.assertEqual(interactions.players, self.names)
+        self.assertTrue(interactions.build_results)
+        self.assertEqual(interactions.metadata["repetitions"], 2)
+        self.assertEqual(interactions.metadata["turns"], 13)
+        self.assertEqual(interactions.metadata["noise"], 0.1)
+        self.assertEqual(interactions.metadata["seed"], 0)
+        self.assertEqual(interactions.metadata["game"], [3, 1, 0, 5])
+        self.assertEqual(len(interactions), 24)
+
+    def test_actions(self):
+        interactions = BinaryInteractions(self.filename)
+        expected = pd.read_csv(self.csv_filename)["Actions"]
+        for index, actions in enumerate(expected):
+            self.assertEqual(
+                "".join(str(a) for a in interactions.actions(index)), actions
+            )
+
+    def test_dataframe(self):
+        df = BinaryInteractions(self.filename).dataframe()
+        expected_df = pd.read_csv(self.csv_filename)
+        self.assertEqual(
+            list(df.columns),
+            [
+                c
+                for c in expected_df.columns
+                if c not in ["Player name", "Opponent name", "Actions"]
+            ],
+        )
+        for column in df.columns:
+            self.assertTrue(
+                np.allclose(df[column], expected_df[column]), msg=column
+            )
+
+    def test_integer_scores(self):
+        interactions = BinaryInteractions(self.filename)
+        self.assertEqual(interactions.score_dtype, np.int64)
+        df = interactions.dataframe()
+        expected_df = pd.read_csv(self.csv_filename)
+        for column in ["Score", "Score difference"]:
+            self.assertEqual(df[column].dtype, expected_df[column].dtype)
+
+    def test_float_scores(self):
+        path = pathlib.Path("test_outputs/test_interaction_store_float.bin")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(
+            self.players,
+            game=axl.Game(r=3.1, s=0.2, t=5.3, p=1.7),
+            turns=3,
+            repetitions=1,
+            seed=0,
+        )
+        tournament.play(
+            filename=filename, file_format="binary", progress_bar=False
+        )
+        interactions = BinaryInteractions(filename)
+        self.assertEqual(interactions.score_dtype, np.float64)
+        self.assertEqual(interactions.dataframe()["Score"].dtype, np.float64)
+        os.remove(filename)
+
+    def test_dask_dataframe(self):
+        interactions = BinaryInteractions(self.filename)
+        df = interactions.dask_dataframe(chunksize=5)
+        self.assertEqual(df.npartitions, 5)
+        self.assertTrue(
+            df.compute().reset_index(drop=True).equals(interactions.dataframe())
+        )
+
+    def test_interactions(self):
+        self.assertEqual(
+            BinaryInteractions(self.filename).interactions(),
+            axl.interaction_utils.read_interactions_from_file(
+                self.csv_filename, progress_bar=False
+            ),
+        )
+
+    def test_interactions_of_matches_of_different_lengths(self):
+        path = pathlib.Path("test_outputs/test_interaction_store_prob.bin")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(
+            self.players, prob_end=0.2, repetitions=3, noise=0.1, seed=1
+        )
+        results = tournament.play(
+            filename=filename, file_format="binary", progress_bar=False
+        )
+        self.assertGreater(len(set(np.ravel(results.match_lengths))), 2)
+        interactions = BinaryInteractions(filename)
+        expected = {}
+        for index in range(0, len(interactions), 2):
+            row = interactions.rows[index]
+            key = (int(row["Player index"]), int(row["Opponent index"]))
+            expected.setdefault(key, []).append(
+                list(
+                    zip(
+                        interactions.actions(index),
+                        interactions.actions(index + 1),
+                    )
+                )
+            )
+        self.assertEqual(interactions.interactions(), expected)
+        os.remove(filename)
+
+    def test_not_a_binary_file(self):
+        with self.assertRaises(ValueError):
+            BinaryInteractions(self.csv_filename)
+
+    def test_incomplete_file(self):
+        path = pathlib.Path("test_outputs/test_interaction_store_open.bin")
+        filename = str(axl_filename(path))
+        writer = BinaryInteractionWriter(filename, players=self.names)
+        writer.writerow([0, 0, 1, 0, "A", "B", "CD"] + [0] * 21)
+        writer.flush()
+        with self.assertRaises(ValueError):
+            BinaryInteractions(filename)
+        writer.close()
+        self.assertEqual(len(BinaryInteractions(filename)), 1)
+        # A file whose trailer was not fully written
+        with open(filename, "r+b") as f:
+            f.truncate(os.path.getsize(filename) - 1)
+        with self.assertRaisesRegex(ValueError, "incomplete"):
+            BinaryInteractions(filename)
+        os.remove(filename)
+
+
+class TestBinaryInteractionWriter(unittest.TestCase):
+    def test_empty_file(self):
+        path = pathlib.Path("test_outputs/test_interaction_store_empty.bin")
+        filename = str(axl_filename(path))
+        writer = BinaryInteractionWriter(filename, players=["A"])
+        writer.close()
+        writer.close()
+        with open(filename, "rb") as f:
+            self.assertEqual(f.read(len(MAGIC)), MAGIC)
+        interactions = BinaryInteractions(filename)
+        self.assertEqual(len(interactions), 0)
+        self.assertEqual(interactions.interactions(), {})
+        self.assertEqual(len(interactions.dask_dataframe().compute()), 0)
+        os.remove(filename)
+
+    def test_rows_without_results(self):
+        path = pathlib.Path("test_outputs/test_interaction_store_rows.bin")
+        filename = str(axl_filename(path))
+        writer = BinaryInteractionWriter(
+            filename, players=["A", "B"], build_results=False, buffer_size=1
+        )
+        writer.writerow([0, 0, 1, 0, "A", "B", "CDC"])
+        writer.writerow([0, 1, 0, 0, "B", "A", "DDC"])
+        writer.close()
+        interactions = BinaryInteractions(filename)
+        self.assertFalse(interactions.build_results)
+        self.assertEqual(
+            list(interactions.dataframe().columns),
+            [
+                "Interaction index",
+                "Player index",
+                "Opponent index",
+                "Repetition",
+            ],
+        )
+        self.assertEqual(
+            interactions.interactions(), {(0, 1): [[(C, D), (D, D), (C, C)]]}
+        )
+        os.remove(filename)
@@ -3,6 +3,7 @@ import unittest
 from collections import Counter
 
 import axelrod as axl
+import numpy as np
 
 C, D = axl.Action.C, axl.Action.D
 
@@ -47,12 +48,101 @@ class TestMatch(unittest.TestCase):
         for inter, score in zip(self.interactions, self.scores):
             self.assertEqual(score, axl.interaction_utils.compute_scores(inter))
 
+    def test_interactions_to_array(self):
+        array = axl.interaction_utils.interactions_to_array(
+            self.interactions[0]
+        )
+        np.testing.assert_array_equal(array, [[0, 1], [1, 0]])
+        self.assertIs(axl.interaction_utils.interactions_to_array(array), array)
+        self.assertEqual(
+            axl.interaction_utils.interactions_to_array([]).shape, (0, 2)
+        )
+
+    def test_compute_batch_metrics(self):
+        metrics = axl.interaction_utils.compute_batch_metrics(self.interactions)
+        np.testing.assert_array_equal(metrics.turns, [2, 2, 2, 0])
+        np.testing.assert_array_equal(
+            metrics.scores, [(5, 5), (10, 0), (3, 8), (0, 0)]
+        )
+        np.testing.assert_array_equal(
+            metrics.cooperations, [(1, 1), (0, 2), (2, 1), (0, 0)]
+        )
+        np.testing.assert_array_equal(
+            metrics.initial_cooperations,
+            [(True, False), (False, True), (True, True), (False, False)],
+        )
+        np.testing.assert_array_equal(
+            metrics.state_counts,
+            [[0, 1, 1, 0], [0, 0, 2, 0], [1, 1, 0, 0], [0, 0, 0, 0]],
+        )
+        np.testing.assert_array_equal(metrics.winner_index, [-1, 0, 1, -1])
+        self.assertEqual(metrics.state_to_action_counts.shape, (4, 2, 4, 2))
+        # After (C, D) the first player defected and the second cooperated
+        np.testing.assert_array_equal(
+            metrics.state_to_action_counts[0, :, 1], [[0, 1], [1, 0]]
+        )
+        self.assertEqual(metrics.state_to_action_counts[0].sum(), 2)
+
+    def test_compute_batch_metrics_with_arrays(self):
+        batch = np.array([[[0, 1], [1, 0]], [[1, 0], [1, 0]]])
+        metrics = axl.interaction_utils.compute_batch_metrics(batch)
+        np.testing.assert_array_equal(metrics.scores, [(5, 5), (10, 0)])
+
+    def test_compute_batch_metrics_with_float_payoffs(self):
+        game = axl.Game(r=3.1, s=0.2, t=5.3, p=1.7)
+        interactions = [(C, D), (D, D), (D, C)] * 5
+        metrics = axl.interaction_utils.compute_batch_metrics(
+            [interactions, interactions[:4]], game
+        )
+        for index, inter in enumerate([interactions, interactions[:4]]):
+            scores = [game.score(plays) for plays in inter]
+            self.assertEqual(
+                tuple(metrics.scores[index]),
+                (sum(s[0] for s in scores), sum(s[1] for s in scores)),
+            )
+
+    def test_compute_batch_metrics_with_larger_asymmetric_games(self):
+        A = np.array([[0, -1, 1], [1, 0, -1], [-1, 1, 0]])
+        B = np.array([[3, 0, 1], [5, 1, 2]])
+        games = [
+            axl.AsymmetricGame(A, -A),
+            axl.AsymmetricGame(A.astype(float), -A.astype(float)),
+            axl.AsymmetricGame(B, np.array([[3, 5], [0, 1], [4, 4]])),
+        ]
+        for game in games:
+            metrics = axl.interaction_utils.compute_batch_metrics(
+                self.interactions, game
+            )
+            for index, inter in enumerate(self.interactions):
+                scores = [game.score(plays) for plays in inter]
+                self.assertEqual(
+                    tuple(metrics.scores[index]),
+                    (sum(s[0] for s in scores), sum(s[1] for s in scores)),
+                )
+                self.assertEqual(
+                    axl.interaction_utils.compute_scores(inter, game), scores
+                )
+
+    def test_compute_metrics(self):
+        metrics = axl.interaction_utils.compute_metrics(self.interactions[2])
+        self.assertEqual(metrics.turns, 2)
+        np.testing.assert_array_equal(metrics.scores, (3, 8))
+        self.assertEqual(metrics.winner_index, 1)
+
     def test_compute_final_score(self):
         for inter, final_score in zip(self.interactions, self.final_scores):
             self.assertEqual(
                 final_score, axl.interaction_utils.compute_final_score(inter)
             )
 
+    def test_final_scores_are_python_numbers(self):
+        inter = self.interactions[0]
+        for score in axl.interaction_utils.compute_final_score(inter):
+            self.assertIs(type(score), int)
+        scores = axl.interaction_utils.compute_final_score_per_turn(inter)
+        for score in scores:
+            self.assertIs(type(score), float)
+
     def test_compute_final_score_per_turn(self):
         for inter, final_score_per_round in zip(
             self.interactions, self.final_score_per_turn
@@ -62,6 +152,15 @@ class TestMatch(unittest.TestCase):
                 axl.interaction_utils.compute_final_score_per_turn(inter),
             )
 
+    def test_compute_final_score_of_iterator(self):
+        history, opponent_history = [C, D, C], [D, D, C]
+        self.assertEqual(
+            axl.interaction_utils.compute_final_score(
+                zip(history, opponent_history)
+            ),
+            (4, 9),
+        )
+
     def test_compute_winner_index(self):
         for inter, winner in zip(self.interactions, self.winners):
             self.assertEqual(
@@ -183,6 +282,22 @@ class TestMatch(unittest.TestCase):
         )
         self.assertEqual(expected_interactions, interactions)
 
+    def test_read_interactions_from_binary_file(self):
+        tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+        players = [axl.Cooperator(), axl.Defector()]
+        tournament = axl.Tournament(players=players, turns=2, repetitions=3)
+        tournament.play(filename=tmp_file.name, file_format="binary")
+        tmp_file.close()
+        expected_interactions = {
+            (0, 0): [[(C, C), (C, C)] for _ in range(3)],
+            (0, 1): [[(C, D), (C, D)] for _ in range(3)],
+            (1, 1): [[(D, D), (D, D)] for _ in range(3)],
+        }
+        interactions = axl.interaction_utils.read_interactions_from_file(
+            tmp_file.name, progress_bar=False
+        )
+        self.assertEqual(expected_interactions, interactions)
+
     def test_string_to_interactions(self):
         string = "CDCDDD"
         interactions = [(C, D), (C, D), (D, D)]
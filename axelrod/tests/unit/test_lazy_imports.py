@@ -0,0 +1,63 @@
+"""Tests for the attributes of the package that are imported on first use."""
+import subprocess
+import sys
+import unittest
+
+import axelrod as axl
+
+
+def run_script(script):
+    """Runs a script in a new Python process and returns its output."""
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_match_does_not_import_heavy_dependencies(self):
+        output = run_script(
+            "import sys\n"
+            "import axelrod as axl\n"
+            "axl.Match((axl.TitForTat(), axl.Random()), seed=0).play()\n"
+            "print(sorted(name for name in ('matplotlib', 'dask', 'pandas')"
+            " if name in sys.modules))"
+        )
+        self.assertEqual(output.strip(), "[]")
+
+    def test_strategy_collections_are_computed_on_first_use(self):
+        output = run_script(
+            "import sys\n"
+            "import axelrod as axl\n"
+            "module = sys.modules['axelrod.strategies']\n"
+            "print('basic_strategies' in vars(module))\n"
+            "print(len(axl.basic_strategies) > 0)\n"
+            "print('basic_strategies' in vars(module))"
+        )
+        self.assertEqual(output.split(), ["False", "True", "True"])
+
+    def test_lazy_attributes(self):
+        from axelrod.fingerprint import AshlockFingerprint
+        from axelrod.plot import Plot
+        from axelrod.result_set import ResultSet
+        from axelrod.tournament import Tournament
+
+        self.assertIs(axl.Tournament, Tournament)
+        self.assertIs(axl.ResultSet, ResultSet)
+        self.assertIs(axl.Plot, Plot)
+        self.assertIs(axl.AshlockFingerprint, AshlockFingerprint)
+
+    def test_strategies_is_a_collection(self):
+        self.assertIsInstance(axl.strategies, list)
+        self.assertIs(axl.ordinary_strategies, axl.strategies)
+        self.assertIn(axl.TitForTat, axl.strategies)
+
+    def test_dir(self):
+        self.assertIn("short_run_time_strategies", dir(axl))
+        self.assertIn("Tournament", dir(axl))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            axl.not_an_attribute
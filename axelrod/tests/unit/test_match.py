@@ -1,8 +1,10 @@
+import json
 import unittest
 from collections import Counter
 
 import axelrod as axl
 from axelrod.deterministic_cache import DeterministicCache
+from axelrod.match import is_stochastic
 from axelrod.random_ import RandomGenerator
 from axelrod.tests.property import games
 from hypothesis import example, given
@@ -136,6 +138,13 @@ class TestMatch(unittest.TestCase):
         match = axl.Match((p1, p2), 5)
         self.assertTrue(match._stochastic)
 
+    @given(p=floats(min_value=1e-10, max_value=1 - 1e-10))
+    def test_is_stochastic(self, p):
+        players = (axl.Cooperator(), axl.Cooperator())
+        self.assertFalse(is_stochastic(players, 0))
+        self.assertTrue(is_stochastic(players, p))
+        self.assertTrue(is_stochastic((axl.Random(), axl.Cooperator()), 0))
+
     @given(p=floats(min_value=1e-10, max_value=1 - 1e-10))
     def test_cache_update_required(self, p):
         p1, p2 = axl.Cooperator(), axl.Cooperator()
@@ -154,6 +163,64 @@ class TestMatch(unittest.TestCase):
         match = axl.Match((p1, p2), 5)
         self.assertFalse(match._cache_update_required)
 
+    def test_plan(self):
+        p1, p2 = axl.Cooperator(), axl.Random()
+        match = axl.Match((p1, p2), 5)
+        self.assertEqual(
+            match.plan,
+            axl.MatchPlan(
+                stochastic=True,
+                cacheable=False,
+                seeded=(False, True),
+                cache_key=(p1, p2),
+            ),
+        )
+        self.assertIs(match.plan, match.plan)
+
+        p3 = axl.Defector()
+        match.players = (p1, p3)
+        self.assertEqual(match.plan.seeded, (False, False))
+        self.assertEqual(match.plan.cache_key, (p1, p3))
+        self.assertTrue(match.plan.cacheable)
+
+        match.noise = 0.1
+        self.assertTrue(match.plan.stochastic)
+        self.assertFalse(match.plan.cacheable)
+        self.assertEqual(match.plan.seeded, (False, False))
+
+    def test_plan_is_recomputed_when_cache_is_replaced(self):
+        match = axl.Match((axl.Cooperator(), axl.Defector()), 5)
+        plan = match.plan
+        self.assertIs(match.plan, plan)
+        match._cache = DeterministicCache()
+        self.assertIsNot(match.plan, plan)
+        self.assertEqual(match.plan, plan)
+
+    def test_counters(self):
+        axl.Match.reset_counters()
+        self.assertEqual(axl.Match.counters, Counter())
+
+        cache = DeterministicCache()
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, 3, deterministic_cache=cache)
+        match.play()
+        match.play()
+        match = axl.Match((axl.Cooperator(), axl.Random()), 3, seed=0)
+        match.play()
+        self.assertEqual(
+            axl.Match.counters,
+            Counter(
+                plans=2,
+                plan_reuses=3,
+                cache_misses=1,
+                cache_writes=1,
+                cache_hits=1,
+                stochastic_plays=1,
+            ),
+        )
+        axl.Match.reset_counters()
+        self.assertEqual(axl.Match.counters, Counter())
+
     def test_play(self):
         cache = DeterministicCache()
         players = (axl.Cooperator(), axl.Defector())
@@ -170,6 +237,127 @@ class TestMatch(unittest.TestCase):
         match = axl.Match(players, 3, deterministic_cache=cache)
         self.assertEqual(match.play(), expected_result[:3])
 
+    def test_play_vectorized(self):
+        for noise in [0, 0.1]:
+            players = (axl.GTFT(), axl.ZDExtort2())
+            match = axl.Match(players, 10, noise=noise, seed=1)
+            expected_result = match.play()
+            players = (axl.GTFT(), axl.ZDExtort2())
+            match = axl.Match(players, 10, noise=noise, seed=1, vectorize=True)
+            self.assertEqual(match.play(), expected_result)
+            self.assertEqual(match.result, expected_result)
+
+    def test_play_repetitions(self):
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, 3)
+        expected_result = [(C, D), (C, D), (C, D)]
+        self.assertEqual(match.play_repetitions(2), [expected_result] * 2)
+        self.assertEqual(match.result, expected_result)
+
+    def test_play_repetitions_vectorized(self):
+        for players in [
+            (axl.GTFT(), axl.StochasticWSLS()),
+            (axl.Random(), axl.TitForTat()),
+        ]:
+            match = axl.Match(players, 10, noise=0.05, seed=3)
+            expected_results = [match.play() for _ in range(5)]
+            match = axl.Match(
+                [p.clone() for p in players],
+                10,
+                noise=0.05,
+                seed=3,
+                vectorize=True,
+            )
+            self.assertEqual(match.play_repetitions(5), expected_results)
+            self.assertEqual(match.result, expected_results[-1])
+
+    def test_play_batch(self):
+        for vectorize in [False, True]:
+            axl.Match.reset_counters()
+            player = axl.Gambler()
+            coplayers = [axl.EvolvedHMM5() for _ in range(3)]
+            matches = [
+                axl.Match((player, coplayer), 10, noise=0.05, seed=seed)
+                for seed, coplayer in enumerate(coplayers)
+            ]
+            expected_results = [match.play() for match in matches]
+            matches = [
+                axl.Match(
+                    (player, coplayer),
+                    10,
+                    noise=0.05,
+                    seed=seed,
+                    vectorize=vectorize,
+                )
+                for seed, coplayer in enumerate(coplayers)
+            ]
+            self.assertEqual(axl.Match.play_batch(matches), expected_results)
+            self.assertEqual(
+                [match.result for match in matches], expected_results
+            )
+            self.assertEqual(
+                axl.Match.counters["vectorized_plays"], 3 if vectorize else 0
+            )
+
+    def test_play_batch_of_different_players(self):
+        matches = [
+            axl.Match((axl.Random(), axl.Random(0.2)), 10, seed=1),
+            axl.Match((axl.Random(), axl.GTFT()), 10, seed=2),
+        ]
+        expected_results = [match.play() for match in matches]
+        matches = [
+            axl.Match((axl.Random(), axl.Random(0.2)), 10, seed=1),
+            axl.Match((axl.Random(), axl.GTFT()), 10, seed=2),
+        ]
+        self.assertEqual(axl.Match.play_batch(matches), expected_results)
+
+    def test_detect_cycles(self):
+        axl.Match.reset_counters()
+        players = (axl.TitForTat(), axl.CyclerCCD())
+        expected_players = (axl.TitForTat(), axl.CyclerCCD())
+        expected_match = axl.Match(expected_players, 100)
+        expected = expected_match.play()
+
+        match = axl.Match(players, 100, detect_cycles=True)
+        self.assertEqual(match.play(), expected)
+        self.assertEqual(match.final_score(), expected_match.final_score())
+        self.assertEqual(
+            match.final_score_per_turn(), expected_match.final_score_per_turn()
+        )
+        for player, expected_player in zip(players, expected_players):
+            self.assertEqual(player.history, expected_player.history)
+            self.assertEqual(
+                player.state_distribution, expected_player.state_distribution
+            )
+            self.assertEqual(player.state_key(), expected_player.state_key())
+        # The play repeats from the second turn with a cycle of 3 turns.
+        self.assertEqual(axl.Match.counters["cycles_detected"], 1)
+        self.assertEqual(axl.Match.counters["turns_skipped"], 93)
+
+    def test_detect_cycles_with_stochastic_players(self):
+        axl.Match.reset_counters()
+        players = (axl.TitForTat(), axl.Random())
+        match = axl.Match(players, 100, seed=0, detect_cycles=True)
+        expected = axl.Match(players, 100, seed=0).play()
+        self.assertEqual(match.play(), expected)
+        self.assertEqual(axl.Match.counters["cycles_detected"], 0)
+
+    def test_detect_cycles_without_state_keys(self):
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, 100, detect_cycles=True)
+        expected = axl.Match(players, 100).play()
+        self.assertEqual(match.play(), expected)
+        self.assertEqual(match.final_score(), (248, 253))
+
+    def test_final_score_after_result_is_replaced(self):
+        players = (axl.Cooperator(), axl.Defector())
+        match = axl.Match(players, 10, detect_cycles=True)
+        match.play()
+        self.assertEqual(match.final_score(), (0, 50))
+        match.result = [(C, C)]
+        self.assertEqual(match.final_score(), (3, 3))
+        self.assertEqual(match.final_score_per_turn(), (3, 3))
+
     def test_cache_grows(self):
         """
         We want to make sure that if we try to use the cache for more turns than
@@ -229,6 +417,10 @@ class TestMatch(unittest.TestCase):
         self.assertEqual(match.final_score(), None)
         match.play()
         self.assertEqual(match.final_score(), (7, 2))
+        self.assertEqual(json.dumps(match.final_score()), "[7, 2]")
+        self.assertEqual(
+            json.dumps(match.final_score_per_turn()), json.dumps([7 / 3, 2 / 3])
+        )
 
     def test_final_score_per_turn(self):
         turns = 3
@@ -5,6 +5,7 @@ from collections import Counter
 import axelrod as axl
 import matplotlib.pyplot as plt
 from axelrod import MoranProcess
+from axelrod.moran import _play_match
 from axelrod.tests.property import strategy_lists
 from hypothesis import example, given, settings
 from hypothesis.strategies import integers
@@ -210,6 +211,104 @@ class TestMoranProcess(unittest.TestCase):
         populations = mp.play()
         self.assertEqual(mp.winning_strategy_name, str(p2))
 
+    def test_executor(self):
+        """The matches played by the workers of an executor give the same
+        process as the matches played in this process."""
+        for mode in ["bd", "db"]:
+            for kwargs in [{"noise": 0.1}, {"prob_end": 0.1}]:
+                players = [
+                    axl.Cooperator(),
+                    axl.Defector(),
+                    axl.Random(),
+                    axl.TitForTat(),
+                ]
+                mp = MoranProcess(
+                    players, turns=10, mode=mode, seed=5, **kwargs
+                )
+                expected = mp.play()
+                expected_scores = mp.score_history
+                with axl.Executor(processes=2) as executor:
+                    mp = MoranProcess(
+                        players,
+                        turns=10,
+                        mode=mode,
+                        seed=5,
+                        executor=executor,
+                        **kwargs
+                    )
+                    self.assertEqual(mp.play(), expected)
+                    self.assertEqual(mp.score_history, expected_scores)
+
+    def test_play_match(self):
+        """The task run by the workers of an executor plays a match between
+        clones of the prototypes."""
+        prototypes = {0: axl.Random(), 1: axl.TitForTat()}
+        kwargs = {"turns": 5, "seed": 3}
+        result, states = _play_match(
+            prototypes, axl.Match, (0, 1), False, kwargs
+        )
+        match = axl.Match((axl.Random(), axl.TitForTat()), **kwargs)
+        self.assertEqual(result, match.play())
+        self.assertEqual(len(states), 2)
+        self.assertEqual(set(states[0]), {"_seed", "_random"})
+        self.assertEqual(states[0]["_seed"], match.players[0]._seed)
+        self.assertEqual(prototypes[0].history, [])
+
+        result, states = _play_match(prototypes, axl.Match, (0, 0), True, {})
+        self.assertEqual(len(result), axl.DEFAULT_TURNS)
+        self.assertEqual(states[0], states[1])
+
+    def test_executor_with_atomic_mutation(self):
+        """Every mutant is a new prototype: the workers only keep the most
+        recently used ones."""
+        players = [
+            axl.EvolvableCycler(cycle_length=5, seed=4) for _ in range(5)
+        ]
+        mp = MoranProcess(players, turns=10, mutation_method="atomic", seed=10)
+        for _ in range(20):
+            next(mp)
+        expected, expected_scores = mp.populations, mp.score_history
+        with axl.Executor(processes=2, max_prototypes=8) as executor:
+            mp = MoranProcess(
+                players,
+                turns=10,
+                mutation_method="atomic",
+                seed=10,
+                executor=executor,
+            )
+            for _ in range(20):
+                next(mp)
+            self.assertEqual(mp.populations, expected)
+            self.assertEqual(mp.score_history, expected_scores)
+            self.assertLessEqual(len(executor._prototype_ids), 8)
+            self.assertGreater(executor.evictions, 0)
+
+    def test_vectorize(self):
+        """Playing the matches of a round together gives the same process."""
+        for mode in ["bd", "db"]:
+            players = [
+                axl.Random(),
+                axl.Random(),
+                axl.GTFT(),
+                axl.GTFT(),
+                axl.EvolvedHMM5(),
+                axl.PSOGambler1_1_1(),
+                axl.Grudger(),
+            ]
+            mp = MoranProcess(players, turns=10, noise=0.1, mode=mode, seed=2)
+            expected = mp.play()
+            expected_scores = mp.score_history
+            mp = MoranProcess(
+                players,
+                turns=10,
+                noise=0.1,
+                mode=mode,
+                seed=2,
+                vectorize=True,
+            )
+            self.assertEqual(mp.play(), expected)
+            self.assertEqual(mp.score_history, expected_scores)
+
     def test_death_birth(self):
         """Two player death-birth should fixate after one round."""
         p1, p2 = axl.Cooperator(), axl.Defector()
@@ -422,9 +521,11 @@ class TestMoranProcess(unittest.TestCase):
         rounds = 10
         for _ in range(rounds):
             next(mp)
+        # This is the population found without a cache: the mutants have
+        # different transitions and do not share cached results.
         self.assertEqual(
             list(sorted(mp.populations[-1].items()))[0][0],
-            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, C), (1, C, 1, D), (1, D, 1, D)), 0, D, 2, 0.1, 2240802643",
+            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, D), (1, C, 1, C), (1, D, 1, D)), 0, D, 2, 0.1, 1407878363",
         )
         self.assertEqual(len(mp.populations), 11)
         self.assertFalse(mp.fixated)
@@ -1,12 +1,26 @@
 import csv
 import pathlib
+import tracemalloc
 import unittest
 from collections import Counter
 
 import axelrod as axl
+import numpy as np
 import pandas as pd
 from axelrod.load_data_ import axl_filename
-from axelrod.result_set import create_counter_dict
+from axelrod.result_set import (
+    _AGGREGATES,
+    _CELL_COLUMNS,
+    METRICS,
+    STATE_KEYS,
+    STATE_TO_ACTION_KEYS,
+    ResultSetBuilder,
+    _partition,
+    _read_chunks,
+    _read_part,
+    _required_metrics,
+    create_counter_dict,
+)
 from axelrod.tests.property import prob_end_tournaments, tournaments
 from dask.dataframe.core import DataFrame
 from hypothesis import given, settings
@@ -246,18 +260,22 @@ class TestResultSet(unittest.TestCase):
         rs_1 = axl.ResultSet(self.filename, self.players, self.repetitions)
         # Force a broken eigenmoses, by replacing vengeful_cooperation with
         # zeroes.
-        self._clear_matrix(rs_1.vengeful_cooperation)
+        self._clear_matrix(rs_1.vengeful_cooperation_array)
         rs_1.eigenmoses_rating = rs_1._build_eigenmoses_rating()
 
         rs_2 = axl.ResultSet(self.filename, self.players, self.repetitions)
         # Force a broken eigenmoses, by replacing vengeful_cooperation with
         # zeroes.
-        self._clear_matrix(rs_2.vengeful_cooperation)
+        self._clear_matrix(rs_2.vengeful_cooperation_array)
         rs_2.eigenmoses_rating = rs_2._build_eigenmoses_rating()
 
+        self.assertTrue(np.isnan(rs_1.eigenmoses_rating).all())
         self.assertEqual(rs_1, rs_2)
 
     def test_init_multiprocessing(self):
+        expected = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
         rs = axl.ResultSet(
             self.filename,
             self.players,
@@ -267,6 +285,7 @@ class TestResultSet(unittest.TestCase):
         )
         self.assertEqual(rs.players, self.players)
         self.assertEqual(rs.num_players, len(self.players))
+        self.assertEqual(rs, expected)
 
         rs = axl.ResultSet(
             self.filename,
@@ -286,6 +305,92 @@ class TestResultSet(unittest.TestCase):
         self.assertEqual(rs.progress_bar.total, 25)
         self.assertEqual(rs.progress_bar.n, rs.progress_bar.total)
 
+    def test_chunk_size(self):
+        expected = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            chunk_size=7,
+        )
+        self.assertEqual(rs, expected)
+
+        rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            memory_limit=2**23,
+        )
+        self.assertIsNone(rs.peak_memory)
+        self.assertEqual(rs, expected)
+
+        rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            memory_limit=2**23,
+            trace_memory=True,
+        )
+        self.assertLessEqual(rs.peak_memory, 2**23)
+        self.assertEqual(rs, expected)
+
+    def test_required_metrics(self):
+        self.assertEqual(_required_metrics(METRICS), list(METRICS))
+        self.assertEqual(
+            _required_metrics(["ranked_names"]),
+            ["normalised_scores", "ranking", "ranked_names"],
+        )
+        self.assertEqual(
+            _required_metrics(["eigenmoses_rating", "match_lengths"]),
+            [
+                "match_lengths",
+                "cooperation",
+                "normalised_cooperation",
+                "vengeful_cooperation",
+                "eigenmoses_rating",
+            ],
+        )
+
+    def test_metrics(self):
+        expected = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=True,
+            metrics=["ranking", "wins"],
+        )
+        self.assertEqual(rs.progress_bar.total, 3)
+        self.assertEqual(rs.progress_bar.n, rs.progress_bar.total)
+        self.assertIn("ranking", vars(rs))
+        self.assertIn("wins_array", vars(rs))
+        self.assertNotIn("payoffs_array", vars(rs))
+        self.assertNotIn("eigenjesus_rating", vars(rs))
+        self.assertEqual(rs.ranking, expected.ranking)
+        self.assertEqual(rs.wins, expected.wins)
+
+        # The other metrics are computed on first access.
+        self.assertEqual(rs.payoff_matrix, expected.payoff_matrix)
+        self.assertEqual(rs.eigenjesus_rating, expected.eigenjesus_rating)
+        self.assertEqual(rs, expected)
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            axl.ResultSet(
+                self.filename,
+                self.players,
+                self.repetitions,
+                progress_bar=False,
+                metrics=["ranking", "not_a_metric"],
+            )
+
     def test_match_lengths(self):
         rs = axl.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=False
@@ -483,6 +588,83 @@ class TestResultSet(unittest.TestCase):
             self.expected_normalised_state_to_action_distribution,
         )
 
+    def test_arrays(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        for attribute in [
+            "score_diffs",
+            "match_lengths",
+            "wins",
+            "scores",
+            "normalised_scores",
+            "cooperation",
+            "good_partner_matrix",
+            "initial_cooperation_count",
+            "initial_cooperation_rate",
+            "good_partner_rating",
+            "normalised_cooperation",
+            "payoff_matrix",
+            "payoff_stddevs",
+            "payoff_diffs_means",
+            "cooperating_rating",
+            "vengeful_cooperation",
+        ]:
+            with self.subTest(attribute=attribute):
+                array = getattr(rs, attribute + "_array")
+                self.assertIsInstance(array, np.ndarray)
+                np.testing.assert_array_equal(array, getattr(rs, attribute))
+
+    def test_payoffs_array(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        self.assertEqual(
+            rs.payoffs_array.shape,
+            (rs.num_players, rs.num_players, rs.repetitions),
+        )
+        for player_index, row in enumerate(self.expected_payoffs):
+            for opponent_index, payoffs in enumerate(row):
+                array = rs.payoffs_array[player_index, opponent_index]
+                # Matches that were not played have no payoffs
+                self.assertEqual(np.isnan(array).all(), not payoffs)
+                np.testing.assert_array_equal(array[~np.isnan(array)], payoffs)
+
+    def test_state_distribution_arrays(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        n = rs.num_players
+        self.assertEqual(rs.state_distribution_array.shape, (n, n, 4))
+        self.assertEqual(
+            rs.state_to_action_distribution_array.shape, (n, n, 4, 2)
+        )
+        for player_index in range(n):
+            for opponent_index in range(n):
+                pair = (player_index, opponent_index)
+                for index, state in enumerate(STATE_KEYS):
+                    self.assertEqual(
+                        rs.state_distribution_array[pair][index],
+                        self.expected_state_distribution[player_index][
+                            opponent_index
+                        ][state],
+                    )
+                    self.assertEqual(
+                        rs.normalised_state_distribution_array[pair][index],
+                        self.expected_normalised_state_distribution[
+                            player_index
+                        ][opponent_index][state],
+                    )
+                for index, key in enumerate(STATE_TO_ACTION_KEYS):
+                    self.assertEqual(
+                        rs.normalised_state_to_action_distribution_array[
+                            pair
+                        ].ravel()[index],
+                        self.expected_normalised_state_to_action_distribution[
+                            player_index
+                        ][opponent_index][key],
+                    )
+
     def test_vengeful_cooperation(self):
         rs = axl.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=False
@@ -569,6 +751,48 @@ class TestResultSet(unittest.TestCase):
         results = tournament.play(progress_bar=False)
         self.assertNotEqual(results, rs_sets[0])
 
+    def test_summary_matrices_with_a_missing_repetition(self):
+        full = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        with open(self.filename) as f:
+            rows = list(csv.reader(f))
+        path = pathlib.Path("test_outputs/test_results_missing_repetition.csv")
+        filename = str(axl_filename(path))
+        with open(filename, "w", newline="") as f:
+            csv.writer(f).writerows(
+                row
+                for row in rows
+                if row[1:4] not in (["0", "1", "0"], ["1", "0", "0"])
+            )
+        rs = axl.ResultSet(
+            filename, self.players, self.repetitions, progress_bar=False
+        )
+        if full.payoffs[0][1]:
+            self.assertEqual(rs.payoffs[0][1], full.payoffs[0][1][1:])
+        for player, opponent in [(0, 1), (1, 0)]:
+            payoffs = rs.payoffs[player][opponent]
+            if payoffs:
+                self.assertAlmostEqual(
+                    rs.payoff_matrix[player][opponent], mean(payoffs)
+                )
+                self.assertAlmostEqual(
+                    rs.payoff_stddevs[player][opponent], std(payoffs)
+                )
+
+    def test_binary_file(self):
+        players = [s() for s in axl.demo_strategies]
+        path = pathlib.Path("test_outputs/test_results_binary.bin")
+        filename = str(axl_filename(path))
+        csv_tournament = axl.Tournament(players, repetitions=2, turns=5, seed=0)
+        expected = csv_tournament.play(progress_bar=False)
+        tournament = axl.Tournament(players, repetitions=2, turns=5, seed=0)
+        tournament.play(
+            filename=filename, file_format="binary", progress_bar=False
+        )
+        rs = axl.ResultSet(filename, players, 2, progress_bar=False)
+        self.assertEqual(rs, expected)
+
     def test_summarise(self):
         rs = axl.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=False
@@ -713,6 +937,24 @@ class TestResultSet(unittest.TestCase):
                         value, summary[outer_index][inner_index], places=3
                     )
 
+    def test_write_summary_of_unreached_states(self):
+        """The rates of states that a player never reaches are written as
+        0."""
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        results = axl.Tournament(players, turns=10, repetitions=2).play(
+            progress_bar=False
+        )
+        summary = results.summarise()
+        self.assertEqual(summary[0].Name, "Defector")
+        for rate in summary[0][-4:]:
+            self.assertIs(type(rate), int)
+        filename = self.filename + ".summary"
+        results.write_summary(filename=filename)
+        with open(filename, "r") as csvfile:
+            rows = list(csv.reader(csvfile))
+        self.assertEqual(rows[1][1], "Defector")
+        self.assertEqual(rows[1][-4:], ["0", "0", "0", "0"])
+
     def test_write_summary(self):
         rs = axl.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=False
@@ -941,6 +1183,18 @@ class TestResultSetSpatialStructure(TestResultSet):
                         self.assertEqual(length, self.turns)
                     else:
                         self.assertEqual(length, 0)
+                        self.assertIsInstance(length, int)
+
+    def test_score_diffs_of_unplayed_matches(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        for i, row in enumerate(rs.score_diffs):
+            for j, diffs in enumerate(row):
+                if (i, j) not in self.edges and (j, i) not in self.edges:
+                    self.assertEqual(diffs, [0] * self.repetitions)
+                    for diff in diffs:
+                        self.assertIsInstance(diff, int)
 
 
 class TestResultSetSpatialStructureTwo(TestResultSetSpatialStructure):
@@ -1356,6 +1610,351 @@ class TestSummary(unittest.TestCase):
             self.assertTrue(0 <= player.Initial_C_rate <= 1)
 
 
+class TestResultSetBuilder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        path = pathlib.Path("test_outputs/test_results_builder.bin")
+        cls.filename = str(axl_filename(path))
+
+    def assert_same_as_file(self, tournament_parameters):
+        players = tournament_parameters.pop("players")
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(players, **tournament_parameters)
+        tournament.play(
+            filename=self.filename, file_format="binary", progress_bar=False
+        )
+        expected = axl.ResultSet(
+            self.filename, names, tournament.repetitions, progress_bar=False
+        )
+
+        tournament = axl.Tournament(players, **tournament_parameters)
+        builder = ResultSetBuilder(names, tournament.repetitions)
+        for chunk in tournament.match_generator.build_match_chunks():
+            builder.add_interactions(tournament._play_matches(chunk))
+        results = builder.build(progress_bar=False)
+        self.assertIsNone(results.filename)
+        self.assertEqual(results, expected)
+        return results
+
+    def test_same_as_file(self):
+        self.assert_same_as_file(
+            {
+                "players": [axl.Random(), axl.GTFT(), axl.Random()],
+                "turns": 13,
+                "repetitions": 3,
+                "noise": 0.1,
+                "seed": 0,
+            }
+        )
+
+    def test_same_as_file_with_prob_end_and_float_game(self):
+        results = self.assert_same_as_file(
+            {
+                "players": [axl.Random(), axl.Grudger(), axl.TitForTat()],
+                "prob_end": 0.1,
+                "repetitions": 4,
+                "game": axl.Game(r=3.5, s=0.5, t=5.5, p=1.5),
+                "seed": 1,
+            }
+        )
+        self.assertIsInstance(results.scores[0][0], float)
+
+    def test_same_as_file_with_edges(self):
+        self.assert_same_as_file(
+            {
+                "players": [s() for s in axl.demo_strategies],
+                "turns": 5,
+                "repetitions": 2,
+                "edges": [(0, 1), (1, 2), (2, 3), (3, 4), (3, 3)],
+                "seed": 2,
+            }
+        )
+
+    def test_add_no_interactions(self):
+        names = ["Cooperator", "Defector"]
+        builder = ResultSetBuilder(names, 2)
+        builder.add_interactions({(0, 1): []})
+        self.assertEqual(builder._counts.sum(), 0)
+        results = builder.build(progress_bar=False)
+        self.assertEqual(results.scores, [[0, 0], [0, 0]])
+
+    def test_scores_per_turn_are_not_rounded(self):
+        """The scores per turn are aggregated as they are computed, rather
+        than as they are read back from a csv file."""
+        players = [axl.TitForTat(), axl.Alternator()]
+        tournament = axl.Tournament(players, turns=7, repetitions=1)
+        results = tournament.play(progress_bar=False)
+        self.assertEqual(results.payoffs[0][1], [18 / 7])
+
+    def test_integer_scores(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        builder = ResultSetBuilder([str(p) for p in players], 2)
+        tournament = axl.Tournament(players, turns=3, repetitions=2)
+        for chunk in tournament.match_generator.build_match_chunks():
+            builder.add_interactions(tournament._play_matches(chunk))
+        results = builder.build(progress_bar=False)
+        self.assertEqual(results.scores, [[0, 0], [15, 15]])
+        self.assertIsInstance(results.scores[0][0], int)
+        self.assertEqual(results.wins, [[0, 0], [1, 1]])
+        self.assertEqual(results.cooperation, [[6, 6], [0, 0]])
+
+    def test_save_and_load(self):
+        players = [axl.Random(), axl.Grudger(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(
+            players, prob_end=0.1, repetitions=3, noise=0.1, seed=4
+        )
+        builder = ResultSetBuilder(names, tournament.repetitions)
+        for chunk in tournament.match_generator.build_match_chunks():
+            builder.add_interactions(tournament._play_matches(chunk))
+
+        path = pathlib.Path("test_outputs/test_results_builder.npz")
+        filename = str(axl_filename(path))
+        builder.save(filename)
+        loaded = ResultSetBuilder.load(filename)
+        self.assertEqual(loaded.players, names)
+        self.assertEqual(loaded.repetitions, 3)
+        self.assertEqual(
+            loaded.build(progress_bar=False), builder.build(progress_bar=False)
+        )
+
+    def test_merge(self):
+        players = [axl.Random(), axl.GTFT(), axl.Random(0.2), axl.Alternator()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(
+            players,
+            turns=10,
+            repetitions=3,
+            noise=0.1,
+            game=axl.Game(r=3.5, s=0.5, t=5.5, p=1.5),
+            seed=5,
+        )
+        chunks = list(tournament.match_generator.build_match_chunks())
+        builder = ResultSetBuilder(names, tournament.repetitions)
+        parts = []
+        for chunk in chunks:
+            results = tournament._play_matches(chunk)
+            builder.add_interactions(results)
+            parts.append(ResultSetBuilder(names, tournament.repetitions))
+            parts[-1].add_interactions(results)
+        expected = builder.build(progress_bar=False)
+
+        self.assertEqual(
+            ResultSetBuilder.merge(*parts).build(progress_bar=False), expected
+        )
+        self.assertEqual(
+            ResultSetBuilder.merge(*parts[::-1]).build(progress_bar=False),
+            expected,
+        )
+        merged = ResultSetBuilder.merge(
+            ResultSetBuilder.merge(*parts[:4]), *parts[4:]
+        )
+        self.assertEqual(merged.build(progress_bar=False), expected)
+        self.assertEqual(
+            axl.ResultSet.merge(*parts, progress_bar=False), expected
+        )
+
+    def test_merge_different_tournaments(self):
+        with self.assertRaises(ValueError):
+            ResultSetBuilder.merge()
+        with self.assertRaises(ValueError):
+            ResultSetBuilder.merge(
+                ResultSetBuilder(["Player"], 1), ResultSetBuilder(["Player"], 2)
+            )
+        with self.assertRaises(ValueError):
+            ResultSetBuilder.merge(
+                ResultSetBuilder(["Player"], 1), ResultSetBuilder(["Other"], 1)
+            )
+
+    def test_from_file(self):
+        players = [axl.Random(), axl.Grudger(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        path = pathlib.Path("test_outputs/test_results_builder.csv")
+        for filename, file_format, game in (
+            (str(axl_filename(path)), "csv", axl.Game()),
+            (self.filename, "binary", axl.Game()),
+            (str(axl_filename(path)), "csv", axl.Game(r=3.5, s=0.5, t=5.5)),
+        ):
+            tournament = axl.Tournament(
+                players, prob_end=0.2, repetitions=3, game=game, seed=0
+            )
+            tournament.play(
+                filename=filename, file_format=file_format, progress_bar=False
+            )
+            expected = axl.ResultSet(filename, names, 3, progress_bar=False)
+            for chunk_size in (None, 1, 5):
+                with self.subTest(
+                    file_format=file_format, chunk_size=chunk_size
+                ):
+                    builder = ResultSetBuilder.from_file(
+                        filename, names, 3, chunk_size=chunk_size
+                    )
+                    self.assertIsNone(builder.peak_memory)
+                    results = builder.build(progress_bar=False)
+                    self.assertEqual(results, expected)
+                    self.assertEqual(
+                        type(results.scores[0][0]), type(expected.scores[0][0])
+                    )
+
+    def test_from_file_with_memory_limit(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        expected = tournament.play(
+            filename=self.filename, file_format="binary", progress_bar=False
+        )
+        memory_limit = 2**22
+        builder = ResultSetBuilder.from_file(
+            self.filename,
+            names,
+            2,
+            memory_limit=memory_limit,
+            trace_memory=True,
+        )
+        self.assertGreater(builder.peak_memory, 0)
+        self.assertLessEqual(builder.peak_memory, memory_limit)
+        self.assertEqual(builder.build(progress_bar=False), expected)
+
+        with self.assertRaises(ValueError):
+            ResultSetBuilder.from_file(
+                self.filename, names, 2, memory_limit=2**10
+            )
+
+    def test_from_file_does_not_reset_a_tracing_session(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        tournament.play(
+            filename=self.filename, file_format="binary", progress_bar=False
+        )
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        allocation = bytearray(2**24)
+        del allocation
+        _, peak = tracemalloc.get_traced_memory()
+        builder = ResultSetBuilder.from_file(
+            self.filename, names, 2, chunk_size=4, trace_memory=True
+        )
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], peak)
+        self.assertGreater(builder.peak_memory, 0)
+
+        ResultSetBuilder.from_file(self.filename, names, 2, chunk_size=4)
+        self.assertTrue(tracemalloc.is_tracing())
+
+    def test_partition(self):
+        players = [axl.Random(), axl.Grudger(), axl.TitForTat()]
+        path = pathlib.Path("test_outputs/test_results_builder.csv")
+        for filename, file_format in (
+            (str(axl_filename(path)), "csv"),
+            (self.filename, "binary"),
+        ):
+            tournament = axl.Tournament(players, turns=3, repetitions=3, seed=0)
+            tournament.play(
+                filename=filename, file_format=file_format, progress_bar=False
+            )
+            expected = pd.concat(_read_chunks(filename, 100), ignore_index=True)
+            for parts in (1, 2, 4, 100):
+                with self.subTest(file_format=file_format, parts=parts):
+                    ranges = _partition(filename, parts)
+                    self.assertLessEqual(len(ranges), parts)
+                    chunks = [
+                        pd.concat(_read_chunks(filename, 2, rows))
+                        for rows in ranges
+                    ]
+                    pd.testing.assert_frame_equal(
+                        pd.concat(chunks, ignore_index=True), expected
+                    )
+                    # The two rows of a self interaction are in the same part
+                    cells = [
+                        set(map(tuple, chunk[_CELL_COLUMNS].to_numpy()))
+                        for chunk in chunks
+                    ]
+                    for first, second in zip(cells, cells[1:]):
+                        self.assertFalse(first & second)
+
+    def test_from_file_with_processes(self):
+        players = [axl.Random(), axl.Grudger(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        path = pathlib.Path("test_outputs/test_results_builder.csv")
+        for filename, file_format in (
+            (str(axl_filename(path)), "csv"),
+            (self.filename, "binary"),
+        ):
+            tournament = axl.Tournament(
+                players, prob_end=0.2, repetitions=3, seed=0
+            )
+            tournament.play(
+                filename=filename, file_format=file_format, progress_bar=False
+            )
+            expected = ResultSetBuilder.from_file(filename, names, 3)
+            for processes in (2, 5):
+                with self.subTest(file_format=file_format, processes=processes):
+                    builder = ResultSetBuilder.from_file(
+                        filename,
+                        names,
+                        3,
+                        chunk_size=4,
+                        processes=processes,
+                        progress_bar=processes == 2,
+                        trace_memory=True,
+                    )
+                    for name in _AGGREGATES:
+                        np.testing.assert_array_equal(
+                            getattr(builder, name), getattr(expected, name)
+                        )
+                    self.assertEqual(
+                        builder._integer_scores, expected._integer_scores
+                    )
+                    self.assertGreater(builder.peak_memory, 0)
+
+            builder = ResultSetBuilder.from_file(
+                filename, names, 3, progress_bar=True, processes=0
+            )
+            for name in _AGGREGATES:
+                np.testing.assert_array_equal(
+                    getattr(builder, name), getattr(expected, name)
+                )
+
+    def test_read_part(self):
+        players = [axl.Random(), axl.Grudger(), axl.TitForTat()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(players, turns=4, repetitions=3, seed=0)
+        tournament.play(
+            filename=self.filename, file_format="binary", progress_bar=False
+        )
+        expected = ResultSetBuilder.from_file(self.filename, names, 3)
+        builder = ResultSetBuilder(names, 3)
+        for rows in _partition(self.filename, 3):
+            part, integer_scores, peak_memory = _read_part(
+                self.filename, names, 3, 2, None, True, rows
+            )
+            self.assertTrue(integer_scores)
+            self.assertGreater(peak_memory, 0)
+            builder._add_part(*part)
+        for name in _AGGREGATES:
+            np.testing.assert_array_equal(
+                getattr(builder, name), getattr(expected, name)
+            )
+
+    def test_add_no_rows(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        names = [str(p) for p in players]
+        tournament = axl.Tournament(players, turns=4, repetitions=2)
+        tournament.play(
+            filename=self.filename, file_format="binary", progress_bar=False
+        )
+        builder = ResultSetBuilder(names, 2)
+        builder.add_rows(next(_read_chunks(self.filename, 4)).iloc[:0])
+        for name in _AGGREGATES:
+            self.assertFalse(getattr(builder, name).any())
+
+    def test_empty_builder(self):
+        results = ResultSetBuilder(["Player"], 1).build(progress_bar=False)
+        self.assertEqual(results.scores, [[0]])
+        self.assertEqual(results.payoffs, [[[]]])
+
+
 class TestCreateCounterDict(unittest.TestCase):
     """Separate test for a helper function"""
 
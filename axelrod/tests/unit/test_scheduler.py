@@ -0,0 +1,141 @@
+"""Tests for the scheduling of tournament chunks."""
+import unittest
+
+import axelrod as axl
+from axelrod.scheduler import (
+    INFINITE_MEMORY_COST,
+    LONG_RUN_TIME_COST,
+    WorkStealingQueues,
+    assign_chunks,
+    estimate_chunk_cost,
+    estimate_costs,
+    expected_turns,
+    player_cost,
+    timing_key,
+    worker_reports,
+)
+
+
+def chunk(index_pair, turns=10, prob_end=None, noise=0, repetitions=5):
+    match_params = {
+        "turns": turns,
+        "game": axl.Game(),
+        "noise": noise,
+        "prob_end": prob_end,
+        "match_attributes": None,
+    }
+    return (index_pair, match_params, repetitions, 0)
+
+
+class TestCosts(unittest.TestCase):
+    players = [
+        axl.Cooperator(),
+        axl.Random(),
+        axl.Grudger(),
+        axl.MetaMajority(),
+    ]
+
+    def test_player_cost(self):
+        self.assertEqual(player_cost(axl.Cooperator()), 1)
+        self.assertEqual(player_cost(axl.Grudger()), INFINITE_MEMORY_COST)
+        self.assertEqual(player_cost(axl.MetaMajority()), LONG_RUN_TIME_COST)
+
+    def test_deterministic_chunk_is_played_once(self):
+        self.assertEqual(estimate_chunk_cost(chunk((0, 0)), self.players), 20)
+        self.assertEqual(
+            estimate_chunk_cost(chunk((0, 0), noise=0.1), self.players), 100
+        )
+
+    def test_stochastic_chunk(self):
+        self.assertEqual(estimate_chunk_cost(chunk((0, 1)), self.players), 100)
+
+    def test_prob_end_chunk(self):
+        cost = estimate_chunk_cost(
+            chunk((0, 1), turns=None, prob_end=0.5), self.players
+        )
+        self.assertEqual(cost, 20)
+
+    def test_expected_turns(self):
+        self.assertEqual(expected_turns(10, None), 10)
+        self.assertEqual(expected_turns(None, 0.5), 2)
+        self.assertEqual(expected_turns(10, 0.001), 10)
+        self.assertEqual(expected_turns(1000, 0.1), 10)
+        self.assertEqual(expected_turns(10, 0), 10)
+        self.assertEqual(expected_turns(None, 0), axl.DEFAULT_TURNS)
+        self.assertEqual(expected_turns(None, None), axl.DEFAULT_TURNS)
+
+    def test_prob_end_chunk_is_capped_by_turns(self):
+        cost = estimate_chunk_cost(
+            chunk((0, 1), turns=10, prob_end=0.001), self.players
+        )
+        self.assertEqual(cost, 100)
+        cost = estimate_chunk_cost(
+            chunk((0, 1), turns=None, prob_end=0), self.players
+        )
+        self.assertEqual(cost, 2 * axl.DEFAULT_TURNS * 5)
+
+    def test_long_run_time_chunk(self):
+        cost = estimate_chunk_cost(chunk((2, 3)), self.players)
+        self.assertEqual(
+            cost, (INFINITE_MEMORY_COST + LONG_RUN_TIME_COST) * 10 * 5
+        )
+
+    def test_estimate_costs_with_timings(self):
+        chunks = [chunk((0, 0)), chunk((0, 1)), chunk((0, 2))]
+        self.assertEqual(estimate_costs(chunks, self.players), [20, 100, 50])
+        timings = {timing_key(chunks[0], self.players): 2.0}
+        self.assertEqual(
+            estimate_costs(chunks, self.players, timings), [2.0, 10.0, 5.0]
+        )
+        # Timings of other chunks are not used
+        timings = {timing_key(chunk((1, 2)), self.players): 2.0}
+        self.assertEqual(
+            estimate_costs(chunks, self.players, timings), [20, 100, 50]
+        )
+
+
+class TestAssignChunks(unittest.TestCase):
+    def test_longest_processing_time_first(self):
+        assignments = assign_chunks([1, 10, 3, 7, 2], workers=2)
+        self.assertEqual(assignments, [[1, 4], [3, 2, 0]])
+
+    def test_more_workers_than_chunks(self):
+        self.assertEqual(assign_chunks([1], workers=3), [[0], [], []])
+
+
+class TestWorkStealingQueues(unittest.TestCase):
+    def test_get_own_chunks_first(self):
+        queues = WorkStealingQueues([[3, 1], [0, 2]])
+        self.assertEqual(queues.remaining(0), 2)
+        self.assertEqual(queues.get(0), (3, False))
+        self.assertEqual(queues.get(0), (1, False))
+        self.assertEqual(queues.get(0), (2, True))
+        self.assertEqual(queues.remaining(1), 1)
+        self.assertEqual(queues.get(1), (0, False))
+        self.assertIsNone(queues.get(0))
+        self.assertIsNone(queues.get(1))
+
+    def test_steal_from_busiest_worker(self):
+        queues = WorkStealingQueues([[], [0], [1, 2, 3]])
+        self.assertEqual(
+            list(queues.iterate(0)),
+            [(3, True), (2, True), (0, True), (1, True)],
+        )
+
+    def test_empty(self):
+        queues = WorkStealingQueues([[], []])
+        self.assertEqual(list(queues.iterate(1)), [])
+
+
+class TestWorkerReports(unittest.TestCase):
+    def test_worker_reports(self):
+        reports = worker_reports(
+            2, [(0, False, 1.0), (1, False, 0.5), (1, True, 1.5)], 2.0
+        )
+        self.assertEqual(reports[0].chunks, 1)
+        self.assertEqual(reports[0].stolen, 0)
+        self.assertEqual(reports[0].utilisation, 0.5)
+        self.assertEqual(reports[1].chunks, 2)
+        self.assertEqual(reports[1].stolen, 1)
+        self.assertEqual(reports[1].busy_time, 2.0)
+        self.assertEqual(reports[1].utilisation, 1.0)
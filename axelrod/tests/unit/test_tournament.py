@@ -1,4 +1,5 @@
 """Tests for the main tournament class."""
+import gc
 import io
 import logging
 import os
@@ -6,6 +7,7 @@ import pathlib
 import pickle
 import unittest
 import warnings
+from collections import Counter
 from multiprocessing import Queue, cpu_count
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +15,7 @@ import axelrod as axl
 import numpy as np
 import pandas as pd
 from axelrod.load_data_ import axl_filename
+from axelrod.scheduler import WorkStealingQueues, assign_chunks
 from axelrod.tests.property import (
     prob_end_tournaments,
     spatial_tournaments,
@@ -118,6 +121,8 @@ class TestTournament(unittest.TestCase):
         self.assertEqual(tournament.name, "test")
         self.assertIsInstance(tournament._logger, logging.Logger)
         self.assertEqual(tournament.noise, 0.2)
+        self.assertFalse(tournament.vectorize)
+        self.assertFalse(tournament.detect_cycles)
         anonymous_tournament = axl.Tournament(players=self.players)
         self.assertEqual(anonymous_tournament.name, "axelrod")
 
@@ -159,19 +164,14 @@ class TestTournament(unittest.TestCase):
         self.test_tournament.setup_output(self.filename)
 
         self.assertEqual(self.test_tournament.filename, self.filename)
-        self.assertIsNone(self.test_tournament._temp_file_descriptor)
         self.assertFalse(hasattr(self.test_tournament, "interactions_dict"))
 
     def test_setup_output_no_filename(self):
         self.test_tournament.setup_output()
 
-        self.assertIsInstance(self.test_tournament.filename, str)
-        self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
+        self.assertIsNone(self.test_tournament.filename)
         self.assertFalse(hasattr(self.test_tournament, "interactions_dict"))
 
-        os.close(self.test_tournament._temp_file_descriptor)
-        os.remove(self.test_tournament.filename)
-
     def test_play_resets_num_interactions(self):
         self.assertEqual(self.test_tournament.num_interactions, 0)
         self.test_tournament.play(progress_bar=False)
@@ -189,38 +189,49 @@ class TestTournament(unittest.TestCase):
         self.test_tournament.play(progress_bar=True)
         self.assertTrue(self.test_tournament.use_progress_bar)
 
-    def test_play_changes_temp_file_descriptor(self):
-        self.assertIsNone(self.test_tournament._temp_file_descriptor)
-
-        # No file descriptor for a named file.
-        self.test_tournament.play(filename=self.filename, progress_bar=False)
-        self.assertIsNone(self.test_tournament._temp_file_descriptor)
-
-        # Temp file creates file descriptor.
-        self.test_tournament.play(filename=None, progress_bar=False)
-        self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
-
-    def test_play_tempfile_removed(self):
-        self.test_tournament.play(filename=None, progress_bar=False)
-
-        self.assertFalse(os.path.isfile(self.test_tournament.filename))
+    @patch("axelrod.tournament.open", create=True)
+    def test_play_without_filename_writes_no_file(self, mock_open):
+        results = self.test_tournament.play(filename=None, progress_bar=False)
+        self.assertIsInstance(results, axl.ResultSet)
+        self.assertIsNone(results.filename)
+        self.assertFalse(mock_open.called)
 
-    def test_play_resets_filename_and_temp_file_descriptor_each_time(self):
+    def test_play_resets_filename_each_time(self):
         self.test_tournament.play(progress_bar=False)
-        self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
-        self.assertIsInstance(self.test_tournament.filename, str)
-        old_filename = self.test_tournament.filename
+        self.assertIsNone(self.test_tournament.filename)
 
         self.test_tournament.play(filename=self.filename, progress_bar=False)
-        self.assertIsNone(self.test_tournament._temp_file_descriptor)
         self.assertEqual(self.test_tournament.filename, self.filename)
-        self.assertNotEqual(old_filename, self.test_tournament.filename)
 
         self.test_tournament.play(progress_bar=False)
-        self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
-        self.assertIsInstance(self.test_tournament.filename, str)
-        self.assertNotEqual(old_filename, self.test_tournament.filename)
-        self.assertNotEqual(self.test_tournament.filename, self.filename)
+        self.assertIsNone(self.test_tournament.filename)
+
+    def test_play_results_match_file(self):
+        players = [axl.Random(), axl.GTFT(), axl.Grudger(), axl.Random()]
+        tournament = axl.Tournament(
+            players, turns=17, repetitions=3, noise=0.1, seed=4
+        )
+        path = pathlib.Path("test_outputs/test_tournament.bin")
+        filename = str(axl_filename(path))
+        results = tournament.play(
+            filename=filename, file_format="binary", progress_bar=False
+        )
+        self.assertEqual(results.filename, filename)
+        expected = axl.ResultSet(
+            filename, [str(p) for p in players], 3, progress_bar=False
+        )
+        self.assertEqual(results, expected)
+
+        # The order in which the parallel results are received can introduce
+        # floating point differences in the mean scores.
+        tournament = axl.Tournament(
+            players, turns=17, repetitions=3, noise=0.1, seed=4
+        )
+        results = tournament.play(processes=2, progress_bar=False)
+        self.assertEqual(results.wins, expected.wins)
+        self.assertEqual(results.scores, expected.scores)
+        self.assertEqual(results.cooperation, expected.cooperation)
+        self.assertEqual(results.match_lengths, expected.match_lengths)
 
     def test_get_file_objects_no_filename(self):
         file, writer = self.test_tournament._get_file_objects()
@@ -494,6 +505,24 @@ class TestTournament(unittest.TestCase):
         calls = tournament._write_interactions_to_file.call_args_list
         self.assertEqual(len(calls), 15)
 
+    def test_run_with_executor(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=axl.DEFAULT_TURNS,
+            repetitions=self.test_repetitions,
+        )
+        tournament._write_interactions_to_file = MagicMock(
+            name="_write_interactions_to_file"
+        )
+        with axl.Executor(processes=2) as executor:
+            self.assertTrue(tournament._run_with_executor(executor))
+
+        # Get the calls made to write_interactions
+        calls = tournament._write_interactions_to_file.call_args_list
+        self.assertEqual(len(calls), 15)
+
     def test_run_parallel(self):
         class PickleableMock(MagicMock):
             def __reduce__(self):
@@ -564,7 +593,6 @@ class TestTournament(unittest.TestCase):
 
     def test_start_workers(self):
         workers = 2
-        work_queue = Queue()
         done_queue = Queue()
         tournament = axl.Tournament(
             name=self.test_name,
@@ -573,17 +601,22 @@ class TestTournament(unittest.TestCase):
             turns=axl.DEFAULT_TURNS,
             repetitions=self.test_repetitions,
         )
-        chunks = tournament.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
-        tournament._start_workers(workers, work_queue, done_queue)
+        chunks = list(tournament.match_generator.build_match_chunks())
+        queues = WorkStealingQueues(
+            assign_chunks([1] * len(chunks), workers=workers)
+        )
+        tournament._start_workers(workers, chunks, queues, done_queue)
 
         stops = 0
+        played = []
         while stops < workers:
             payoffs = done_queue.get()
             if payoffs == "STOP":
                 stops += 1
+            else:
+                played.append(payoffs[1])
         self.assertEqual(stops, workers)
+        self.assertEqual(sorted(played), list(range(len(chunks))))
 
     def test_worker(self):
         tournament = axl.Tournament(
@@ -594,24 +627,93 @@ class TestTournament(unittest.TestCase):
             repetitions=self.test_repetitions,
         )
 
-        work_queue = Queue()
-        chunks = tournament.match_generator.build_match_chunks()
-        count = 0
-        for chunk in chunks:
-            work_queue.put(chunk)
-            count += 1
-        work_queue.put("STOP")
+        chunks = list(tournament.match_generator.build_match_chunks())
+        count = len(chunks)
+        # All the chunks are assigned to the second worker: the first one
+        # steals them all.
+        queues = WorkStealingQueues([[], list(range(count))])
 
         done_queue = Queue()
-        tournament._worker(work_queue, done_queue)
+        tournament._worker(0, chunks, queues, done_queue)
         for r in range(count):
-            new_matches = done_queue.get()
+            worker, chunk_index, stolen, elapsed, new_matches = done_queue.get()
+            self.assertEqual(worker, 0)
+            self.assertEqual(chunk_index, count - 1 - r)
+            self.assertTrue(stolen)
+            self.assertGreaterEqual(elapsed, 0)
             for index_pair, matches in new_matches.items():
                 self.assertIsInstance(index_pair, tuple)
                 self.assertEqual(len(matches), self.test_repetitions)
         queue_stop = done_queue.get()
         self.assertEqual(queue_stop, "STOP")
 
+    def test_worker_reports(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=axl.DEFAULT_TURNS,
+            repetitions=self.test_repetitions,
+        )
+        self.assertEqual(tournament.worker_reports, [])
+        tournament.play(processes=2, progress_bar=False)
+        workers = tournament._n_workers(processes=2)
+        self.assertEqual(len(tournament.worker_reports), workers)
+        self.assertEqual(
+            sum(report.chunks for report in tournament.worker_reports),
+            tournament.match_generator.size,
+        )
+        for report in tournament.worker_reports:
+            self.assertGreaterEqual(report.utilisation, 0)
+            self.assertLessEqual(report.utilisation, 1)
+        self.assertEqual(
+            len(tournament.chunk_timings), tournament.match_generator.size
+        )
+
+    def test_chunk_timings_serial(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=axl.DEFAULT_TURNS,
+            repetitions=self.test_repetitions,
+        )
+        tournament.play(progress_bar=False)
+        names = [str(p) for p in self.players]
+        self.assertIn((names[0], names[1]), tournament.chunk_timings)
+        self.assertEqual(
+            len(tournament.chunk_timings), tournament.match_generator.size
+        )
+
+    def test_play_with_executor(self):
+        players = [
+            axl.Cooperator(),
+            axl.Random(),
+            axl.TitForTat(),
+            axl.Grudger(),
+        ]
+        expected = axl.Tournament(
+            players, turns=10, repetitions=3, noise=0.1, seed=3
+        ).play(progress_bar=False)
+        with axl.Executor(processes=2) as executor:
+            for _ in range(2):
+                tournament = axl.Tournament(
+                    players, turns=10, repetitions=3, noise=0.1, seed=3
+                )
+                results = tournament.play(progress_bar=False, executor=executor)
+                self.assertEqual(results.wins, expected.wins)
+                self.assertEqual(results.cooperation, expected.cooperation)
+                self.assertEqual(results.match_lengths, expected.match_lengths)
+                self.assertEqual(
+                    len(tournament.worker_reports), executor.processes
+                )
+                self.assertEqual(
+                    sum(r.chunks for r in tournament.worker_reports),
+                    tournament.match_generator.size,
+                )
+            # The players were only sent to the workers once
+            self.assertEqual(len(executor._prototype_ids), len(players))
+
     def test_build_result_set(self):
         tournament = axl.Tournament(
             name=self.test_name,
@@ -688,6 +790,31 @@ class TestTournament(unittest.TestCase):
         # Check that matches no longer exist
         self.assertEqual((len(list(chunk_generator))), 0)
 
+    def test_calculate_results(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            repetitions=self.test_repetitions,
+        )
+        interactions = [(C, D), (C, D), (C, D)]
+        results = tournament._calculate_results(interactions)
+        self.assertEqual(
+            results,
+            [
+                (0, 15),
+                (-15, 15),
+                3,
+                (0, 5),
+                (-5, 5),
+                (True, False),
+                (3, 0),
+                Counter({(C, D): 3}),
+                [Counter({((C, D), C): 2}), Counter({((C, D), D): 2})],
+                1,
+            ],
+        )
+
     def test_write_interactions(self):
         tournament = axl.Tournament(
             name=self.test_name,
@@ -742,6 +869,275 @@ class TestTournament(unittest.TestCase):
         expected_df = pd.read_csv(axl_filename(path))
         self.assertTrue(df.equals(expected_df))
 
+    def test_write_to_binary_file(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=2,
+            repetitions=2,
+        )
+        path = pathlib.Path("test_outputs/test_tournament.bin")
+        filename = str(axl_filename(path))
+        tournament.play(
+            filename=filename, progress_bar=False, file_format="binary"
+        )
+        self.assertEqual(tournament.file_format, "binary")
+        interactions = axl.interaction_store.BinaryInteractions(filename)
+        self.assertEqual(interactions.players, [str(p) for p in self.players])
+        self.assertEqual(interactions.metadata["name"], self.test_name)
+        df = interactions.dataframe()
+        path = pathlib.Path("test_outputs/expected_test_tournament.csv")
+        expected_df = pd.read_csv(axl_filename(path))
+        for column in df.columns:
+            self.assertTrue(
+                np.allclose(df[column], expected_df[column]), msg=column
+            )
+        actions = [
+            axl.action.actions_to_str(interactions.actions(index))
+            for index in range(len(interactions))
+        ]
+        self.assertEqual(actions, list(expected_df["Actions"]))
+
+    def test_invalid_file_format(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=2,
+            repetitions=2,
+        )
+        with self.assertRaises(ValueError):
+            tournament.play(progress_bar=False, file_format="json")
+
+    def interrupted_play(self, tournament, filename, interrupt_after, **kwargs):
+        """Plays a checkpointed tournament that stops after a number of
+        chunks."""
+        play_matches = axl.Tournament._play_matches
+        calls = []
+
+        def interrupt(tournament, chunk, build_results=True):
+            calls.append(chunk)
+            if len(calls) > interrupt_after:
+                raise KeyboardInterrupt
+            return play_matches(tournament, chunk, build_results)
+
+        with patch.object(axl.Tournament, "_play_matches", interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                tournament.play(
+                    filename=filename,
+                    progress_bar=False,
+                    checkpoint=True,
+                    **kwargs
+                )
+
+    def test_resume(self):
+        def tournament():
+            return axl.Tournament(
+                players=[
+                    axl.Cooperator(),
+                    axl.Random(),
+                    axl.TitForTat(),
+                    axl.Grudger(),
+                ],
+                turns=10,
+                repetitions=3,
+                noise=0.1,
+                seed=7,
+            )
+
+        path = pathlib.Path("test_outputs/test_resume_expected.csv")
+        expected_filename = str(axl_filename(path))
+        expected = tournament().play(
+            filename=expected_filename, progress_bar=False
+        )
+        path = pathlib.Path("test_outputs/test_resume.csv")
+        filename = str(axl_filename(path))
+
+        self.interrupted_play(tournament(), filename, interrupt_after=5)
+        checkpoint = axl.checkpoint.Checkpoint.load(filename + ".checkpoint")
+        self.assertEqual(checkpoint.completed_chunks, {0, 1, 2, 3, 4})
+        # A row and a record that were being written when the run stopped
+        with open(filename, "a") as f:
+            f.write("15,1,2,0,Random: 0.5,Tit")
+        with open(filename + ".checkpoint", "a") as f:
+            f.write('{"chunk": 5, "inter')
+
+        results = tournament().play(
+            filename=filename, progress_bar=False, resume=True
+        )
+        with open(filename) as f, open(expected_filename) as expected_f:
+            self.assertEqual(f.read(), expected_f.read())
+        self.assertEqual(results.scores, expected.scores)
+        self.assertEqual(results.wins, expected.wins)
+        self.assertEqual(results.cooperation, expected.cooperation)
+        self.assertEqual(results.payoff_matrix, expected.payoff_matrix)
+
+        # Resuming a completed tournament plays no matches
+        with patch.object(axl.Tournament, "_play_matches") as play_matches:
+            results = tournament().play(
+                filename=filename, progress_bar=False, resume=True
+            )
+            play_matches.assert_not_called()
+        self.assertEqual(results.scores, expected.scores)
+
+    def test_resume_with_executor(self):
+        players = [axl.Cooperator(), axl.Random(), axl.TitForTat()]
+        expected = axl.Tournament(players, turns=5, repetitions=2, seed=7).play(
+            progress_bar=False
+        )
+        path = pathlib.Path("test_outputs/test_resume_executor.csv")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(players, turns=5, repetitions=2, seed=7)
+        self.interrupted_play(tournament, filename, interrupt_after=2)
+
+        tournament = axl.Tournament(players, turns=5, repetitions=2, seed=7)
+        with axl.Executor(processes=2) as executor:
+            results = tournament.play(
+                filename=filename,
+                progress_bar=True,
+                resume=True,
+                executor=executor,
+            )
+        self.assertEqual(results.scores, expected.scores)
+        self.assertEqual(results.cooperation, expected.cooperation)
+        checkpoint = axl.checkpoint.Checkpoint.load(filename + ".checkpoint")
+        self.assertEqual(checkpoint.completed_chunks, set(range(6)))
+
+    def test_interrupted_play_closes_files(self):
+        players = [axl.Cooperator(), axl.TitForTat(), axl.Alternator()]
+        path = pathlib.Path("test_outputs/test_resume_interrupted.csv")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            self.interrupted_play(tournament, filename, interrupt_after=2)
+            self.interrupted_play(
+                tournament, filename, interrupt_after=1, resume=True
+            )
+            gc.collect()
+        self.assertFalse(
+            [w for w in caught if issubclass(w.category, ResourceWarning)]
+        )
+        self.assertIsNone(tournament._checkpoint)
+        self.assertIsNone(tournament._resume_offset)
+        self.assertEqual(tournament._completed_chunks, 0)
+
+        checkpoint = axl.checkpoint.Checkpoint.load(filename + ".checkpoint")
+        self.assertEqual(checkpoint.completed_chunks, {0, 1, 2})
+
+    def test_resume_without_seed(self):
+        players = [axl.Random(), axl.TitForTat(), axl.Alternator()]
+        path = pathlib.Path("test_outputs/test_resume_without_seed.csv")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        self.interrupted_play(tournament, filename, interrupt_after=2)
+
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        results = tournament.play(
+            filename=filename, progress_bar=False, resume=True
+        )
+        self.assertEqual(results.num_players, 3)
+        self.assertEqual(tournament.num_interactions, 12)
+        checkpoint = axl.checkpoint.Checkpoint.load(filename + ".checkpoint")
+        self.assertEqual(checkpoint.completed_chunks, set(range(6)))
+        self.assertEqual(
+            len(pd.read_csv(filename)), 2 * tournament.num_interactions
+        )
+
+    def test_resume_different_tournament(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        path = pathlib.Path("test_outputs/test_resume_different.csv")
+        filename = str(axl_filename(path))
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        tournament.play(filename=filename, progress_bar=False, checkpoint=True)
+        tournament = axl.Tournament(players, turns=6, repetitions=2)
+        with self.assertRaises(ValueError):
+            tournament.play(filename=filename, progress_bar=False, resume=True)
+
+    def test_checkpoint_requires_csv_file(self):
+        tournament = axl.Tournament(
+            [axl.Cooperator(), axl.Defector()], turns=5, repetitions=2
+        )
+        with self.assertRaises(ValueError):
+            tournament.play(progress_bar=False, checkpoint=True)
+        path = pathlib.Path("test_outputs/test_checkpoint.bin")
+        with self.assertRaises(ValueError):
+            tournament.play(
+                filename=str(axl_filename(path)),
+                progress_bar=False,
+                file_format="binary",
+                checkpoint=True,
+            )
+
+    def test_play_with_metrics(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        expected = axl.Tournament(players, turns=5, repetitions=2).play(
+            progress_bar=False
+        )
+        tournament = axl.Tournament(players, turns=5, repetitions=2)
+        results = tournament.play(progress_bar=False, metrics=["ranked_names"])
+        self.assertIn("ranked_names", vars(results))
+        self.assertNotIn("cooperation_array", vars(results))
+        self.assertEqual(results.ranked_names, expected.ranked_names)
+        self.assertEqual(results, expected)
+
+    def test_play_shard(self):
+        players = [
+            axl.Random(),
+            axl.GTFT(),
+            axl.TitForTat(),
+            axl.Defector(),
+            axl.Random(0.3),
+        ]
+        parameters = {
+            "players": players,
+            "game": axl.Game(r=3.5, s=0.5, t=5.5, p=1.5),
+            "prob_end": 0.1,
+            "repetitions": 4,
+            "noise": 0.05,
+            "seed": 3,
+        }
+        tournament = axl.Tournament(**parameters)
+        expected = tournament.play(progress_bar=False)
+        num_interactions = tournament.num_interactions
+
+        filenames = []
+        interactions = 0
+        executor = axl.Executor(processes=2)
+        self.addCleanup(executor.close)
+        for shard in range(3):
+            path = pathlib.Path("test_outputs/test_shard_{}.npz".format(shard))
+            filenames.append(str(axl_filename(path)))
+            tournament = axl.Tournament(**parameters)
+            builder = tournament.play_shard(
+                filenames[-1],
+                shard,
+                shards=3,
+                processes=2 if shard == 1 else None,
+                progress_bar=False,
+                executor=executor if shard == 2 else None,
+            )
+            self.assertTrue(os.path.exists(filenames[-1]))
+            interactions += tournament.num_interactions
+        self.assertEqual(interactions, num_interactions)
+        self.assertIsInstance(builder, axl.result_set.ResultSetBuilder)
+
+        results = axl.ResultSet.merge(*filenames, progress_bar=False)
+        self.assertEqual(results, expected)
+        results = axl.ResultSet.merge(*filenames[::-1], progress_bar=False)
+        self.assertEqual(results, expected)
+
+    def test_play_shard_with_invalid_shard(self):
+        tournament = axl.Tournament(
+            [axl.Cooperator(), axl.Defector()], turns=5, repetitions=2
+        )
+        path = pathlib.Path("test_outputs/test_shard.npz")
+        filename = str(axl_filename(path))
+        for shard in [-1, 2]:
+            with self.assertRaises(ValueError):
+                tournament.play_shard(filename, shard, 2, progress_bar=False)
+
     @given(seed=integers(min_value=1, max_value=4294967295))
     @example(seed=2)
     @settings(max_examples=5, deadline=None)
@@ -782,6 +1178,52 @@ class TestTournament(unittest.TestCase):
             self.assertEqual(results1.scores, results2.scores)
             self.assertEqual(results1.cooperation, results2.cooperation)
 
+    def test_vectorize_equality(self):
+        players = [
+            axl.GTFT(),
+            axl.ZDExtort2(),
+            axl.StochasticWSLS(),
+            axl.TitForTat(),
+            axl.Random(),
+            axl.PSOGambler2_2_2(),
+            axl.EvolvedHMM5(),
+            axl.Grudger(),
+        ]
+        results = []
+        for vectorize in [False, True]:
+            tournament = axl.Tournament(
+                players=players,
+                game=self.game,
+                turns=10,
+                repetitions=5,
+                noise=0.1,
+                seed=10,
+                vectorize=vectorize,
+            )
+            results.append(tournament.play(progress_bar=False))
+        self.assertEqual(results[0], results[1])
+
+    def test_detect_cycles_equality(self):
+        players = [
+            axl.EvolvedFSM4(),
+            axl.Winner12(),
+            axl.CyclerCCD(),
+            axl.TitForTat(),
+            axl.Random(),
+        ]
+        results = []
+        for detect_cycles in [False, True]:
+            tournament = axl.Tournament(
+                players=players,
+                game=self.game,
+                turns=50,
+                repetitions=2,
+                seed=10,
+                detect_cycles=detect_cycles,
+            )
+            results.append(tournament.play(progress_bar=False))
+        self.assertEqual(results[0], results[1])
+
     def test_seeding_inequality(self):
         players = [axl.Random(0.4), axl.Random(0.6)]
         tournament1 = axl.Tournament(
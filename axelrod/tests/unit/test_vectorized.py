@@ -0,0 +1,343 @@
+"""Tests for the vectorized play of memory-n players."""
+import unittest
+
+import axelrod as axl
+import numpy as np
+from axelrod.vectorized import (
+    BatchedStrategy,
+    HMMTable,
+    LookerUpTable,
+    MemoryTable,
+    memory_table,
+    play_matches,
+    play_repetitions,
+    play_tables,
+    to_interactions,
+)
+from hypothesis import given, settings
+from hypothesis.strategies import integers, sampled_from
+
+C, D = axl.Action.C, axl.Action.D
+
+table_players = [
+    axl.Cooperator,
+    axl.Defector,
+    axl.TitForTat,
+    axl.WinStayLoseShift,
+    axl.GTFT,
+    axl.StochasticWSLS,
+    axl.SoftJoss,
+    axl.WinShiftLoseStay,
+    axl.ZDExtort2,
+    axl.ZDGTFT2,
+    axl.AON2,
+    axl.DelayedAON1,
+    axl.Random,
+    axl.EvolvedLookerUp1_1_1,
+    axl.PSOGambler1_1_1,
+    axl.PSOGambler2_2_2,
+    axl.ZDMem2,
+    axl.EvolvedHMM5,
+]
+
+
+class TestBatchedStrategy(unittest.TestCase):
+    def test_is_abstract(self):
+        with self.assertRaises(TypeError):
+            BatchedStrategy()
+
+        class Incomplete(BatchedStrategy):
+            stochastic = False
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestMemoryTable(unittest.TestCase):
+    def test_init(self):
+        table = MemoryTable(1, (1, 0, 1, 0), (C,))
+        self.assertEqual(table.depth, 1)
+        self.assertTrue(np.array_equal(table.probabilities, [1, 0, 1, 0]))
+        self.assertTrue(np.array_equal(table.initial, [0]))
+        self.assertFalse(table.stochastic)
+
+    def test_stochastic(self):
+        table = MemoryTable(1, (1, 0.5, 1, 0), (C,))
+        self.assertTrue(table.stochastic)
+
+    def test_invalid_probabilities(self):
+        with self.assertRaises(ValueError):
+            MemoryTable(2, (1, 0, 1, 0), (C, C))
+
+    def test_invalid_initial(self):
+        with self.assertRaises(ValueError):
+            MemoryTable(1, (1, 0, 1, 0), (C, C))
+
+
+class TestMemoryTableLookup(unittest.TestCase):
+    def test_memory_one_player(self):
+        player = axl.MemoryOnePlayer((0.1, 0.2, 0.3, 0.4), D)
+        table = memory_table(player)
+        self.assertEqual(table.depth, 1)
+        self.assertTrue(
+            np.array_equal(table.probabilities, [0.1, 0.2, 0.3, 0.4])
+        )
+        self.assertTrue(np.array_equal(table.initial, [1]))
+
+    def test_memory_two_player(self):
+        sixteen_vector = [i / 16 for i in range(16)]
+        player = axl.MemoryTwoPlayer(sixteen_vector, (D, C))
+        table = memory_table(player)
+        self.assertEqual(table.depth, 2)
+        self.assertTrue(np.array_equal(table.probabilities, sixteen_vector))
+        self.assertTrue(np.array_equal(table.initial, [1, 0]))
+
+    def test_deterministic_players(self):
+        expected = {
+            axl.Cooperator: [1, 1, 1, 1],
+            axl.Defector: [0, 0, 0, 0],
+            axl.TitForTat: [1, 0, 1, 0],
+            axl.WinStayLoseShift: [1, 0, 0, 1],
+        }
+        for player_class, probabilities in expected.items():
+            table = memory_table(player_class())
+            self.assertTrue(np.array_equal(table.probabilities, probabilities))
+
+    def test_random(self):
+        table = memory_table(axl.Random(0.3))
+        self.assertEqual(table.depth, 0)
+        self.assertTrue(np.array_equal(table.probabilities, [0.3]))
+        self.assertTrue(table.stochastic)
+        table = memory_table(axl.Random(-1))
+        self.assertTrue(np.array_equal(table.probabilities, [0]))
+
+    def test_lookerup(self):
+        player = axl.Gambler(
+            pattern=(0.5, 1, 0, 0.25, 1, 1, 0, 0),
+            parameters=(1, 1, 1),
+            initial_actions=(D,),
+        )
+        table = memory_table(player)
+        self.assertIsInstance(table, LookerUpTable)
+        self.assertEqual(table.depths, (1, 1, 1))
+        # The keys of the pattern are ordered as the states of the table.
+        self.assertTrue(
+            np.array_equal(table.probabilities, [0.5, 1, 0, 0.25, 1, 1, 0, 0])
+        )
+        self.assertTrue(np.array_equal(table.initial, [1]))
+        self.assertTrue(table.stochastic)
+        self.assertFalse(memory_table(axl.EvolvedLookerUp2_2_2()).stochastic)
+
+    def test_hmm(self):
+        table = memory_table(axl.EvolvedHMM5())
+        self.assertIsInstance(table, HMMTable)
+        self.assertEqual(table.transitions.shape, (2, 5, 5))
+        self.assertEqual(table.initial_state, 3)
+        self.assertEqual(table.initial_action, C)
+        self.assertTrue(table.stochastic)
+        player = axl.HMMPlayer([[0, 1], [1, 0]], [[1, 0], [0, 1]], [1, 0])
+        self.assertFalse(memory_table(player).stochastic)
+
+    def test_unsupported_players(self):
+        for player in [axl.Grudger(), axl.Alternator(), axl.EvolvedFSM4()]:
+            self.assertIsNone(memory_table(player))
+
+    def test_transformed_players_are_not_supported(self):
+        player = axl.strategy_transformers.DualTransformer()(axl.TitForTat)()
+        self.assertIsNone(memory_table(player))
+
+
+class TestLookerUpTable(unittest.TestCase):
+    def test_invalid_probabilities(self):
+        with self.assertRaises(ValueError):
+            LookerUpTable((1, 1, 0), (1, 0, 1), (C,))
+
+    def test_invalid_initial(self):
+        with self.assertRaises(ValueError):
+            LookerUpTable((1, 2, 0), (1, 0) * 4, (C,))
+
+
+class TestPlayTables(unittest.TestCase):
+    def test_deterministic_tables(self):
+        tables = (
+            memory_table(axl.TitForTat()),
+            memory_table(axl.Defector()),
+        )
+        actions = play_tables(tables, [3, 2], (None, None))
+        self.assertEqual(actions.shape, (2, 3, 2))
+        self.assertEqual(
+            to_interactions(actions[0], 3), [(C, D), (D, D), (D, D)]
+        )
+        self.assertEqual(to_interactions(actions[1], 2), [(C, D), (D, D)])
+
+    def test_noise_flips(self):
+        tables = (
+            memory_table(axl.Cooperator()),
+            memory_table(axl.Cooperator()),
+        )
+        noise_uniforms = np.array([[0, 1, 1, 0]])
+        actions = play_tables(tables, [2], (None, None), noise_uniforms, 0.5)
+        self.assertEqual(to_interactions(actions[0], 2), [(D, C), (C, D)])
+
+    def test_openings(self):
+        # Cooperates only if the coplayer opened with a cooperation.
+        table = LookerUpTable((0, 0, 1), (1, 0), (D,))
+        tables = (table, memory_table(axl.TitForTat()))
+        actions = play_tables(tables, [3], (None, None))
+        self.assertEqual(
+            to_interactions(actions[0], 3), [(D, C), (C, D), (C, C)]
+        )
+
+    def test_hmm_draws(self):
+        # Moves to state 1 (which defects) with probability 0.5.
+        table = HMMTable(
+            [[0.5, 0.5], [0, 1]], [[0.5, 0.5], [0, 1]], [1, 0], 0, C
+        )
+        tables = (table, memory_table(axl.Cooperator()))
+        uniforms = np.array(
+            [[0.2, 0.9, 0.7, 0.1, 1, 1], [0.7, 0.1, 1, 1, 1, 1]]
+        )
+        actions = play_tables(tables, [3, 3], (uniforms, None))
+        self.assertEqual(
+            to_interactions(actions[0], 3), [(C, C), (C, C), (D, C)]
+        )
+        self.assertEqual(
+            to_interactions(actions[1], 3), [(C, C), (D, C), (D, C)]
+        )
+
+
+class TestPlayRepetitions(unittest.TestCase):
+    def test_unsupported_players_return_none(self):
+        match = axl.Match((axl.Grudger(), axl.TitForTat()), turns=5, seed=0)
+        self.assertIsNone(play_repetitions(match, 3))
+
+    def test_no_reset_returns_none(self):
+        match = axl.Match(
+            (axl.GTFT(), axl.TitForTat()), turns=5, seed=0, reset=False
+        )
+        self.assertIsNone(play_repetitions(match, 3))
+
+    def test_unseeded_stochastic_player_returns_none(self):
+        player = axl.MemoryOnePlayer(four_vector=(1, 0.5, 0, 1))
+        # The match does not seed players that are not classified stochastic.
+        player.classifier["stochastic"] = False
+        match = axl.Match((player, axl.TitForTat()), turns=5, seed=0)
+        self.assertIsNone(play_repetitions(match, 3))
+
+    def test_players_are_left_with_last_history(self):
+        players = (axl.GTFT(), axl.StochasticWSLS())
+        match = axl.Match(players, turns=5, noise=0.2, seed=0)
+        results = play_repetitions(match, 3)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(
+            list(players[0].history), [plays[0] for plays in results[-1]]
+        )
+        self.assertEqual(
+            list(players[1].history), [plays[1] for plays in results[-1]]
+        )
+
+    def test_hmm_players_are_left_with_last_state(self):
+        player = axl.EvolvedHMM5()
+        match = axl.Match((player, axl.Random()), turns=10, seed=1)
+        expected = [match.play() for _ in range(3)]
+        state = player.hmm.state
+        other_player = axl.EvolvedHMM5()
+        match = axl.Match((other_player, axl.Random()), turns=10, seed=1)
+        self.assertEqual(play_repetitions(match, 3), expected)
+        self.assertEqual(other_player.hmm.state, state)
+        self.assertEqual(other_player.state, state)
+
+    @given(
+        player1=sampled_from(table_players),
+        player2=sampled_from(table_players),
+        noise=sampled_from([0, 0.1, 0.5, 1]),
+        prob_end=sampled_from([None, 0.1]),
+        turns=integers(min_value=1, max_value=20),
+        seed=integers(min_value=0, max_value=2**32 - 1),
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_same_results_as_match(
+        self, player1, player2, noise, prob_end, turns, seed
+    ):
+        repetitions = 4
+        match = axl.Match(
+            (player1(), player2()),
+            turns=turns,
+            noise=noise,
+            prob_end=prob_end,
+            seed=seed,
+        )
+        expected = [match.play() for _ in range(repetitions)]
+        vectorized_match = axl.Match(
+            (player1(), player2()),
+            turns=turns,
+            noise=noise,
+            prob_end=prob_end,
+            seed=seed,
+        )
+        results = play_repetitions(vectorized_match, repetitions)
+        self.assertEqual(results, expected)
+        # The match random generator is left in the same state.
+        self.assertEqual(
+            match._random.random(), vectorized_match._random.random()
+        )
+
+
+class TestPlayMatches(unittest.TestCase):
+    def test_no_matches(self):
+        self.assertEqual(play_matches([]), [])
+
+    def test_different_players_return_none(self):
+        matches = [
+            axl.Match((axl.GTFT(), axl.Random()), turns=5, seed=0),
+            axl.Match((axl.GTFT(), axl.Random(0.3)), turns=5, seed=1),
+        ]
+        self.assertIsNone(play_matches(matches))
+
+    def test_different_noise_returns_none(self):
+        matches = [
+            axl.Match((axl.GTFT(), axl.Random()), turns=5, seed=0),
+            axl.Match((axl.GTFT(), axl.Random()), turns=5, noise=0.1, seed=1),
+        ]
+        self.assertIsNone(play_matches(matches))
+
+    @given(
+        player1=sampled_from(table_players),
+        player2=sampled_from(table_players),
+        noise=sampled_from([0, 0.1]),
+        prob_end=sampled_from([None, 0.1]),
+        seed=integers(min_value=0, max_value=2**32 - 5),
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_same_results_as_match(
+        self, player1, player2, noise, prob_end, seed
+    ):
+        # The first player takes part in all the matches.
+        players = [player1()] + [player2() for _ in range(4)]
+        expected = []
+        for k in range(4):
+            match = axl.Match(
+                (players[0], players[k + 1]),
+                turns=10,
+                noise=noise,
+                prob_end=prob_end,
+                seed=seed + k,
+            )
+            expected.append(match.play())
+        histories = [list(player.history) for player in players]
+
+        players = [player1()] + [player2() for _ in range(4)]
+        matches = [
+            axl.Match(
+                (players[0], players[k + 1]),
+                turns=10,
+                noise=noise,
+                prob_end=prob_end,
+                seed=seed + k,
+            )
+            for k in range(4)
+        ]
+        self.assertEqual(play_matches(matches), expected)
+        self.assertEqual(
+            [list(player.history) for player in players], histories
+        )
@@ -1,22 +1,35 @@
 import csv
+import json
 import logging
 import os
+import time
 import warnings
 from collections import defaultdict
 from multiprocessing import Process, Queue, cpu_count
-from tempfile import mkstemp
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import axelrod.interaction_utils as iu
 import tqdm
 from axelrod import DEFAULT_TURNS
 from axelrod.action import Action, actions_to_str
+from axelrod.checkpoint import Checkpoint, checkpoint_filename, truncate
+from axelrod.deterministic_cache import DeterministicCache
+from axelrod.executor import Executor
+from axelrod.interaction_store import BinaryInteractionWriter
 from axelrod.player import Player
+from axelrod.scheduler import (
+    WorkerReport,
+    WorkStealingQueues,
+    assign_chunks,
+    estimate_costs,
+    timing_key,
+    worker_reports,
+)
 
 from .game import Game
 from .match import Match
 from .match_generator import MatchGenerator
-from .result_set import ResultSet
+from .result_set import ResultSet, ResultSetBuilder
 
 C, D = Action.C, Action.D
 
@@ -34,6 +47,9 @@ class Tournament(object):
         edges: List[Tuple] = None,
         match_attributes: dict = None,
         seed: int = None,
+        vectorize: bool = False,
+        detect_cycles: bool = False,
+        deterministic_cache: DeterministicCache = None,
     ) -> None:
         """
         Parameters
@@ -61,6 +77,19 @@ class Tournament(object):
         seed : integer
             The seed for random numbers that will be generated for this
             tournament, thus allowing future runs to exactly reproduce results.
+        vectorize : bool
+            Whether matches between players that can be expressed as tables
+            (see axelrod.vectorized) should be played as array operations
+            over all repetitions at once. This does not change the results.
+        detect_cycles : bool
+            Whether deterministic matches should stop playing once the play
+            between the players starts to repeat (see axelrod.Match). This
+            does not change the results.
+        deterministic_cache : axelrod.DeterministicCache
+            A cache of the results of deterministic matches shared by all the
+            matches of the tournament. By default each match has its own
+            cache. The workers of a parallel tournament only share the
+            results written to an axelrod.PersistentDeterministicCache.
         """
         if game is None:
             self.game = Game()
@@ -73,6 +102,8 @@ class Tournament(object):
         self.repetitions = repetitions
         self.edges = edges
         self.seed = seed
+        self.vectorize = vectorize
+        self.detect_cycles = detect_cycles
 
         if turns is None and prob_end is None:
             turns = DEFAULT_TURNS
@@ -89,22 +120,30 @@ class Tournament(object):
             edges=edges,
             match_attributes=match_attributes,
             seed=self.seed,
+            deterministic_cache=deterministic_cache,
         )
         self._logger = logging.getLogger(__name__)
 
         self.use_progress_bar = True
         self.filename = None  # type: Optional[str]
-        self._temp_file_descriptor = None  # type: Optional[int]
-
-    def setup_output(self, filename=None):
-        """assign/create `filename` to `self`. If file should be deleted once
-        `play` is finished, assign a file descriptor."""
-        temp_file_descriptor = None
-        if filename is None:
-            temp_file_descriptor, filename = mkstemp()
-
+        self.file_format = "csv"
+        self.chunk_timings = {}  # type: Dict[Tuple[str, str], float]
+        self._checkpoint = None  # type: Optional[Checkpoint]
+        self._resume_offset = None  # type: Optional[int]
+        self._completed_chunks = 0
+        self.worker_reports = []  # type: List[WorkerReport]
+
+    def setup_output(self, filename=None, file_format="csv"):
+        """assign `filename` and `file_format` to `self`. No file is written
+        if `filename` is None."""
+        if file_format not in ("csv", "binary"):
+            raise ValueError(
+                "file_format must be 'csv' or 'binary', not {}.".format(
+                    file_format
+                )
+            )
         self.filename = filename
-        self._temp_file_descriptor = temp_file_descriptor
+        self.file_format = file_format
 
     def play(
         self,
@@ -112,10 +151,20 @@ class Tournament(object):
         filename: str = None,
         processes: int = None,
         progress_bar: bool = True,
+        file_format: str = "csv",
+        executor: Optional[Executor] = None,
+        checkpoint: bool = False,
+        resume: bool = False,
+        metrics: Optional[List[str]] = None,
     ) -> ResultSet:
         """
         Plays the tournament and passes the results to the ResultSet class
 
+        The results set is aggregated in memory as the matches are played: the
+        interactions are only written to file if a filename is given. Its
+        mean scores can differ in the last digit from those read back from a
+        csv file (see axelrod.result_set.ResultSetBuilder).
+
         Parameters
         ----------
         build_results : bool
@@ -126,6 +175,32 @@ class Tournament(object):
             The number of processes to be used for parallel processing
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        file_format : string
+            The format of the output file: "csv" or "binary". The binary
+            format stores bit-packed actions and a fixed width table of the
+            results (see axelrod.interaction_store) and is much smaller and
+            faster to read back than the csv.
+        executor : axelrod.Executor
+            A pool of worker processes to play the matches. Unlike
+            `processes`, the workers are not started by this call and can be
+            reused by other tournaments: they only receive the players they
+            have not seen before. If given, `processes` is ignored.
+        checkpoint : bool
+            Whether or not to record the completed chunks in a checkpoint
+            file (`filename + ".checkpoint"`, see axelrod.checkpoint) so that
+            the tournament can be resumed if it is interrupted. This requires
+            a csv output file.
+        resume : bool
+            Whether or not to resume the tournament from its checkpoint file:
+            only the chunks that were not completed are played, with the
+            seeds recorded in the checkpoint. The output file of a resumed
+            serial run is the same as that of an uninterrupted run. A new
+            checkpointed run is started if there is no checkpoint file.
+        metrics : list
+            The names of the results computed when the results set is built
+            (see axelrod.result_set.METRICS). The other results are computed
+            when they are first accessed. By default all results are
+            computed.
 
         Returns
         -------
@@ -135,7 +210,7 @@ class Tournament(object):
 
         self.use_progress_bar = progress_bar
 
-        self.setup_output(filename)
+        self.setup_output(filename, file_format=file_format)
 
         if not build_results and not filename:
             warnings.warn(
@@ -143,43 +218,265 @@ class Tournament(object):
                 "build_results=False and no filename was supplied."
             )
 
-        if processes is None:
-            self._run_serial(build_results=build_results)
-        else:
-            self._run_parallel(build_results=build_results, processes=processes)
-
-        result_set = None
+        result_set_builder = None
         if build_results:
-            result_set = ResultSet(
-                filename=self.filename,
+            result_set_builder = ResultSetBuilder(
                 players=[str(p) for p in self.players],
                 repetitions=self.repetitions,
-                processes=processes,
+            )
+
+        try:
+            chunks = self._build_chunks(
+                checkpoint=checkpoint or resume,
+                resume=resume,
+                result_set_builder=result_set_builder,
+            )
+
+            if executor is not None:
+                self._run_with_executor(
+                    executor=executor,
+                    build_results=build_results,
+                    result_set_builder=result_set_builder,
+                    chunks=chunks,
+                )
+            elif processes is None:
+                self._run_serial(
+                    build_results=build_results,
+                    result_set_builder=result_set_builder,
+                    chunks=chunks,
+                )
+            else:
+                self._run_parallel(
+                    build_results=build_results,
+                    processes=processes,
+                    result_set_builder=result_set_builder,
+                    chunks=chunks,
+                )
+        finally:
+            self._end_run()
+
+        result_set = None
+        if result_set_builder is not None:
+            result_set = result_set_builder.build(
+                filename=self.filename,
                 progress_bar=progress_bar,
+                metrics=metrics,
             )
-        if self._temp_file_descriptor is not None:
-            assert self.filename is not None
-            os.close(self._temp_file_descriptor)
-            os.remove(self.filename)
 
         return result_set
 
-    def _run_serial(self, build_results: bool = True) -> bool:
+    def play_shard(
+        self,
+        filename: str,
+        shard: int,
+        shards: int,
+        processes: Optional[int] = None,
+        progress_bar: bool = True,
+        executor: Optional[Executor] = None,
+    ) -> ResultSetBuilder:
+        """
+        Plays one of `shards` blocks of the matches of the tournament and
+        writes their aggregated results to file.
+
+        The shards can be played separately, for example on different
+        machines, and `ResultSet.merge` combines the files of all the shards
+        into the result set of the whole tournament: each match is played
+        with the same seed as in `play`.
+
+        Parameters
+        ----------
+        filename : string
+            The file the aggregated results are written to (see
+            ResultSetBuilder.save)
+        shard : integer
+            The index of the block of matches to play, from 0 to shards - 1
+        shards : integer
+            The number of blocks the matches are split into
+        processes : integer
+            The number of processes to be used for parallel processing
+        progress_bar : bool
+            Whether or not to create a progress bar which will be updated
+        executor : axelrod.Executor
+            A pool of worker processes to play the matches (see `play`)
+
+        Returns
+        -------
+        axelrod.ResultSetBuilder
+            The aggregated results of the shard
+        """
+        if not 0 <= shard < shards:
+            raise ValueError(
+                "shard must be between 0 and {}, not {}.".format(
+                    shards - 1, shard
+                )
+            )
+        self.num_interactions = 0
+        self.use_progress_bar = progress_bar
+        self.setup_output(None)
+
+        result_set_builder = ResultSetBuilder(
+            players=[str(p) for p in self.players],
+            repetitions=self.repetitions,
+        )
+
+        chunks = self._build_chunks()
+        # Contiguous blocks of player pairs
+        chunks = [
+            (index, chunk)
+            for index, chunk in chunks
+            if index * shards // len(chunks) == shard
+        ]
+        # The progress bar counts the matches of the other shards as done
+        self._completed_chunks = self.match_generator.size - len(chunks)
+
+        try:
+            if executor is not None:
+                self._run_with_executor(
+                    executor=executor,
+                    result_set_builder=result_set_builder,
+                    chunks=chunks,
+                )
+            elif processes is None:
+                self._run_serial(
+                    result_set_builder=result_set_builder, chunks=chunks
+                )
+            else:
+                self._run_parallel(
+                    processes=processes,
+                    result_set_builder=result_set_builder,
+                    chunks=chunks,
+                )
+        finally:
+            self._end_run()
+
+        result_set_builder.save(filename)
+        return result_set_builder
+
+    def _build_chunks(
+        self,
+        checkpoint: bool = False,
+        resume: bool = False,
+        result_set_builder: Optional[ResultSetBuilder] = None,
+    ) -> List[Tuple[int, tuple]]:
+        """
+        Returns the chunks to play, with their index in the tournament.
+
+        If `checkpoint` is True, the checkpoint file is created when the
+        output file is opened. If `resume` is True and a checkpoint file
+        exists, the chunks that were completed are left out (their
+        interactions are read from the output file and passed to the
+        `result_set_builder`) and the seeds of the checkpoint are used.
+        """
+        chunks = list(enumerate(self.match_generator.build_match_chunks()))
+        if not checkpoint:
+            return chunks
+
+        if self.filename is None or self.file_format != "csv":
+            raise ValueError(
+                "Checkpoints require a filename and the csv file format."
+            )
+        metadata = self._metadata()
+        metadata["players"] = [str(p) for p in self.players]
+        # The metadata as read back from json (with lists rather than tuples)
+        metadata = json.loads(json.dumps(metadata))
+        filename = checkpoint_filename(self.filename)
+
+        if not (resume and os.path.exists(filename)):
+            seeds = [int(chunk[3]) for _, chunk in chunks]
+            self._checkpoint = Checkpoint(filename, metadata, seeds, start=0)
+            return chunks
+
+        checkpoint_ = Checkpoint.load(filename)
+        if checkpoint_.metadata != metadata or len(checkpoint_.seeds) != len(
+            chunks
+        ):
+            raise ValueError(
+                "The checkpoint {} was not written by this tournament.".format(
+                    filename
+                )
+            )
+        chunks = [
+            (index, (index_pair, match_params, repetitions, seed))
+            for (
+                index,
+                (index_pair, match_params, repetitions, _),
+            ), seed in zip(chunks, checkpoint_.seeds)
+        ]
+        if result_set_builder is not None:
+            for _, interactions in checkpoint_.read_completed_interactions(
+                self.filename
+            ):
+                result_set_builder.add_interactions(
+                    {
+                        index_pair: [
+                            [interaction, results]
+                            for interaction, results in zip(
+                                pair_interactions,
+                                _calculate_batch_results(
+                                    pair_interactions, self.game
+                                ),
+                            )
+                        ]
+                        for index_pair, pair_interactions in interactions.items()
+                    }
+                )
+        self.num_interactions = checkpoint_.num_interactions
+        self._checkpoint = checkpoint_
+        self._resume_offset = checkpoint_.offset
+        completed = checkpoint_.completed_chunks
+        self._completed_chunks = len(completed)
+        return [chunk for chunk in chunks if chunk[0] not in completed]
+
+    def _end_run(self) -> None:
+        """Closes the checkpoint and forgets the state of the run, whether
+        or not all of its matches were played."""
+        _close_objects(self._checkpoint)
+        self._checkpoint = None
+        self._resume_offset = None
+        self._completed_chunks = 0
+
+    def _record_chunk(self, chunk_index: int, results: dict, out_file) -> None:
+        """Records a completed chunk in the checkpoint, if there is one."""
+        if self._checkpoint is None:
+            return
+        out_file.flush()
+        self._checkpoint.record(
+            chunk_index,
+            interactions=sum(len(v) for v in results.values()),
+            offset=out_file.tell(),
+            num_interactions=self.num_interactions,
+        )
+
+    def _run_serial(
+        self,
+        build_results: bool = True,
+        result_set_builder: Optional[ResultSetBuilder] = None,
+        chunks: Optional[List[Tuple[int, tuple]]] = None,
+    ) -> bool:
         """Run all matches in serial."""
 
-        chunks = self.match_generator.build_match_chunks()
+        if chunks is None:
+            chunks = self._build_chunks()
 
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
-        for chunk in chunks:
-            results = self._play_matches(chunk, build_results=build_results)
-            self._write_interactions_to_file(results, writer=writer)
-
-            if self.use_progress_bar:
-                progress_bar.update(1)
+        try:
+            for chunk_index, chunk in chunks:
+                start = time.perf_counter()
+                results = self._play_matches(chunk, build_results=build_results)
+                self.chunk_timings[timing_key(chunk, self.players)] = (
+                    time.perf_counter() - start
+                )
+                self._write_interactions_to_file(results, writer=writer)
+                self._record_chunk(chunk_index, results, out_file)
+                if result_set_builder is not None:
+                    result_set_builder.add_interactions(results)
 
-        _close_objects(out_file, progress_bar)
+                if self.use_progress_bar:
+                    progress_bar.update(1)
+        finally:
+            _close_objects(out_file, progress_bar)
 
         return True
 
@@ -188,6 +485,19 @@ class Tournament(object):
         (None, None) if self.filename is None"""
         file_obj = None
         writer = None
+        if self.filename is not None and self.file_format == "binary":
+            writer = BinaryInteractionWriter(
+                self.filename,
+                players=[str(p) for p in self.players],
+                build_results=build_results,
+                metadata=self._metadata(),
+            )
+            return writer, writer
+        if self.filename is not None and self._resume_offset is not None:
+            truncate(self.filename, self._resume_offset)
+            file_obj = open(self.filename, "a")
+            writer = csv.writer(file_obj, lineterminator="\n")
+            return file_obj, writer
         if self.filename is not None:
             file_obj = open(self.filename, "w")
             writer = csv.writer(file_obj, lineterminator="\n")
@@ -229,17 +539,44 @@ class Tournament(object):
                 )
 
             writer.writerow(header)
+            if self._checkpoint is not None:
+                file_obj.flush()
+                self._checkpoint = Checkpoint.create(
+                    self._checkpoint.filename,
+                    self._checkpoint.metadata,
+                    self._checkpoint.seeds,
+                    start=file_obj.tell(),
+                )
         return file_obj, writer
 
+    def _metadata(self):
+        """Returns the parameters of the tournament stored in the header of
+        binary output files."""
+        return {
+            "name": self.name,
+            "turns": self.turns,
+            "repetitions": self.repetitions,
+            "noise": self.noise,
+            "prob_end": self.prob_end,
+            "seed": self.seed,
+            "game": [float(score) for score in self.game.RPST()],
+        }
+
     def _get_progress_bar(self):
         if self.use_progress_bar:
             return tqdm.tqdm(
-                total=self.match_generator.size, desc="Playing matches"
+                total=self.match_generator.size,
+                initial=self._completed_chunks,
+                desc="Playing matches",
             )
         return None
 
     def _write_interactions_to_file(self, results, writer):
-        """Write the interactions to csv."""
+        """Write the interactions to csv (or to a binary writer)."""
+        if writer is None:
+            for interactions in results.values():
+                self.num_interactions += len(interactions)
+            return
         for index_pair, interactions in results.items():
             repetition = 0
             for interaction, results in interactions:
@@ -302,33 +639,152 @@ class Tournament(object):
                 self.num_interactions += 1
 
     def _run_parallel(
-        self, processes: int = 2, build_results: bool = True
+        self,
+        processes: int = 2,
+        build_results: bool = True,
+        result_set_builder: Optional[ResultSetBuilder] = None,
+        chunks: Optional[List[Tuple[int, tuple]]] = None,
     ) -> bool:
         """
         Run all matches in parallel
 
+        The chunks are assigned to the workers by decreasing estimated cost
+        (see axelrod.scheduler): the timings recorded in `self.chunk_timings`
+        by a previous run are used when they are available. A worker that
+        runs out of chunks steals the remaining chunks of the others. Once
+        all matches are played, `self.worker_reports` gives the number of
+        chunks played by each worker and its utilisation.
+
         Parameters
         ----------
         build_results : bool
             whether or not to build a results set
         processes : int
             How many processes to use.
+        result_set_builder : ResultSetBuilder
+            Aggregates the results as they are received from the workers
+        chunks : list
+            The chunks to play with their index in the tournament, as
+            returned by `_build_chunks`
         """
         # At first sight, it might seem simpler to use the multiprocessing Pool
         # Class rather than Processes and Queues. However, this way is faster.
-        work_queue = Queue()  # type: Queue
         done_queue = Queue()  # type: Queue
         workers = self._n_workers(processes=processes)
 
-        chunks = self.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
+        if chunks is None:
+            chunks = self._build_chunks()
+        chunk_indices = [index for index, _ in chunks]
+        chunks = [chunk for _, chunk in chunks]
+        costs = estimate_costs(chunks, self.players, self.chunk_timings)
+        queues = WorkStealingQueues(assign_chunks(costs, workers))
+
+        start = time.perf_counter()
+        self._start_workers(workers, chunks, queues, done_queue, build_results)
+        timings = self._process_done_queue(
+            workers,
+            done_queue,
+            build_results,
+            result_set_builder,
+            chunks,
+            chunk_indices,
+        )
 
-        self._start_workers(workers, work_queue, done_queue, build_results)
-        self._process_done_queue(workers, done_queue, build_results)
+        self._report_workers(workers, timings, time.perf_counter() - start)
 
         return True
 
+    def _run_with_executor(
+        self,
+        executor: Executor,
+        build_results: bool = True,
+        result_set_builder: Optional[ResultSetBuilder] = None,
+        chunks: Optional[List[Tuple[int, tuple]]] = None,
+    ) -> bool:
+        """
+        Run all matches with the workers of an executor
+
+        The workers keep the players between calls so only the descriptors of
+        the chunks are sent to them: the ids of the players, the match
+        parameters, the number of repetitions and the seed.
+
+        Parameters
+        ----------
+        executor : axelrod.Executor
+            The pool of worker processes
+        build_results : bool
+            whether or not to build a results set
+        result_set_builder : ResultSetBuilder
+            Aggregates the results as they are received from the workers
+        chunks : list
+            The chunks to play with their index in the tournament, as
+            returned by `_build_chunks`
+        """
+        ids = executor.register_players(self.players)
+        if chunks is None:
+            chunks = self._build_chunks()
+        chunk_indices = [index for index, _ in chunks]
+        to_play = [chunk for _, chunk in chunks]
+        costs = estimate_costs(to_play, self.players, self.chunk_timings)
+        tasks = [
+            (
+                ((ids[i], ids[j]), match_params, repetitions, seed),
+                self.game,
+                build_results,
+                self.vectorize,
+                self.detect_cycles,
+            )
+            for (i, j), match_params, repetitions, seed in to_play
+        ]
+
+        out_file, writer = self._get_file_objects(build_results)
+        progress_bar = self._get_progress_bar()
+
+        timings = []
+        start = time.perf_counter()
+        try:
+            for chunk_index, worker, elapsed, interactions in executor.map(
+                _play_chunk, tasks, costs
+            ):
+                chunk = to_play[chunk_index]
+                timings.append((worker, False, elapsed))
+                self.chunk_timings[timing_key(chunk, self.players)] = elapsed
+
+                results = {chunk[0]: interactions}
+                self._write_interactions_to_file(results, writer)
+                self._record_chunk(
+                    chunk_indices[chunk_index], results, out_file
+                )
+                if result_set_builder is not None:
+                    result_set_builder.add_interactions(results)
+
+                if self.use_progress_bar:
+                    progress_bar.update(1)
+        finally:
+            _close_objects(out_file, progress_bar)
+        self._report_workers(
+            executor.processes, timings, time.perf_counter() - start
+        )
+        return True
+
+    def _report_workers(
+        self,
+        workers: int,
+        timings: List[Tuple[int, bool, float]],
+        wall_time: float,
+    ) -> None:
+        """Sets and logs `self.worker_reports`."""
+        self.worker_reports = worker_reports(workers, timings, wall_time)
+        for report in self.worker_reports:
+            self._logger.info(
+                "Worker {}: {} chunks ({} stolen), {:.1%} utilisation".format(
+                    report.worker,
+                    report.chunks,
+                    report.stolen,
+                    report.utilisation,
+                )
+            )
+
     def _n_workers(self, processes: int = 2) -> int:
         """
         Determines the number of parallel processes to use.
@@ -346,7 +802,8 @@ class Tournament(object):
     def _start_workers(
         self,
         workers: int,
-        work_queue: Queue,
+        chunks: List[tuple],
+        queues: WorkStealingQueues,
         done_queue: Queue,
         build_results: bool = True,
     ) -> bool:
@@ -357,8 +814,10 @@ class Tournament(object):
         ----------
         workers : integer
             The number of sub-processes to create
-        work_queue : multiprocessing.Queue
-            A queue containing an entry for each round robin to be processed
+        chunks : list
+            The chunks of the tournament
+        queues : axelrod.scheduler.WorkStealingQueues
+            The indices of the chunks to be played by each worker
         done_queue : multiprocessing.Queue
             A queue containing the output dictionaries from each round robin
         build_results : bool
@@ -367,15 +826,20 @@ class Tournament(object):
         for worker in range(workers):
             process = Process(
                 target=self._worker,
-                args=(work_queue, done_queue, build_results),
+                args=(worker, chunks, queues, done_queue, build_results),
             )
-            work_queue.put("STOP")
             process.start()
         return True
 
     def _process_done_queue(
-        self, workers: int, done_queue: Queue, build_results: bool = True
-    ):
+        self,
+        workers: int,
+        done_queue: Queue,
+        build_results: bool = True,
+        result_set_builder: Optional[ResultSetBuilder] = None,
+        chunks: Optional[List[tuple]] = None,
+        chunk_indices: Optional[List[int]] = None,
+    ) -> List[Tuple[int, bool, float]]:
         """
         Retrieves the matches from the parallel sub-processes
 
@@ -384,45 +848,86 @@ class Tournament(object):
         workers : integer
             The number of sub-processes in existence
         done_queue : multiprocessing.Queue
-            A queue containing the output dictionaries from each round robin
+            A queue containing the output of each chunk played by a worker
         build_results : bool
             whether or not to build a results set
+        result_set_builder : ResultSetBuilder
+            Aggregates the results as they are received
+        chunks : list
+            The chunks of the tournament, used to record their timings
+        chunk_indices : list
+            The index of each chunk in the tournament, used to record them in
+            the checkpoint
+
+        Returns
+        -------
+        list
+            (worker, stolen, elapsed time) for each chunk played
         """
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
+        timings = []
         stops = 0
-        while stops < workers:
-            results = done_queue.get()
-            if results == "STOP":
-                stops += 1
-            else:
-                self._write_interactions_to_file(results, writer)
-
-                if self.use_progress_bar:
-                    progress_bar.update(1)
+        try:
+            while stops < workers:
+                output = done_queue.get()
+                if output == "STOP":
+                    stops += 1
+                else:
+                    worker, chunk_index, stolen, elapsed, results = output
+                    timings.append((worker, stolen, elapsed))
+                    if chunks is not None:
+                        key = timing_key(chunks[chunk_index], self.players)
+                        self.chunk_timings[key] = elapsed
+
+                    self._write_interactions_to_file(results, writer)
+                    if chunk_indices is not None:
+                        self._record_chunk(
+                            chunk_indices[chunk_index], results, out_file
+                        )
+                    if result_set_builder is not None:
+                        result_set_builder.add_interactions(results)
 
-        _close_objects(out_file, progress_bar)
-        return True
+                    if self.use_progress_bar:
+                        progress_bar.update(1)
+        finally:
+            _close_objects(out_file, progress_bar)
+        return timings
 
     def _worker(
-        self, work_queue: Queue, done_queue: Queue, build_results: bool = True
+        self,
+        worker: int,
+        chunks: List[tuple],
+        queues: WorkStealingQueues,
+        done_queue: Queue,
+        build_results: bool = True,
     ):
         """
         The work for each parallel sub-process to execute.
 
         Parameters
         ----------
-        work_queue : multiprocessing.Queue
-            A queue containing an entry for each round robin to be processed
+        worker : int
+            The index of the worker
+        chunks : list
+            The chunks of the tournament
+        queues : axelrod.scheduler.WorkStealingQueues
+            The indices of the chunks to be played by each worker
         done_queue : multiprocessing.Queue
-            A queue containing the output dictionaries from each round robin
+            A queue receiving, for each chunk played, a tuple: (worker, chunk
+            index, whether the chunk was stolen, time taken, output
+            dictionary)
         build_results : bool
             whether or not to build a results set
         """
-        for chunk in iter(work_queue.get, "STOP"):
-            interactions = self._play_matches(chunk, build_results)
-            done_queue.put(interactions)
+        for chunk_index, stolen in queues.iterate(worker):
+            start = time.perf_counter()
+            interactions = self._play_matches(
+                chunks[chunk_index], build_results
+            )
+            elapsed = time.perf_counter() - start
+            done_queue.put((worker, chunk_index, stolen, elapsed, interactions))
         done_queue.put("STOP")
         return True
 
@@ -444,65 +949,139 @@ class Tournament(object):
 
                 (0, 1) -> [(C, D), (D, C),...]
         """
+        index_pair = chunk[0]
+        prototypes = dict(enumerate(self.players))
         interactions = defaultdict(list)
-        index_pair, match_params, repetitions, seed = chunk
-        p1_index, p2_index = index_pair
-        player1 = self.players[p1_index].clone()
-        player2 = self.players[p2_index].clone()
-        match_params["players"] = (player1, player2)
-        match_params["seed"] = seed
-        match = Match(**match_params)
-        for _ in range(repetitions):
-            match.play()
-
-            if build_results:
-                results = self._calculate_results(match.result)
-            else:
-                results = None
-
-            interactions[index_pair].append([match.result, results])
+        interactions[index_pair] = _play_chunk(
+            prototypes,
+            chunk,
+            self.game,
+            build_results,
+            self.vectorize,
+            self.detect_cycles,
+        )
         return interactions
 
     def _calculate_results(self, interactions):
+        return _calculate_results(interactions, self.game)
+
+
+def _play_chunk(
+    prototypes,
+    chunk,
+    game,
+    build_results=True,
+    vectorize=False,
+    detect_cycles=False,
+):
+    """
+    Play the matches of a chunk between clones of the given players.
+
+    This is used by Tournament._play_matches and, in worker processes, by
+    Tournament._run_with_executor.
+
+    Parameters
+    ----------
+    prototypes : dict
+        Mapping the indices in the index pair of the chunk to players
+    chunk : tuple (index pair, match_parameters, repetitions, seed)
+    game : axelrod.Game
+        The game used to calculate the results
+    build_results : bool
+        whether or not to calculate the results of each match
+    vectorize : bool
+        whether or not to play the matches as array operations
+    detect_cycles : bool
+        whether or not deterministic matches stop playing once they repeat
+
+    Returns
+    -------
+    list
+        [interactions, results] for each repetition
+    """
+    index_pair, match_params, repetitions, seed = chunk
+    p1_index, p2_index = index_pair
+    match_params = dict(match_params)
+    match_params["players"] = (
+        prototypes[p1_index].clone(),
+        prototypes[p2_index].clone(),
+    )
+    match_params["seed"] = seed
+    match_params["vectorize"] = vectorize
+    match_params["detect_cycles"] = detect_cycles
+    match = Match(**match_params)
+    interactions = list(match.play_repetitions(repetitions))
+    if build_results:
+        results = _calculate_batch_results(interactions, game)
+    else:
+        results = [None] * len(interactions)
+    return [
+        [result, result_results]
+        for result, result_results in zip(interactions, results)
+    ]
+
+
+def _calculate_results(interactions, game):
+    return _calculate_batch_results([interactions], game)[0]
+
+
+def _calculate_batch_results(batch, game):
+    """
+    Calculate the results of all the repetitions of a match at once with
+    axelrod.interaction_utils.compute_batch_metrics.
+
+    Returns
+    -------
+    list
+        For each interaction of the batch: [scores, score_diffs, turns,
+        score_per_turns, score_diffs_per_turns, initial_coops, cooperations,
+        state_distribution, state_to_action_distributions, winner_index]
+    """
+    metrics = iu.compute_batch_metrics(batch, game)
+    batch_results = []
+    for index in range(len(batch)):
         results = []
 
-        scores = iu.compute_final_score(interactions, self.game)
+        scores = tuple(metrics.scores[index])
         results.append(scores)
 
         score_diffs = scores[0] - scores[1], scores[1] - scores[0]
         results.append(score_diffs)
 
-        turns = len(interactions)
+        turns = int(metrics.turns[index])
         results.append(turns)
 
-        score_per_turns = iu.compute_final_score_per_turn(
-            interactions, self.game
-        )
+        score_per_turns = tuple(metrics.scores[index] / turns)
         results.append(score_per_turns)
 
         score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
         results.append(score_diffs_per_turns)
 
-        initial_coops = tuple(
-            map(bool, iu.compute_cooperations(interactions[:1]))
-        )
+        initial_coops = tuple(metrics.initial_cooperations[index].tolist())
         results.append(initial_coops)
 
-        cooperations = iu.compute_cooperations(interactions)
+        cooperations = tuple(metrics.cooperations[index].tolist())
         results.append(cooperations)
 
-        state_distribution = iu.compute_state_distribution(interactions)
+        state_distribution = iu.state_distribution_from_counts(
+            metrics.state_counts[index]
+        )
         results.append(state_distribution)
 
-        state_to_action_distributions = iu.compute_state_to_action_distribution(
-            interactions
+        state_to_action_distributions = (
+            iu.state_to_action_distribution_from_counts(
+                metrics.state_to_action_counts[index]
+            )
         )
         results.append(state_to_action_distributions)
 
-        winner_index = iu.compute_winner_index(interactions, self.game)
+        winner_index = int(metrics.winner_index[index])
+        if winner_index == -1:
+            winner_index = False  # No winner
         results.append(winner_index)
 
-        return results
+        batch_results.append(results)
+    return batch_results
 
 
 def _close_objects(*objs):
@@ -0,0 +1,645 @@
+"""Vectorized play of the repetitions of a match.
+
+Most of the classic strategies (memory one players, the zero determinant
+family, Win-Stay Lose-Shift, Tit For Tat, memory two players, ...) can be
+written as a transition table: a probability of cooperating for each possible
+combination of the last n plays of both players, along with n initial plays.
+Lookup tables (LookerUp and Gambler) also respond to the first plays of the
+coplayer and hidden Markov models (HMMPlayer) keep a hidden state.
+
+For such pairs the turns of a match do not need to go through
+`Player.strategy` and `History.append`: all repetitions of the match can be
+advanced together as array operations. The random values are drawn from the
+same generators, in the same order, as `Match.play` would draw them so that
+both paths give identical results for the same seed.
+"""
+
+import abc
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from axelrod.action import Action
+
+C, D = Action.C, Action.D
+
+# Action pairs indexed by the integer state 2 * player + coplayer.
+STATES = ((C, C), (C, D), (D, C), (D, D))
+
+# Draws the next random value of a player for the repetitions in a mask.
+Draw = Callable[[np.ndarray], np.ndarray]
+
+
+class BatchedStrategy(abc.ABC):
+    """A strategy that plays a turn of all the repetitions of a match at once.
+
+    Plays are integer coded (C = 0, D = 1). Subclasses implement `play` and
+    draw their random values with the `draw` function they are given, which
+    returns for each repetition the next value of the player's generator and
+    only moves on to the following value for the repetitions in the mask it is
+    called with.
+
+    Attributes
+    ----------
+    draws_per_turn: int
+        The largest number of random values drawn in a turn.
+    """
+
+    draws_per_turn = 1
+
+    @property
+    @abc.abstractmethod
+    def stochastic(self) -> bool:
+        """Whether the player draws random values."""
+
+    def start(self, lengths: Sequence[int]) -> None:
+        """Prepares to play repetitions with the given number of turns."""
+
+    @abc.abstractmethod
+    def play(
+        self, turn: int, actions: np.ndarray, index: int, draw: Optional[Draw]
+    ) -> np.ndarray:
+        """Returns the plays of the player on a turn of every repetition.
+
+        Parameters
+        ----------
+        turn:
+            The index of the turn.
+        actions:
+            The array of shape (repetitions, turns, 2) of the plays, filled up
+            to (and excluding) `turn`.
+        index:
+            The index of the player in the last dimension of `actions`.
+        draw:
+            The function drawing the random values of the player, or None if
+            the player is not stochastic.
+        """
+
+    def update_player(self, player, repetition: int) -> None:
+        """Gives the player the state, other than its history, it has at the
+        end of a repetition."""
+
+
+def _pack(plays: np.ndarray) -> np.ndarray:
+    """Returns the integers whose binary digits are the plays of each row
+    (oldest first)."""
+    weights = 1 << np.arange(plays.shape[1] - 1, -1, -1, dtype=np.int64)
+    return plays @ weights
+
+
+def _choose(probabilities: np.ndarray, draw: Optional[Draw]) -> np.ndarray:
+    """Plays C with the given probabilities, drawing random values only where
+    they are strictly between 0 and 1 (as RandomGenerator.random_choice)."""
+    cooperate = probabilities == 1
+    draws = (probabilities > 0) & (probabilities < 1)
+    if np.any(draws):
+        cooperate = cooperate | (draws & (draw(draws) < probabilities))
+    return (~cooperate).astype(np.int8)
+
+
+class MemoryTable(BatchedStrategy):
+    """A memory-n transition table for a player.
+
+    Attributes
+    ----------
+    depth: int
+        The number of previous turns the player responds to.
+    probabilities: np.ndarray
+        The probability of cooperating for each of the 4 ** depth states. The
+        state index is the integer whose binary digits are the last `depth`
+        plays of the player followed by the last `depth` plays of the
+        coplayer (oldest first, C = 0 and D = 1).
+    initial: tuple
+        The actions played on the first `depth` turns.
+    """
+
+    def __init__(
+        self, depth: int, probabilities: Sequence[float], initial: Sequence
+    ) -> None:
+        self.depth = depth
+        self.probabilities = np.array(probabilities, dtype=float)
+        self.initial = np.array([action.value for action in initial])
+        if len(self.probabilities) != 4**depth:
+            raise ValueError(
+                "A memory {} table requires {} probabilities.".format(
+                    depth, 4**depth
+                )
+            )
+        if len(self.initial) != depth:
+            raise ValueError(
+                "A memory {} table requires {} initial plays.".format(
+                    depth, depth
+                )
+            )
+
+    @property
+    def stochastic(self) -> bool:
+        return bool(np.any((self.probabilities > 0) & (self.probabilities < 1)))
+
+    def play(self, turn, actions, index, draw):
+        if turn < self.depth:
+            return np.full(len(actions), self.initial[turn], dtype=np.int8)
+        last = actions[:, turn - self.depth : turn]
+        state = (_pack(last[:, :, index]) << self.depth) | _pack(
+            last[:, :, 1 - index]
+        )
+        return _choose(self.probabilities[state], draw)
+
+
+class LookerUpTable(BatchedStrategy):
+    """The lookup table of a LookerUp or a Gambler.
+
+    Attributes
+    ----------
+    depths: tuple
+        The number of last plays of the player, of last plays of the coplayer
+        and of first plays of the coplayer the player responds to.
+    probabilities: np.ndarray
+        The probability of cooperating for each of the 2 ** sum(depths)
+        states. The state index is the integer whose binary digits are the
+        last plays of the player, the last plays of the coplayer and the first
+        plays of the coplayer (oldest first, C = 0 and D = 1).
+    initial: np.ndarray
+        The actions played on the first turns, before the table is used.
+    """
+
+    def __init__(
+        self,
+        depths: Tuple[int, int, int],
+        probabilities: Sequence[float],
+        initial: Sequence,
+    ) -> None:
+        self.depths = depths
+        self.probabilities = np.array(probabilities, dtype=float)
+        self.initial = np.array([action.value for action in initial])
+        if len(self.probabilities) != 2 ** sum(depths):
+            raise ValueError(
+                "A lookup table of depths {} requires {} probabilities.".format(
+                    depths, 2 ** sum(depths)
+                )
+            )
+        if len(self.initial) < max(depths):
+            raise ValueError(
+                "A lookup table of depths {} requires {} initial plays.".format(
+                    depths, max(depths)
+                )
+            )
+
+    @property
+    def stochastic(self) -> bool:
+        return bool(np.any((self.probabilities > 0) & (self.probabilities < 1)))
+
+    def play(self, turn, actions, index, draw):
+        if turn < len(self.initial):
+            return np.full(len(actions), self.initial[turn], dtype=np.int8)
+        player_depth, op_depth, op_openings_depth = self.depths
+        state = _pack(actions[:, turn - player_depth : turn, index])
+        state = (state << op_depth) | _pack(
+            actions[:, turn - op_depth : turn, 1 - index]
+        )
+        state = (state << op_openings_depth) | _pack(
+            actions[:, :op_openings_depth, 1 - index]
+        )
+        return _choose(self.probabilities[state], draw)
+
+
+class HMMTable(BatchedStrategy):
+    """The hidden Markov model of an HMMPlayer.
+
+    Attributes
+    ----------
+    transitions: np.ndarray
+        The transition matrices of shape (2, states, states), following the
+        last play of the coplayer (C = 0 and D = 1).
+    emissions: np.ndarray
+        The probability of cooperating in each state.
+    initial_state: int
+        The hidden state on the first turn.
+    initial_action: Action
+        The action played on the first turn.
+    """
+
+    # A turn draws the next hidden state, then the play.
+    draws_per_turn = 2
+
+    def __init__(
+        self,
+        transitions_C: Sequence[Sequence[float]],
+        transitions_D: Sequence[Sequence[float]],
+        emissions: Sequence[float],
+        initial_state: int,
+        initial_action: Action,
+    ) -> None:
+        self.transitions = np.array([transitions_C, transitions_D], dtype=float)
+        self.emissions = np.array(emissions, dtype=float)
+        self.initial_state = initial_state
+        self.initial_action = initial_action
+        # As SimpleHMM, rows that contain a 1 are followed without a draw.
+        # The others are sampled as numpy.random.RandomState.choice does.
+        self._next_states = np.array(
+            [
+                [list(row).index(1) if 1 in row else -1 for row in matrix]
+                for matrix in (transitions_C, transitions_D)
+            ]
+        )
+        cdfs = np.cumsum(self.transitions, axis=2)
+        self._cdfs = cdfs / cdfs[:, :, -1:]
+        self._states = None  # type: Optional[np.ndarray]
+        self._final_states = None  # type: Optional[np.ndarray]
+        self._ends = None  # type: Optional[np.ndarray]
+
+    @property
+    def stochastic(self) -> bool:
+        values = np.concatenate([self.transitions.ravel(), self.emissions])
+        return bool(np.any((values > 0) & (values < 1)))
+
+    def start(self, lengths):
+        self._states = np.full(len(lengths), self.initial_state)
+        self._final_states = self._states.copy()
+        self._ends = np.array(lengths) - 1
+
+    def play(self, turn, actions, index, draw):
+        if turn == 0:
+            return np.full(
+                len(actions), self.initial_action.value, dtype=np.int8
+            )
+        coplays = actions[:, turn - 1, 1 - index]
+        states = self._next_states[coplays, self._states]
+        sampled = states < 0
+        if np.any(sampled):
+            cdfs = self._cdfs[coplays, self._states]
+            u = draw(sampled)
+            # Past the end of a repetition the drawn values are 1.
+            choices = np.minimum(
+                np.sum(cdfs <= u[:, None], axis=1), len(self.emissions) - 1
+            )
+            states = np.where(sampled, choices, states)
+        self._states = states
+        ended = self._ends == turn
+        self._final_states[ended] = states[ended]
+        return _choose(self.emissions[states], draw)
+
+    def update_player(self, player, repetition):
+        state = int(self._final_states[repetition])
+        player.hmm.state = state
+        player.state = state
+
+
+def _memory_one_table(player) -> MemoryTable:
+    four_vector = [player._four_vector[state] for state in STATES]
+    return MemoryTable(1, four_vector, (player._initial,))
+
+
+def _memory_two_table(player) -> MemoryTable:
+    sixteen_vector = [
+        player._sixteen_vector[(STATES[i // 4], STATES[i % 4])]
+        for i in range(16)
+    ]
+    return MemoryTable(2, sixteen_vector, player._initial)
+
+
+def _constant_table(probabilities, initial):
+    def table(player) -> MemoryTable:
+        return MemoryTable(1, probabilities, (initial,))
+
+    return table
+
+
+def _random_table(player) -> MemoryTable:
+    return MemoryTable(0, (min(max(player.p, 0), 1),), ())
+
+
+def _bits(plays) -> int:
+    value = 0
+    for action in plays:
+        value = (value << 1) | action.value
+    return value
+
+
+def _lookerup_table(player) -> LookerUpTable:
+    lookup = player._lookup
+    depths = (lookup.player_depth, lookup.op_depth, lookup.op_openings_depth)
+    probabilities = np.empty(2 ** sum(depths))
+    for plays, reaction in lookup.dictionary.items():
+        state = _bits(plays.self_plays + plays.op_plays + plays.op_openings)
+        if isinstance(reaction, Action):
+            reaction = 1 if reaction == C else 0
+        probabilities[state] = reaction
+    return LookerUpTable(depths, probabilities, player._initial_actions_pool)
+
+
+def _hmm_table(player) -> HMMTable:
+    hmm = player.hmm
+    return HMMTable(
+        hmm.transitions_C,
+        hmm.transitions_D,
+        hmm.emission_probabilities,
+        hmm.state,
+        player.initial_action,
+    )
+
+
+_TABLE_BUILDERS = None
+
+
+def _table_builders() -> dict:
+    """Map strategy methods to a function building the equivalent table.
+
+    Built on first use to avoid a circular import of the strategies. The keys
+    are the `strategy` functions themselves so that subclasses (for example,
+    transformed strategies) that change the strategy are not matched.
+    """
+    global _TABLE_BUILDERS
+    if _TABLE_BUILDERS is None:
+        from axelrod.strategies.cooperator import Cooperator
+        from axelrod.strategies.defector import Defector
+        from axelrod.strategies.gambler import Gambler
+        from axelrod.strategies.hmm import HMMPlayer
+        from axelrod.strategies.lookerup import LookerUp
+        from axelrod.strategies.memoryone import (
+            MemoryOnePlayer,
+            WinStayLoseShift,
+        )
+        from axelrod.strategies.memorytwo import MemoryTwoPlayer
+        from axelrod.strategies.rand import Random
+        from axelrod.strategies.titfortat import TitForTat
+
+        _TABLE_BUILDERS = {
+            MemoryOnePlayer.strategy: _memory_one_table,
+            MemoryTwoPlayer.strategy: _memory_two_table,
+            WinStayLoseShift.strategy: _constant_table((1, 0, 0, 1), C),
+            TitForTat.strategy: _constant_table((1, 0, 1, 0), C),
+            Cooperator.strategy: _constant_table((1, 1, 1, 1), C),
+            Defector.strategy: _constant_table((0, 0, 0, 0), D),
+            Random.strategy: _random_table,
+            LookerUp.strategy: _lookerup_table,
+            Gambler.strategy: _lookerup_table,
+            HMMPlayer.strategy: _hmm_table,
+        }
+    return _TABLE_BUILDERS
+
+
+def memory_table(player) -> Optional[BatchedStrategy]:
+    """Returns the table of a player, or None if the player cannot be
+    expressed as one.
+
+    The player should have received its match attributes, since some
+    strategies (e.g. GTFT and the ZD strategies) compute their probabilities
+    from the game.
+    """
+    builder = _table_builders().get(type(player).strategy)
+    if builder is None:
+        return None
+    return builder(player)
+
+
+def _draw_uniforms(seed, size: int) -> np.ndarray:
+    """Draw the values a player seeded with `seed` would draw."""
+    return np.random.RandomState(seed).rand(size)
+
+
+def _drawer(uniforms: Optional[np.ndarray]) -> Optional[Draw]:
+    """Returns the function drawing the values of each row of `uniforms` in
+    turn."""
+    if uniforms is None:
+        return None
+    rows = np.arange(len(uniforms))
+    pointers = np.zeros(len(uniforms), dtype=np.int64)
+
+    def draw(mask):
+        values = uniforms[rows, pointers]
+        pointers[mask] += 1
+        return values
+
+    return draw
+
+
+def play_tables(
+    tables: Tuple[BatchedStrategy, BatchedStrategy],
+    lengths: Sequence[int],
+    player_uniforms: Tuple[Optional[np.ndarray], Optional[np.ndarray]],
+    noise_uniforms: Optional[np.ndarray] = None,
+    noise: float = 0,
+) -> np.ndarray:
+    """Play repetitions of a match between two tables.
+
+    Parameters
+    ----------
+    tables:
+        The tables of the two players.
+    lengths:
+        The number of turns of each repetition.
+    player_uniforms:
+        For each player, an array of shape (repetitions, draws_per_turn *
+        max(lengths)) of the values that would be drawn from the player's
+        random generator, or None if the player does not draw random values.
+    noise_uniforms:
+        An array of shape (repetitions, 2 * max(lengths)) of the values used to
+        flip actions, interleaving the two players.
+    noise:
+        The probability of flipping an action.
+
+    Returns
+    -------
+    An integer array of shape (repetitions, max(lengths), 2) of the actions
+    played (C = 0, D = 1). Turns beyond the length of a repetition are padded
+    with zeros.
+    """
+    repetitions = len(lengths)
+    turns = max(lengths) if repetitions else 0
+    actions = np.zeros((repetitions, turns, 2), dtype=np.int8)
+    draws = [_drawer(uniforms) for uniforms in player_uniforms]
+    for table in tables:
+        table.start(lengths)
+
+    for turn in range(turns):
+        plays = [
+            table.play(turn, actions, index, draws[index])
+            for index, table in enumerate(tables)
+        ]
+        if noise_uniforms is not None:
+            for index in range(2):
+                flips = noise_uniforms[:, 2 * turn + index] < noise
+                plays[index] = plays[index] ^ flips
+        for index in range(2):
+            actions[:, turn, index] = plays[index]
+
+    # Turns beyond the length of a repetition are not played.
+    actions[np.arange(turns) >= np.array(lengths)[:, None]] = 0
+    return actions
+
+
+def to_interactions(actions: np.ndarray, length: int) -> List[tuple]:
+    """Convert an array of integer coded plays to a list of action pairs."""
+    return [STATES[s] for s in (2 * actions[:length, 0] + actions[:length, 1])]
+
+
+class _Repetition(object):
+    """The random values a match draws before playing a repetition."""
+
+    def __init__(self, match, seeded, length: Optional[int] = None) -> None:
+        # Drawn in the order of Match.play.
+        if length is None:
+            length = match._sample_turns()
+        self.length = length
+        self.seeds = [
+            match._random.random_seed_int() if is_seeded else None
+            for is_seeded in seeded
+        ]
+        self.noise_draws = None
+        if 0 < match.noise < 1:
+            self.noise_draws = match._random.random(2 * length)
+
+
+def _tables(match) -> Optional[Tuple[BatchedStrategy, BatchedStrategy]]:
+    """Resets the players of a match and returns their tables, or None if they
+    can not be played as tables by the match."""
+    players = match.players
+    if not match.reset or players[0] is players[1]:
+        # A player matched with itself records both sides in its history.
+        return None
+    for player in players:
+        player.reset()
+        player.set_match_attributes(**match.match_attributes)
+    tables = tuple(memory_table(player) for player in players)
+    if any(table is None for table in tables):
+        return None
+    if any(t.stochastic and not s for t, s in zip(tables, match.plan.seeded)):
+        # The player would not be seeded by the match.
+        return None
+    return tables
+
+
+def _play_repetitions(
+    tables, repetitions: Sequence[_Repetition], noise: float
+) -> List[List[tuple]]:
+    """Plays the tables for the given repetitions."""
+    lengths = [repetition.length for repetition in repetitions]
+    turns = max(lengths) if lengths else 0
+
+    player_uniforms = []
+    for index, table in enumerate(tables):
+        uniforms = None
+        if table.stochastic:
+            size = table.draws_per_turn
+            uniforms = np.ones((len(lengths), size * turns))
+            for k, repetition in enumerate(repetitions):
+                uniforms[k, : size * repetition.length] = _draw_uniforms(
+                    repetition.seeds[index], size * repetition.length
+                )
+        player_uniforms.append(uniforms)
+
+    noise_uniforms = None
+    if noise == 1:
+        noise_uniforms = np.zeros((len(lengths), 2 * turns))
+    elif 0 < noise < 1:
+        noise_uniforms = np.ones((len(lengths), 2 * turns))
+        for k, repetition in enumerate(repetitions):
+            noise_uniforms[k, : 2 * repetition.length] = repetition.noise_draws
+
+    actions = play_tables(
+        tables, lengths, player_uniforms, noise_uniforms, noise
+    )
+    return [
+        to_interactions(actions[k], length) for k, length in enumerate(lengths)
+    ]
+
+
+def _leave_players(players, tables, repetition, result, k) -> None:
+    """Leaves the players with the seed, history and state they have after
+    playing the k-th repetition."""
+    for index, player in enumerate(players):
+        if repetition.seeds[index] is not None:
+            player.set_seed(repetition.seeds[index])
+        plays = [interaction[index] for interaction in result]
+        coplays = [interaction[1 - index] for interaction in result]
+        player.history.extend(plays, coplays)
+        tables[index].update_player(player, k)
+
+
+def play_repetitions(
+    match, repetitions: int, lengths: Optional[Sequence[int]] = None
+) -> Optional[List[List[tuple]]]:
+    """Play repetitions of a match using the tables of its players.
+
+    The random values are drawn from the match's random generator exactly as
+    `Match.play` would draw them, so that the results (and the state of the
+    match's generator) are identical to calling `Match.play` `repetitions`
+    times.
+
+    Parameters
+    ----------
+    match: axelrod.Match
+        The match to play.
+    repetitions: int
+        The number of repetitions to play.
+    lengths: list
+        The number of turns of each repetition, if already sampled. Otherwise
+        lengths are sampled from the match for each repetition.
+
+    Returns
+    -------
+    A list of interactions for each repetition, or None (without drawing any
+    random values) if the players cannot be expressed as tables, if the
+    match does not reset its players or if a player is matched with itself.
+    """
+    tables = _tables(match)
+    if tables is None:
+        return None
+    seeded = match.plan.seeded
+    draws = [
+        _Repetition(match, seeded, None if lengths is None else lengths[k])
+        for k in range(repetitions)
+    ]
+    results = _play_repetitions(tables, draws, match.noise)
+
+    # Leave the players with the seed and history of the last repetition.
+    if results:
+        _leave_players(
+            match.players, tables, draws[-1], results[-1], repetitions - 1
+        )
+    return results
+
+
+def play_matches(matches: Sequence) -> Optional[List[List[tuple]]]:
+    """Play each of a list of matches once, all at once.
+
+    The matches must be between players with the same configurations and
+    have the same noise and match attributes. Each match draws its random
+    values from its own generator exactly as `Match.play` would, so that the
+    results are identical to calling `Match.play` on each of them.
+
+    Returns
+    -------
+    A list of interactions for each match, or None (without drawing any
+    random values) if the players cannot be expressed as tables, if a match
+    does not reset its players or matches a player with itself or if the
+    matches are not between the same players.
+    """
+    if not matches:
+        return []
+    first = matches[0]
+    keys = [player.configuration_key() for player in first.players]
+    for match in matches:
+        if (
+            not match.reset
+            or match.players[0] is match.players[1]
+            or match.noise != first.noise
+            or match.match_attributes != first.match_attributes
+            or [player.configuration_key() for player in match.players] != keys
+        ):
+            return None
+    tables = _tables(first)
+    if tables is None:
+        return None
+    seeded = first.plan.seeded
+    draws = [_Repetition(match, seeded) for match in matches]
+    results = _play_repetitions(tables, draws, first.noise)
+
+    # A player can take part in several matches: as when the matches are
+    # played in turn, it is left with the state of the last one.
+    for k, (match, result) in enumerate(zip(matches, results)):
+        for player in match.players:
+            player.reset()
+            player.set_match_attributes(**match.match_attributes)
+        _leave_players(match.players, tables, draws[k], result, k)
+    return results
@@ -0,0 +1,12 @@
+"""
+Benchmarks of the hot paths of the library: playing matches and
+tournaments, analysing results, Moran processes and fingerprints.
+
+Each workload is seeded so that it does the same work on every run. The
+results (wall time, peak resident memory and matches played per second) can
+be saved and compared against a stored baseline to catch performance
+regressions, for example when upgrading dependencies::
+
+    $ python -m benchmarks --output baseline.json
+    $ python -m benchmarks --baseline baseline.json
+"""
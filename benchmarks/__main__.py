@@ -0,0 +1,153 @@
+"""
+Runs the benchmarks from the command line::
+
+    $ python -m benchmarks --list
+    $ python -m benchmarks --workload "match.*" --workload moran
+    $ python -m benchmarks --output baseline.json
+    $ python -m benchmarks --baseline baseline.json --tolerance 0.2
+
+The workloads named `<name>.processes.<n>` are also reported as a speed-up
+curve, relative to `<name>.processes.1`.
+
+The process exits with status 1 if any workload is slower than its baseline
+by more than the tolerance.
+"""
+import argparse
+import fnmatch
+import sys
+
+from .harness import compare, load, run_benchmarks, save, speedups
+from .workloads import WORKLOADS
+
+
+def select_workloads(patterns):
+    """Returns the names of the workloads that match any of the patterns, in
+    the order they were registered."""
+    if not patterns:
+        return list(WORKLOADS)
+    return [
+        name
+        for name in WORKLOADS
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+
+def _format_bytes(size):
+    if size is None:
+        return "-"
+    return "{:.1f} MB".format(size / 2**20)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("::")[0]
+    )
+    parser.add_argument(
+        "-w",
+        "--workload",
+        action="append",
+        dest="patterns",
+        help="Run the workloads matching this pattern (can be repeated).",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the workloads and exit."
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Run each workload this many times and keep the fastest run.",
+    )
+    parser.add_argument("-o", "--output", help="Save the results as json.")
+    parser.add_argument(
+        "-b", "--baseline", help="Compare with the results saved in this file."
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="The fraction by which a workload can be slower than its "
+        "baseline before it is reported as a regression.",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run the workloads in this process rather than one new process "
+        "each (the peak memory is then that of all the workloads so far).",
+    )
+    args = parser.parse_args(arguments)
+
+    names = select_workloads(args.patterns)
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        parser.error("No workload matches {}".format(args.patterns))
+
+    results = run_benchmarks(
+        names, repeat=args.repeat, isolated=not args.in_process
+    )
+    print(
+        "{:<32} {:>10} {:>10} {:>10} {:>12}".format(
+            "workload", "time (s)", "peak RSS", "matches", "matches/s"
+        )
+    )
+    for name, measurement in results["workloads"].items():
+        print(
+            "{:<32} {:>10.3f} {:>10} {:>10} {:>12.1f}".format(
+                name,
+                measurement["wall_time"],
+                _format_bytes(measurement["peak_rss"]),
+                measurement["matches"],
+                measurement["matches_per_second"] or 0,
+            )
+        )
+
+    curve = speedups(results)
+    if curve:
+        print()
+        print(
+            "{:<32} {:>10} {:>10} {:>10}".format(
+                "workload", "processes", "time (s)", "speed-up"
+            )
+        )
+        for speedup in curve:
+            print(
+                "{:<32} {:>10} {:>10.3f} {:>10.2f}".format(
+                    speedup.workload,
+                    speedup.processes,
+                    speedup.wall_time,
+                    speedup.speedup,
+                )
+            )
+
+    if args.output:
+        save(results, args.output)
+
+    if args.baseline:
+        comparisons = compare(results, load(args.baseline), args.tolerance)
+        print()
+        print(
+            "{:<32} {:>10} {:>10} {:>8}".format(
+                "workload", "baseline", "time (s)", "ratio"
+            )
+        )
+        for comparison in comparisons:
+            print(
+                "{:<32} {:>10.3f} {:>10.3f} {:>8.2f}{}".format(
+                    comparison.workload,
+                    comparison.baseline,
+                    comparison.wall_time,
+                    comparison.ratio,
+                    "  REGRESSION" if comparison.regressed else "",
+                )
+            )
+        if any(comparison.regressed for comparison in comparisons):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Measuring the workloads and comparing the measurements against a baseline.
+"""
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import axelrod as axl
+import numpy as np
+
+from .workloads import WORKLOADS
+
+
+class Comparison(NamedTuple):
+    """The wall time of a workload compared to its baseline."""
+
+    workload: str
+    baseline: float
+    wall_time: float
+    ratio: float
+    regressed: bool
+
+
+class Speedup(NamedTuple):
+    """The wall time of a workload run with a number of processes compared
+    to the same workload run with one process."""
+
+    workload: str
+    processes: int
+    wall_time: float
+    speedup: float
+
+
+def peak_rss() -> Optional[int]:
+    """Returns the peak resident set size, in bytes, of this process and of
+    its finished child processes, or None if it is not available (on
+    Windows)."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    if sys.platform == "darwin":  # pragma: no cover
+        return peak
+    return peak * 1024
+
+
+def environment() -> dict:
+    """Returns the versions and hardware the measurements were made with."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "axelrod": axl.__version__,
+        "numpy": np.__version__,
+        "cpu_count": multiprocessing.cpu_count(),
+    }
+
+
+def measure(name: str, repeat: int = 1) -> dict:
+    """
+    Runs a workload in this process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the workload
+    repeat : int
+        The number of times to run the workload: the fastest run is kept.
+
+    Returns
+    -------
+    dict
+        The wall time in seconds, the peak resident set size in bytes, the
+        number of matches played and the number of matches per second.
+    """
+    run = WORKLOADS[name]()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matches = run()
+        times.append(time.perf_counter() - start)
+    wall_time = min(times)
+    return {
+        "wall_time": wall_time,
+        "peak_rss": peak_rss(),
+        "matches": matches,
+        "matches_per_second": matches / wall_time if wall_time else None,
+    }
+
+
+def _measure_in_child(name, repeat, queue):
+    # The child is spawned and would start the processes of the parallel
+    # workloads in the same way: restore the default of the platform.
+    multiprocessing.set_start_method(None, force=True)
+    try:
+        queue.put((measure(name, repeat), None))
+    except Exception as e:  # Sent back to the parent to be raised there
+        queue.put((None, "{}: {}".format(type(e).__name__, e)))
+
+
+def measure_isolated(name: str, repeat: int = 1) -> dict:
+    """Runs a workload with `measure` in a new process, so that the peak
+    resident set size is that of this workload alone."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(
+        target=_measure_in_child, args=(name, repeat, queue)
+    )
+    process.start()
+    result, error = queue.get()
+    process.join()
+    if error is not None:
+        raise RuntimeError("Workload {} failed: {}".format(name, error))
+    return result
+
+
+def run_benchmarks(
+    names: List[str], repeat: int = 1, isolated: bool = True
+) -> dict:
+    """Measures the given workloads and returns the results together with
+    the environment they were measured in."""
+    function = measure_isolated if isolated else measure
+    return {
+        "environment": environment(),
+        "workloads": {name: function(name, repeat) for name in names},
+    }
+
+
+def save(results: dict, filename: str) -> None:
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load(filename: str) -> dict:
+    with open(filename) as f:
+        return json.load(f)
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float = 0.25
+) -> List[Comparison]:
+    """
+    Compares the wall times of the workloads with a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        As returned by `run_benchmarks`
+    baseline : dict
+        As returned by `run_benchmarks`, usually loaded from a file
+    tolerance : float
+        A workload has regressed if it is slower than its baseline by more
+        than this fraction of the baseline wall time.
+
+    Returns
+    -------
+    list
+        A Comparison for each workload that is in both the results and the
+        baseline.
+    """
+    comparisons = []
+    baseline_workloads = baseline["workloads"]  # type: Dict[str, dict]
+    for name, measurement in results["workloads"].items():
+        if name not in baseline_workloads:
+            continue
+        baseline_time = baseline_workloads[name]["wall_time"]
+        wall_time = measurement["wall_time"]
+        ratio = wall_time / baseline_time if baseline_time else float("inf")
+        comparisons.append(
+            Comparison(
+                name,
+                baseline_time,
+                wall_time,
+                ratio,
+                wall_time > baseline_time * (1 + tolerance),
+            )
+        )
+    return comparisons
+
+
+def speedups(results: dict) -> List[Speedup]:
+    """
+    Returns the speed-up of each workload named `<name>.processes.<n>`
+    relative to the workload `<name>.processes.1`.
+
+    Parameters
+    ----------
+    results : dict
+        As returned by `run_benchmarks`
+
+    Returns
+    -------
+    list
+        A Speedup for each of these workloads, if the workload with one
+        process was measured.
+    """
+    workloads = results["workloads"]  # type: Dict[str, dict]
+    curve = []
+    for name, measurement in workloads.items():
+        family, separator, processes = name.rpartition(".processes.")
+        serial = workloads.get(family + ".processes.1")
+        if not separator or not processes.isdigit() or serial is None:
+            continue
+        wall_time = measurement["wall_time"]
+        curve.append(
+            Speedup(
+                name,
+                int(processes),
+                wall_time,
+                serial["wall_time"] / wall_time if wall_time else float("inf"),
+            )
+        )
+    return curve
@@ -0,0 +1,120 @@
+"""
+Measures the cost of resetting and cloning each strategy, restoring the state
+recorded after initialisation and by running __init__ again::
+
+    $ python -m benchmarks.reset
+    $ python -m benchmarks.reset --strategy "Evolved*" --strategy "Meta*"
+
+Strategies whose state cannot be recorded are always reset by running
+__init__ and are marked with a `-` in the snapshot columns.
+"""
+import argparse
+import copy
+import fnmatch
+import sys
+import timeit
+import warnings
+from typing import NamedTuple, Optional
+
+import axelrod as axl
+
+
+class ResetCost(NamedTuple):
+    """The cost, in microseconds, of resetting and cloning a strategy."""
+
+    strategy: str
+    reset: Optional[float]
+    reset_with_init: float
+    clone: Optional[float]
+    clone_with_init: float
+
+
+def _reset_with_init(player):
+    player.__init__(**player.init_kwargs)
+
+
+def _clone_with_init(player):
+    new_player = type(player)(**player.init_kwargs)
+    new_player.match_attributes = copy.copy(player.match_attributes)
+    return new_player
+
+
+def _time(function, number):
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e6
+
+
+def measure(strategy, number: int = 200) -> ResetCost:
+    """Measures the cost of resetting and cloning a player of a strategy,
+    after it has played a short match."""
+    player = strategy()
+    axl.Match((player, axl.Alternator()), turns=10, seed=0).play()
+    has_snapshot = player._get_snapshot() is not None
+    return ResetCost(
+        strategy.name,
+        _time(player.reset, number) if has_snapshot else None,
+        _time(lambda: _reset_with_init(player), number),
+        _time(player.clone, number) if has_snapshot else None,
+        _time(lambda: _clone_with_init(player), number),
+    )
+
+
+def _format(cost):
+    return "{:>10}".format("-") if cost is None else "{:>10.1f}".format(cost)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.reset", description=__doc__.split("::")[0]
+    )
+    parser.add_argument(
+        "-s",
+        "--strategy",
+        action="append",
+        dest="patterns",
+        help="Measure the strategies whose class name matches this pattern "
+        "(can be repeated).",
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=200,
+        help="The number of resets and clones in each measurement.",
+    )
+    args = parser.parse_args(arguments)
+
+    strategies = [
+        strategy
+        for strategy in axl.all_strategies
+        if not args.patterns
+        or any(
+            fnmatch.fnmatch(strategy.__name__, pattern)
+            for pattern in args.patterns
+        )
+    ]
+    if not strategies:
+        parser.error("No strategy matches {}".format(args.patterns))
+
+    print(
+        "{:<40} {:>10} {:>10} {:>10} {:>10}".format(
+            "strategy (us)", "reset", "__init__", "clone", "__init__"
+        )
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for strategy in strategies:
+            cost = measure(strategy, args.number)
+            print(
+                "{:<40} {} {} {} {}".format(
+                    cost.strategy[:40],
+                    _format(cost.reset),
+                    _format(cost.reset_with_init),
+                    _format(cost.clone),
+                    _format(cost.clone_with_init),
+                )
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+The benchmark workloads.
+
+A workload is a function that prepares everything it needs (players, input
+files) and returns a function that runs the timed part and returns the
+number of matches it played. Workloads are registered with the `workload`
+decorator and all of them are seeded.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict
+
+import axelrod as axl
+import numpy as np
+import pandas as pd
+from axelrod.result_set import (
+    DEFAULT_CHUNK_SIZE,
+    SUM_PER_PLAYER_OPPONENT_COLUMNS,
+)
+
+SEED = 0
+
+MATCH_TURNS = 200
+MATCH_OPPONENTS = [axl.Cooperator, axl.Defector, axl.TitForTat, axl.Random]
+
+TOURNAMENT_TURNS = 20
+TOURNAMENT_REPETITIONS = 1
+TOURNAMENT_PROCESSES = 2
+
+RESULT_SET_PLAYERS = 15
+RESULT_SET_TURNS = 200
+RESULT_SET_REPETITIONS = 5
+RESULT_SET_MEMORY_LIMIT = 2**22
+PARALLEL_RESULT_SET_REPETITIONS = 200
+PARALLEL_RESULT_SET_TURNS = 20
+PARALLEL_RESULT_SET_PROCESSES = [1, 2, 4, 8]
+RESHAPE_PLAYERS = 200
+RESHAPE_REPETITIONS = 20
+
+MORAN_PLAYERS = 6
+MORAN_TURNS = 50
+
+STARTUP_SCRIPTS = OrderedDict(
+    [
+        ("import", ("import axelrod", 0)),
+        (
+            "match",
+            (
+                "import axelrod as axl\n"
+                "axl.Match((axl.TitForTat(), axl.Random()), seed=0).play()",
+                1,
+            ),
+        ),
+    ]
+)
+
+FINGERPRINT_TURNS = 50
+FINGERPRINT_REPETITIONS = 2
+FINGERPRINT_STEP = 0.1
+
+WORKLOADS = OrderedDict()  # type: Dict[str, Callable[[], Callable[[], int]]]
+
+
+def workload(name: str) -> Callable:
+    """Registers a workload under `name`."""
+
+    def decorator(function):
+        WORKLOADS[name] = function
+        return function
+
+    return decorator
+
+
+def strategy_families() -> Dict[str, list]:
+    """Returns the short run time strategies grouped by the module in which
+    they are defined."""
+    families = defaultdict(list)
+    for strategy in axl.short_run_time_strategies:
+        families[strategy.__module__.split(".")[-1]].append(strategy)
+    return OrderedDict(sorted(families.items()))
+
+
+def _startup_workload(script, matches):
+    def setup():
+        def run():
+            subprocess.run([sys.executable, "-c", script], check=True)
+            return matches
+
+        return run
+
+    return setup
+
+
+for _name, (_script, _matches) in STARTUP_SCRIPTS.items():
+    workload("startup." + _name)(_startup_workload(_script, _matches))
+
+
+def _match_workload(strategies):
+    def setup():
+        pairs = [
+            (strategy, opponent)
+            for strategy in strategies
+            for opponent in MATCH_OPPONENTS
+        ]
+
+        def run():
+            for seed, (strategy, opponent) in enumerate(pairs, start=SEED):
+                match = axl.Match(
+                    (strategy(), opponent()), turns=MATCH_TURNS, seed=seed
+                )
+                match.play()
+            return len(pairs)
+
+        return run
+
+    return setup
+
+
+for _family, _strategies in strategy_families().items():
+    workload("match." + _family)(_match_workload(_strategies))
+
+
+def _tournament_workload(processes):
+    def setup():
+        players = [strategy() for strategy in axl.short_run_time_strategies]
+
+        def run():
+            tournament = axl.Tournament(
+                players,
+                turns=TOURNAMENT_TURNS,
+                repetitions=TOURNAMENT_REPETITIONS,
+                seed=SEED,
+            )
+            tournament.play(processes=processes, progress_bar=False)
+            return tournament.num_interactions
+
+        return run
+
+    return setup
+
+
+workload("tournament.serial")(_tournament_workload(processes=None))
+workload("tournament.parallel")(
+    _tournament_workload(processes=TOURNAMENT_PROCESSES)
+)
+
+
+def _result_set_file():
+    """Plays a tournament and returns its players, the file of its
+    interactions and the number of matches played."""
+    players = [
+        strategy()
+        for strategy in axl.short_run_time_strategies[:RESULT_SET_PLAYERS]
+    ]
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, "result_set.csv")
+    tournament = axl.Tournament(
+        players,
+        turns=RESULT_SET_TURNS,
+        repetitions=RESULT_SET_REPETITIONS,
+        seed=SEED,
+    )
+    tournament.play(filename=filename, progress_bar=False)
+    return players, filename, tournament.num_interactions
+
+
+@workload("result_set")
+def result_set():
+    players, filename, matches = _result_set_file()
+
+    def run():
+        axl.ResultSet(
+            filename,
+            players,
+            RESULT_SET_REPETITIONS,
+            progress_bar=False,
+        )
+        return matches
+
+    return run
+
+
+@workload("result_set.chunked")
+def result_set_chunked():
+    players, filename, matches = _result_set_file()
+
+    def run():
+        axl.ResultSet(
+            filename,
+            players,
+            RESULT_SET_REPETITIONS,
+            progress_bar=False,
+            memory_limit=RESULT_SET_MEMORY_LIMIT,
+        )
+        return matches
+
+    return run
+
+
+def _result_set_processes_workload(processes):
+    def setup():
+        players = [
+            strategy()
+            for strategy in axl.short_run_time_strategies[:RESULT_SET_PLAYERS]
+        ]
+        names = [str(player) for player in players]
+        directory = tempfile.mkdtemp()
+        filename = os.path.join(directory, "result_set.csv")
+        tournament = axl.Tournament(
+            players,
+            turns=PARALLEL_RESULT_SET_TURNS,
+            repetitions=PARALLEL_RESULT_SET_REPETITIONS,
+            seed=SEED,
+        )
+        tournament.play(filename=filename, progress_bar=False)
+
+        def run():
+            axl.ResultSet(
+                filename,
+                names,
+                PARALLEL_RESULT_SET_REPETITIONS,
+                progress_bar=False,
+                processes=processes,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+            )
+            return tournament.num_interactions
+
+        return run
+
+    return setup
+
+
+for _processes in PARALLEL_RESULT_SET_PROCESSES:
+    workload("result_set.processes.{}".format(_processes))(
+        _result_set_processes_workload(_processes)
+    )
+
+
+def _summaries(num_players, repetitions):
+    """Returns random aggregated results of a tournament, of the form used by
+    `ResultSet.from_summaries`."""
+    random = np.random.RandomState(SEED)
+    n, reps = num_players, repetitions
+    index = pd.MultiIndex.from_product(
+        [range(reps), range(n), range(n)],
+        names=["Repetition", "Player index", "Opponent index"],
+    )
+    mean_per_reps_player_opponent_df = pd.DataFrame(
+        {
+            "Turns": np.full(len(index), 200),
+            "Score per turn": random.uniform(0, 5, len(index)),
+            "Score difference per turn": random.uniform(-5, 5, len(index)),
+        },
+        index=index,
+    )
+    index = pd.MultiIndex.from_product(
+        [range(n), range(n)], names=["Player index", "Opponent index"]
+    )
+    sum_per_player_opponent_df = pd.DataFrame(
+        random.randint(
+            0, 200, (len(index), len(SUM_PER_PLAYER_OPPONENT_COLUMNS))
+        ),
+        columns=SUM_PER_PLAYER_OPPONENT_COLUMNS,
+        index=index,
+    )
+    index = pd.MultiIndex.from_product(
+        [range(n), range(reps)], names=["Player index", "Repetition"]
+    )
+    sum_per_player_repetition_df = pd.DataFrame(
+        {
+            "Win": random.randint(0, n, len(index)),
+            "Score": random.randint(0, 1000 * n, len(index)),
+        },
+        index=index,
+    )
+    normalised_scores_series = pd.Series(
+        random.uniform(0, 5, len(index)), index=index
+    )
+    initial_cooperation_count_series = pd.Series(random.randint(0, n * reps, n))
+    interactions_count_series = pd.Series(np.full(n, n * reps))
+    return (
+        mean_per_reps_player_opponent_df,
+        sum_per_player_opponent_df,
+        sum_per_player_repetition_df,
+        normalised_scores_series,
+        initial_cooperation_count_series,
+        interactions_count_series,
+    )
+
+
+@workload("result_set.reshape")
+def result_set_reshape():
+    players = ["Player {}".format(i) for i in range(RESHAPE_PLAYERS)]
+    summaries = _summaries(RESHAPE_PLAYERS, RESHAPE_REPETITIONS)
+
+    def run():
+        axl.ResultSet.from_summaries(
+            summaries, players, RESHAPE_REPETITIONS, progress_bar=False
+        )
+        return (
+            RESHAPE_PLAYERS * (RESHAPE_PLAYERS + 1) // 2 * RESHAPE_REPETITIONS
+        )
+
+    return run
+
+
+class CountingMatch(axl.Match):
+    """A match that counts how many times matches are played."""
+
+    plays = 0
+
+    def play(self):
+        CountingMatch.plays += 1
+        return super().play()
+
+
+@workload("moran")
+def moran():
+    strategies = axl.short_run_time_strategies[:MORAN_PLAYERS]
+
+    def run():
+        CountingMatch.plays = 0
+        process = axl.MoranProcess(
+            [strategy() for strategy in strategies],
+            turns=MORAN_TURNS,
+            seed=SEED,
+            match_class=CountingMatch,
+        )
+        process.play()
+        return CountingMatch.plays
+
+    return run
+
+
+@workload("fingerprint")
+def fingerprint():
+    def run():
+        ashlock = axl.AshlockFingerprint(axl.TitForTat)
+        ashlock.fingerprint(
+            turns=FINGERPRINT_TURNS,
+            repetitions=FINGERPRINT_REPETITIONS,
+            step=FINGERPRINT_STEP,
+            seed=SEED,
+            progress_bar=False,
+        )
+        return sum(
+            len(interactions) for interactions in ashlock.interactions.values()
+        )
+
+    return run